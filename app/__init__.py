@@ -37,6 +37,7 @@ def create_app(config_name=None):
     )
     from .domains.attachment.models import Attachment  # Phase 31: 독립 도메인
     from .domains.company.models import ClassificationOption
+    from .domains.sync.models import SyncJob, SyncFingerprint, SyncBatchRun, SyncBatchItem
 
     # 테이블 생성 (개발 환경)
     with app.app_context():
@@ -64,7 +64,162 @@ def list_superadmins():
         click.echo(f'  - {user.username} ({user.email}) [{status}]')
 
 
+@click.command('rebuild-org-closure')
+@with_appcontext
+def rebuild_org_closure():
+    """조직 계층 클로저 테이블(organization_closure) 재구성"""
+    from app.domains.company.repositories import organization_repository
+
+    count = organization_repository.rebuild_closure()
+    click.echo(click.style(f'organization_closure rebuilt: {count} rows', fg='green'))
+
+
+@click.command('rebuild-org-headcount')
+@with_appcontext
+def rebuild_org_headcount():
+    """조직별 인원 롤업 테이블(org_headcount) 재구성"""
+    from app.domains.company.repositories import organization_repository
+
+    count = organization_repository.rebuild_headcounts()
+    click.echo(click.style(f'org_headcount rebuilt: {count} rows', fg='green'))
+
+
+@click.command('refresh-tenant-daily-stats')
+@click.option('--date', 'stat_date', type=click.DateTime(formats=['%Y-%m-%d']), default=None,
+              help='Snapshot date (default: today)')
+@with_appcontext
+def refresh_tenant_daily_stats(stat_date):
+    """테넌트 일별 직원 현황 스냅샷(tenant_daily_stats) 생성/보정 (스케줄러 일 1회)"""
+    from app.domains.company.repositories import organization_repository
+
+    count = organization_repository.refresh_daily_stats(stat_date.date() if stat_date else None)
+    click.echo(click.style(f'tenant_daily_stats refreshed: {count} tenant(s)', fg='green'))
+
+
+@click.command('check-employee-company-ids')
+@click.option('--company-id', type=int, default=None, help='Limit to a single company')
+@click.option('--limit', type=int, default=50, help='Max mismatches to print')
+@with_appcontext
+def check_employee_company_ids(company_id, limit):
+    """직원 company_id와 조직 트리 소속 회사 정합성 검사"""
+    from app.domains.employee.repositories.employee_repository import employee_repository
+
+    mismatches = employee_repository.find_company_id_mismatches(company_id)
+    if not mismatches:
+        click.echo(click.style('employees.company_id is consistent with the org tree', fg='green'))
+        return
+
+    click.echo(click.style(f'Found {len(mismatches)} mismatched employee(s):', fg='yellow'))
+    for row in mismatches[:limit]:
+        click.echo(
+            f"  - employee {row['employee_id']}: "
+            f"company_id={row['company_id']} expected={row['expected_company_id']}"
+        )
+    raise SystemExit(1)
+
+
+@click.command('backfill-employee-company-ids')
+@click.option('--company-id', type=int, default=None, help='Limit to a single company')
+@with_appcontext
+def backfill_employee_company_ids(company_id):
+    """직원 company_id를 조직 트리 소속 회사로 일괄 보정"""
+    from app.domains.employee.repositories.employee_repository import employee_repository
+
+    count = employee_repository.backfill_company_ids(company_id)
+    click.echo(click.style(f'employees.company_id backfilled: {count} row(s)', fg='green'))
+
+
+@click.command('run-sync-worker')
+@click.option('--once', is_flag=True, help='Process pending jobs once and exit')
+@with_appcontext
+def run_sync_worker(once):
+    """개인 -> 법인 동기화 작업 큐(sync_jobs) 처리 워커"""
+    from flask import current_app
+    from app.domains.sync.services.sync_job_service import sync_job_service
+
+    poll_seconds = current_app.config.get('SYNC_QUEUE_POLL_SECONDS', 5)
+    while True:
+        stats = sync_job_service.run_pending()
+        if any(stats.values()):
+            click.echo(
+                f"sync_jobs processed: {stats['succeeded']} succeeded, "
+                f"{stats['retrying']} retrying, {stats['failed']} failed"
+            )
+        if once:
+            return
+        sync_job_service.wait_for_work(sync_job_service.next_wait_seconds(poll_seconds))
+
+
+@click.command('run-sync-batch')
+@click.argument('run_id', type=int)
+@click.option('--workers', type=int, default=None, help='Parallel workers (default: SYNC_BATCH_WORKERS)')
+@click.option('--retry-failed', is_flag=True, help='Retry contracts that failed in a previous attempt')
+@with_appcontext
+def run_sync_batch(run_id, workers, retry_failed):
+    """법인 일괄 동기화 실행/재개 (남은 계약부터)"""
+    from app.domains.sync.services.sync_batch_service import sync_batch_service
+
+    run = sync_batch_service.batch_repo.find_by_id(run_id)
+    if not run:
+        click.echo(click.style(f'sync batch {run_id} not found', fg='red'))
+        raise SystemExit(1)
+
+    # 처리 중인 워커의 항목은 유지 (하트비트가 끊긴 항목만 재처리)
+    sync_batch_service.release_stale_items(run_id, retry_failed=retry_failed)
+    result = sync_batch_service.run(run_id, workers=workers)
+    progress = result['progress']
+    click.echo(click.style(
+        f"sync batch {run_id} {result['status']}: {progress['succeeded']} succeeded, "
+        f"{progress['failed']} failed, {progress['remaining']} remaining",
+        fg='green' if not progress['failed'] else 'yellow'
+    ))
+
+
+@click.command('dedupe-uploads')
+@click.option('--path', 'root', type=click.Path(exists=True, file_okay=False), default=None,
+              help='Upload folder to scan (default: static/uploads)')
+@click.option('--dry-run', is_flag=True, help='Report duplicates without changing files')
+@with_appcontext
+def dedupe_uploads(root, dry_run):
+    """기존 업로드 파일을 blob 저장소로 이전하여 중복 제거 (경로 유지, 하드 링크)"""
+    from app.shared.services.blob_store import blob_store
+
+    stats = blob_store.dedupe_tree(root, dry_run=dry_run)
+    label = 'would link' if dry_run else 'linked'
+    click.echo(click.style(
+        f"uploads scanned: {stats['files']} file(s), {label} {stats['linked']} duplicate(s), "
+        f"{stats['bytes_saved']} byte(s) saved",
+        fg='green'
+    ))
+
+
+@click.command('prune-blobs')
+@click.option('--min-age', type=int, default=None,
+              help='Only remove unreferenced blobs older than this many seconds')
+@click.option('--dry-run', is_flag=True, help='Report unreferenced blobs without removing them')
+@with_appcontext
+def prune_blobs(min_age, dry_run):
+    """참조(하드 링크)가 없는 blob 삭제"""
+    from flask import current_app
+    from app.shared.services.blob_store import blob_store
+
+    if min_age is None:
+        min_age = current_app.config.get('BLOB_STORE_PRUNE_MIN_AGE_SECONDS', 3600)
+    stats = blob_store.prune(min_age_seconds=min_age, dry_run=dry_run)
+    label = 'unreferenced' if dry_run else 'removed'
+    click.echo(click.style(f"blobs {label}: {stats['blobs']} ({stats['bytes']} byte(s))", fg='green'))
+
+
 def register_cli_commands(app):
     """Flask 앱에 CLI 명령어 등록"""
     app.cli.add_command(create_superadmin)
     app.cli.add_command(list_superadmins)
+    app.cli.add_command(rebuild_org_closure)
+    app.cli.add_command(rebuild_org_headcount)
+    app.cli.add_command(refresh_tenant_daily_stats)
+    app.cli.add_command(check_employee_company_ids)
+    app.cli.add_command(backfill_employee_company_ids)
+    app.cli.add_command(run_sync_worker)
+    app.cli.add_command(run_sync_batch)
+    app.cli.add_command(dedupe_uploads)
+    app.cli.add_command(prune_blobs)
@@ -2,6 +2,7 @@
 Flask 애플리케이션 설정 파일
 """
 import os
+import tempfile
 
 
 class Config:
@@ -90,6 +91,51 @@ class Config:
     # 법인 관리자 프로필 기능 플래그
     ENABLE_CORPORATE_ADMIN_PROFILE = os.environ.get('ENABLE_CORPORATE_ADMIN_PROFILE', 'true').lower() == 'true'
 
+    # 멀티테넌시 직원 스코프 모드 (org_tree | company_id)
+    # company_id 모드 전환 전 `flask check-employee-company-ids`로 정합성 확인 필요
+    TENANT_SCOPE_MODE = os.environ.get('TENANT_SCOPE_MODE', 'org_tree')
+
+    # 조직 스코프 프로세스 캐시 (테넌트 조직 ID 집합/트리 스냅샷)
+    # 다른 워커의 조직 변경은 버전 행 폴링 간격 내에 반영
+    ORG_SCOPE_CACHE_ENABLED = os.environ.get('ORG_SCOPE_CACHE_ENABLED', 'true').lower() == 'true'
+    ORG_SCOPE_CACHE_SIZE = int(os.environ.get('ORG_SCOPE_CACHE_SIZE', '256'))
+    ORG_SCOPE_VERSION_POLL_SECONDS = float(os.environ.get('ORG_SCOPE_VERSION_POLL_SECONDS', '0.2'))
+
+    # 직원 자동완성 프로세스 인덱스 (테넌트별)
+    # 같은 워커의 직원 변경은 커밋 즉시, 다른 워커의 변경은 TTL 내 반영
+    TYPEAHEAD_INDEX_TTL_SECONDS = int(os.environ.get('TYPEAHEAD_INDEX_TTL_SECONDS', '300'))
+    TYPEAHEAD_SCAN_LIMIT = int(os.environ.get('TYPEAHEAD_SCAN_LIMIT', '500'))
+
+    # 테넌트 데이터 버전 프로세스 캐시 (목록 패싯 건수 등 파생 집계)
+    TENANT_DATA_CACHE_ENABLED = os.environ.get('TENANT_DATA_CACHE_ENABLED', 'true').lower() == 'true'
+    TENANT_DATA_CACHE_SIZE = int(os.environ.get('TENANT_DATA_CACHE_SIZE', '512'))
+
+    # 개인 -> 법인 자동 동기화 작업 큐 (sync_jobs)
+    # 앱 프로세스 내 워커 스레드 수 (0이면 `flask run-sync-worker` 별도 프로세스로 처리)
+    # 웹 서버 프로세스별 첫 요청에서 시작 (flask run 외 CLI 명령은 시작하지 않음, gunicorn --preload의 fork 전 시작 방지)
+    SYNC_QUEUE_WORKERS = int(os.environ.get('SYNC_QUEUE_WORKERS', '2'))
+    SYNC_QUEUE_POLL_SECONDS = float(os.environ.get('SYNC_QUEUE_POLL_SECONDS', '5'))
+    SYNC_QUEUE_MAX_ATTEMPTS = int(os.environ.get('SYNC_QUEUE_MAX_ATTEMPTS', '5'))
+    SYNC_QUEUE_RETRY_BASE_SECONDS = int(os.environ.get('SYNC_QUEUE_RETRY_BASE_SECONDS', '30'))
+    SYNC_QUEUE_RETRY_MAX_SECONDS = int(os.environ.get('SYNC_QUEUE_RETRY_MAX_SECONDS', '3600'))
+    SYNC_QUEUE_STALE_SECONDS = int(os.environ.get('SYNC_QUEUE_STALE_SECONDS', '900'))
+    # 같은 사용자의 연속 편집은 병합 대기 시간 동안 모아 1회 동기화 (첫 요청 후 최대 지연까지)
+    SYNC_COALESCE_WINDOW_SECONDS = float(os.environ.get('SYNC_COALESCE_WINDOW_SECONDS', '3'))
+    SYNC_COALESCE_MAX_DELAY_SECONDS = float(os.environ.get('SYNC_COALESCE_MAX_DELAY_SECONDS', '30'))
+
+    # 법인 일괄 동기화 (sync_batch_runs)
+    # 병렬 워커 수, 청크당 계약 수, 진행이 없으면 중단으로 보는 시간
+    # SYNC_BATCH_IN_PROCESS=False면 `flask run-sync-batch`로 실행
+    SYNC_BATCH_WORKERS = int(os.environ.get('SYNC_BATCH_WORKERS', '4'))
+    SYNC_BATCH_CHUNK_SIZE = int(os.environ.get('SYNC_BATCH_CHUNK_SIZE', '50'))
+    SYNC_BATCH_STALE_SECONDS = int(os.environ.get('SYNC_BATCH_STALE_SECONDS', '900'))
+    SYNC_BATCH_IN_PROCESS = os.environ.get('SYNC_BATCH_IN_PROCESS', 'true').lower() == 'true'
+
+    # 업로드 파일 내용 저장소 (SHA-256 blob, 업로드 경로는 blob 하드 링크)
+    # 기본 경로는 업로드 폴더 아래 .blobs (하드 링크는 같은 파일 시스템에서만 가능)
+    BLOB_STORE_PATH = os.environ.get('BLOB_STORE_PATH') or None
+    BLOB_STORE_PRUNE_MIN_AGE_SECONDS = int(os.environ.get('BLOB_STORE_PRUNE_MIN_AGE_SECONDS', '3600'))
+
 
 class DevelopmentConfig(Config):
     """개발 환경 설정"""
@@ -109,6 +155,18 @@ class TestingConfig(Config):
     WTF_CSRF_ENABLED = False
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     SECRET_KEY = 'test-secret-key'
+    # 테스트마다 DB가 재생성되어 ID/버전이 재사용되므로 비활성화
+    ORG_SCOPE_CACHE_ENABLED = False
+    TENANT_DATA_CACHE_ENABLED = False
+    TYPEAHEAD_INDEX_TTL_SECONDS = 0
+    # 동기화 작업은 테스트에서 run_pending()으로 직접 처리
+    SYNC_QUEUE_WORKERS = 0
+    SYNC_COALESCE_WINDOW_SECONDS = 0
+    # 일괄 동기화는 테스트에서 run()으로 직접 처리
+    SYNC_BATCH_IN_PROCESS = False
+    SYNC_BATCH_WORKERS = 1
+    # 업로드 테스트의 blob이 저장소 폴더에 남지 않도록 임시 폴더 사용
+    BLOB_STORE_PATH = os.path.join(tempfile.gettempdir(), 'hrm-test-blobs')
 
 
 # 설정 딕셔너리
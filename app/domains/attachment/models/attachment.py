@@ -5,6 +5,8 @@ Attachment SQLAlchemy 모델
 Phase 31: 독립 도메인으로 분리 + owner_type/owner_id 범용화
 Phase 33: source 추적 필드 추가 (계약 기반 동기화/분리)
 """
+from sqlalchemy import event
+
 from app.database import db
 from app.shared.models.mixins import DictSerializableMixin
 
@@ -89,3 +91,18 @@ class Attachment(DictSerializableMixin, db.Model):
     def can_delete_on_termination(self) -> bool:
         """계약 해지 시 삭제 가능 여부"""
         return self.is_deletable_on_termination and self.is_synced()
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(Attachment, 'after_insert')
+@event.listens_for(Attachment, 'after_update')
+@event.listens_for(Attachment, 'after_delete')
+def on_attachment_change(mapper, connection, target):
+    """명함 이미지 변경 시 직원 테넌트 기록 (직원 목록 명함 뷰)"""
+    from app.domains.attachment.constants import AttachmentCategory
+    if target.employee_id and target.category in (
+        AttachmentCategory.BUSINESS_CARD_FRONT, AttachmentCategory.BUSINESS_CARD_BACK
+    ):
+        from app.domains.company.models import TenantDataVersion
+        TenantDataVersion.mark(target, TenantDataVersion.EMPLOYEES, target.employee_id)
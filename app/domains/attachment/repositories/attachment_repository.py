@@ -12,6 +12,9 @@ from app.shared.repositories.base_repository import BaseRelationRepository
 class AttachmentRepository(BaseRelationRepository[Attachment]):
     """첨부파일 저장소 (범용)"""
 
+    # 명함 이미지는 직원 목록에 반영 (attachment.py 모델 이벤트와 같은 종류)
+    bulk_tenant_kind = 'EMPLOYEES'
+
     def __init__(self):
         super().__init__(Attachment)
 
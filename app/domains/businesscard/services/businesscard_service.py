@@ -180,8 +180,7 @@ class BusinessCardService:
             # 파일 저장
             unique_filename = self._generate_filename(employee_id, file.filename, side)
             upload_folder = self._get_upload_folder()
-            file_path = os.path.join(upload_folder, unique_filename)
-            file.save(file_path)
+            file_storage.save_file(file, upload_folder, unique_filename)
 
             # 웹 접근 경로
             web_path = f"/static/uploads/{self.UPLOAD_SUBFOLDER}/{unique_filename}"
@@ -2,7 +2,7 @@
 Company Domain
 
 법인 관련 모든 기능을 포함합니다:
-- Models: Company, CompanySettings, CompanyVisibilitySettings, CompanyDocument, Organization, ClassificationOption, NumberCategory, NumberRegistry
+- Models: Company, CompanySettings, CompanyVisibilitySettings, CompanyDocument, Organization, OrganizationClosure, ClassificationOption, NumberCategory, NumberRegistry
 - Repositories: CompanyRepository, CompanySettingsRepository, CompanyVisibilityRepository, CompanyDocumentRepository, OrganizationRepository, ClassificationOptionsRepository, NumberCategoryRepository, DataSharingSettingsRepository
 - Services: CompanyService, OrganizationService, CorporateSettingsService
 
@@ -13,7 +13,9 @@ from app.domains.company.services.organization_service import organization_servi
 from app.domains.company.services.company_service import company_service
 from app.domains.employee.services import employee_service
 from app.shared.utils.decorators import admin_required, login_required
-from app.shared.utils.api_helpers import api_success, api_error, api_not_found, api_server_error
+from app.shared.utils.api_helpers import (
+    api_success, api_success_with_etag, api_error, api_not_found, api_server_error
+)
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -50,6 +52,9 @@ def api_get_organizations():
         data = organization_service.get_tree_with_member_count(root_organization_id=root_org_id)
     elif format_type == 'flat':
         data = organization_service.get_flat_list(root_organization_id=root_org_id)
+    elif format_type == 'selector':
+        data = organization_service.get_selector_tree(root_organization_id=root_org_id)
+        return api_success_with_etag(data)
     else:
         data = organization_service.get_tree_with_member_count(root_organization_id=root_org_id)
 
@@ -8,6 +8,11 @@ Phase 2 Migration: 모델을 도메인 내부로 이동 완료
 # 도메인 내부 모델 (Phase 2 Migration)
 from .company import Company
 from .organization import Organization
+from .organization_closure import OrganizationClosure
+from .org_scope_version import OrgScopeVersion
+from .org_headcount import OrgHeadcount
+from .tenant_data_version import TenantDataVersion
+from .tenant_daily_stats import TenantDailyStats
 from .classification_option import ClassificationOption
 from .company_settings import CompanySettings
 from .company_visibility_settings import CompanyVisibilitySettings
@@ -21,6 +26,11 @@ from .organization_type_config import OrganizationTypeConfig
 __all__ = [
     'Company',
     'Organization',
+    'OrganizationClosure',
+    'OrgScopeVersion',
+    'OrgHeadcount',
+    'TenantDataVersion',
+    'TenantDailyStats',
     'ClassificationOption',
     'CompanySettings',
     'CompanyVisibilitySettings',
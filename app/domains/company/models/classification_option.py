@@ -7,6 +7,9 @@ ClassificationOption SQLAlchemy 모델
 Phase 2 Migration: app/domains/company/models/로 이동
 """
 from datetime import datetime
+
+from sqlalchemy import event
+
 from app.database import db
 
 
@@ -128,3 +131,17 @@ class ClassificationOption(db.Model):
 
     def __repr__(self):
         return f'<ClassificationOption {self.category}: {self.value}>'
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(ClassificationOption, 'after_insert')
+@event.listens_for(ClassificationOption, 'after_update')
+@event.listens_for(ClassificationOption, 'after_delete')
+def on_classification_option_change(mapper, connection, target):
+    """분류 옵션 변경 시 테넌트 기록 (공용 옵션은 전체 테넌트)"""
+    from .tenant_data_version import TenantDataVersion
+    if target.company_id is None:
+        TenantDataVersion.mark(target, TenantDataVersion.ALL_TENANTS)
+    else:
+        TenantDataVersion.mark(target, TenantDataVersion.COMPANIES, target.company_id)
@@ -42,7 +42,8 @@ class Company(db.Model):
     root_organization_id = db.Column(
         db.Integer,
         db.ForeignKey('organizations.id'),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     # 상태 정보
@@ -0,0 +1,112 @@
+"""
+OrgHeadcount SQLAlchemy 모델
+
+조직별 인원 롤업 테이블입니다. (조직, 직원 상태)별로
+직접 소속 인원(direct_count)과 하위 트리 전체 인원(subtree_count)을 유지합니다.
+
+- 직원 생성/조직 이동/상태 변경/삭제: Employee 이벤트 리스너에서 증분 반영
+- 조직 상위 변경/삭제: 아래 Organization 이벤트 리스너에서 증분 반영
+- 기존 데이터 및 벌크 UPDATE 이후: OrganizationRepository.rebuild_headcounts() 또는
+  `flask rebuild-org-headcount` 명령으로 재구성
+"""
+from sqlalchemy import case, event, select
+
+from app.database import db
+from app.shared.utils.sql_dialect import dialect_insert
+from .organization import Organization
+from .organization_closure import OrganizationClosure
+
+
+class OrgHeadcount(db.Model):
+    """조직별 상태별 인원 롤업"""
+    __tablename__ = 'org_headcount'
+
+    organization_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), primary_key=True)
+    # 직원 상태 (NULL 상태는 STATUS_NONE으로 저장)
+    status = db.Column(db.String(50), primary_key=True)
+    direct_count = db.Column(db.Integer, nullable=False, default=0)
+    subtree_count = db.Column(db.Integer, nullable=False, default=0)
+
+    STATUS_NONE = ''
+
+    @classmethod
+    def apply_delta(cls, connection, org_id: int, status: str, delta: int,
+                    direct: bool = True) -> None:
+        """조직과 모든 상위 조직의 인원 증감
+
+        Args:
+            connection: 현재 flush 트랜잭션 커넥션
+            org_id: 인원이 증감된 조직 ID
+            status: 직원 상태
+            delta: 증감 인원
+            direct: org_id 자신의 direct_count도 증감할지 여부
+                (하위 트리 이동 시 상위 조직에만 반영하려면 False)
+        """
+        if not org_id or not delta:
+            return
+
+        table = cls.__table__
+        closure = OrganizationClosure.__table__
+        status = status or cls.STATUS_NONE
+        direct_delta = delta if direct else 0
+
+        # 조직 + 상위 조직 행 증감 (없으면 생성, INSERT ... SELECT ... ON CONFLICT DO UPDATE)
+        # 동시에 같은 조직의 첫 행을 만드는 트랜잭션도 기본 키 충돌 없이 합산되며,
+        # 조직 ID 순으로 잠가 상위 경로가 겹치는 트랜잭션 간 교착을 피합니다.
+        stmt = dialect_insert(connection, table).from_select(
+            ['organization_id', 'status', 'direct_count', 'subtree_count'],
+            select(
+                closure.c.ancestor_id,
+                db.literal(status),
+                case((closure.c.depth == 0, direct_delta), else_=0),
+                db.literal(delta),
+            )
+            .where(closure.c.descendant_id == org_id)
+            .order_by(closure.c.ancestor_id)
+        )
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.organization_id, table.c.status],
+            set_={
+                'direct_count': table.c.direct_count + stmt.excluded.direct_count,
+                'subtree_count': table.c.subtree_count + stmt.excluded.subtree_count,
+            },
+        ))
+
+    @classmethod
+    def move_subtree(cls, connection, org_id: int, old_parent_id: int,
+                     new_parent_id: int) -> None:
+        """하위 트리 이동 시 이전/새 상위 조직 경로의 subtree_count 이전"""
+        table = cls.__table__
+        rows = connection.execute(
+            select(table.c.status, table.c.subtree_count).where(
+                table.c.organization_id == org_id, table.c.subtree_count != 0
+            )
+        ).all()
+        for status, count in rows:
+            cls.apply_delta(connection, old_parent_id, status, -count, direct=False)
+            cls.apply_delta(connection, new_parent_id, status, count, direct=False)
+
+    def __repr__(self):
+        return (f'<OrgHeadcount {self.organization_id} {self.status or "-"} '
+                f'{self.direct_count}/{self.subtree_count}>')
+
+
+# ===== SQLAlchemy Event Listeners =====
+# 직원 측 리스너는 app/domains/employee/models/employee.py에 있습니다.
+
+@event.listens_for(Organization, 'after_update')
+def on_organization_update(mapper, connection, target):
+    """상위 조직 변경 시 하위 트리 인원을 새 상위 경로로 이전"""
+    history = db.inspect(target).attrs.parent_id.history
+    if not history.has_changes():
+        return
+    old_parent_id = history.deleted[0] if history.deleted else None
+    OrgHeadcount.move_subtree(connection, target.id, old_parent_id, target.parent_id)
+
+
+@event.listens_for(Organization, 'before_delete')
+def on_organization_delete(mapper, connection, target):
+    """조직 삭제 시 인원 행 제거 (상위 경로의 인원 차감)"""
+    table = OrgHeadcount.__table__
+    OrgHeadcount.move_subtree(connection, target.id, target.parent_id, None)
+    connection.execute(table.delete().where(table.c.organization_id == target.id))
@@ -0,0 +1,129 @@
+"""
+OrgScopeVersion SQLAlchemy 모델
+
+테넌트(루트 조직)별 조직 구조 버전 카운터입니다.
+조직 INSERT/UPDATE/DELETE 시 이벤트 리스너로 해당 루트 조직의 버전을 증가시키며,
+프로세스 캐시(org_scope_cache)는 (root_organization_id, version)을 키로 사용합니다.
+
+- 같은 프로세스: 커밋 직후 로컬 캐시 즉시 무효화
+- 다른 워커: 버전 행 폴링(ORG_SCOPE_VERSION_POLL_SECONDS)으로 무효화
+"""
+from datetime import datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.database import db
+from .organization import Organization
+from .organization_closure import OrganizationClosure
+
+
+class OrgScopeVersion(db.Model):
+    """테넌트 조직 구조 버전"""
+    __tablename__ = 'org_scope_versions'
+
+    # 루트 조직 삭제와 무관하게 유지 (FK 없음)
+    root_organization_id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Session.info 키: 커밋 대기 중인 변경 루트 조직 ID 집합
+    DIRTY_KEY = 'org_scope_dirty'
+
+    @classmethod
+    def get_version(cls, root_org_id: int) -> int:
+        """현재 버전 조회 (행이 없으면 0)"""
+        version = db.session.execute(
+            select(cls.version).where(cls.root_organization_id == root_org_id)
+        ).scalar()
+        return version or 0
+
+    @classmethod
+    def bump(cls, connection, root_org_ids) -> None:
+        """루트 조직별 버전 증가 (행이 없으면 생성)
+
+        Args:
+            connection: 현재 flush 트랜잭션 커넥션
+            root_org_ids: 루트 조직 ID 목록
+        """
+        table = cls.__table__
+        now = datetime.utcnow()
+        for root_org_id in root_org_ids:
+            result = connection.execute(
+                table.update()
+                .where(table.c.root_organization_id == root_org_id)
+                .values(version=table.c.version + 1, updated_at=now)
+            )
+            if result.rowcount == 0:
+                connection.execute(table.insert().values(
+                    root_organization_id=root_org_id, version=1, updated_at=now
+                ))
+
+    def __repr__(self):
+        return f'<OrgScopeVersion {self.root_organization_id} v{self.version}>'
+
+
+def _root_ids_of(connection, org_ids) -> set:
+    """조직 ID들이 속한 최상위 조직 ID 집합 (organization_closure 단일 조회)"""
+    org_ids = [org_id for org_id in org_ids if org_id]
+    if not org_ids:
+        return set()
+    closure = OrganizationClosure.__table__
+    orgs = Organization.__table__
+    rows = connection.execute(
+        select(closure.c.ancestor_id)
+        .join(orgs, orgs.c.id == closure.c.ancestor_id)
+        .where(closure.c.descendant_id.in_(org_ids), orgs.c.parent_id.is_(None))
+    )
+    return set(rows.scalars())
+
+
+def _bump_for(connection, target, org_ids) -> None:
+    """변경 조직의 테넌트 버전 증가 및 세션에 변경 루트 기록"""
+    root_ids = _root_ids_of(connection, org_ids)
+    if not root_ids:
+        return
+    OrgScopeVersion.bump(connection, root_ids)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(OrgScopeVersion.DIRTY_KEY, set()).update(root_ids)
+
+
+# ===== SQLAlchemy Event Listeners =====
+# 클로저 리스너(organization_closure) 이후 실행되어 갱신된 경로로 루트를 해석합니다.
+
+@event.listens_for(Organization, 'after_insert')
+def on_organization_insert(mapper, connection, target):
+    """조직 생성 시 테넌트 버전 증가"""
+    _bump_for(connection, target, [target.id])
+
+
+@event.listens_for(Organization, 'after_update')
+def on_organization_update(mapper, connection, target):
+    """조직 수정 시 테넌트 버전 증가 (상위 조직 변경 시 이전 테넌트 포함)"""
+    session = object_session(target)
+    if session is not None and not session.is_modified(target, include_collections=False):
+        return
+    org_ids = [target.id] + list(db.inspect(target).attrs.parent_id.history.deleted or [])
+    _bump_for(connection, target, org_ids)
+
+
+@event.listens_for(Organization, 'before_delete', insert=True)
+def on_organization_delete(mapper, connection, target):
+    """조직 삭제 시 테넌트 버전 증가 (클로저 행 삭제 전에 루트 해석)"""
+    _bump_for(connection, target, [target.id])
+
+
+@event.listens_for(Session, 'after_commit')
+def on_session_commit(session):
+    """커밋된 변경 루트의 로컬 캐시 즉시 무효화"""
+    root_ids = session.info.pop(OrgScopeVersion.DIRTY_KEY, None)
+    if root_ids:
+        from app.shared.utils.org_scope_cache import org_scope_cache
+        org_scope_cache.invalidate(root_ids)
+
+
+@event.listens_for(Session, 'after_rollback')
+def on_session_rollback(session):
+    """롤백된 변경 루트 기록 제거"""
+    session.info.pop(OrgScopeVersion.DIRTY_KEY, None)
@@ -69,39 +69,70 @@ class Organization(db.Model):
         return self.TYPE_LABELS.get(self.org_type, self.org_type)
 
     def get_level(self):
-        """조직 트리에서의 깊이 반환 (루트=0)"""
-        level = 0
-        current = self
-        while current.parent_id:
-            level += 1
-            current = current.parent
-            if level > 10:  # 무한 루프 방지
-                break
-        return level
+        """조직 트리에서의 깊이 반환 (루트=0, organization_closure 단일 조회)"""
+        if self.id is None:
+            return len(self._walk_ancestors())
+
+        from .organization_closure import OrganizationClosure
+        depth = db.session.query(db.func.max(OrganizationClosure.depth)).filter(
+            OrganizationClosure.descendant_id == self.id
+        ).scalar()
+        return depth or 0
 
     def get_ancestors(self):
-        """상위 조직 목록 반환 (루트까지)"""
-        ancestors = []
-        current = self.parent
-        while current:
-            ancestors.append(current)
-            current = current.parent
-            if len(ancestors) > 10:  # 무한 루프 방지
-                break
-        return list(reversed(ancestors))
+        """상위 조직 목록 반환 (루트까지, organization_closure 단일 조회)"""
+        if self.id is None:
+            return list(reversed(self._walk_ancestors()))
+
+        from .organization_closure import OrganizationClosure
+        return Organization.query.join(
+            OrganizationClosure, OrganizationClosure.ancestor_id == Organization.id
+        ).filter(
+            OrganizationClosure.descendant_id == self.id,
+            OrganizationClosure.depth > 0
+        ).order_by(OrganizationClosure.depth.desc()).all()
 
     def get_descendants(self):
-        """하위 조직 목록 반환 (모든 자손)"""
+        """하위 조직 목록 반환 (모든 자손, 전위 순회 순서)
+
+        organization_closure 단일 조회 후 메모리에서 트리 순서를 복원합니다.
+        비활성 조직과 그 하위 트리는 제외됩니다.
+        """
+        from .organization_closure import OrganizationClosure
+        orgs = Organization.query.join(
+            OrganizationClosure, OrganizationClosure.descendant_id == Organization.id
+        ).filter(
+            OrganizationClosure.ancestor_id == self.id,
+            OrganizationClosure.depth > 0,
+            Organization.is_active == True,  # noqa: E712
+            OrganizationClosure.active_path_clause(OrganizationClosure)
+        ).order_by(Organization.sort_order, Organization.id).all()
+
+        children_map = {}
+        for org in orgs:
+            children_map.setdefault(org.parent_id, []).append(org)
+
         descendants = []
 
-        def collect_children(org):
-            for child in org.children.filter_by(is_active=True).order_by(Organization.sort_order):
+        def collect_children(parent_id):
+            for child in children_map.get(parent_id, []):
                 descendants.append(child)
-                collect_children(child)
+                collect_children(child.id)
 
-        collect_children(self)
+        collect_children(self.id)
         return descendants
 
+    def _walk_ancestors(self):
+        """parent 관계를 따라 상위 조직 수집 (플러시 전 객체용)"""
+        ancestors = []
+        current = self.parent
+        while current:
+            ancestors.append(current)
+            current = current.parent
+            if len(ancestors) > 10:  # 무한 루프 방지
+                break
+        return ancestors
+
     def get_path(self):
         """루트부터 현재 조직까지의 경로 문자열"""
         ancestors = self.get_ancestors()
@@ -114,8 +145,15 @@ class Organization(db.Model):
         codes = [a.code for a in ancestors if a.code] + [self.code] if self.code else []
         return '-'.join(codes) if codes else None
 
-    def to_dict(self, include_children=False, include_path=False):
-        """딕셔너리 변환"""
+    def to_dict(self, include_children=False, include_path=False, tree_info=None):
+        """딕셔너리 변환
+
+        Args:
+            include_children: 하위 조직 재귀 포함 (노드별 조회, 단건 용도)
+            include_path: path/full_code 포함
+            tree_info: 메모리 트리에서 미리 계산한 {'level', 'path', 'full_code'}
+                (OrganizationRepository 트리 조립용, 지정 시 계층 조회 생략)
+        """
         data = {
             'id': self.id,
             'name': self.name,
@@ -129,14 +167,18 @@ class Organization(db.Model):
             'description': self.description,
             'department_phone': self.department_phone,
             'department_email': self.department_email,
-            'level': self.get_level(),
+            'level': tree_info['level'] if tree_info else self.get_level(),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
 
         if include_path:
-            data['path'] = self.get_path()
-            data['full_code'] = self.get_full_code()
+            if tree_info:
+                data['path'] = tree_info['path']
+                data['full_code'] = tree_info['full_code']
+            else:
+                data['path'] = self.get_path()
+                data['full_code'] = self.get_full_code()
 
         if include_children:
             data['children'] = [
@@ -154,14 +196,20 @@ class Organization(db.Model):
 
         return data
 
-    def to_tree_node(self):
-        """트리 구조용 노드 데이터"""
+    def to_tree_node(self, has_children=None):
+        """트리 구조용 노드 데이터
+
+        Args:
+            has_children: 하위 조직 존재 여부 (미지정 시 COUNT 조회)
+        """
+        if has_children is None:
+            has_children = self.children.filter_by(is_active=True).count() > 0
         return {
             'id': self.id,
             'text': self.name,
             'type': self.org_type,
             'parent': self.parent_id if self.parent_id else '#',
-            'children': self.children.filter_by(is_active=True).count() > 0,
+            'children': has_children,
             'data': {
                 'code': self.code,
                 'manager_id': self.manager_id,
@@ -0,0 +1,143 @@
+"""
+OrganizationClosure SQLAlchemy 모델
+
+조직 트리의 클로저 테이블(ancestor, descendant, depth)입니다.
+모든 (조상, 자손) 쌍을 저장하여 하위/상위 조직 조회를 단일 인덱스 쿼리로 처리합니다.
+
+- 자기 자신 행 포함 (depth=0)
+- Organization INSERT/UPDATE(parent_id)/DELETE 시 이벤트 리스너로 자동 갱신
+- 기존 데이터는 OrganizationRepository.rebuild_closure() 또는
+  `flask rebuild-org-closure` 명령으로 재구성
+"""
+from sqlalchemy import event, exists, select
+from sqlalchemy.orm import aliased
+
+from app.database import db
+from .organization import Organization
+
+
+class OrganizationClosure(db.Model):
+    """조직 계층 클로저 테이블"""
+    __tablename__ = 'organization_closure'
+
+    ancestor_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), primary_key=True)
+    descendant_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), primary_key=True)
+    depth = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('idx_org_closure_descendant', 'descendant_id', 'depth'),
+    )
+
+    # 재구성 시 순환 데이터로 인한 무한 재귀 방지
+    MAX_DEPTH = 64
+
+    @classmethod
+    def active_path_clause(cls, link):
+        """link 경로(조상 제외, 자손 포함)에 비활성 조직이 없다는 조건
+
+        Organization.get_descendants()의 기존 동작(비활성 조직의 하위 트리 제외)을
+        단일 쿼리로 재현하기 위한 NOT EXISTS 절입니다.
+
+        Args:
+            link: OrganizationClosure alias (조상 -> 자손 행)
+        """
+        path = aliased(cls)
+        path_org = aliased(Organization)
+        return ~exists(
+            select(path.descendant_id)
+            .join(path_org, path_org.id == path.ancestor_id)
+            .where(
+                path.descendant_id == link.descendant_id,
+                path.depth < link.depth,
+                path_org.is_active == False,  # noqa: E712
+            )
+        )
+
+    @classmethod
+    def subtree_ids_select(cls, root_org_id: int, include_self: bool = True,
+                           active_only: bool = True):
+        """루트 조직 하위 트리의 조직 ID SELECT 구문
+
+        Args:
+            root_org_id: 루트 조직 ID
+            include_self: 루트 자신 포함 여부
+            active_only: 비활성 조직(및 그 하위 트리) 제외 여부
+
+        Returns:
+            descendant_id 단일 컬럼 Select (IN 서브쿼리로 사용 가능)
+        """
+        link = aliased(cls)
+        stmt = select(link.descendant_id).where(link.ancestor_id == root_org_id)
+        if not include_self:
+            stmt = stmt.where(link.depth > 0)
+        if active_only:
+            stmt = stmt.where(cls.active_path_clause(link))
+        return stmt
+
+    def __repr__(self):
+        return f'<OrganizationClosure {self.ancestor_id}->{self.descendant_id} ({self.depth})>'
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(Organization, 'after_insert')
+def on_organization_insert(mapper, connection, target):
+    """조직 생성 시 클로저 행 추가 (자기 자신 + 상위 조직 경로)"""
+    closure = OrganizationClosure.__table__
+    connection.execute(closure.insert().values(
+        ancestor_id=target.id, descendant_id=target.id, depth=0
+    ))
+    if target.parent_id:
+        connection.execute(closure.insert().from_select(
+            ['ancestor_id', 'descendant_id', 'depth'],
+            select(
+                closure.c.ancestor_id,
+                db.literal(target.id),
+                closure.c.depth + 1,
+            ).where(closure.c.descendant_id == target.parent_id)
+        ))
+
+
+@event.listens_for(Organization, 'after_update')
+def on_organization_update(mapper, connection, target):
+    """상위 조직 변경 시 하위 트리 전체의 클로저 경로 재연결"""
+    history = db.inspect(target).attrs.parent_id.history
+    if not history.has_changes():
+        return
+
+    closure = OrganizationClosure.__table__
+    subtree = closure.alias('subtree')
+    subtree_ids = select(subtree.c.descendant_id).where(subtree.c.ancestor_id == target.id)
+
+    # 1. 기존 상위 경로 분리 (하위 트리 내부 경로는 유지)
+    connection.execute(closure.delete().where(
+        closure.c.descendant_id.in_(subtree_ids),
+        closure.c.ancestor_id.notin_(subtree_ids),
+    ))
+
+    # 2. 새 상위 조직의 조상 x 하위 트리 연결
+    if target.parent_id:
+        parent_path = closure.alias('parent_path')
+        connection.execute(closure.insert().from_select(
+            ['ancestor_id', 'descendant_id', 'depth'],
+            select(
+                parent_path.c.ancestor_id,
+                subtree.c.descendant_id,
+                parent_path.c.depth + subtree.c.depth + 1,
+            ).select_from(
+                parent_path.join(subtree, db.true())  # 의도된 교차 조인
+            ).where(
+                parent_path.c.descendant_id == target.parent_id,
+                subtree.c.ancestor_id == target.id,
+            )
+        ))
+
+
+@event.listens_for(Organization, 'before_delete')
+def on_organization_delete(mapper, connection, target):
+    """조직 삭제 전 관련 클로저 행 제거 (FK 제약 충돌 방지)"""
+    closure = OrganizationClosure.__table__
+    connection.execute(closure.delete().where(db.or_(
+        closure.c.ancestor_id == target.id,
+        closure.c.descendant_id == target.id,
+    )))
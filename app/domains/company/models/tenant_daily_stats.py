@@ -0,0 +1,217 @@
+"""
+TenantDailyStats SQLAlchemy 모델
+
+테넌트(루트 조직)별 일별 직원 현황 스냅샷입니다.
+대시보드 현황 카드와 추이 차트는 직원 테이블 대신 이 스냅샷을 읽습니다.
+
+- 직원 생성/삭제/상태·소속 변경: Employee 이벤트에서 (소속, 상태, ±1)을 Session.info에 기록하고
+  after_flush에서 테넌트별 증감을 당일 행에 INSERT ... ON CONFLICT DO UPDATE로 반영
+  (당일 행이 없으면 가장 최근 스냅샷 값에서 시작, 스냅샷이 없으면 0)
+- 조직 상위 변경/법인 루트 변경처럼 직원 행 변경 없이 테넌트 범위가 바뀌는 경우와 기존 데이터:
+  `flask refresh-tenant-daily-stats`로 전체 재계산 (스케줄러 일 1회 이상)
+"""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import object_session
+
+from app.database import db
+from app.shared.constants.status import EmployeeStatus
+from app.shared.utils.sql_dialect import dialect_insert
+
+
+class TenantDailyStats(db.Model):
+    """테넌트 일별 직원 현황 스냅샷"""
+    __tablename__ = 'tenant_daily_stats'
+
+    # 루트 조직 삭제와 무관하게 이력 유지 (FK 없음)
+    root_organization_id = db.Column(db.Integer, primary_key=True)
+    stat_date = db.Column(db.Date, primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    active = db.Column(db.Integer, nullable=False, default=0)
+    on_leave = db.Column(db.Integer, nullable=False, default=0)
+    resigned = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Session.info 키: flush 대기 중인 직원 인원 증감 [(organization_id, company_id, status, delta)]
+    PENDING_KEY = 'tenant_daily_stats_pending'
+
+    # 상태 → 상태별 건수 컬럼 (total은 모든 상태)
+    STATUS_COLUMNS = {
+        EmployeeStatus.ACTIVE: 'active',
+        'on_leave': 'on_leave',
+        EmployeeStatus.RESIGNED: 'resigned',
+    }
+    COUNT_COLUMNS = ('total', 'active', 'on_leave', 'resigned')
+
+    @classmethod
+    def mark_employee(cls, target, organization_id: Optional[int], company_id: Optional[int],
+                      status: Optional[str], delta: int) -> None:
+        """직원 인원 증감 기록 (Employee 이벤트 리스너에서 호출)
+
+        Args:
+            target: 변경된 직원 인스턴스 (세션 확인용)
+            organization_id: 소속 조직 ID
+            company_id: 소속 법인 ID
+            status: 직원 상태
+            delta: 증감 인원 (+1/-1)
+        """
+        session = object_session(target)
+        if session is None:
+            return
+        session.info.setdefault(cls.PENDING_KEY, []).append((organization_id, company_id, status, delta))
+
+    @classmethod
+    def apply_pending(cls, session, connection) -> None:
+        """세션에 기록된 직원 인원 증감을 테넌트별 당일 행에 반영 (after_flush)"""
+        pending = session.info.pop(cls.PENDING_KEY, None)
+        if not pending:
+            return
+        roots = cls._resolve_roots(connection, pending)
+        deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(cls.COUNT_COLUMNS, 0))
+        for organization_id, company_id, status, delta in pending:
+            root_org_id = roots.get((organization_id, company_id))
+            if not root_org_id:
+                continue
+            counts = deltas[root_org_id]
+            counts['total'] += delta
+            column = cls.STATUS_COLUMNS.get(status)
+            if column:
+                counts[column] += delta
+        cls.apply_deltas(connection, {
+            root_org_id: counts for root_org_id, counts in deltas.items() if any(counts.values())
+        })
+
+    @staticmethod
+    def _resolve_roots(connection, pending) -> Dict[tuple, int]:
+        """(organization_id, company_id) → 테넌트 루트 조직 ID
+
+        직원 목록/대시보드와 같은 테넌트 범위(TENANT_SCOPE_MODE)를 사용합니다.
+        """
+        from app.domains.employee.repositories.employee_repository import employee_repository
+        from .company import Company
+        from .organization import Organization
+        from .organization_closure import OrganizationClosure
+
+        if employee_repository._use_company_scope():
+            company_ids = {company_id for _, company_id, _, _ in pending if company_id}
+            companies = Company.__table__
+            root_of = dict(connection.execute(
+                select(companies.c.id, companies.c.root_organization_id)
+                .where(companies.c.id.in_(company_ids))
+            ).all()) if company_ids else {}
+            return {(org_id, company_id): root_of.get(company_id)
+                    for org_id, company_id, _, _ in pending}
+
+        org_ids = {org_id for org_id, _, _, _ in pending if org_id}
+        closure = OrganizationClosure.__table__
+        orgs = Organization.__table__
+        root_of = dict(connection.execute(
+            select(closure.c.descendant_id, closure.c.ancestor_id)
+            .join(orgs, orgs.c.id == closure.c.ancestor_id)
+            .where(closure.c.descendant_id.in_(org_ids), orgs.c.parent_id.is_(None))
+        ).all()) if org_ids else {}
+        return {(org_id, company_id): root_of.get(org_id) for org_id, company_id, _, _ in pending}
+
+    @classmethod
+    def apply_deltas(cls, connection, deltas: Dict[int, Dict[str, int]],
+                     stat_date: Optional[date] = None) -> None:
+        """테넌트별 건수 증감을 기준일 행에 반영 (INSERT ... ON CONFLICT DO UPDATE)
+
+        기준일 행이 없으면 직전 스냅샷 값(없으면 0)에 증감을 더해 생성하므로
+        같은 테넌트의 첫 쓰기가 동시에 일어나도 기본 키 충돌 없이 합산됩니다.
+
+        Args:
+            connection: 현재 트랜잭션 커넥션
+            deltas: {루트 조직 ID: {'total', 'active', 'on_leave', 'resigned': 증감}}
+            stat_date: 기준일 (기본: 오늘)
+        """
+        stat_date = stat_date or date.today()
+        table = cls.__table__
+        now = datetime.utcnow()
+        for root_org_id in sorted(deltas):
+            counts = deltas[root_org_id]
+
+            def previous(column):
+                return func.coalesce(
+                    select(table.c[column])
+                    .where(table.c.root_organization_id == root_org_id,
+                           table.c.stat_date < stat_date)
+                    .order_by(table.c.stat_date.desc())
+                    .limit(1)
+                    .scalar_subquery(),
+                    0
+                ) + counts[column]
+
+            stmt = dialect_insert(connection, table).values(
+                root_organization_id=root_org_id, stat_date=stat_date, updated_at=now,
+                **{column: previous(column) for column in cls.COUNT_COLUMNS}
+            )
+            connection.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.root_organization_id, table.c.stat_date],
+                set_={'updated_at': now,
+                      **{column: table.c[column] + counts[column] for column in cls.COUNT_COLUMNS}},
+            ))
+
+    @classmethod
+    def refresh(cls, connection, root_org_ids: Iterable[int],
+                stat_date: Optional[date] = None) -> int:
+        """루트 조직별 스냅샷 행 재계산 (없으면 생성)
+
+        직원 현황은 EmployeeRepository.get_statistics(조건부 COUNT 단일 행)로 집계하므로
+        직원 목록/대시보드와 같은 테넌트 범위(TENANT_SCOPE_MODE)를 사용합니다.
+
+        Args:
+            connection: 현재 트랜잭션 커넥션
+            root_org_ids: 루트 조직 ID 목록
+            stat_date: 기준일 (기본: 오늘)
+
+        Returns:
+            int: 갱신한 행 수
+        """
+        from app.domains.employee.repositories.employee_repository import employee_repository
+
+        stat_date = stat_date or date.today()
+        table = cls.__table__
+        now = datetime.utcnow()
+        root_org_ids = sorted(set(root_org_ids))
+        for root_org_id in root_org_ids:
+            stats = employee_repository.get_statistics(root_org_id)
+            values = {
+                'total': stats['total'],
+                'active': stats[EmployeeStatus.ACTIVE],
+                'on_leave': stats['onLeave'],
+                'resigned': stats[EmployeeStatus.RESIGNED],
+            }
+            stmt = dialect_insert(connection, table).values(
+                root_organization_id=root_org_id, stat_date=stat_date, updated_at=now, **values
+            )
+            connection.execute(stmt.on_conflict_do_update(
+                index_elements=[table.c.root_organization_id, table.c.stat_date],
+                set_={'updated_at': now, **values},
+            ))
+        return len(root_org_ids)
+
+    def to_statistics(self) -> Dict:
+        """EmployeeRepository.get_statistics와 같은 형식"""
+        return {
+            'total': self.total,
+            EmployeeStatus.ACTIVE: self.active,
+            'onLeave': self.on_leave,
+            EmployeeStatus.RESIGNED: self.resigned,
+        }
+
+    def to_dict(self) -> Dict:
+        """추이 차트용 딕셔너리"""
+        return {
+            'date': self.stat_date.isoformat(),
+            'total': self.total,
+            'active': self.active,
+            'on_leave': self.on_leave,
+            'resigned': self.resigned,
+        }
+
+    def __repr__(self):
+        return f'<TenantDailyStats {self.root_organization_id} {self.stat_date} {self.total}>'
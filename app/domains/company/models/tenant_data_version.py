@@ -0,0 +1,211 @@
+"""
+TenantDataVersion SQLAlchemy 모델
+
+테넌트(루트 조직)별 목록 데이터 버전 카운터입니다.
+직원/조직/계약/분류 옵션(및 법인 정보, 계약 직원 계정, 명함 이미지, 직원 이력) 변경이 flush될 때 해당 테넌트의 버전을 한 번 증가시키며,
+목록 화면과 API는 (테넌트, 버전)으로 강한 ETag를 만들어 변경이 없으면 조회 없이 304를 반환합니다.
+
+- 모델 이벤트: 변경 행의 organization_id / company_id / employee_id를 Session.info에 기록
+- after_flush: 기록된 ID를 루트 조직으로 해석하여 루트별 1회 증가 (같은 트랜잭션)
+  및 직원 인원 증감을 당일 현황 스냅샷(tenant_daily_stats)에 반영
+"""
+from datetime import datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.database import db
+from app.shared.utils.sql_dialect import dialect_insert
+from .company import Company
+from .organization import Organization
+from .org_scope_version import _root_ids_of
+from .tenant_daily_stats import TenantDailyStats
+
+
+class TenantDataVersion(db.Model):
+    """테넌트 목록 데이터 버전"""
+    __tablename__ = 'tenant_data_versions'
+
+    # 루트 조직 삭제와 무관하게 유지 (FK 없음)
+    root_organization_id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Session.info 키: flush 대기 중인 변경 ID 집합 / 커밋 전 버전이 증가한 루트 조직 ID 집합
+    PENDING_KEY = 'tenant_data_pending'
+    DIRTY_KEY = 'tenant_data_dirty'
+
+    # 변경 ID 종류
+    ROOTS = 'root_ids'
+    ORGANIZATIONS = 'org_ids'
+    COMPANIES = 'company_ids'
+    EMPLOYEES = 'employee_ids'
+    # 직원 이력/인사기록(학력, 근로계약 등) 변경 직원 (인사카드 섹션 조각, 현황 스냅샷 무관)
+    RELATIONS = 'relation_employee_ids'
+    # 공용 항목(company_id 없음) 변경 → 전체 테넌트
+    ALL_TENANTS = 'all'
+
+    @classmethod
+    def get_version(cls, root_org_id: int) -> int:
+        """현재 버전 조회 (행이 없으면 0)"""
+        version = db.session.execute(
+            select(cls.version).where(cls.root_organization_id == root_org_id)
+        ).scalar()
+        return version or 0
+
+    @classmethod
+    def bump(cls, connection, root_org_ids) -> None:
+        """루트 조직별 버전 증가 (행이 없으면 생성, INSERT ... ON CONFLICT DO UPDATE)
+
+        동시에 첫 행을 만드는 트랜잭션도 기본 키 충돌 없이 증가합니다.
+
+        Args:
+            connection: 현재 트랜잭션 커넥션
+            root_org_ids: 루트 조직 ID 목록 (정렬된 순서로 잠금)
+        """
+        root_org_ids = list(root_org_ids)
+        if not root_org_ids:
+            return
+        table = cls.__table__
+        now = datetime.utcnow()
+        stmt = dialect_insert(connection, table).values([
+            {'root_organization_id': root_org_id, 'version': 1, 'updated_at': now}
+            for root_org_id in root_org_ids
+        ])
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.root_organization_id],
+            set_={'version': table.c.version + 1, 'updated_at': now},
+        ))
+
+    @classmethod
+    def mark(cls, target, kind: str, *ids) -> None:
+        """변경 대상 기록 (모델 이벤트 리스너에서 호출)
+
+        Args:
+            target: 변경된 모델 인스턴스 (세션 확인용)
+            kind: ROOTS / ORGANIZATIONS / COMPANIES / EMPLOYEES / RELATIONS / ALL_TENANTS
+            *ids: 변경 ID (None 무시)
+        """
+        cls.mark_session(object_session(target), kind, *ids)
+
+    @classmethod
+    def mark_session(cls, session, kind: str, *ids) -> None:
+        """세션에 변경 대상 기록 (모델 이벤트가 없는 일괄 UPDATE/DELETE용)
+
+        Args:
+            session: 변경을 flush할 세션 (None이면 무시)
+            kind: mark()와 같음
+            *ids: 변경 ID (None 무시)
+        """
+        if session is None:
+            return
+        pending = session.info.setdefault(cls.PENDING_KEY, {})
+        if kind == cls.ALL_TENANTS:
+            pending[kind] = True
+            return
+        pending.setdefault(kind, set()).update(i for i in ids if i)
+
+    def __repr__(self):
+        return f'<TenantDataVersion {self.root_organization_id} v{self.version}>'
+
+
+def _resolve_root_ids(connection, pending: dict) -> set:
+    """기록된 변경 ID → 루트 조직 ID 집합"""
+    companies = Company.__table__
+    if pending.get(TenantDataVersion.ALL_TENANTS):
+        rows = connection.execute(
+            select(companies.c.root_organization_id)
+            .where(companies.c.root_organization_id.isnot(None))
+        )
+        return set(rows.scalars())
+
+    root_ids = set(pending.get(TenantDataVersion.ROOTS, ()))
+    org_ids = set(pending.get(TenantDataVersion.ORGANIZATIONS, ()))
+    company_ids = set(pending.get(TenantDataVersion.COMPANIES, ()))
+
+    employee_ids = (set(pending.get(TenantDataVersion.EMPLOYEES, ()))
+                    | set(pending.get(TenantDataVersion.RELATIONS, ())))
+    if employee_ids:
+        from app.domains.employee.models import Employee
+        employees = Employee.__table__
+        for org_id, company_id in connection.execute(
+            select(employees.c.organization_id, employees.c.company_id)
+            .where(employees.c.id.in_(employee_ids))
+        ):
+            org_ids.add(org_id)
+            company_ids.add(company_id)
+
+    company_ids.discard(None)
+    if company_ids:
+        rows = connection.execute(
+            select(companies.c.root_organization_id)
+            .where(companies.c.id.in_(company_ids))
+        )
+        root_ids.update(root_id for root_id in rows.scalars() if root_id)
+
+    root_ids.update(_root_ids_of(connection, org_ids))
+    return root_ids
+
+
+# ===== SQLAlchemy Event Listeners =====
+# 조직: 클로저 경로 기준으로 즉시 루트 해석 (삭제는 클로저 행 삭제 전)
+
+@event.listens_for(Organization, 'after_insert')
+@event.listens_for(Organization, 'after_update')
+def on_organization_change(mapper, connection, target):
+    """조직 생성/수정 시 테넌트 기록 (상위 조직 변경 시 이전 테넌트 포함)"""
+    session = object_session(target)
+    if session is None or not session.is_modified(target, include_collections=False):
+        return
+    org_ids = [target.id] + list(db.inspect(target).attrs.parent_id.history.deleted or [])
+    TenantDataVersion.mark(target, TenantDataVersion.ROOTS, *_root_ids_of(connection, org_ids))
+
+
+@event.listens_for(Organization, 'before_delete', insert=True)
+def on_organization_delete(mapper, connection, target):
+    """조직 삭제 시 테넌트 기록"""
+    TenantDataVersion.mark(target, TenantDataVersion.ROOTS, *_root_ids_of(connection, [target.id]))
+
+
+@event.listens_for(Company, 'after_update')
+def on_company_update(mapper, connection, target):
+    """법인 정보 수정 시 테넌트 기록 (직원 목록 명함 뷰)"""
+    TenantDataVersion.mark(target, TenantDataVersion.COMPANIES, target.id)
+
+
+@event.listens_for(Session, 'after_flush')
+def on_session_flush(session, flush_context):
+    """flush된 변경의 테넌트 버전 증가 (루트별 1회) 및 당일 현황 스냅샷 증감"""
+    if session.info.get(TenantDailyStats.PENDING_KEY):
+        TenantDailyStats.apply_pending(session, session.connection())
+    apply_pending_changes(session)
+
+
+def apply_pending_changes(session) -> None:
+    """세션에 기록된 변경의 테넌트 버전 증가
+
+    after_flush에서 호출되며, 모델 이벤트 없이 mark_session()으로 기록한
+    일괄 UPDATE/DELETE는 실행 직후 직접 호출합니다. (flush할 객체가 없으면 after_flush 미발생)
+    """
+    pending = session.info.pop(TenantDataVersion.PENDING_KEY, None)
+    if not pending:
+        return
+    connection = session.connection()
+    root_ids = _resolve_root_ids(connection, pending)
+    if root_ids:
+        TenantDataVersion.bump(connection, sorted(root_ids))
+        session.info.setdefault(TenantDataVersion.DIRTY_KEY, set()).update(root_ids)
+
+
+@event.listens_for(Session, 'after_commit')
+def on_session_commit(session):
+    """커밋된 버전 증가 기록 제거"""
+    session.info.pop(TenantDataVersion.DIRTY_KEY, None)
+
+
+@event.listens_for(Session, 'after_rollback')
+def on_session_rollback(session):
+    """flush되지 않은 변경/롤백된 버전 증가 기록 제거"""
+    session.info.pop(TenantDataVersion.PENDING_KEY, None)
+    session.info.pop(TenantDataVersion.DIRTY_KEY, None)
+    session.info.pop(TenantDailyStats.PENDING_KEY, None)
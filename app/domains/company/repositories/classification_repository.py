@@ -17,6 +17,9 @@ from app.shared.repositories.base_repository import BaseRepository
 class ClassificationOptionsRepository(BaseRepository[ClassificationOption]):
     """분류 옵션 저장소"""
 
+    # 모델 이벤트가 법인 테넌트 버전(분류 옵션 변경)을 기록하므로 일괄 쓰기 불가
+    bulk_write_supported = False
+
     def __init__(self):
         super().__init__(ClassificationOption)
 
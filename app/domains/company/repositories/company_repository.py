@@ -14,6 +14,9 @@ from app.shared.repositories.base_repository import BaseRepository
 class CompanyRepository(BaseRepository[Company]):
     """법인(기업) Repository"""
 
+    # 모델 이벤트가 법인 테넌트 버전(루트 조직 기준)을 기록하므로 일괄 쓰기 불가
+    bulk_write_supported = False
+
     def __init__(self):
         super().__init__(Company)
 
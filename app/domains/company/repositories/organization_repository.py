@@ -3,12 +3,19 @@ Organization Repository
 
 조직 데이터의 CRUD 및 트리 구조 관련 기능을 제공합니다.
 멀티테넌시: root_organization_id를 기준으로 해당 조직과 하위 조직만 접근 가능합니다.
+트리 조회는 organization_closure 테이블(모델 이벤트로 자동 갱신)을 사용합니다.
+트리/목록 응답은 조직+조직장을 일괄 조회한 뒤 level/path/full_code를 메모리에서 O(n)으로 계산합니다.
 
 Phase 7: 도메인 중심 마이그레이션 완료
 """
+import copy
+from datetime import date
 from typing import List, Optional, Dict, Set
+from sqlalchemy.orm import joinedload
 from app.database import db
-from app.domains.company.models import Organization
+from app.domains.company.models import (
+    Organization, OrganizationClosure, OrgHeadcount, TenantDailyStats, TenantDataVersion
+)
 from app.shared.repositories.base_repository import BaseRepository
 from app.shared.repositories.mixins import TenantFilterMixin
 
@@ -16,6 +23,9 @@ from app.shared.repositories.mixins import TenantFilterMixin
 class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
     """조직 저장소 - 멀티테넌시 지원 (TenantFilterMixin)"""
 
+    # 모델 이벤트가 조직 클로저(organization_closure)를 유지하므로 일괄 쓰기 불가
+    bulk_write_supported = False
+
     def __init__(self):
         super().__init__(Organization)
 
@@ -39,88 +49,208 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
         """특정 조직이 해당 테넌트 소속인지 확인"""
         return self.verify_tenant_ownership(org_id, root_organization_id)
 
+    # ========================================
+    # 메모리 트리 조립 (일괄 조회)
+    # ========================================
+
+    def _load_organizations(self, root_organization_id: int = None,
+                            include_inactive: bool = False) -> List[Organization]:
+        """테넌트 조직 + 조직장 일괄 조회 (단일 쿼리, sort_order 순)"""
+        query = Organization.query.options(joinedload(Organization.manager))
+        if not include_inactive:
+            query = query.filter(Organization.is_active == True)  # noqa: E712
+        query = self._filter_by_tenant(query, root_organization_id)
+        return query.order_by(Organization.sort_order, Organization.id).all()
+
+    def _build_tree_index(self, orgs: List[Organization]) -> Dict[int, Dict]:
+        """조직별 level/path/full_code 메모리 계산
+
+        로드된 조직 집합 안에서는 parent_id로 상위 정보를 이어받고,
+        상위 조직이 집합 밖에 있는 경계 조직만 organization_closure로 한 번에 조회합니다.
+
+        Args:
+            orgs: Organization 모델 목록
+
+        Returns:
+            {org_id: {'level', 'path', 'full_code', 'code_chain'}}
+        """
+        by_id = {org.id: org for org in orgs}
+        boundary_ids = [org.id for org in orgs if org.parent_id and org.parent_id not in by_id]
+
+        outer_ancestors: Dict[int, List] = {}
+        if boundary_ids:
+            rows = db.session.query(
+                OrganizationClosure.descendant_id, Organization.name, Organization.code
+            ).join(
+                Organization, Organization.id == OrganizationClosure.ancestor_id
+            ).filter(
+                OrganizationClosure.descendant_id.in_(boundary_ids),
+                OrganizationClosure.depth > 0
+            ).order_by(
+                OrganizationClosure.descendant_id, OrganizationClosure.depth.desc()
+            ).all()
+            for descendant_id, name, code in rows:
+                outer_ancestors.setdefault(descendant_id, []).append((name, code))
+
+        index: Dict[int, Dict] = {}
+        for org in orgs:
+            # 아직 계산되지 않은 상위 체인 수집 (순환 데이터 방지)
+            chain = []
+            current = org
+            while current is not None and current.id not in index and current not in chain:
+                chain.append(current)
+                current = by_id.get(current.parent_id)
+
+            for node in reversed(chain):
+                parent_info = index.get(node.parent_id)
+                if parent_info:
+                    level = parent_info['level'] + 1
+                    path = f"{parent_info['path']} > {node.name}"
+                    ancestor_codes = parent_info['code_chain']
+                else:
+                    ancestors = outer_ancestors.get(node.id, [])
+                    level = len(ancestors)
+                    path = ' > '.join([name for name, _ in ancestors] + [node.name])
+                    ancestor_codes = [code for _, code in ancestors if code]
+
+                index[node.id] = {
+                    'level': level,
+                    'path': path,
+                    'full_code': '-'.join(ancestor_codes + [node.code]) if node.code else None,
+                    'code_chain': ancestor_codes + [node.code] if node.code else ancestor_codes,
+                }
+
+        return index
+
+    def _to_dict_list(self, orgs: List[Organization], include_path: bool = False) -> List[Dict]:
+        """조직 목록 Dict 변환 (계층 정보 일괄 계산)"""
+        index = self._build_tree_index(orgs)
+        return [org.to_dict(include_path=include_path, tree_info=index[org.id]) for org in orgs]
+
+    def _assemble_tree(self, orgs: List[Organization], root_organization_id: int = None):
+        """로드된 조직으로 (루트 목록, 부모별 자식 맵) 구성"""
+        children_map: Dict[Optional[int], List[Organization]] = {}
+        for org in orgs:
+            children_map.setdefault(org.parent_id, []).append(org)
+
+        if root_organization_id:
+            roots = [org for org in orgs if org.id == root_organization_id]
+        else:
+            roots = children_map.get(None, [])
+        return roots, children_map
+
     def get_by_code(self, code: str, root_organization_id: int = None) -> Optional[Organization]:
         """조직 코드로 조회"""
         query = Organization.query.filter_by(code=code, is_active=True)
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            query = query.filter(Organization.id.in_(allowed_ids))
+        query = self._filter_by_tenant(query, root_organization_id)
         return query.first()
 
     def get_root_organizations(self, root_organization_id: int = None) -> List[Dict]:
         """최상위 조직 목록 (멀티테넌시: 해당 회사의 루트 조직)"""
+        query = Organization.query.options(joinedload(Organization.manager))
         if root_organization_id:
-            org = Organization.query.filter_by(
-                id=root_organization_id, is_active=True
-            ).first()
-            return [org.to_dict()] if org else []
+            org = query.filter_by(id=root_organization_id, is_active=True).first()
+            return self._to_dict_list([org]) if org else []
 
-        orgs = Organization.query.filter_by(
+        orgs = query.filter_by(
             parent_id=None, is_active=True
         ).order_by(Organization.sort_order).all()
-        return [org.to_dict() for org in orgs]
+        return self._to_dict_list(orgs)
 
     def get_children(self, parent_id: int, root_organization_id: int = None) -> List[Dict]:
         """특정 조직의 하위 조직 목록"""
         if root_organization_id and not self.verify_ownership(parent_id, root_organization_id):
             return []
 
-        orgs = Organization.query.filter_by(
+        query = Organization.query.options(joinedload(Organization.manager)).filter_by(
             parent_id=parent_id, is_active=True
-        ).order_by(Organization.sort_order).all()
-
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            orgs = [org for org in orgs if org.id in allowed_ids]
+        )
+        query = self._filter_by_tenant(query, root_organization_id)
+        orgs = query.order_by(Organization.sort_order).all()
 
-        return [org.to_dict() for org in orgs]
+        return self._to_dict_list(orgs)
 
     def get_tree(self, root_organization_id: int = None) -> List[Dict]:
-        """조직 트리 구조 반환 (멀티테넌시: 해당 회사의 루트 조직부터)"""
-        if root_organization_id:
-            root_org = Organization.query.filter_by(
-                id=root_organization_id, is_active=True
-            ).first()
-            return [root_org.to_dict(include_children=True)] if root_org else []
+        """조직 트리 구조 반환 (멀티테넌시: 해당 회사의 루트 조직부터)
 
-        root_orgs = Organization.query.filter_by(
-            parent_id=None, is_active=True
-        ).order_by(Organization.sort_order).all()
-        return [org.to_dict(include_children=True) for org in root_orgs]
+        활성 조직과 조직장을 일괄 조회한 뒤 메모리에서 트리를 조립합니다.
+        """
+        orgs = self._load_organizations(root_organization_id)
+        index = self._build_tree_index(orgs)
+        roots, children_map = self._assemble_tree(orgs, root_organization_id)
+
+        def build_node(org: Organization) -> Dict:
+            data = org.to_dict(tree_info=index[org.id])
+            data['children'] = [build_node(child) for child in children_map.get(org.id, [])]
+            return data
+
+        return [build_node(org) for org in roots]
+
+    def get_tree_nodes(self, root_organization_id: int = None) -> List[Dict]:
+        """트리 위젯용 플랫 노드 목록 (to_tree_node, 하위 조직 여부 메모리 계산)"""
+        orgs = self._load_organizations(root_organization_id)
+        _, children_map = self._assemble_tree(orgs, root_organization_id)
+        return [org.to_tree_node(has_children=org.id in children_map) for org in orgs]
+
+    def get_selector_tree(self, root_organization_id: int = None) -> List[Dict]:
+        """조직 선택기(tree-selector.js)용 경량 트리 (org_scope_cache 캐시)
+
+        Returns:
+            [{'id', 'name', 'code', 'org_type', 'children': [...]}, ...]
+        """
+        from app.shared.utils.org_scope_cache import org_scope_cache
+        return org_scope_cache.get_or_load(
+            'selector_tree', root_organization_id,
+            lambda: self._load_selector_tree(root_organization_id), copy=copy.deepcopy
+        )
+
+    def _load_selector_tree(self, root_organization_id: int = None) -> List[Dict]:
+        """조직 선택기용 경량 트리 조회 (조직 컬럼만 단일 쿼리)"""
+        orgs = Organization.query.filter(
+            Organization.is_active == True  # noqa: E712
+        )
+        orgs = self._filter_by_tenant(orgs, root_organization_id).with_entities(
+            Organization.id, Organization.parent_id, Organization.name,
+            Organization.code, Organization.org_type,
+        ).order_by(Organization.sort_order, Organization.id).all()
+        roots, children_map = self._assemble_tree(orgs, root_organization_id)
+
+        def build_node(org) -> Dict:
+            return {
+                'id': org.id,
+                'name': org.name,
+                'code': org.code,
+                'org_type': org.org_type,
+                'children': [build_node(child) for child in children_map.get(org.id, [])],
+            }
+
+        return [build_node(org) for org in roots]
 
     def get_flat_list(self, include_inactive=False, root_organization_id: int = None) -> List[Dict]:
         """전체 조직 목록 (플랫 리스트, 경로 포함)"""
-        query = Organization.query
+        query = Organization.query.options(joinedload(Organization.manager))
         if not include_inactive:
             query = query.filter_by(is_active=True)
 
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            if allowed_ids:
-                query = query.filter(Organization.id.in_(allowed_ids))
-            else:
-                return []
+        query = self._filter_by_tenant(query, root_organization_id)
 
         orgs = query.order_by(
             Organization.parent_id.nullsfirst(),
             Organization.sort_order
         ).all()
 
-        return [org.to_dict(include_path=True) for org in orgs]
+        return self._to_dict_list(orgs, include_path=True)
 
     def get_by_type(self, org_type: str, root_organization_id: int = None) -> List[Dict]:
         """조직 유형별 조회"""
-        query = Organization.query.filter_by(org_type=org_type, is_active=True)
+        query = Organization.query.options(joinedload(Organization.manager)).filter_by(
+            org_type=org_type, is_active=True
+        )
 
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            if allowed_ids:
-                query = query.filter(Organization.id.in_(allowed_ids))
-            else:
-                return []
+        query = self._filter_by_tenant(query, root_organization_id)
 
         orgs = query.order_by(Organization.sort_order).all()
-        return [org.to_dict() for org in orgs]
+        return self._to_dict_list(orgs)
 
     def get_departments(self, root_organization_id: int = None) -> List[Dict]:
         """부서 목록 조회"""
@@ -138,7 +268,7 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
         if not org:
             return []
         ancestors = org.get_ancestors()
-        return [a.to_dict() for a in ancestors]
+        return self._to_dict_list(ancestors)
 
     def get_descendants(self, org_id: int, root_organization_id: int = None) -> List[Dict]:
         """하위 조직 목록 조회 (모든 자손)"""
@@ -148,7 +278,7 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
         if not org:
             return []
         descendants = org.get_descendants()
-        return [d.to_dict() for d in descendants]
+        return self._to_dict_list(descendants)
 
     def create_organization(self, name: str, org_type: str,
                             parent_id: int = None, code: str = None,
@@ -204,6 +334,8 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
                 if root_organization_id and new_parent_id:
                     if not self.verify_ownership(new_parent_id, root_organization_id):
                         raise ValueError("상위 조직이 현재 회사에 속하지 않습니다.")
+                if new_parent_id and self.is_in_subtree(new_parent_id, org_id):
+                    raise ValueError("하위 조직을 상위 조직으로 지정할 수 없습니다.")
                 org.parent_id = new_parent_id
         if 'manager_id' in data:
             org.manager_id = data['manager_id']
@@ -240,9 +372,8 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
             if not new_parent:
                 return False
 
-            # 순환 참조 체크
-            descendants = org.get_descendants()
-            if new_parent in descendants:
+            # 순환 참조 체크 (비활성 포함 전체 하위 트리)
+            if self.is_in_subtree(new_parent_id, org_id):
                 return False
 
         org.parent_id = new_parent_id
@@ -256,6 +387,130 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
         db.session.commit()
         return True
 
+    def is_in_subtree(self, org_id: int, root_org_id: int) -> bool:
+        """org_id가 root_org_id의 하위 트리(자기 자신 포함)에 속하는지 확인
+
+        활성 여부와 무관하게 organization_closure를 단일 조회합니다 (순환 참조 방지용).
+        """
+        return db.session.query(
+            OrganizationClosure.query.filter_by(
+                ancestor_id=root_org_id, descendant_id=org_id
+            ).exists()
+        ).scalar()
+
+    def rebuild_closure(self, commit: bool = True) -> int:
+        """organization_closure 전체 재구성 (parent_id 기준)
+
+        마이그레이션 이전 데이터나 ORM 외부에서 변경된 트리를 복구할 때 사용합니다.
+
+        Args:
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+
+        Returns:
+            생성된 클로저 행 수
+        """
+        orgs = Organization.__table__
+        closure = OrganizationClosure.__table__
+
+        tree = db.select(
+            orgs.c.id.label('ancestor_id'),
+            orgs.c.id.label('descendant_id'),
+            db.literal(0).label('depth'),
+        ).cte('org_tree', recursive=True)
+        child = orgs.alias('child')
+        tree = tree.union_all(
+            db.select(tree.c.ancestor_id, child.c.id, tree.c.depth + 1).where(
+                child.c.parent_id == tree.c.descendant_id,
+                tree.c.depth < OrganizationClosure.MAX_DEPTH,
+            )
+        )
+
+        db.session.execute(closure.delete())
+        db.session.execute(closure.insert().from_select(
+            ['ancestor_id', 'descendant_id', 'depth'],
+            db.select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth)
+        ))
+        count = db.session.query(db.func.count()).select_from(closure).scalar()
+        if commit:
+            db.session.commit()
+        return count
+
+    def rebuild_headcounts(self, commit: bool = True) -> int:
+        """org_headcount 전체 재구성 (employees + organization_closure 기준)
+
+        마이그레이션 이전 데이터나 벌크 UPDATE로 이벤트가 생략된 경우 사용합니다.
+
+        Args:
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+
+        Returns:
+            생성된 롤업 행 수
+        """
+        from app.domains.employee.models import Employee
+
+        employees = Employee.__table__
+        closure = OrganizationClosure.__table__
+        headcount = OrgHeadcount.__table__
+        status = db.func.coalesce(employees.c.status, OrgHeadcount.STATUS_NONE)
+
+        db.session.execute(headcount.delete())
+        db.session.execute(headcount.insert().from_select(
+            ['organization_id', 'status', 'direct_count', 'subtree_count'],
+            db.select(
+                closure.c.ancestor_id,
+                status,
+                db.func.sum(db.case((closure.c.depth == 0, 1), else_=0)),
+                db.func.count(),
+            ).select_from(
+                employees.join(closure, closure.c.descendant_id == employees.c.organization_id)
+            ).group_by(closure.c.ancestor_id, status)
+        ))
+        count = db.session.query(db.func.count()).select_from(headcount).scalar()
+        if commit:
+            db.session.commit()
+        return count
+
+    def refresh_daily_stats(self, stat_date: date = None, commit: bool = True) -> int:
+        """전체 테넌트의 일별 현황 스냅샷(tenant_daily_stats) 생성/보정
+
+        변경이 없는 날도 추이 차트에 행이 있도록 스케줄러에서 일 1회 이상 실행합니다.
+        (현재 직원 현황을 stat_date 행으로 기록하므로 과거 일자 재계산 용도는 아님)
+        스냅샷 행은 모델 이벤트 없이 기록되므로 테넌트 데이터 버전도 함께 증가시킵니다.
+
+        Args:
+            stat_date: 기준일 (기본: 오늘)
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+
+        Returns:
+            갱신된 테넌트 수
+        """
+        root_ids = db.session.execute(
+            db.select(Organization.id).where(Organization.parent_id.is_(None))
+        ).scalars().all()
+        connection = db.session.connection()
+        count = TenantDailyStats.refresh(connection, root_ids, stat_date)
+        TenantDataVersion.bump(connection, root_ids)
+        if commit:
+            db.session.commit()
+        return count
+
+    def find_daily_stats(self, root_organization_id: int, start_date: date,
+                         end_date: date = None) -> List[TenantDailyStats]:
+        """테넌트 일별 현황 스냅샷 조회 (기준일 오름차순)
+
+        Args:
+            root_organization_id: 루트 조직 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함, 기본: 제한 없음)
+        """
+        query = TenantDailyStats.query.filter(
+            TenantDailyStats.root_organization_id == root_organization_id,
+            TenantDailyStats.stat_date >= start_date,
+        )
+        if end_date:
+            query = query.filter(TenantDailyStats.stat_date <= end_date)
+        return query.order_by(TenantDailyStats.stat_date).all()
+
     def reorder_children(self, parent_id: int, org_ids: List[int],
                          root_organization_id: int = None) -> bool:
         """하위 조직 순서 변경 (멀티테넌시 적용)"""
@@ -344,15 +599,10 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
             )
         )
 
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            if allowed_ids:
-                q = q.filter(Organization.id.in_(allowed_ids))
-            else:
-                return []
+        q = self._filter_by_tenant(q, root_organization_id)
 
-        orgs = q.order_by(Organization.name).all()
-        return [org.to_dict(include_path=True) for org in orgs]
+        orgs = q.options(joinedload(Organization.manager)).order_by(Organization.name).all()
+        return self._to_dict_list(orgs, include_path=True)
 
     def code_exists(self, code: str, exclude_id: int = None,
                     root_organization_id: int = None) -> bool:
@@ -361,42 +611,77 @@ class OrganizationRepository(BaseRepository[Organization], TenantFilterMixin):
         if exclude_id:
             query = query.filter(Organization.id != exclude_id)
 
-        if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            if allowed_ids:
-                query = query.filter(Organization.id.in_(allowed_ids))
-            else:
-                return False
+        query = self._filter_by_tenant(query, root_organization_id)
 
         return query.first() is not None
 
     def get_member_counts(self, root_organization_id: int = None) -> Dict[int, int]:
         """조직별 소속인원 수 집계 (멀티테넌시 적용)
 
+        org_headcount 롤업에서 조직별 직접 소속 인원(퇴사자 제외)을 읽습니다.
+
         Args:
             root_organization_id: 루트 조직 ID
 
         Returns:
             Dict[org_id, member_count]
         """
-        from sqlalchemy import func
-        from app.domains.employee.models import Employee
+        query = self._working_headcount_query(OrgHeadcount.direct_count)
+        if root_organization_id:
+            query = self.apply_tenant_filter(query, OrgHeadcount.organization_id, root_organization_id)
 
-        # 서브쿼리로 조직별 직원 수 집계 (status가 resigned가 아닌 직원만)
-        query = db.session.query(
-            Employee.organization_id,
-            func.count(Employee.id).label('member_count')
-        ).filter(
-            db.or_(Employee.status != 'resigned', Employee.status.is_(None))
-        )
+        counts = query.group_by(OrgHeadcount.organization_id).all()
+        return {org_id: count for org_id, count in counts if count}
 
+    def get_member_count(self, org_id: int, root_organization_id: int = None,
+                         include_descendants: bool = False) -> int:
+        """단일 조직 소속인원 수 (org_headcount 롤업, 퇴사자 제외)
+
+        Args:
+            org_id: 조직 ID
+            root_organization_id: 루트 조직 ID (테넌트 외 조직이면 0)
+            include_descendants: True면 하위 조직 인원 포함
+
+        Returns:
+            인원 수
+        """
+        column = OrgHeadcount.subtree_count if include_descendants else OrgHeadcount.direct_count
+        query = self._working_headcount_query(column).filter(OrgHeadcount.organization_id == org_id)
         if root_organization_id:
-            allowed_ids = self._get_descendant_ids(root_organization_id)
-            if allowed_ids:
-                query = query.filter(Employee.organization_id.in_(allowed_ids))
+            query = self.apply_tenant_filter(query, OrgHeadcount.organization_id, root_organization_id)
+        row = query.group_by(OrgHeadcount.organization_id).first()
+        return row[1] if row else 0
 
-        counts = query.group_by(Employee.organization_id).all()
-        return {org_id: count for org_id, count in counts if org_id is not None}
+    def get_headcounts(self, org_ids: List[int]) -> Dict[int, Dict]:
+        """조직별 상태별 인원 (org_headcount 롤업)
+
+        Args:
+            org_ids: 조직 ID 목록
+
+        Returns:
+            {org_id: {'direct': {status: n}, 'subtree': {status: n}}}
+            (상태가 없는 직원은 status '' 로 집계)
+        """
+        if not org_ids:
+            return {}
+        rows = OrgHeadcount.query.filter(OrgHeadcount.organization_id.in_(org_ids)).all()
+
+        result: Dict[int, Dict] = {}
+        for row in rows:
+            entry = result.setdefault(row.organization_id, {'direct': {}, 'subtree': {}})
+            if row.direct_count:
+                entry['direct'][row.status] = row.direct_count
+            if row.subtree_count:
+                entry['subtree'][row.status] = row.subtree_count
+        return result
+
+    def _working_headcount_query(self, column):
+        """조직별 재직(퇴사 제외) 인원 합계 쿼리 (organization_id, count)"""
+        from app.shared.constants.status import EmployeeStatus
+        return db.session.query(
+            OrgHeadcount.organization_id,
+            db.func.sum(column).label('member_count')
+        ).filter(OrgHeadcount.status != EmployeeStatus.RESIGNED)
 
 
 # 싱글톤 인스턴스
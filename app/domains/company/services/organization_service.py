@@ -75,6 +75,17 @@ class OrganizationService:
         add_counts_recursive(tree)
         return tree
 
+    def get_selector_tree(self, root_organization_id: int = None) -> List[Dict]:
+        """조직 선택기용 경량 트리 조회
+
+        Args:
+            root_organization_id: 루트 조직 ID
+
+        Returns:
+            id/name/code/org_type/children만 포함한 조직 트리 목록
+        """
+        return self.organization_repo.get_selector_tree(root_organization_id=root_organization_id)
+
     def get_flat_list(self, root_organization_id: int = None) -> List[Dict]:
         """조직 평탄화 목록 조회
 
@@ -107,8 +118,7 @@ class OrganizationService:
         Returns:
             소속인원 수
         """
-        member_counts = self.organization_repo.get_member_counts(root_organization_id)
-        return member_counts.get(org_id, 0)
+        return self.organization_repo.get_member_count(org_id, root_organization_id)
 
     def get_by_id(self, org_id: int) -> Optional[Dict]:
         """조직 ID로 조회 (Dict 반환)
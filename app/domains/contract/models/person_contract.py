@@ -9,6 +9,9 @@ Phase 2 Migration: app/domains/contract/models/로 이동
 SSOT: FieldOptions.CONTRACT_TYPE 참조
 """
 from datetime import datetime
+
+from sqlalchemy import event
+
 from app.database import db
 from app.shared.constants.field_options import FieldOptions
 from app.shared.constants.status import ContractStatus
@@ -325,3 +328,14 @@ class PersonCorporateContract(db.Model):
     def is_pending(self):
         """대기 중 여부"""
         return self.status == self.STATUS_REQUESTED
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(PersonCorporateContract, 'after_insert')
+@event.listens_for(PersonCorporateContract, 'after_update')
+@event.listens_for(PersonCorporateContract, 'after_delete')
+def on_contract_change(mapper, connection, target):
+    """계약 변경 시 법인 테넌트의 목록 데이터 버전 갱신 기록"""
+    from app.domains.company.models import TenantDataVersion
+    TenantDataVersion.mark(target, TenantDataVersion.COMPANIES, target.company_id)
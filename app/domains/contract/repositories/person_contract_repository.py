@@ -19,6 +19,9 @@ from app.shared.repositories.base_repository import BaseRepository
 class PersonContractRepository(BaseRepository[PersonCorporateContract]):
     """개인-법인 계약 관리 Repository"""
 
+    # 모델 이벤트가 법인 테넌트 버전(company_id 기준)을 기록하므로 일괄 쓰기 불가
+    bulk_write_supported = False
+
     def __init__(self):
         super().__init__(PersonCorporateContract)
 
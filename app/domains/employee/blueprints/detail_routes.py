@@ -10,7 +10,7 @@ from flask import Blueprint, render_template, redirect, url_for, flash, session
 from app.shared.constants.session_keys import SessionKeys, UserRole, AccountType
 from app.shared.utils.decorators import login_required, manager_or_admin_required
 from app.shared.utils.object_helpers import safe_get
-from app.domains.employee.services import employee_service
+from app.domains.employee.services import employee_relation_loader, employee_service
 from app.domains.contract.services.contract_service import contract_service
 from app.domains.attachment.constants import AttachmentCategory
 from .helpers import verify_employee_access
@@ -88,12 +88,15 @@ def _render_employee_full_view(employee_id, employee):
     """
     from app.domains.user.services.user_service import user_service
 
-    # 통합 데이터 조회 (Phase 24: N+1 최적화)
+    # 통합 데이터 조회 (관계형 데이터 21개 테이블 단일 쿼리)
     full_view_data = employee_service.get_employee_full_view_data(employee_id)
 
-    # 명함 이미지 조회 (별도 조회 필요)
-    business_card_front = employee_service.get_attachment_by_category(employee_id, AttachmentCategory.BUSINESS_CARD_FRONT)
-    business_card_back = employee_service.get_attachment_by_category(employee_id, AttachmentCategory.BUSINESS_CARD_BACK)
+    # 명함 이미지 (조회된 첨부파일 목록에서 선택)
+    attachment_list = full_view_data['attachment_list']
+    business_card_front = employee_relation_loader.latest_attachment(
+        attachment_list, AttachmentCategory.BUSINESS_CARD_FRONT)
+    business_card_back = employee_relation_loader.latest_attachment(
+        attachment_list, AttachmentCategory.BUSINESS_CARD_BACK)
 
     # 명함 편집 권한 체크
     can_edit_business_card = (
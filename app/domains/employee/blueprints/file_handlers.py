@@ -27,6 +27,7 @@ __all__ = [
     'get_profile_photo_folder',
     'get_business_card_folder',
     'generate_unique_filename',
+    'save_uploaded_file',
     'delete_file_if_exists',
 ]
 
@@ -72,6 +73,11 @@ def generate_unique_filename(employee_id, original_filename, prefix=''):
     return file_storage.generate_filename(original_filename, prefix, employee_id)
 
 
+def save_uploaded_file(file, folder_path, filename):
+    """업로드 파일 저장 (FileStorageService 위임)"""
+    return file_storage.save_file(file, folder_path, filename)
+
+
 def delete_file_if_exists(file_path):
     """파일이 존재하면 삭제 (FileStorageService 위임)"""
     return file_storage.delete_file(file_path)
@@ -21,7 +21,7 @@ from app.domains.attachment.services import attachment_service
 from .helpers import (
     allowed_file, allowed_image_file, get_file_extension,
     get_upload_folder, get_profile_photo_folder, get_business_card_folder,
-    generate_unique_filename, delete_file_if_exists,
+    generate_unique_filename, save_uploaded_file, delete_file_if_exists,
     MAX_FILE_SIZE, MAX_IMAGE_SIZE
 )
 
@@ -80,8 +80,7 @@ def register_file_routes(bp: Blueprint):
             unique_filename = generate_unique_filename(employee_id, file.filename)
 
             upload_folder = get_upload_folder()
-            file_path = os.path.join(upload_folder, unique_filename)
-            file.save(file_path)
+            save_uploaded_file(file, upload_folder, unique_filename)
 
             # 웹 접근 경로
             web_path = f"/static/uploads/attachments/{unique_filename}"
@@ -167,8 +166,7 @@ def register_file_routes(bp: Blueprint):
             unique_filename = generate_unique_filename(employee_id, file.filename, 'profile')
 
             upload_folder = get_profile_photo_folder()
-            file_path = os.path.join(upload_folder, unique_filename)
-            file.save(file_path)
+            save_uploaded_file(file, upload_folder, unique_filename)
 
             # 웹 접근 경로
             web_path = f"/static/uploads/profile_photos/{unique_filename}"
@@ -294,8 +292,7 @@ def register_file_routes(bp: Blueprint):
             unique_filename = generate_unique_filename(employee_id, file.filename, side)
 
             upload_folder = get_business_card_folder()
-            file_path = os.path.join(upload_folder, unique_filename)
-            file.save(file_path)
+            save_uploaded_file(file, upload_folder, unique_filename)
 
             # 웹 접근 경로
             web_path = f"/static/uploads/business_cards/{unique_filename}"
@@ -165,6 +165,7 @@ from .file_handlers import (
     get_profile_photo_folder,
     get_business_card_folder,
     generate_unique_filename,
+    save_uploaded_file,
     delete_file_if_exists,
 )
 
@@ -209,6 +210,7 @@ __all__ = [
     'get_profile_photo_folder',
     'get_business_card_folder',
     'generate_unique_filename',
+    'save_uploaded_file',
     'delete_file_if_exists',
     # 관계형 데이터 업데이트
     'EmployeeRelationUpdater',
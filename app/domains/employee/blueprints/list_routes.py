@@ -8,84 +8,115 @@ Phase 8: 상수 모듈 적용
 Phase 9: 통합 계약 필터 서비스 적용 (N+1 쿼리 제거)
 Phase 24: Option A - isinstance 체크 제거, 데이터 변환 로직 Service 이동
 """
-from flask import Blueprint, render_template, request, session
+from urllib.parse import quote
+
+from flask import Blueprint, Response, render_template, request, session, stream_with_context
 
 from app.shared.constants.session_keys import SessionKeys
-from app.shared.constants.status import AccountStatus
-from app.shared.utils.api_helpers import api_success, api_server_error
+from app.shared.utils.api_helpers import api_success, api_error, api_server_error
+from app.shared.utils.conditional import tenant_conditional
+from app.shared.utils.cursor_pagination import InvalidCursorError
 from app.shared.utils.decorators import manager_or_admin_required
 from app.shared.utils.tenant import get_current_organization_id
-from app.domains.employee.services import employee_service
-from app.domains.contract.services.contract_service import contract_service
-from app.domains.user.services.user_service import user_service
+from app.domains.employee.services import (
+    employee_export_service,
+    employee_service,
+    employee_typeahead_index,
+)
+from app.domains.platform.services.audit_service import audit_service
 from app.domains.company.services.company_service import company_service
 from app.domains.businesscard.repositories.businesscard_repository import BusinessCardRepository
 
 
+# 정렬 필드 매핑 (Phase 0.7: snake_case only)
+SORT_FIELD_MAP = {
+    'id': 'id',
+    'name': 'name',
+    'department': 'department',
+    'position': 'position',
+    'hire_date': 'hire_date',
+    'status': 'status'
+}
+
+
+def _extract_filter_params(org_id: int) -> dict:
+    """요청 파라미터 → filter_employees 필터/정렬 인자 (목록/내보내기 공통)"""
+    # 필터 파라미터 추출
+    search = request.args.get('search', '').strip()
+    departments = request.args.getlist('department')
+    positions = request.args.getlist('position')
+    statuses = request.args.getlist('status')
+
+    # 정렬 파라미터 추출
+    sort_by = request.args.get('sort', None)
+    sort_order = request.args.get('order', 'asc')
+    sort_column = SORT_FIELD_MAP.get(sort_by) if sort_by else None
+
+    # 단일 값도 지원 (하위 호환성)
+    department = request.args.get('department', None) if not departments else None
+    position = request.args.get('position', None) if not positions else None
+    status = request.args.get('status', None) if not statuses else None
+
+    filter_params = {
+        'search': search if search else None,
+        'sort_by': sort_column,
+        'sort_order': sort_order,
+        'organization_id': org_id,
+    }
+
+    if departments or positions or statuses:
+        filter_params.update({
+            'departments': departments if departments else None,
+            'positions': positions if positions else None,
+            'statuses': statuses if statuses else None,
+        })
+    elif department or position or status:
+        filter_params.update({
+            'department': department,
+            'position': position,
+            'status': status,
+        })
+    return filter_params
+
+
 def register_list_routes(bp: Blueprint):
     """목록 조회 라우트를 Blueprint에 등록"""
 
     @bp.route('/employees')
     @manager_or_admin_required
+    @tenant_conditional
     def employee_list():
         """직원 목록 - 매니저/관리자만 접근 가능 (멀티테넌시 적용)"""
         org_id = get_current_organization_id()
 
         # 페이지네이션 파라미터 (Phase 32)
+        # paging=cursor 또는 cursor 지정 시 키셋 페이지네이션 (OFFSET/COUNT 생략)
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
-
-        # 필터 파라미터 추출
-        search = request.args.get('search', '').strip()
-        departments = request.args.getlist('department')
-        positions = request.args.getlist('position')
-        statuses = request.args.getlist('status')
-
-        # 정렬 파라미터 추출
-        sort_by = request.args.get('sort', None)
-        sort_order = request.args.get('order', 'asc')
-
-        # 정렬 필드 매핑 (Phase 0.7: snake_case only)
-        sort_field_map = {
-            'id': 'id',
-            'name': 'name',
-            'department': 'department',
-            'position': 'position',
-            'hire_date': 'hire_date',
-            'status': 'status'
-        }
-        sort_column = sort_field_map.get(sort_by) if sort_by else None
-
-        # 단일 값도 지원 (하위 호환성)
-        department = request.args.get('department', None) if not departments else None
-        position = request.args.get('position', None) if not positions else None
-        status = request.args.get('status', None) if not statuses else None
+        cursor = request.args.get('cursor') or None
+        cursor_mode = request.args.get('paging') == 'cursor' or bool(cursor)
 
         # 다중 필터 적용 + 페이지네이션 (Phase 32)
-        filter_params = {
-            'search': search if search else None,
-            'sort_by': sort_column,
-            'sort_order': sort_order,
-            'organization_id': org_id,
+        filter_params = _extract_filter_params(org_id)
+        filter_params.update({
             'page': page,
             'per_page': per_page,
-        }
+            # 목록/카드/명함 뷰 컬럼만 조회 (Employee 객체 생성 및 조직 lazy load 없음)
+            'projection': True,
+        })
 
-        if departments or positions or statuses:
-            filter_params.update({
-                'departments': departments if departments else None,
-                'positions': positions if positions else None,
-                'statuses': statuses if statuses else None,
-            })
-        elif department or position or status:
-            filter_params.update({
-                'department': department,
-                'position': position,
-                'status': status,
-            })
-
-        pagination = employee_service.filter_employees(**filter_params)
-        employees = [emp.to_dict() for emp in pagination.items]
+        if cursor_mode:
+            filter_params.pop('page')
+            filter_params.update({'cursor': cursor, 'cursor_mode': True, 'with_total': True})
+            try:
+                pagination = employee_service.filter_employees(**filter_params)
+            except InvalidCursorError:
+                # 정렬 변경 등으로 무효화된 커서는 첫 페이지로
+                filter_params['cursor'] = None
+                pagination = employee_service.filter_employees(**filter_params)
+        else:
+            pagination = employee_service.filter_employees(**filter_params)
+        employees = [row._asdict() for row in pagination.items]
 
         # 21번 원칙: 계약 approved인 직원만 표시
         # Phase 9: 벌크 조회로 N+1 쿼리 제거
@@ -103,6 +134,9 @@ def register_list_routes(bp: Blueprint):
         # Phase 31: 카테고리별 분류 옵션 반환 (departments, positions, statuses)
         classification_options = employee_service.get_all_classification_options(company_id)
 
+        # 필터 옵션별 건수 (단일 패싯 쿼리, 테넌트 데이터 버전 캐시)
+        facet_counts = employee_service.get_filter_facets(**_extract_filter_params(org_id)) if org_id else None
+
         # 명함 컴포넌트용 회사 정보 조회
         company = company_service.get_by_id(company_id) if company_id else None
 
@@ -119,6 +153,7 @@ def register_list_routes(bp: Blueprint):
                                pagination=pagination,
                                per_page=per_page,
                                classification_options=classification_options,
+                               facet_counts=facet_counts,
                                company=company,
                                business_cards_map=business_cards_map,
                                view_mode=view_mode)
@@ -126,51 +161,149 @@ def register_list_routes(bp: Blueprint):
     @bp.route('/employees/pending')
     @manager_or_admin_required
     def employee_pending_list():
-        """계약대기 목록 - 계약 없거나 대기 중인 직원"""
+        """계약대기 목록 - 계약 없거나 대기 중인 직원 (페이지네이션)"""
         company_id = session.get(SessionKeys.COMPANY_ID)
         if not company_id:
             return render_template('domains/employee/pending_list.html',
                                    employees=[],
                                    pending_count=0)
 
-        # employee_sub 계정 중 계약 없거나 pending인 경우
-        pending_employees = []
-        users = user_service.get_employee_sub_users_with_employee(company_id)
-
-        for user in users:
-            # 해당 법인과의 계약 상태 확인
-            contract_status = contract_service.get_employee_contract_status(
-                user.id, company_id
-            )
-
-            # 계약 없음 또는 pending (requested)
-            if contract_status in [AccountStatus.NONE, AccountStatus.REQUESTED, AccountStatus.PENDING]:
-                employee = employee_service.get_employee_model_by_id(user.employee_id)
-                if employee:
-                    emp_dict = employee.to_dict()
-                    emp_dict['user_id'] = user.id
-                    emp_dict['user_email'] = user.email
-                    emp_dict['contract_status'] = contract_status
-                    pending_employees.append(emp_dict)
+        # employee_sub 계정 중 승인 계약이 없는 직원 (계정/계약 상태 단일 조인 쿼리)
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        pending_employees, pagination = employee_service.get_pending_contract_employees(
+            company_id, page=page, per_page=per_page
+        )
 
         return render_template('domains/employee/pending_list.html',
                                employees=pending_employees,
-                               pending_count=len(pending_employees))
+                               pending_count=pagination.total,
+                               pagination=pagination,
+                               per_page=per_page)
+
+    @bp.route('/api/employees/export')
+    @manager_or_admin_required
+    def api_employee_export():
+        """직원 목록 내보내기 (CSV/XLSX 스트리밍)
+
+        format=csv|xlsx (기본 xlsx), 필터/정렬 파라미터는 직원 목록과 동일합니다.
+        행 단위로 생성하여 전송하므로 직원 수와 무관하게 서버 메모리 사용량이 일정합니다.
+        """
+        export_format = request.args.get('format', employee_export_service.FORMAT_XLSX).lower()
+        if export_format not in employee_export_service.FORMATS:
+            return api_error('지원하지 않는 내보내기 형식입니다.')
+
+        org_id = get_current_organization_id()
+        filter_params = _extract_filter_params(org_id)
+        chunks, mimetype, filename = employee_export_service.stream_export(
+            export_format, **filter_params
+        )
+
+        audit_service.log_export('employee', details={
+            'format': export_format,
+            'filters': {k: v for k, v in filter_params.items()
+                        if v and k not in ('organization_id', 'sort_by', 'sort_order')},
+        })
+
+        response = Response(stream_with_context(chunks), mimetype=mimetype)
+        response.headers['Content-Disposition'] = (
+            f"attachment; filename=employees.{export_format}; filename*=UTF-8''{quote(filename)}"
+        )
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+
+    @bp.route('/api/employees/facets')
+    @manager_or_admin_required
+    @tenant_conditional
+    def api_employee_facets():
+        """직원 목록 필터 패싯 건수 API (목록과 동일한 필터 파라미터)
+
+        각 패싯은 자기 필터를 제외한 나머지 필터 조건으로 집계됩니다.
+        """
+        org_id = get_current_organization_id()
+        if not org_id:
+            return api_error('법인 정보를 찾을 수 없습니다.', 403)
+        facets = employee_service.get_filter_facets(**_extract_filter_params(org_id))
+        data = {
+            facet: [{'value': value, 'count': count} for value, count in facets[facet].items()]
+            for facet in ('department', 'position', 'status', 'employment_type')
+        }
+        data['organization'] = [
+            {'value': org, 'label': facets['organization_names'].get(org), 'count': count}
+            for org, count in facets['organization'].items()
+        ]
+        return api_success(data)
+
+    @bp.route('/api/employees/typeahead')
+    @manager_or_admin_required
+    def api_employee_typeahead():
+        """직원 자동완성 API - 사이드바 검색에서 키 입력마다 사용
+
+        테넌트별 메모리 인덱스에서 이름/초성/영문명/사번/부서/직급 접두 일치 상위 limit건을
+        반환합니다. (인덱스 생성 후에는 DB를 조회하지 않음)
+        """
+        try:
+            org_id = get_current_organization_id()
+            query = (request.args.get('q') or request.args.get('search') or '').strip()
+            limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+
+            records = employee_typeahead_index.search(org_id, query, limit=limit)
+            employees = [{
+                'id': record['id'],
+                'employee_number': record['employee_number'] or '',
+                'name': record['name'] or '',
+                'department': record['department'] or '',
+                'position': record['position'] or '',
+                'status': record['status'] or '',
+                'photo_url': record['photo'] or '',
+            } for record in records]
+
+            return api_success({
+                'employees': employees,
+                'total': len(employees)
+            })
+        except Exception as e:
+            return api_server_error(str(e))
 
     @bp.route('/api/employees')
     @manager_or_admin_required
+    @tenant_conditional
     def api_employee_list():
-        """직원 목록 API - 내보내기 및 검색에서 사용"""
+        """직원 목록 API - 내보내기 및 검색에서 사용
+
+        paging=cursor 또는 cursor 파라미터 지정 시 커서 페이지 단위로 반환합니다.
+        (sort, order, per_page 지원 / 응답의 pagination.next_cursor로 다음 페이지 조회)
+        """
         try:
             org_id = get_current_organization_id()
             search = request.args.get('search', '').strip()
             limit = request.args.get('limit', None, type=int)
+            cursor = request.args.get('cursor') or None
+            page = None
 
-            # 검색어가 있으면 검색, 없으면 전체 조회
-            if search:
-                employees = employee_service.search_employees(search, organization_id=org_id)
+            if request.args.get('paging') == 'cursor' or cursor:
+                page = employee_service.filter_employees(
+                    search=search or None,
+                    sort_by=request.args.get('sort'),
+                    sort_order=request.args.get('order', 'asc'),
+                    organization_id=org_id,
+                    per_page=min(request.args.get('per_page', 50, type=int), 500),
+                    cursor=cursor,
+                    cursor_mode=True,
+                    with_total=request.args.get('with_total') == 'true',
+                    projection=True,
+                )
+                employees = [row._asdict() for row in page.items]
+            # 검색어가 있으면 검색, 없으면 전체 조회 (목록 컬럼만 조회)
+            elif search:
+                employees = employee_service.search_employees(
+                    search, organization_id=org_id, limit=limit if limit and limit > 0 else None,
+                    projection=True
+                )
             else:
-                employees = employee_service.get_all_employees(organization_id=org_id)
+                employees = employee_service.filter_employees(
+                    organization_id=org_id, projection=True
+                )
 
             # 결과 수 제한 적용
             if limit and limit > 0:
@@ -190,12 +323,21 @@ def register_list_routes(bp: Blueprint):
                     'phone': emp_dict.get('phone', ''),
                     'hire_date': str(emp_dict.get('hire_date', '')) if emp_dict.get('hire_date') else '',
                     'status': emp_dict.get('status', ''),
-                    'photo_url': emp_dict.get('photo_url', '')
+                    'photo_url': emp_dict.get('photo_url') or emp_dict.get('photo') or ''
+                })
+
+            if page is not None:
+                return api_success({
+                    'employees': employee_list,
+                    'total': page.total,
+                    'pagination': page.to_dict(),
                 })
 
             return api_success({
                 'employees': employee_list,
                 'total': len(employee_list)
             })
+        except InvalidCursorError as e:
+            return api_error(e.message)
         except Exception as e:
             return api_server_error(str(e))
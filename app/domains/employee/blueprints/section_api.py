@@ -11,8 +11,11 @@ API 엔드포인트:
 - POST /api/employees/<id>/<relation> - 동적 섹션 항목 추가
 - PATCH /api/employees/<id>/<relation>/<item_id> - 동적 섹션 항목 수정
 - DELETE /api/employees/<id>/<relation>/<item_id> - 동적 섹션 항목 삭제
+- GET /api/employees/<id>/sections/<section>/render - 인사카드 섹션 HTML 조각 (지연 로딩)
 """
-from flask import Blueprint, request, session
+from datetime import date
+
+from flask import Blueprint, render_template, request, session
 
 from app.shared.constants.session_keys import SessionKeys, UserRole, AccountType
 from app.shared.utils.decorators import api_login_required
@@ -20,8 +23,14 @@ from app.shared.utils.api_helpers import (
     api_success, api_error, api_not_found, api_forbidden, api_server_error,
     api_validation_error
 )
+from app.shared.utils.conditional import tenant_conditional
+from app.shared.utils.tenant import get_current_organization_id
+from app.shared.utils.tenant_data_cache import tenant_data_cache
 from app.shared.utils.transaction import atomic_transaction
-from app.domains.employee.services import employee_service, inline_edit_service, validation_service
+from app.domains.employee.services import (
+    employee_relation_loader, employee_service, inline_edit_service, validation_service
+)
+from .helpers import verify_employee_access
 
 
 # ========================================
@@ -207,6 +216,23 @@ DYNAMIC_SECTIONS = {
 # 개인계약 연동 보호 섹션
 PROTECTED_SECTIONS = [key for key, config in DYNAMIC_SECTIONS.items() if config.get('protected')]
 
+# ========================================
+# 지연 로딩 섹션 조각 (인사카드)
+# ========================================
+# 인사카드는 헤더/기본정보만 렌더링하고, 아래 섹션은 화면에 들어올 때 조각으로 조회합니다.
+# 조각은 조회자와 무관(관계 데이터만 사용)하므로 (직원, 섹션, 근태 연도, 테넌트 데이터 버전)으로 캐시합니다.
+
+SECTION_FRAGMENTS = {
+    'history': {
+        'name': '이력 및 경력',
+        'template': 'domains/employee/partials/detail/_history_info.html',
+    },
+    'hr-records': {
+        'name': '인사기록',
+        'template': 'domains/employee/partials/detail/_hr_records.html',
+    },
+}
+
 
 def register_section_api_routes(bp: Blueprint):
     """섹션 API 라우트를 Blueprint에 등록"""
@@ -274,6 +300,24 @@ def register_section_api_routes(bp: Blueprint):
             employee_id, company_id
         )
 
+    def _check_view_access(employee_id: int):
+        """
+        직원 조회 권한 확인 (직원 상세 화면과 같은 기준)
+
+        Returns:
+            에러 응답 또는 None
+        """
+        user_role = session.get(SessionKeys.USER_ROLE)
+        if user_role == UserRole.EMPLOYEE:
+            if session.get(SessionKeys.EMPLOYEE_ID) != employee_id:
+                return api_forbidden('본인 정보만 열람할 수 있습니다.')
+            return None
+        if user_role in [UserRole.ADMIN, UserRole.MANAGER]:
+            if not verify_employee_access(employee_id):
+                return api_forbidden('접근 권한이 없습니다.')
+            return None
+        return api_forbidden('접근 권한이 없습니다.')
+
     # ========================================
     # 정적 섹션 API
     # ========================================
@@ -503,6 +547,45 @@ def register_section_api_routes(bp: Blueprint):
         except Exception as e:
             return api_server_error(str(e))
 
+    # ========================================
+    # 섹션 조각 API (지연 로딩)
+    # ========================================
+
+    @bp.route('/api/employees/<int:employee_id>/sections/<section>/render', methods=['GET'])
+    @api_login_required
+    @tenant_conditional(daily=True)
+    def render_section_fragment(employee_id: int, section: str):
+        """인사카드 섹션 HTML 조각
+
+        응답: text/html (인사카드의 해당 섹션 partial)
+        같은 테넌트 데이터 버전이면 ETag로 304, 서버에서는 렌더링 결과를 캐시합니다.
+        근태 섹션은 올해 기준이므로 ETag에 날짜를 포함합니다. (연도가 바뀌면 새 조각)
+        """
+        config = SECTION_FRAGMENTS.get(section)
+        if not config:
+            return api_error(f'알 수 없는 섹션입니다: {section}', status_code=400)
+
+        error = _check_view_access(employee_id)
+        if error:
+            return error
+        if not employee_service.get_employee_by_id(employee_id):
+            return api_not_found('직원')
+
+        year = date.today().year
+
+        def render():
+            data = employee_relation_loader.load(employee_id, year)
+            return render_template(config['template'], **data)
+
+        try:
+            html = tenant_data_cache.get_or_load(
+                'employee_section', get_current_organization_id(),
+                (employee_id, section, year), render
+            )
+        except Exception as e:
+            return api_server_error(str(e))
+        return html, 200, {'Content-Type': 'text/html; charset=utf-8'}
+
     # ========================================
     # 순서 변경 API (드래그 앤 드롭)
     # ========================================
@@ -6,6 +6,8 @@ Employee 도메인 모델 패키지
 
 Phase 31: Attachment는 독립 도메인으로 분리됨 (app/domains/attachment/)
 """
+from sqlalchemy import event
+
 from app.shared.models.mixins import DictSerializableMixin, TimestampMixin, SoftDeleteMixin
 from .employee import Employee
 from .profile import Profile
@@ -62,3 +64,20 @@ __all__ = [
     'Contract',
     'Insurance',
 ]
+
+
+# ===== 테넌트 데이터 버전 (인사카드 섹션 조각 캐시) =====
+# Contract는 목록 패싯에 반영되므로 contract.py에서 EMPLOYEES로 기록
+
+def _on_relation_change(mapper, connection, target):
+    """직원 이력/인사기록 변경 시 직원 테넌트 기록 (인사카드 섹션 조각)"""
+    from app.domains.company.models import TenantDataVersion
+    TenantDataVersion.mark(target, TenantDataVersion.RELATIONS, target.employee_id)
+
+
+for _model in (Education, Career, Certificate, FamilyMember, Language, Salary, Benefit,
+               SalaryHistory, Promotion, Evaluation, Training, Attendance, Insurance,
+               HrProject, ProjectParticipation, Award, Asset, SalaryPayment, EmploymentContract):
+    for _identifier in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _identifier, _on_relation_change)
+del _model, _identifier
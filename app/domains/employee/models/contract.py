@@ -5,6 +5,8 @@ Contract SQLAlchemy 모델
 Phase 8: DictSerializableMixin 적용
 Phase 29: __dict_camel_mapping__ 제거
 """
+from sqlalchemy import event
+
 from app.database import db
 from app.shared.models.mixins import DictSerializableMixin
 
@@ -24,3 +26,14 @@ class Contract(DictSerializableMixin, db.Model):
 
     def __repr__(self):
         return f'<Contract {self.id}: {self.employee_id}>'
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(Contract, 'after_insert')
+@event.listens_for(Contract, 'after_update')
+@event.listens_for(Contract, 'after_delete')
+def on_contract_change(mapper, connection, target):
+    """직원 계약(고용형태) 변경 시 직원 테넌트 기록 (목록 패싯)"""
+    from app.domains.company.models import TenantDataVersion
+    TenantDataVersion.mark(target, TenantDataVersion.EMPLOYEES, target.employee_id)
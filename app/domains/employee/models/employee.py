@@ -32,6 +32,8 @@ class Employee(db.Model):
     data_retention_until = db.Column(db.Date, nullable=True)  # 데이터 보관 만료일
     probation_end_date = db.Column(db.Date, nullable=True)  # Phase 0.7: probation_end -> probation_end_date
     name = db.Column(db.String(100), nullable=False)
+    # 이름 초성 (검색용, name 설정 시 자동 계산)
+    name_choseong = db.Column(db.String(100), nullable=True, index=True)
     photo = db.Column(db.String(500), nullable=True)
     department = db.Column(db.String(100), nullable=True)
     position = db.Column(db.String(100), nullable=True)
@@ -48,8 +50,20 @@ class Employee(db.Model):
         backref=db.backref('employees', lazy='dynamic')
     )
 
-    # 회사 연결 (직접 참조)
-    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=True)
+    # 회사 연결 (직접 참조, company_id 테넌트 스코프용 인덱스)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=True, index=True)
+
+    # 목록 필터/정렬/통계 복합 인덱스 (조직 또는 회사 스코프 + 필터/정렬 컬럼)
+    # EmployeeRepository.filter_employees / get_statistics / get_recent_employees 기준
+    __table_args__ = (
+        db.Index('idx_employees_org_status', 'organization_id', 'status'),
+        db.Index('idx_employees_org_department', 'organization_id', 'department'),
+        db.Index('idx_employees_org_position', 'organization_id', 'position'),
+        db.Index('idx_employees_org_hire_date', 'organization_id', 'hire_date'),
+        db.Index('idx_employees_org_name', 'organization_id', 'name'),
+        db.Index('idx_employees_company_status', 'company_id', 'status'),
+        db.Index('idx_employees_company_hire_date', 'company_id', 'hire_date'),
+    )
 
     # 소속 정보 추가 필드
     team = db.Column(db.String(100), nullable=True)
@@ -366,3 +380,80 @@ def _update_pcc_status_to_terminated(employee: Employee):
     for contract in contracts:
         contract.status = ContractStatus.TERMINATED
         contract.terminated_at = datetime.utcnow()
+
+
+@event.listens_for(Employee.name, 'set')
+def on_employee_name_set(target, value, oldvalue, initiator):
+    """이름 변경 시 초성 검색 컬럼 갱신"""
+    from app.shared.utils.korean_search import to_choseong
+    target.name_choseong = to_choseong(value)
+
+
+# ===== 조직 인원 롤업 (org_headcount) / 당일 현황 스냅샷 (tenant_daily_stats) 증분 반영 =====
+
+def _committed_value(target: Employee, attr: str):
+    """flush 직전 DB에 저장되어 있던 값 (변경 없으면 현재 값)"""
+    history = db.inspect(target).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attr)
+
+
+@event.listens_for(Employee.organization_id, 'set', active_history=True)
+@event.listens_for(Employee.company_id, 'set', active_history=True)
+@event.listens_for(Employee.status, 'set', active_history=True)
+def on_headcount_key_set(target, value, oldvalue, initiator):
+    """만료된 속성도 변경 전 값을 로드하여 history에 남기도록 active_history 설정"""
+
+
+@event.listens_for(Employee, 'after_insert')
+def on_employee_insert(mapper, connection, target):
+    """직원 생성 시 소속 조직 경로 인원 증가"""
+    from app.domains.company.models import OrgHeadcount, TenantDailyStats
+    OrgHeadcount.apply_delta(connection, target.organization_id, target.status, 1)
+    TenantDailyStats.mark_employee(target, target.organization_id, target.company_id, target.status, 1)
+
+
+@event.listens_for(Employee, 'after_update')
+def on_employee_update(mapper, connection, target):
+    """조직/법인 이동, 상태 변경 시 이전 값 차감, 새 값 증가"""
+    state = db.inspect(target)
+    if not (state.attrs.organization_id.history.has_changes()
+            or state.attrs.company_id.history.has_changes()
+            or state.attrs.status.history.has_changes()):
+        return
+
+    from app.domains.company.models import OrgHeadcount, TenantDailyStats
+    old_org_id = _committed_value(target, 'organization_id')
+    old_status = _committed_value(target, 'status')
+    if old_org_id != target.organization_id or old_status != target.status:
+        OrgHeadcount.apply_delta(connection, old_org_id, old_status, -1)
+        OrgHeadcount.apply_delta(connection, target.organization_id, target.status, 1)
+    TenantDailyStats.mark_employee(target, old_org_id, _committed_value(target, 'company_id'),
+                                   old_status, -1)
+    TenantDailyStats.mark_employee(target, target.organization_id, target.company_id, target.status, 1)
+
+
+@event.listens_for(Employee, 'after_delete')
+def on_employee_delete(mapper, connection, target):
+    """직원 삭제 시 소속 조직 경로 인원 감소"""
+    from app.domains.company.models import OrgHeadcount, TenantDailyStats
+    old_org_id = _committed_value(target, 'organization_id')
+    old_status = _committed_value(target, 'status')
+    OrgHeadcount.apply_delta(connection, old_org_id, old_status, -1)
+    TenantDailyStats.mark_employee(target, old_org_id, _committed_value(target, 'company_id'),
+                                   old_status, -1)
+
+
+# ===== 테넌트 목록 데이터 버전 (tenant_data_versions) =====
+
+@event.listens_for(Employee, 'after_insert')
+@event.listens_for(Employee, 'after_update')
+@event.listens_for(Employee, 'after_delete')
+def on_employee_data_change(mapper, connection, target):
+    """직원 변경 시 소속 테넌트 기록 (조직/법인 이동 시 이전 테넌트 포함)"""
+    from app.domains.company.models import TenantDataVersion
+    TenantDataVersion.mark(target, TenantDataVersion.ORGANIZATIONS,
+                           target.organization_id, _committed_value(target, 'organization_id'))
+    TenantDataVersion.mark(target, TenantDataVersion.COMPANIES,
+                           target.company_id, _committed_value(target, 'company_id'))
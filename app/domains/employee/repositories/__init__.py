@@ -28,6 +28,7 @@ from .award_repository import AwardRepository
 from .asset_repository import AssetRepository
 from .salary_payment_repository import SalaryPaymentRepository
 from .employment_contract_repository import EmploymentContractRepository
+from .relation_batch_repository import RelationBatchRepository, relation_batch_repository
 
 
 __all__ = [
@@ -56,4 +57,7 @@ __all__ = [
     'BenefitRepository',
     'ContractRepository',
     'InsuranceRepository',
+    # Batch
+    'RelationBatchRepository',
+    'relation_batch_repository',
 ]
@@ -41,7 +41,11 @@ class AttendanceRepository(BaseRelationRepository[Attendance]):
             Attendance.employee_id == employee_id,
             Attendance.year == year
         ).all()
+        return self.summarize(records, year)
 
+    @staticmethod
+    def summarize(records: List[Attendance], year: int) -> Dict:
+        """근태 레코드 연간 합계 (get_summary_by_employee와 같은 형식)"""
         if not records:
             return {
                 'year': year,
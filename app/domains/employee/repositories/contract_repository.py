@@ -10,5 +10,8 @@ from app.shared.repositories.base_repository import BaseOneToOneRepository
 class ContractRepository(BaseOneToOneRepository[Contract]):
     """계약 저장소 (1:1)"""
 
+    # 고용형태는 직원 목록 패싯/현황에 반영 (contract.py 모델 이벤트와 같은 종류)
+    bulk_tenant_kind = 'EMPLOYEES'
+
     def __init__(self):
         super().__init__(Contract)
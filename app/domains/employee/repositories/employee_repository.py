@@ -6,13 +6,25 @@ Employee Repository
 Phase 28.2: Repository 레벨 필드 보호 추가
 - organization_id, company_id 등 핵심 필드 보호
 - update/update_partial 시 의도치 않은 덮어쓰기 방지
+
+테넌트 스코프 모드 (Config.TENANT_SCOPE_MODE):
+- org_tree: 조직 트리(organization_closure) 기준 organization_id 필터 (기본값)
+- company_id: 인덱스된 employees.company_id 직접 필터 (조직 트리 크기와 무관한 단일 인덱스 스캔)
+
+검색 (search / filter_employees의 search):
+- 이름/영문명/사번/부서/직급/이메일 부분 일치 (PostgreSQL: pg_trgm GIN 인덱스 사용)
+- 초성 검색어(예: 'ㄱㅁㅅ')는 미리 계산된 name_choseong 컬럼으로 매칭
+- 관련도 순 정렬 (정확 일치 > 이름 접두 > 이름 포함 > 기타 컬럼, PostgreSQL은 similarity 보조)
 """
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict, Set, Tuple
+from flask import current_app, has_app_context
 from app.database import db
 from app.domains.employee.models import Employee
 from app.shared.constants.status import EmployeeStatus
+from app.shared.constants.system_config import TenantScopeConfig
 from app.shared.repositories.base_repository import BaseRepository
 from app.shared.repositories.mixins import TenantFilterMixin
+from app.shared.utils.korean_search import is_choseong_query
 
 
 # ========================================
@@ -32,10 +44,31 @@ PROTECTED_FIELDS: Set[str] = {
     'company',           # company=None 설정 시 company_id=None 됨
 }
 
+# 목록/카드/명함 뷰 프로젝션 컬럼 (Employee.to_dict() 대신 컬럼만 조회)
+LIST_PROJECTION_FIELDS = (
+    'id', 'employee_number', 'name', 'english_name', 'photo',
+    'department', 'position', 'status', 'hire_date', 'resignation_date',
+    'phone', 'email', 'internal_phone', 'organization_id',
+)
+
+# 검색 대상 컬럼 (PostgreSQL pg_trgm GIN 인덱스 대상과 일치)
+SEARCH_COLUMNS = ('name', 'english_name', 'employee_number', 'department', 'position', 'email')
+
+
+def _escape_like(term: str) -> str:
+    """LIKE 와일드카드 이스케이프 (escape 문자: \\)"""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
 
 class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
     """직원 저장소 - 멀티테넌시 지원 (TenantFilterMixin)"""
 
+    # 커서 페이지네이션 허용 정렬 컬럼 (id 동률 해소)
+    KEYSET_SORT_COLUMNS = ('id', 'name', 'department', 'position', 'hire_date', 'status')
+
+    # 모델 이벤트가 초성(name_choseong), 조직 인원 집계, 테넌트 버전/일별 통계를 유지하므로 일괄 쓰기 불가
+    bulk_write_supported = False
+
     def __init__(self):
         super().__init__(Employee)
 
@@ -43,10 +76,19 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
     # 멀티테넌시 헬퍼 메서드
     # ========================================
 
+    def _use_company_scope(self) -> bool:
+        """company_id 스코프 모드 여부 (Config.TENANT_SCOPE_MODE)"""
+        if not has_app_context():
+            return False
+        mode = current_app.config.get('TENANT_SCOPE_MODE', TenantScopeConfig.MODE_ORG_TREE)
+        return mode == TenantScopeConfig.MODE_COMPANY_ID
+
     def _build_query(self, organization_id: int = None):
         """organization_id 필터가 적용된 기본 쿼리 생성
 
         루트 조직과 모든 하위 조직의 직원을 포함합니다.
+        company_id 스코프 모드에서는 루트 조직의 회사 ID로 필터링합니다
+        (회사 ID는 스칼라 서브쿼리로 해석되어 단일 쿼리로 실행).
 
         Args:
             organization_id: 루트 조직 ID (None이면 필터 미적용)
@@ -56,10 +98,37 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         """
         query = Employee.query
         if organization_id:
-            # TenantFilterMixin 사용
-            query = self.apply_tenant_filter(query, Employee.organization_id, organization_id)
+            if self._use_company_scope():
+                from app.domains.company.models import Company
+                company_id = db.select(Company.id).where(
+                    Company.root_organization_id == organization_id
+                ).limit(1).scalar_subquery()
+                query = query.filter(Employee.company_id == company_id)
+            else:
+                # TenantFilterMixin 사용
+                query = self.apply_tenant_filter(query, Employee.organization_id, organization_id)
         return query
 
+    def _build_company_query(self, company_id: int):
+        """회사 ID 기준 기본 쿼리 생성
+
+        company_id 스코프 모드에서는 Company 조회 없이 employees.company_id로 직접 필터링합니다.
+
+        Args:
+            company_id: 회사 ID
+
+        Returns:
+            SQLAlchemy Query 객체 (회사/루트 조직이 없으면 None)
+        """
+        if self._use_company_scope():
+            return Employee.query.filter(Employee.company_id == company_id)
+
+        from app.domains.company.models import Company
+        company = Company.query.get(company_id)
+        if not company or not company.root_organization_id:
+            return None
+        return self._build_query(company.root_organization_id)
+
     def _get_organization_ids_under_root(self, root_org_id: int) -> List[int]:
         """루트 조직과 모든 하위 조직의 ID 목록 반환
 
@@ -82,11 +151,10 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         Returns:
             해당 회사의 직원 목록
         """
-        from app.domains.company.models import Company
-        company = Company.query.get(company_id)
-        if not company or not company.root_organization_id:
+        query = self._build_company_query(company_id)
+        if query is None:
             return []
-        models = self.find_all(organization_id=company.root_organization_id)
+        models = query.order_by(Employee.id).all()
         return [m.to_dict() for m in models]
 
     def verify_ownership(self, employee_id: int, root_organization_id: int) -> bool:
@@ -210,29 +278,126 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         db.session.commit()
         return True
 
-    def search(self, query: str, organization_id: int = None) -> List[Dict]:
-        """직원 검색 (이름, 부서, 직급)
+    def search(self, query: str, organization_id: int = None, limit: int = None,
+               projection: bool = False) -> List[Dict]:
+        """직원 검색 (이름, 영문명, 사번, 부서, 직급, 이메일 / 초성) - 관련도 순
 
         Args:
-            query: 검색어
+            query: 검색어 (자음만 입력하면 이름 초성 검색)
             organization_id: 조직 ID (None이면 전체 검색)
+            limit: 최대 결과 수 (None이면 전체)
+            projection: True면 목록 프로젝션 컬럼만 조회 (LIST_PROJECTION_FIELDS + organization_name)
         """
+        query = (query or '').strip()
         if not query:
+            if projection:
+                rows = self.project_list(self._build_query(organization_id))
+                return [row._asdict() for row in rows.order_by(Employee.id).limit(limit).all()]
             models = self.find_all(organization_id=organization_id)
+            if limit:
+                models = models[:limit]
             return [m.to_dict() for m in models]
 
-        search_term = f'%{query}%'
-        base_query = self._build_query(organization_id)
-        employees = base_query.filter(
-            db.or_(
-                Employee.name.ilike(search_term),
-                Employee.department.ilike(search_term),
-                Employee.position.ilike(search_term),
-                Employee.employee_number.ilike(search_term)
-            )
-        ).order_by(Employee.id).all()
+        base_query = self._build_query(organization_id).filter(self._search_clause(query))
+        if projection:
+            base_query = self.project_list(base_query)
+        results = base_query.order_by(*self._search_order(query)).limit(limit).all()
 
-        return [emp.to_dict() for emp in employees]
+        if projection:
+            return [row._asdict() for row in results]
+        return [emp.to_dict() for emp in results]
+
+    def project_list(self, query):
+        """목록 프로젝션 적용 (ORM 객체 대신 컬럼 Row 조회, 조직명 조인)
+
+        Employee.to_dict()의 전체 컬럼 수집, 나이 계산, 조직 lazy load(N+1)를 피합니다.
+        Row는 속성 접근(row.name)과 row._asdict() 변환을 지원합니다.
+
+        Args:
+            query: 필터가 적용된 Employee Query
+
+        Returns:
+            LIST_PROJECTION_FIELDS + organization_name 컬럼 Query
+        """
+        from app.domains.company.models import Organization
+        columns = [getattr(Employee, field) for field in LIST_PROJECTION_FIELDS]
+        return query.outerjoin(
+            Organization, Organization.id == Employee.organization_id
+        ).with_entities(*columns, Organization.name.label('organization_name'))
+
+    def get_tenant_scope(self, organization_id: int) -> Tuple[str, frozenset]:
+        """_build_query와 같은 테넌트 스코프 (직원 컬럼명, 허용 값 집합)
+
+        메모리에 보관한 직원 요약(자동완성 인덱스 등)에 변경을 반영할 때
+        조회 쿼리와 같은 기준으로 소속 여부를 판단하는 데 사용합니다.
+
+        Args:
+            organization_id: 루트 조직 ID
+
+        Returns:
+            company_id 스코프 모드: ('company_id', {회사 ID}),
+            조직 트리 모드: ('organization_id', 루트 + 하위 조직 ID 집합)
+        """
+        if self._use_company_scope():
+            from app.domains.company.models import Company
+            company_id = db.session.execute(
+                db.select(Company.id).where(Company.root_organization_id == organization_id).limit(1)
+            ).scalar()
+            return 'company_id', frozenset([company_id] if company_id else [])
+        return 'organization_id', frozenset(self.get_tenant_org_ids(organization_id))
+
+    def find_typeahead_rows(self, organization_id: int, fields) -> list:
+        """자동완성 인덱스용 요약 컬럼 조회 (모델 로드 없이 컬럼 튜플 반환)
+
+        Args:
+            organization_id: 루트 조직 ID
+            fields: 조회할 Employee 컬럼명 목록
+
+        Returns:
+            컬럼명 속성을 가진 Row 목록
+        """
+        columns = [getattr(Employee, field) for field in fields]
+        return self._build_query(organization_id).with_entities(*columns).all()
+
+    def _search_clause(self, query: str):
+        """검색어 조건 (초성 검색어면 name_choseong, 아니면 검색 컬럼 부분 일치)"""
+        if is_choseong_query(query):
+            pattern = f'%{_escape_like(query.replace(" ", ""))}%'
+            return Employee.name_choseong.like(pattern, escape='\\')
+
+        pattern = f'%{_escape_like(query)}%'
+        return db.or_(*[
+            getattr(Employee, column).ilike(pattern, escape='\\') for column in SEARCH_COLUMNS
+        ])
+
+    def _search_order(self, query: str) -> list:
+        """관련도 정렬 식 (순위 오름차순 → PostgreSQL similarity 내림차순 → id)"""
+        if is_choseong_query(query):
+            term = query.replace(' ', '')
+            rank = db.case(
+                (Employee.name_choseong == term, 0),
+                (Employee.name_choseong.like(f'{_escape_like(term)}%', escape='\\'), 1),
+                else_=2,
+            )
+            return [rank, Employee.name, Employee.id]
+
+        lowered = query.lower()
+        prefix = f'{_escape_like(query)}%'
+        contains = f'%{_escape_like(query)}%'
+        rank = db.case(
+            (db.func.lower(Employee.name) == lowered, 0),
+            (db.func.lower(Employee.employee_number) == lowered, 0),
+            (db.func.lower(Employee.email) == lowered, 0),
+            (Employee.name.ilike(prefix, escape='\\'), 1),
+            (Employee.name.ilike(contains, escape='\\'), 2),
+            (Employee.english_name.ilike(prefix, escape='\\'), 3),
+            (Employee.employee_number.ilike(prefix, escape='\\'), 3),
+            else_=4,
+        )
+        order = [rank]
+        if db.session.get_bind().dialect.name == 'postgresql':
+            order.append(db.func.similarity(Employee.name, query).desc())
+        return order + [Employee.id]
 
     def filter_by_department(self, department: str, organization_id: int = None) -> List[Dict]:
         """부서별 직원 조회
@@ -303,11 +468,16 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         Args:
             organization_id: 조직 ID (None이면 전체 조회)
         """
-        query = self._build_query(organization_id)
-        total = query.count()
-        active = self._build_query(organization_id).filter_by(status=EmployeeStatus.ACTIVE).count()
-        on_leave = self._build_query(organization_id).filter_by(status='on_leave').count()
-        resigned = self._build_query(organization_id).filter_by(status=EmployeeStatus.RESIGNED).count()
+        # 상태별 건수 조건부 COUNT 단일 행 조회
+        def status_count(status):
+            return db.func.count(db.case((Employee.status == status, Employee.id)))
+
+        total, active, on_leave, resigned = self._build_query(organization_id).with_entities(
+            db.func.count(Employee.id),
+            status_count(EmployeeStatus.ACTIVE),
+            status_count('on_leave'),
+            status_count(EmployeeStatus.RESIGNED),
+        ).one()
 
         return {
             'total': total,
@@ -316,40 +486,120 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
             EmployeeStatus.RESIGNED: resigned
         }
 
-    def get_department_statistics(self, organization_id: int = None) -> Dict[str, int]:
+    def get_department_statistics(self, organization_id: int = None) -> List[Dict]:
         """부서별 통계 정보
 
+        organization_id가 있으면 조직 트리 기준으로 루트 조직의 1단계 하위 조직별
+        인원(하위 조직 포함, 퇴사자 제외)을 org_headcount 롤업에서 조회합니다.
+        루트 조직 직속 인원은 루트 조직 항목으로 맨 앞에 포함합니다.
+        (이름이 같은 조직도 합치지 않도록 조직 ID별로 반환)
+
         Args:
-            organization_id: 조직 ID (None이면 전체 조회)
+            organization_id: 루트 조직 ID (None이면 Employee.department 문자열 기준 전체 집계)
+
+        Returns:
+            [{'organization_id', 'name', 'count'}] (문자열 기준 집계는 organization_id가 None)
         """
+        if organization_id:
+            from app.domains.company.models import Organization, OrgHeadcount
+            is_root = Organization.id == organization_id
+            member_count = db.func.sum(db.case(
+                (is_root, OrgHeadcount.direct_count), else_=OrgHeadcount.subtree_count
+            ))
+            result = db.session.query(
+                Organization.id, Organization.name, member_count
+            ).join(
+                OrgHeadcount, OrgHeadcount.organization_id == Organization.id
+            ).filter(
+                db.or_(is_root, Organization.parent_id == organization_id),
+                Organization.is_active == True,  # noqa: E712
+                OrgHeadcount.status != EmployeeStatus.RESIGNED
+            ).group_by(
+                Organization.id, Organization.name, Organization.sort_order
+            ).having(member_count > 0).order_by(
+                db.case((is_root, 0), else_=1), Organization.sort_order, Organization.id
+            ).all()
+            return [
+                {'organization_id': org_id, 'name': name, 'count': count}
+                for org_id, name, count in result
+            ]
+
         query = db.session.query(
             Employee.department,
             db.func.count(Employee.id)
         )
-        if organization_id:
-            query = query.filter(Employee.organization_id == organization_id)
         result = query.group_by(Employee.department).all()
 
-        return {dept or '미지정': count for dept, count in result}
+        return [
+            {'organization_id': None, 'name': dept or '미지정', 'count': count}
+            for dept, count in result
+        ]
 
-    def get_recent_employees(self, limit: int = 5, organization_id: int = None) -> List[Dict]:
+    def get_recent_employees(self, limit: int = 5, organization_id: int = None,
+                             projection: bool = False) -> List[Dict]:
         """최근 입사 직원
 
         Args:
             limit: 조회할 직원 수
             organization_id: 조직 ID (None이면 전체 조회)
+            projection: True면 목록 프로젝션 컬럼만 조회 (project_list 참고)
         """
-        query = self._build_query(organization_id)
-        employees = query.filter(
-            Employee.hire_date.isnot(None)
-        ).order_by(Employee.hire_date.desc()).limit(limit).all()
-        return [emp.to_dict() for emp in employees]
+        query = self._build_query(organization_id).filter(Employee.hire_date.isnot(None))
+        if projection:
+            query = self.project_list(query)
+        query = query.order_by(Employee.hire_date.desc()).limit(limit)
+        if projection:
+            return [row._asdict() for row in query]
+        return [emp.to_dict() for emp in query.all()]
+
+    def find_pending_contract_employees(self, company_id: int, page: int = 1, per_page: int = 20):
+        """계약대기 직원 조회 (employee_sub 계정 중 승인 계약이 없는 직원, 단일 조인 쿼리)
+
+        계정 + 직원 조인에 계약 상태를 EXISTS 서브쿼리로 판정하여
+        계정별 계약/직원 조회(N+1) 없이 페이지 단위로 반환합니다.
+
+        Args:
+            company_id: 법인 ID
+            page: 페이지 번호
+            per_page: 페이지당 항목 수
+
+        Returns:
+            Pagination (항목은 Row: id, name, email, department, position,
+            user_id, user_email, contract_status('requested' | 'none'))
+        """
+        from sqlalchemy import and_, case, exists
+        from app.domains.contract.models import PersonCorporateContract
+        from app.domains.user.models import User
+
+        def contract_exists(status):
+            return exists().where(and_(
+                PersonCorporateContract.person_user_id == User.id,
+                PersonCorporateContract.company_id == company_id,
+                PersonCorporateContract.status == status,
+            ))
+
+        query = Employee.query.join(User, User.employee_id == Employee.id).filter(
+            User.account_type == User.ACCOUNT_EMPLOYEE_SUB,
+            User.company_id == company_id,
+            ~contract_exists(PersonCorporateContract.STATUS_APPROVED),
+        ).with_entities(
+            Employee.id, Employee.name, Employee.email, Employee.department, Employee.position,
+            User.id.label('user_id'), User.email.label('user_email'),
+            case(
+                (contract_exists(PersonCorporateContract.STATUS_REQUESTED),
+                 PersonCorporateContract.STATUS_REQUESTED),
+                else_='none',
+            ).label('contract_status'),
+        ).order_by(Employee.id)
+        return query.paginate(page=page, per_page=per_page, error_out=False)
 
     def filter_employees(self, department: str = None, position: str = None, status: str = None,
                          departments: List[str] = None, positions: List[str] = None, statuses: List[str] = None,
                          search: str = None, sort_by: str = None, sort_order: str = 'asc',
                          organization_id: int = None,
-                         page: int = None, per_page: int = None):
+                         page: int = None, per_page: int = None,
+                         cursor: str = None, cursor_mode: bool = False,
+                         with_total: bool = False, projection: bool = False):
         """다중 필터링 및 정렬 (페이지네이션 옵션)
 
         Args:
@@ -365,38 +615,42 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
             organization_id: 조직 ID (None이면 전체 조회)
             page: 페이지 번호 (None이면 전체 조회)
             per_page: 페이지당 항목 수 (None이면 전체 조회)
+            cursor: 커서 페이지 토큰 (지정 시 커서 모드)
+            cursor_mode: 커서(키셋) 페이지네이션 사용 (첫 페이지는 cursor 없이 호출)
+            with_total: 커서 모드 첫 페이지에서 총건수 조회 (이후 커서에 보관)
+            projection: True면 목록 프로젝션 컬럼만 조회 (project_list 참고)
+                - 페이지 항목은 Employee 대신 Row (속성 접근 / _asdict())
 
         Returns:
             page/per_page가 None이면 List[Dict] 반환 (하위 호환성)
             page/per_page가 지정되면 Pagination 객체 반환
-        """
-        from sqlalchemy import or_
-        query = self._build_query(organization_id)
+            커서 모드면 CursorPage 반환 (OFFSET/COUNT 없이 정렬 컬럼 + id 탐색)
 
-        # 검색어 필터 (이름, 부서, 직급)
-        if search:
-            search_pattern = f'%{search}%'
-            query = query.filter(or_(
-                Employee.name.ilike(search_pattern),
-                Employee.department.ilike(search_pattern),
-                Employee.position.ilike(search_pattern)
-            ))
-
-        # 단일 필터 (하위 호환성)
-        if department:
-            query = query.filter(Employee.department == department)
-        if position:
-            query = query.filter(Employee.position == position)
-        if status:
-            query = query.filter(Employee.status == status)
+        Raises:
+            InvalidCursorError: 커서가 잘못되었거나 정렬 기준이 변경된 경우
+        """
+        query = self._filtered_query(
+            organization_id=organization_id, search=search,
+            department=department, position=position, status=status,
+            departments=departments, positions=positions, statuses=statuses,
+        )
 
-        # 다중 필터
-        if departments:
-            query = query.filter(Employee.department.in_(departments))
-        if positions:
-            query = query.filter(Employee.position.in_(positions))
-        if statuses:
-            query = query.filter(Employee.status.in_(statuses))
+        if projection:
+            query = self.project_list(query)
+
+        # 커서 페이지네이션 분기 (정렬 컬럼 + id 키셋 탐색)
+        if cursor_mode or cursor:
+            from app.shared.utils.cursor_pagination import keyset_paginate
+            sort_column = Employee.id
+            if sort_by in self.KEYSET_SORT_COLUMNS:
+                sort_column = getattr(Employee, sort_by)
+            return keyset_paginate(
+                query, sort_column, Employee.id,
+                per_page=per_page or 20,
+                cursor=cursor,
+                descending=sort_order == 'desc',
+                with_total=with_total,
+            )
 
         # 정렬
         if sort_by:
@@ -416,8 +670,153 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
             return query.paginate(page=page, per_page=per_page, error_out=False)
         else:
             employees = query.all()
+            if projection:
+                return [row._asdict() for row in employees]
             return [emp.to_dict() for emp in employees]
 
+    def _filtered_query(self, organization_id: int = None, search: str = None, **facet_filters):
+        """filter_employees/iter_export_rows 공통 필터 쿼리 (정렬 미적용)"""
+        query = self._build_query(organization_id)
+
+        # 검색어 필터 (search()와 동일 조건: 검색 컬럼 부분 일치 / 초성)
+        if search:
+            query = query.filter(self._search_clause(search))
+
+        for clauses in self._facet_clauses(**facet_filters).values():
+            query = query.filter(*clauses)
+        return query
+
+    def _facet_clauses(self, department: str = None, position: str = None, status: str = None,
+                       departments: List[str] = None, positions: List[str] = None,
+                       statuses: List[str] = None) -> Dict[str, list]:
+        """부서/직급/상태 필터 조건 (패싯별 분리: 패싯 집계 시 자기 조건 제외용)"""
+        clauses = {'department': [], 'position': [], 'status': []}
+
+        # 단일 필터 (하위 호환성)
+        if department:
+            clauses['department'].append(Employee.department == department)
+        if position:
+            clauses['position'].append(Employee.position == position)
+        if status:
+            clauses['status'].append(Employee.status == status)
+
+        # 다중 필터
+        if departments:
+            clauses['department'].append(Employee.department.in_(departments))
+        if positions:
+            clauses['position'].append(Employee.position.in_(positions))
+        if statuses:
+            clauses['status'].append(Employee.status.in_(statuses))
+        return clauses
+
+    def get_facet_counts(self, organization_id: int = None, search: str = None,
+                         **facet_filters) -> Dict[str, Dict]:
+        """목록 필터 패싯별 건수 (단일 쿼리)
+
+        각 패싯은 자기 필터를 제외한 나머지 필터 조건으로 집계합니다
+        (부서를 선택해도 다른 부서의 건수를 표시).
+        - PostgreSQL: GROUPING SETS 단일 스캔 + 패싯별 조건부 COUNT
+        - 그 외(SQLite): 패싯별 GROUP BY를 UNION ALL로 묶은 단일 문장
+
+        Args:
+            organization_id: 루트 조직 ID
+            search: 검색어
+            **facet_filters: department(s), position(s), status(es)
+
+        Returns:
+            {'department' | 'position' | 'status' | 'employment_type': {값: 건수},
+             'organization': {조직 ID: 건수}, 'organization_names': {조직 ID: 조직명}}
+        """
+        from app.domains.company.models import Organization
+        from app.domains.employee.models import Contract
+
+        groups = {
+            'department': (Employee.department,),
+            'position': (Employee.position,),
+            'status': (Employee.status,),
+            'organization': (Employee.organization_id, Organization.name),
+            'employment_type': (Contract.employee_type,),
+        }
+        clauses = self._facet_clauses(**facet_filters)
+
+        def conditions(facet):
+            return [c for name, items in clauses.items() if name != facet for c in items]
+
+        base = self._filtered_query(organization_id, search).outerjoin(
+            Organization, Organization.id == Employee.organization_id
+        ).outerjoin(Contract, Contract.employee_id == Employee.id)
+
+        result = {facet: {} for facet in groups}
+        result['organization_names'] = {}
+
+        def collect(facet, value, label, count):
+            if value is None or not count:
+                return
+            result[facet][value] = count
+            if facet == 'organization':
+                result['organization_names'][value] = label
+
+        if db.session.get_bind().dialect.name == 'postgresql':
+            flags, keys, counts = [], [], []
+            for facet, columns in groups.items():
+                flags.append(db.func.grouping(columns[0]).label(f'{facet}_grouping'))
+                keys.extend(column.label(f'{facet}_{i}') for i, column in enumerate(columns))
+                condition = conditions(facet)
+                count = (db.func.count(db.case((db.and_(*condition), Employee.id)))
+                         if condition else db.func.count(Employee.id))
+                counts.append(count.label(f'{facet}_count'))
+            grouping_sets = db.func.grouping_sets(*[db.tuple_(*columns) for columns in groups.values()])
+            for row in base.with_entities(*flags, *keys, *counts).group_by(grouping_sets):
+                mapping = row._mapping
+                facet = next(name for name in groups if mapping[f'{name}_grouping'] == 0)
+                label = mapping['organization_1'] if facet == 'organization' else None
+                collect(facet, mapping[f'{facet}_0'], label, mapping[f'{facet}_count'])
+            return result
+
+        selects = []
+        for facet, columns in groups.items():
+            label = columns[1] if len(columns) > 1 else db.null()
+            selects.append(
+                base.filter(*conditions(facet)).with_entities(
+                    db.literal(facet).label('facet'),
+                    db.cast(columns[0], db.String).label('value'),
+                    label.label('label'),
+                    db.func.count(Employee.id).label('count'),
+                ).group_by(*columns).statement
+            )
+        for facet, value, label, count in db.session.execute(db.union_all(*selects)):
+            if facet == 'organization' and value is not None:
+                value = int(value)
+            collect(facet, value, label, count)
+        return result
+
+    def iter_export_rows(self, fields, sort_by: str = None, sort_order: str = 'asc',
+                         batch_size: int = 1000, **filters):
+        """내보내기용 컬럼 행 스트리밍 조회 (yield_per 서버 측 커서)
+
+        모델 객체 없이 지정 컬럼 Row를 batch_size 단위로 가져오므로
+        전체 건수와 무관하게 메모리 사용량이 일정합니다.
+
+        Args:
+            fields: 조회할 Employee 컬럼명 목록
+            sort_by: 정렬 기준 컬럼 (KEYSET_SORT_COLUMNS, 기본 id)
+            sort_order: 정렬 순서 (asc/desc)
+            batch_size: DB 페치 단위
+            **filters: filter_employees와 동일한 필터
+                (organization_id, search, department(s), position(s), status(es))
+
+        Yields:
+            컬럼명 속성을 가진 Row
+        """
+        columns = [getattr(Employee, field) for field in fields]
+        sort_column = getattr(Employee, sort_by) if sort_by in self.KEYSET_SORT_COLUMNS else Employee.id
+        order = [sort_column.desc() if sort_order == 'desc' else sort_column.asc()]
+        if sort_column is not Employee.id:
+            order.append(Employee.id)
+
+        query = self._filtered_query(**filters).with_entities(*columns).order_by(*order)
+        yield from query.yield_per(batch_size)
+
     def _generate_new_id(self) -> int:
         """새 직원 ID 생성 (Integer 자동 증가)"""
         last_employee = Employee.query.order_by(Employee.id.desc()).first()
@@ -468,11 +867,10 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         Returns:
             직원 수
         """
-        from app.domains.company.models import Company
-        company = Company.query.get(company_id)
-        if not company or not company.root_organization_id:
+        query = self._build_company_query(company_id)
+        if query is None:
             return 0
-        return self._build_query(company.root_organization_id).count()
+        return query.count()
 
     def count_by_status_and_company(
         self,
@@ -488,11 +886,10 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         Returns:
             직원 수
         """
-        from app.domains.company.models import Company
-        company = Company.query.get(company_id)
-        if not company or not company.root_organization_id:
+        query = self._build_company_query(company_id)
+        if query is None:
             return 0
-        return self._build_query(company.root_organization_id).filter_by(status=status).count()
+        return query.filter_by(status=status).count()
 
     def find_by_company_id(self, company_id: int) -> List[Employee]:
         """회사 ID로 직원 목록 조회 (Model 반환)
@@ -506,11 +903,90 @@ class EmployeeRepository(BaseRepository[Employee], TenantFilterMixin):
         Returns:
             Employee 모델 객체 리스트
         """
-        from app.domains.company.models import Company
-        company = Company.query.get(company_id)
-        if not company or not company.root_organization_id:
+        query = self._build_company_query(company_id)
+        if query is None:
             return []
-        return self._build_query(company.root_organization_id).all()
+        return query.all()
+
+    # ========================================
+    # company_id 정합성 (company_id 스코프 모드 전환용)
+    # ========================================
+
+    def find_company_id_mismatches(self, company_id: int = None) -> List[Dict]:
+        """조직 트리 기준 회사와 employees.company_id가 다른 직원 조회
+
+        직원 조직의 가장 가까운 상위 루트 조직(Company.root_organization_id)을
+        organization_closure로 찾아 기대 회사 ID로 사용합니다.
+        조직 미배정 직원이나 어느 회사 트리에도 속하지 않는 직원은 판정 대상에서 제외됩니다.
+
+        Args:
+            company_id: 특정 회사로 제한 (현재값 또는 기대값 기준, None이면 전체)
+
+        Returns:
+            [{'employee_id', 'company_id', 'expected_company_id'}, ...]
+        """
+        from app.domains.company.models import Company, OrganizationClosure
+
+        expected = db.select(Company.id).join(
+            OrganizationClosure,
+            OrganizationClosure.ancestor_id == Company.root_organization_id
+        ).where(
+            OrganizationClosure.descendant_id == Employee.organization_id
+        ).order_by(OrganizationClosure.depth).limit(1).correlate(Employee).scalar_subquery()
+
+        sub = db.session.query(
+            Employee.id.label('employee_id'),
+            Employee.company_id.label('company_id'),
+            expected.label('expected_company_id'),
+        ).filter(Employee.organization_id.isnot(None)).subquery()
+
+        query = db.session.query(sub).filter(
+            sub.c.expected_company_id.isnot(None),
+            db.or_(
+                sub.c.company_id.is_(None),
+                sub.c.company_id != sub.c.expected_company_id,
+            )
+        )
+        if company_id:
+            query = query.filter(db.or_(
+                sub.c.company_id == company_id,
+                sub.c.expected_company_id == company_id,
+            ))
+
+        return [
+            {
+                'employee_id': row.employee_id,
+                'company_id': row.company_id,
+                'expected_company_id': row.expected_company_id,
+            }
+            for row in query.order_by(sub.c.employee_id).all()
+        ]
+
+    def backfill_company_ids(self, company_id: int = None, commit: bool = True) -> int:
+        """employees.company_id를 조직 트리 기준 회사로 일괄 보정
+
+        Args:
+            company_id: 특정 회사로 제한 (None이면 전체)
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+
+        Returns:
+            보정된 직원 수
+        """
+        mismatches = self.find_company_id_mismatches(company_id)
+
+        ids_by_company: Dict[int, List[int]] = {}
+        for row in mismatches:
+            ids_by_company.setdefault(row['expected_company_id'], []).append(row['employee_id'])
+
+        for expected_company_id, employee_ids in ids_by_company.items():
+            Employee.query.filter(Employee.id.in_(employee_ids)).update(
+                {Employee.company_id: expected_company_id},
+                synchronize_session=False
+            )
+
+        if commit:
+            db.session.commit()
+        return len(mismatches)
 
     def find_by_id(self, employee_id: int) -> Optional[Employee]:
         """ID로 직원 조회 (Model 반환)
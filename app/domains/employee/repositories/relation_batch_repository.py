@@ -0,0 +1,154 @@
+"""
+RelationBatch Repository
+
+직원 상세(인사카드) 화면의 관계형 데이터(학력~첨부파일 21개 테이블)를
+단일 UNION ALL 문으로 조회합니다. (관계별 Repository 호출 시 테이블당 1회 왕복)
+
+- 결과 컬럼(slot)은 타입별로 테이블 간 공유, 테이블은 자기 컬럼 slot만 채우고 나머지는 NULL
+- 첫 번째 컬럼(kind)으로 테이블을 구분하여 모델 인스턴스로 복원
+- 복원된 인스턴스는 세션에 연결되지 않은 읽기 전용 객체 (to_dict() 용도)
+- 문장은 employee_id/year 바인드 파라미터로 1회 생성 후 재사용 (컴파일 캐시)
+"""
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Integer, bindparam, cast, literal_column, null, select, union_all
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.database import db
+
+
+class RelationBatchRepository:
+    """직원 관계형 데이터 일괄 조회 저장소"""
+
+    # (관계 키, employee 모델명) - UNION ALL 순서
+    EMPLOYEE_RELATIONS = (
+        ('education', 'Education'),
+        ('career', 'Career'),
+        ('certificate', 'Certificate'),
+        ('family', 'FamilyMember'),
+        ('language', 'Language'),
+        ('salary', 'Salary'),
+        ('benefit', 'Benefit'),
+        ('contract', 'Contract'),
+        ('salary_history', 'SalaryHistory'),
+        ('promotion', 'Promotion'),
+        ('evaluation', 'Evaluation'),
+        ('training', 'Training'),
+        ('attendance', 'Attendance'),  # 조회 연도(year)만
+        ('insurance', 'Insurance'),
+        ('hr_project', 'HrProject'),
+        ('project_participation', 'ProjectParticipation'),
+        ('award', 'Award'),
+        ('asset', 'Asset'),
+        ('salary_payment', 'SalaryPayment'),
+        ('employment_contract', 'EmploymentContract'),
+    )
+    ATTACHMENT = 'attachment'
+
+    def __init__(self):
+        self._statement = None
+        # kind 인덱스 → (관계 키, 모델, [(행 위치, 속성명)])
+        self._layouts: List[Tuple[str, type, List[Tuple[int, str]]]] = []
+
+    def _sources(self) -> List[Tuple[str, type, object]]:
+        """(관계 키, 모델, 조회 조건) 목록"""
+        from app.domains.attachment.models import Attachment
+        from app.domains.employee import models
+
+        employee_id = bindparam('employee_id', type_=Integer)
+        sources = []
+        for key, model_name in self.EMPLOYEE_RELATIONS:
+            model = getattr(models, model_name)
+            condition = model.employee_id == employee_id
+            if key == 'attendance':
+                condition = condition & (model.year == bindparam('year', type_=Integer))
+            sources.append((key, model, condition))
+        sources.append((
+            self.ATTACHMENT, Attachment,
+            (Attachment.owner_type == 'employee') & (Attachment.owner_id == employee_id),
+        ))
+        return sources
+
+    def _build(self):
+        """UNION ALL 문과 행 레이아웃 생성 (최초 1회)
+
+        slot은 컬럼 타입별로 테이블 간 공유합니다. (결과 폭 = 타입별 최대 컬럼 수의 합)
+        빈 slot은 CAST(NULL AS slot 타입)으로 채웁니다.
+        (PostgreSQL은 UNION을 두 분기씩 해석하므로 타입 없는 NULL이 앞 분기들에서 text로 정해지면
+         뒤 분기의 boolean/numeric/date 컬럼과 타입 불일치 오류)
+        """
+        sources = self._sources()
+
+        # 테이블별 (타입, 타입 내 순번) → 공유 slot 위치
+        slot_counts: Dict[type, int] = {}
+        assignments = []
+        for _, model, _ in sources:
+            used: Dict[type, int] = {}
+            assigned = []
+            for prop in model.__mapper__.column_attrs:
+                column = prop.columns[0]
+                type_class = type(column.type)
+                assigned.append((type_class, used.get(type_class, 0), prop.key, column))
+                used[type_class] = used.get(type_class, 0) + 1
+            for type_class, count in used.items():
+                slot_counts[type_class] = max(slot_counts.get(type_class, 0), count)
+            assignments.append(assigned)
+
+        slots = []  # (타입, 타입 내 순번)
+        for type_class, count in slot_counts.items():
+            slots.extend((type_class, ordinal) for ordinal in range(count))
+        slot_types = {}
+        for assigned in assignments:
+            for type_class, ordinal, _, column in assigned:
+                slot_types.setdefault((type_class, ordinal), column.type)
+
+        selects = []
+        layouts = []
+        for index, ((key, model, condition), assigned) in enumerate(zip(sources, assignments)):
+            owned = {(type_class, ordinal): (attr, column)
+                     for type_class, ordinal, attr, column in assigned}
+            columns = [literal_column(str(index), Integer).label('kind')]
+            positions = []
+            for position, slot in enumerate(slots, start=1):
+                if slot in owned:
+                    attr, column = owned[slot]
+                    columns.append(column.label(f'c{position}'))
+                    positions.append((position, attr))
+                else:
+                    columns.append(cast(null(), slot_types[slot]).label(f'c{position}'))
+            selects.append(select(*columns).where(condition))
+            layouts.append((key, model, positions))
+
+        self._layouts = layouts
+        self._statement = union_all(*selects)
+
+    def find_for_employee(self, employee_id: int, year: int) -> Dict[str, List]:
+        """직원의 관계형 데이터 일괄 조회 (SQL 1회)
+
+        Args:
+            employee_id: 직원 ID
+            year: 근태(attendance) 조회 연도
+
+        Returns:
+            {관계 키: 모델 인스턴스 목록 (id 오름차순)}
+            1:1 관계(salary 등)도 목록이며, 첨부파일 키는 ATTACHMENT
+        """
+        if self._statement is None:
+            self._build()
+
+        result: Dict[str, List] = {key: [] for key, _, _ in self._layouts}
+        rows = db.session.execute(self._statement, {'employee_id': employee_id, 'year': year})
+        for row in rows:
+            key, model, positions = self._layouts[row[0]]
+            instance = model.__mapper__.class_manager.new_instance()
+            for position, attr in positions:
+                set_committed_value(instance, attr, row[position])
+            result[key].append(instance)
+
+        for instances in result.values():
+            instances.sort(key=lambda instance: instance.id)
+        return result
+
+
+# 싱글톤 인스턴스
+relation_batch_repository = RelationBatchRepository()
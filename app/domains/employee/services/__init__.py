@@ -31,6 +31,9 @@ from .employee_account_service import EmployeeAccountService, employee_account_s
 from .profile_relation_service import ProfileRelationService, profile_relation_service
 from .inline_edit_service import InlineEditService, inline_edit_service
 from .validation_service import SectionValidationService, validation_service
+from .typeahead_index import EmployeeTypeaheadIndex, employee_typeahead_index
+from .employee_export_service import EmployeeExportService, employee_export_service
+from .employee_relation_loader import EmployeeRelationLoader, employee_relation_loader
 
 
 class EmployeeService:
@@ -189,6 +192,9 @@ class EmployeeService:
     def get_all_employees(self, organization_id: int = None) -> List[Dict]:
         return self.core.get_all_employees(organization_id)
 
+    def get_filter_facets(self, organization_id: int = None, **filters) -> Dict[str, Dict]:
+        return self.core.get_filter_facets(organization_id, **filters)
+
     def get_employees_by_ids(self, employee_ids: List[int]) -> List[Dict]:
         return self.core.get_employees_by_ids(employee_ids)
 
@@ -242,8 +248,18 @@ class EmployeeService:
     def get_recent_employees(self, organization_id: int = None, limit: int = 5) -> List[Dict]:
         return self.core.get_recent_employees(organization_id, limit)
 
-    def search_employees(self, query: str, organization_id: int = None) -> List[Dict]:
-        return self.core.search_employees(query, organization_id)
+    def get_dashboard(self, organization_id: int = None, recent_limit: int = 5) -> Dict:
+        return self.core.get_dashboard(organization_id, recent_limit)
+
+    def get_headcount_trend(self, organization_id: int, days: int = 30) -> List[Dict]:
+        return self.core.get_headcount_trend(organization_id, days)
+
+    def search_employees(self, query: str, organization_id: int = None, limit: int = None,
+                         projection: bool = False) -> List[Dict]:
+        return self.core.search_employees(query, organization_id, limit=limit, projection=projection)
+
+    def get_pending_contract_employees(self, company_id: int, page: int = 1, per_page: int = 20):
+        return self.core.get_pending_contract_employees(company_id, page, per_page)
 
     def get_employees_with_contracts(
         self,
@@ -417,9 +433,9 @@ class EmployeeService:
     # 관계형 데이터 일괄 업데이트 (내부용)
     # ========================================
 
-    def _update_all_related_data(self, employee_id: int, form_data: Dict):
-        """모든 관계형 데이터 일괄 업데이트"""
-        self.relation.update_all_related_data(employee_id, form_data)
+    def _update_all_related_data(self, employee_id: int, form_data: Dict) -> Dict[str, Dict]:
+        """모든 관계형 데이터 일괄 업데이트 (관계 타입별 변경 요약 반환)"""
+        return self.relation.update_all_related_data(employee_id, form_data)
 
     def _update_military_data(self, employee_id: int, form_data: Dict):
         """병역 정보 업데이트"""
@@ -459,6 +475,9 @@ __all__ = [
     'ProfileRelationService',
     'InlineEditService',
     'SectionValidationService',
+    'EmployeeTypeaheadIndex',
+    'EmployeeExportService',
+    'EmployeeRelationLoader',
     'employee_service',
     'employee_core_service',
     'employee_relation_service',
@@ -466,4 +485,7 @@ __all__ = [
     'profile_relation_service',
     'inline_edit_service',
     'validation_service',
+    'employee_typeahead_index',
+    'employee_export_service',
+    'employee_relation_loader',
 ]
@@ -10,12 +10,13 @@ Employee Core Service
 Phase 3: EmployeeService 분리 - Core Service
 Phase 28: RRN 파싱/자동입력, 신규 필드 추가, blood_type/religion 삭제
 """
+from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.database import db
 from app.domains.employee.models import Employee
 from app.shared.utils.transaction import atomic_transaction
-from app.shared.utils.tenant import get_current_organization_id
+from app.shared.utils.tenant import get_current_company_id, get_current_organization_id
 from app.shared.constants.status import EmployeeStatus
 from app.shared.utils.rrn_parser import RRNParser
 
@@ -33,6 +34,12 @@ class EmployeeCoreService:
         from app.extensions import employee_repo
         return employee_repo
 
+    @property
+    def organization_repo(self):
+        """지연 초기화된 조직 Repository"""
+        from app.domains.company.repositories import organization_repository
+        return organization_repository
+
     # ========================================
     # 멀티테넌시 접근 제어
     # ========================================
@@ -92,6 +99,31 @@ class EmployeeCoreService:
         models = self.employee_repo.find_all(organization_id=organization_id)
         return [m.to_dict() for m in models]
 
+    # 패싯 건수에 영향을 주는 필터 인자
+    FACET_FILTER_KEYS = ('search', 'department', 'position', 'status',
+                         'departments', 'positions', 'statuses')
+
+    def get_filter_facets(self, organization_id: int = None, **filters) -> Dict[str, Dict]:
+        """목록 필터 패싯별 건수 (테넌트 데이터 버전 캐시)
+
+        Args:
+            organization_id: 루트 조직 ID
+            **filters: filter_employees와 동일한 필터 (정렬/페이지 인자는 무시)
+
+        Returns:
+            EmployeeRepository.get_facet_counts 결과 (수정 금지)
+        """
+        from app.shared.utils.tenant_data_cache import tenant_data_cache
+        facet_filters = {key: filters[key] for key in self.FACET_FILTER_KEYS if filters.get(key)}
+        cache_key = tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in facet_filters.items()
+        ))
+        return tenant_data_cache.get_or_load(
+            'employee_facets', organization_id, cache_key,
+            lambda: self.employee_repo.get_facet_counts(organization_id, **facet_filters)
+        )
+
     # ========================================
     # 직원 CRUD (직접 호출 - Blueprint용)
     # ========================================
@@ -134,7 +166,8 @@ class EmployeeCoreService:
 
             with atomic_transaction():
                 employee = self._extract_employee_from_form(form_data)
-                employee.company_id = org_id
+                # company_id 스코프 정합성: 루트 조직 ID가 아닌 회사 ID 저장
+                employee.company_id = get_current_company_id()
 
                 self.employee_repo.create(employee, commit=False)
                 db.session.flush()
@@ -249,9 +282,59 @@ class EmployeeCoreService:
         """최근 입사 직원 조회"""
         return self.employee_repo.get_recent_employees(limit=limit, organization_id=organization_id)
 
-    def search_employees(self, query: str, organization_id: int = None) -> List[Dict]:
-        """직원 검색"""
-        return self.employee_repo.search(query, organization_id=organization_id)
+    def get_dashboard(self, organization_id: int = None, recent_limit: int = 5) -> Dict:
+        """대시보드 데이터 (테넌트 데이터 버전 캐시)
+
+        현황 카드는 당일 현황 스냅샷(tenant_daily_stats)을 읽고,
+        스냅샷이 없으면 조건부 COUNT 단일 쿼리로 집계합니다.
+        부서별 현황은 org_headcount 롤업, 최근 입사자는 목록 프로젝션 컬럼만 조회합니다.
+
+        Args:
+            organization_id: 루트 조직 ID
+            recent_limit: 최근 입사자 수
+
+        Returns:
+            {'stats': 상태별 건수, 'dept_stats': 부서별 인원 목록, 'recent_employees': 직원 목록}
+            (캐시 값이므로 수정 금지)
+        """
+        from app.shared.utils.tenant_data_cache import tenant_data_cache
+
+        def load():
+            snapshot = None
+            if organization_id:
+                today = date.today()
+                snapshots = self.organization_repo.find_daily_stats(organization_id, today, today)
+                snapshot = snapshots[0] if snapshots else None
+            return {
+                'stats': (snapshot.to_statistics() if snapshot
+                          else self.employee_repo.get_statistics(organization_id)),
+                'dept_stats': self.employee_repo.get_department_statistics(organization_id),
+                'recent_employees': self.employee_repo.get_recent_employees(
+                    limit=recent_limit, organization_id=organization_id, projection=True
+                ),
+            }
+
+        return tenant_data_cache.get_or_load('dashboard', organization_id, recent_limit, load)
+
+    def get_headcount_trend(self, organization_id: int, days: int = 30) -> List[Dict]:
+        """일별 직원 현황 추이 (tenant_daily_stats 스냅샷)
+
+        Args:
+            organization_id: 루트 조직 ID
+            days: 조회 일수 (오늘 포함)
+
+        Returns:
+            [{'date', 'total', 'active', 'on_leave', 'resigned'}] (기준일 오름차순, 스냅샷 없는 날 제외)
+        """
+        start_date = date.today() - timedelta(days=days - 1)
+        return [row.to_dict() for row in self.organization_repo.find_daily_stats(organization_id, start_date)]
+
+    def search_employees(self, query: str, organization_id: int = None, limit: int = None,
+                         projection: bool = False) -> List[Dict]:
+        """직원 검색 (관련도 순, 초성 검색 지원 / projection=True면 목록 컬럼만)"""
+        return self.employee_repo.search(
+            query, organization_id=organization_id, limit=limit, projection=projection
+        )
 
     def get_employees_by_ids(self, employee_ids: List[int]) -> List[Dict]:
         """여러 직원 ID로 조회 (벌크)
@@ -267,6 +350,22 @@ class EmployeeCoreService:
         employees = self.employee_repo.find_by_ids(employee_ids)
         return [emp.to_dict() for emp in employees]
 
+    def get_pending_contract_employees(self, company_id: int, page: int = 1, per_page: int = 20):
+        """계약대기 직원 목록 (계약 없음 또는 계약 요청 중, 페이지 단위)
+
+        Args:
+            company_id: 법인 ID
+            page: 페이지 번호
+            per_page: 페이지당 항목 수
+
+        Returns:
+            Tuple[직원 Dict 목록, Pagination]
+        """
+        pagination = self.employee_repo.find_pending_contract_employees(
+            company_id, page=page, per_page=per_page
+        )
+        return [row._asdict() for row in pagination.items], pagination
+
     def get_employees_with_contracts(
         self,
         employees: List[Dict],
@@ -0,0 +1,108 @@
+"""
+직원 내보내기 서비스
+
+직원 목록 필터와 동일한 조건으로 CSV/XLSX 파일을 스트리밍 생성합니다.
+- DB: EmployeeRepository.iter_export_rows (컬럼 Row, yield_per 서버 측 커서)
+- 파일: app.shared.utils.export_stream (행 단위 청크 생성)
+
+사용법:
+    from app.domains.employee.services import employee_export_service
+
+    chunks, mimetype, filename = employee_export_service.stream_export(
+        'xlsx', organization_id=org_id, statuses=['active']
+    )
+    return Response(stream_with_context(chunks), mimetype=mimetype)
+"""
+from datetime import date
+from typing import Dict, Iterator, Tuple
+
+from app.shared.constants.field_options import FieldOptions
+from app.shared.utils.export_stream import CSV_MIMETYPE, XLSX_MIMETYPE, iter_csv, iter_xlsx
+
+
+class EmployeeExportService:
+    """직원 내보내기 서비스"""
+
+    FORMAT_CSV = 'csv'
+    FORMAT_XLSX = 'xlsx'
+    FORMATS = (FORMAT_CSV, FORMAT_XLSX)
+
+    # (컬럼, 헤더, 열 너비) - 대시보드 내보내기 컬럼과 동일
+    COLUMNS = (
+        ('employee_number', '사번', 14),
+        ('name', '이름', 12),
+        ('department', '부서', 14),
+        ('position', '직급', 10),
+        ('email', '이메일', 24),
+        ('phone', '연락처', 16),
+        ('hire_date', '입사일', 12),
+        ('status', '상태', 10),
+    )
+    SHEET_NAME = '직원현황'
+
+    @property
+    def employee_repo(self):
+        """지연 초기화된 직원 Repository"""
+        from app.domains.employee.repositories.employee_repository import employee_repository
+        return employee_repository
+
+    def iter_rows(self, sort_by: str = None, sort_order: str = 'asc', **filters) -> Iterator[tuple]:
+        """내보내기 데이터 행 (상태는 표시 라벨로 변환)
+
+        Args:
+            sort_by: 정렬 기준 컬럼
+            sort_order: 정렬 순서 (asc/desc)
+            **filters: filter_employees와 동일한 필터
+
+        Yields:
+            COLUMNS 순서의 값 튜플
+        """
+        fields = [column for column, _, _ in self.COLUMNS]
+        status_index = fields.index('status')
+        labels: Dict[str, str] = {}
+
+        for row in self.employee_repo.iter_export_rows(fields, sort_by=sort_by,
+                                                       sort_order=sort_order, **filters):
+            values = list(row)
+            status = values[status_index]
+            if status:
+                if status not in labels:
+                    labels[status] = FieldOptions.get_label_with_legacy(
+                        FieldOptions.EMPLOYEE_STATUS, status
+                    )
+                values[status_index] = labels[status]
+            yield values
+
+    def stream_export(self, export_format: str, sort_by: str = None, sort_order: str = 'asc',
+                      **filters) -> Tuple[Iterator[bytes], str, str]:
+        """내보내기 스트림 생성
+
+        Args:
+            export_format: 'csv' 또는 'xlsx'
+            sort_by: 정렬 기준 컬럼
+            sort_order: 정렬 순서 (asc/desc)
+            **filters: filter_employees와 동일한 필터
+
+        Returns:
+            Tuple[바이트 청크 이터레이터, MIME 타입, 파일명]
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(f'지원하지 않는 내보내기 형식입니다: {export_format}')
+
+        header = [label for _, label, _ in self.COLUMNS]
+        rows = self.iter_rows(sort_by=sort_by, sort_order=sort_order, **filters)
+        filename = f'{self.SHEET_NAME}_{date.today():%Y%m%d}.{export_format}'
+
+        if export_format == self.FORMAT_CSV:
+            return iter_csv(header, rows), CSV_MIMETYPE, filename
+
+        widths = [width for _, _, width in self.COLUMNS]
+        chunks = iter_xlsx(header, rows, sheet_name=self.SHEET_NAME, column_widths=widths)
+        return chunks, XLSX_MIMETYPE, filename
+
+
+# 싱글톤 인스턴스
+employee_export_service = EmployeeExportService()
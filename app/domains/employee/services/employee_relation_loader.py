@@ -0,0 +1,111 @@
+"""
+직원 관계형 데이터 일괄 로더
+
+직원 상세(인사카드)/마이페이지의 관계형 데이터를 SQL 1회로 조회하여
+EmployeeRelationService 개별 조회 메서드(get_education_list 등)와 같은 형식의 Dict로 반환합니다.
+- DB: RelationBatchRepository.find_for_employee (21개 테이블 UNION ALL)
+- 명함 이미지는 조회된 첨부파일 목록에서 선택 (latest_attachment)
+
+사용법:
+    from app.domains.employee.services import employee_relation_loader
+
+    data = employee_relation_loader.load(employee_id)
+    data, query_count = employee_relation_loader.load_with_query_count(employee_id)
+"""
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from app.shared.utils.query_counter import count_queries
+
+
+class EmployeeRelationLoader:
+    """직원 관계형 데이터 일괄 로더"""
+
+    # 결과 키 → 관계 키 (목록)
+    LIST_KEYS = (
+        ('education_list', 'education'),
+        ('career_list', 'career'),
+        ('certificate_list', 'certificate'),
+        ('family_list', 'family'),
+        ('language_list', 'language'),
+        ('salary_history_list', 'salary_history'),
+        ('promotion_list', 'promotion'),
+        ('evaluation_list', 'evaluation'),
+        ('training_list', 'training'),
+        ('hr_project_list', 'hr_project'),
+        ('project_participation_list', 'project_participation'),
+        ('award_list', 'award'),
+        ('asset_list', 'asset'),
+        ('salary_payment_list', 'salary_payment'),
+        ('employment_contract_list', 'employment_contract'),
+    )
+    # 결과 키 → 관계 키 (1:1, 없으면 None)
+    ONE_KEYS = (
+        ('salary', 'salary'),
+        ('benefit', 'benefit'),
+        ('contract', 'contract'),
+        ('insurance', 'insurance'),
+    )
+
+    @property
+    def batch_repo(self):
+        """지연 초기화된 일괄 조회 Repository"""
+        from app.domains.employee.repositories.relation_batch_repository import (
+            relation_batch_repository,
+        )
+        return relation_batch_repository
+
+    def load(self, employee_id: int, year: int = None) -> Dict:
+        """직원 전체 조회 데이터 (get_employee_full_view_data 형식)
+
+        Args:
+            employee_id: 직원 ID
+            year: 근태 요약 조회 연도 (기본: 현재 연도)
+
+        Returns:
+            education_list ~ attachment_list, attendance_summary 키를 가진 Dict
+        """
+        from app.domains.employee.repositories.attendance_repository import AttendanceRepository
+
+        if year is None:
+            year = date.today().year
+        relations = self.batch_repo.find_for_employee(employee_id, year)
+
+        data = {key: [m.to_dict() for m in relations[relation]]
+                for key, relation in self.LIST_KEYS}
+        for key, relation in self.ONE_KEYS:
+            models = relations[relation]
+            data[key] = models[0].to_dict() if models else None
+        data['attendance_summary'] = AttendanceRepository.summarize(relations['attendance'], year)
+
+        # AttachmentRepository.get_by_owner와 같은 display_order 순
+        attachments = sorted(relations[self.batch_repo.ATTACHMENT],
+                             key=lambda m: (m.display_order or 0, m.id))
+        data['attachment_list'] = [m.to_dict() for m in attachments]
+        return data
+
+    def load_with_query_count(self, employee_id: int, year: int = None) -> Tuple[Dict, int]:
+        """load() 결과와 실행된 SQL 문 수 (쿼리 수 상한 검증용)"""
+        with count_queries() as counter:
+            data = self.load(employee_id, year)
+        return data, counter.count
+
+    @staticmethod
+    def latest_attachment(attachment_list: List[Dict], category: str) -> Optional[Dict]:
+        """카테고리별 최신 첨부파일 (get_attachment_by_category와 같은 upload_date 최신 1개)
+
+        Args:
+            attachment_list: load()의 attachment_list
+            category: 첨부파일 카테고리
+
+        Returns:
+            첨부파일 Dict 또는 None
+        """
+        matches = [a for a in attachment_list if a.get('category') == category]
+        if not matches:
+            return None
+        return max(matches, key=lambda a: (a.get('upload_date') or '', a.get('id') or 0))
+
+
+# 싱글톤 인스턴스
+employee_relation_loader = EmployeeRelationLoader()
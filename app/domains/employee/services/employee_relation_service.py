@@ -367,17 +367,22 @@ class EmployeeRelationService:
     # 전체 관계형 데이터 업데이트 (내부용)
     # ========================================
 
-    def update_all_related_data(self, employee_id: int, form_data: Dict):
+    def update_all_related_data(self, employee_id: int, form_data: Dict) -> Dict[str, Dict]:
         """모든 관계형 데이터 일괄 업데이트
 
-        RelationDataUpdater를 사용하여 관계 타입을 처리합니다.
+        RelationDataUpdater.update_diff로 관계 타입별 변경분만 반영합니다.
+
+        Returns:
+            {관계 타입: RelationChangeSummary.to_dict()} (감사 로그용)
         """
         repos = self._get_repositories()
 
         # 1:N 관계 데이터 일괄 처리
+        changes = {}
         for relation_type in SUPPORTED_RELATION_TYPES:
             config = get_relation_config(relation_type, repos)
-            relation_updater.update(employee_id, form_data, config)
+            changes[relation_type] = relation_updater.update_diff(employee_id, form_data, config).to_dict()
+        return changes
 
     def save_insurance_data(self, employee_id: int, data: Dict, commit: bool = True) -> Dict:
         """4대보험 데이터 저장 (Phase 28: upsert)
@@ -400,7 +405,7 @@ class EmployeeRelationService:
         """직원 전체 조회 데이터 통합 반환 (N+1 쿼리 최적화)
 
         detail_routes.py, mypage.py에서 사용되는 모든 관계형 데이터를
-        한 번에 조회하여 반환합니다.
+        단일 UNION ALL 쿼리로 조회하여 반환합니다. (employee_relation_loader)
 
         Args:
             employee_id: 직원 ID
@@ -409,48 +414,14 @@ class EmployeeRelationService:
         Returns:
             Dict containing all relation data for employee detail view:
             - education_list, career_list, certificate_list, family_list
-            - language_list, military, salary, benefit, contract
+            - language_list, salary, benefit, contract
             - salary_history_list, promotion_list, evaluation_list
             - training_list, attendance_summary, insurance
             - hr_project_list, project_participation_list, award_list
-            - asset_list, salary_payment_list, attachment_list
+            - asset_list, salary_payment_list, employment_contract_list, attachment_list
         """
-        from datetime import date
-        if year is None:
-            year = date.today().year
-
-        return {
-            # 기본 이력 데이터
-            'education_list': self.get_education_list(employee_id),
-            'career_list': self.get_career_list(employee_id),
-            'certificate_list': self.get_certificate_list(employee_id),
-            'family_list': self.get_family_list(employee_id),
-            'language_list': self.get_language_list(employee_id),
-
-            # 핵심 기능 데이터
-            'salary': self.get_salary_info(employee_id),
-            'benefit': self.get_benefit_info(employee_id),
-            'contract': self.get_contract_info(employee_id),
-            'salary_history_list': self.get_salary_history_list(employee_id),
-
-            # 인사평가 기능 데이터
-            'promotion_list': self.get_promotion_list(employee_id),
-            'evaluation_list': self.get_evaluation_list(employee_id),
-            'training_list': self.get_training_list(employee_id),
-            'attendance_summary': self.get_attendance_summary(employee_id, year),
-
-            # 부가 기능 데이터
-            'insurance': self.get_insurance_info(employee_id),
-            'hr_project_list': self.get_hr_project_list(employee_id),
-            'project_participation_list': self.get_project_participation_list(employee_id),
-            'award_list': self.get_award_list(employee_id),
-            'asset_list': self.get_asset_list(employee_id),
-
-            # 급여 및 첨부파일
-            'salary_payment_list': self.get_salary_payment_list(employee_id),
-            'employment_contract_list': self.get_employment_contract_list(employee_id),
-            'attachment_list': self.get_attachment_list(employee_id),
-        }
+        from .employee_relation_loader import employee_relation_loader
+        return employee_relation_loader.load(employee_id, year)
 
     # ========================================
     # 대시보드용 메서드
@@ -0,0 +1,283 @@
+"""
+직원 Typeahead 인덱스
+
+테넌트(루트 조직)별 직원 요약 레코드와 정렬된 접두 키 목록을 프로세스 메모리에 보관하여
+사이드바 검색 자동완성을 DB 조회 없이 처리합니다.
+
+- 키: 이름(전체/이름 부분 접미), 이름 초성, 영문명, 사번, 부서, 직급 (소문자, 공백 제거)
+- 조회: bisect 접두 탐색 O(log n + k)
+- 생성: 테넌트 첫 조회 시 단일 쿼리로 지연 생성
+- 갱신: 직원 INSERT/UPDATE/DELETE 커밋 후 같은 프로세스 인덱스에 증분 반영
+  (소속 판단은 생성 쿼리와 같은 테넌트 스코프: 조직 트리 또는 company_id 모드의 회사 ID)
+- 무효화: 조직 구조 버전(org_scope_cache) 변경 또는 TYPEAHEAD_INDEX_TTL_SECONDS 경과 시 재생성
+  (다른 워커의 직원 변경은 TTL 내 반영)
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.domains.employee.models import Employee
+from app.shared.utils.korean_search import to_choseong
+
+# 직원 요약 레코드 필드 (Employee 컬럼명)
+RECORD_FIELDS = ('id', 'name', 'employee_number', 'department', 'position', 'photo', 'status')
+# 접두 키 대상 필드
+KEY_FIELDS = ('english_name', 'employee_number', 'department', 'position')
+# 키/테넌트 소속 판단 전용 부가 필드 (레코드에는 미포함)
+EXTRA_FIELDS = ('english_name', 'organization_id', 'company_id')
+
+# Session.info 키: 커밋 대기 중인 직원 변경 {employee_id: record 또는 None(삭제)}
+PENDING_KEY = 'typeahead_pending'
+
+
+def _normalize(text: Optional[str]) -> str:
+    return ''.join(text.split()).lower() if text else ''
+
+
+def _record_keys(record: Dict, extra: Dict) -> Set[str]:
+    """레코드의 접두 탐색 키 집합 (이름은 접미도 포함하여 '민수' → 김민수 매칭)"""
+    keys = set()
+    name = _normalize(record.get('name'))
+    for start in range(len(name)):
+        keys.add(name[start:])
+    choseong = to_choseong(record.get('name'))
+    if choseong:
+        keys.add(choseong)
+    for field in KEY_FIELDS:
+        value = _normalize(extra.get(field) if field in extra else record.get(field))
+        if value:
+            keys.add(value)
+    return keys
+
+
+class TenantTypeaheadIndex:
+    """단일 테넌트 typeahead 인덱스"""
+
+    def __init__(self, scope_field: str, scope_ids: frozenset, org_version: int):
+        # 테넌트 소속 판단 직원 컬럼 (organization_id 또는 company_id)과 허용 값
+        self.scope_field = scope_field
+        self.scope_ids = scope_ids
+        self.org_version = org_version
+        self.built_at = time.monotonic()
+        self._records: Dict[int, Dict] = {}
+        self._keys: Dict[int, Set[str]] = {}
+        self._entries: List[tuple] = []  # 정렬된 (key, employee_id)
+
+    def __len__(self):
+        return len(self._records)
+
+    def contains(self, extra: Dict) -> bool:
+        """변경된 직원이 이 테넌트 소속인지"""
+        return extra.get(self.scope_field) in self.scope_ids
+
+    def upsert(self, record: Dict, extra: Dict) -> None:
+        """레코드 추가/갱신"""
+        employee_id = record['id']
+        self.remove(employee_id)
+        keys = _record_keys(record, extra)
+        self._records[employee_id] = record
+        self._keys[employee_id] = keys
+        for key in keys:
+            insort(self._entries, (key, employee_id))
+
+    def bulk_load(self, items) -> None:
+        """초기 생성 (정렬 1회)"""
+        entries = []
+        for record, extra in items:
+            keys = _record_keys(record, extra)
+            self._records[record['id']] = record
+            self._keys[record['id']] = keys
+            entries.extend((key, record['id']) for key in keys)
+        entries.sort()
+        self._entries = entries
+
+    def remove(self, employee_id: int) -> None:
+        """레코드 제거"""
+        keys = self._keys.pop(employee_id, None)
+        if keys is None:
+            return
+        self._records.pop(employee_id, None)
+        for key in keys:
+            pos = bisect_left(self._entries, (key, employee_id))
+            if pos < len(self._entries) and self._entries[pos] == (key, employee_id):
+                del self._entries[pos]
+
+    def search(self, query: str, limit: int, scan_limit: int) -> List[Dict]:
+        """접두 일치 상위 limit건 (이름 정확 일치 > 이름 접두 > 기타, 동순위는 이름순)"""
+        prefix = _normalize(query)
+        if not prefix:
+            return []
+
+        matches: Dict[int, int] = {}
+        pos = bisect_left(self._entries, (prefix,))
+        scanned = 0
+        while pos < len(self._entries) and scanned < scan_limit:
+            key, employee_id = self._entries[pos]
+            if not key.startswith(prefix):
+                break
+            if employee_id not in matches:
+                name = _normalize(self._records[employee_id]['name'])
+                if name == prefix:
+                    matches[employee_id] = 0
+                elif name.startswith(prefix):
+                    matches[employee_id] = 1
+                else:
+                    matches[employee_id] = 2
+            pos += 1
+            scanned += 1
+
+        ranked = sorted(
+            matches.items(),
+            key=lambda item: (item[1], self._records[item[0]]['name'] or '', item[0])
+        )
+        return [dict(self._records[employee_id]) for employee_id, _ in ranked[:limit]]
+
+
+class EmployeeTypeaheadIndex:
+    """테넌트별 typeahead 인덱스 관리자 (프로세스 싱글톤)"""
+
+    DEFAULT_TTL_SECONDS = 300
+    DEFAULT_SCAN_LIMIT = 500
+
+    def __init__(self):
+        self._indexes: Dict[int, TenantTypeaheadIndex] = {}
+        self._lock = threading.RLock()
+
+    def _config(self, key: str, default):
+        if not has_app_context():
+            return default
+        return current_app.config.get(key, default)
+
+    def _is_fresh(self, index: TenantTypeaheadIndex, root_org_id: int) -> bool:
+        from app.shared.utils.org_scope_cache import org_scope_cache
+        ttl = self._config('TYPEAHEAD_INDEX_TTL_SECONDS', self.DEFAULT_TTL_SECONDS)
+        if time.monotonic() - index.built_at > ttl:
+            return False
+        return index.org_version == org_scope_cache.current_version(root_org_id)
+
+    def _build(self, root_org_id: int) -> TenantTypeaheadIndex:
+        """테넌트 인덱스 생성 (요약 컬럼만 단일 쿼리)"""
+        from app.domains.employee.repositories.employee_repository import employee_repository
+        from app.shared.utils.org_scope_cache import org_scope_cache
+
+        org_version = org_scope_cache.current_version(root_org_id)
+        scope_field, scope_ids = employee_repository.get_tenant_scope(root_org_id)
+        index = TenantTypeaheadIndex(scope_field, scope_ids, org_version)
+        index.bulk_load(
+            _split_row(row) for row in employee_repository.find_typeahead_rows(
+                root_org_id, RECORD_FIELDS + EXTRA_FIELDS
+            )
+        )
+        return index
+
+    def get_index(self, root_org_id: int) -> TenantTypeaheadIndex:
+        """테넌트 인덱스 (없거나 만료되었으면 생성)"""
+        with self._lock:
+            index = self._indexes.get(root_org_id)
+        if index is not None and self._is_fresh(index, root_org_id):
+            return index
+
+        index = self._build(root_org_id)
+        with self._lock:
+            self._indexes[root_org_id] = index
+        return index
+
+    def search(self, root_org_id: int, query: str, limit: int = 10) -> List[Dict]:
+        """접두 검색 상위 limit건
+
+        Args:
+            root_org_id: 루트 조직 ID (테넌트)
+            query: 검색어 (이름/초성/영문명/사번/부서/직급 접두)
+            limit: 최대 결과 수
+
+        Returns:
+            직원 요약 레코드 목록 (id, name, employee_number, department, position, photo, status)
+        """
+        if not root_org_id or not query:
+            return []
+        index = self.get_index(root_org_id)
+        scan_limit = self._config('TYPEAHEAD_SCAN_LIMIT', self.DEFAULT_SCAN_LIMIT)
+        with self._lock:
+            return index.search(query, limit, scan_limit)
+
+    def apply_changes(self, changes: Dict[int, Optional[tuple]]) -> None:
+        """커밋된 직원 변경을 생성된 인덱스에 증분 반영
+
+        Args:
+            changes: {employee_id: (record, extra) 또는 None(삭제)}
+        """
+        with self._lock:
+            for index in self._indexes.values():
+                for employee_id, change in changes.items():
+                    if change is None:
+                        index.remove(employee_id)
+                        continue
+                    record, extra = change
+                    if index.contains(extra):
+                        index.upsert(record, extra)
+                    else:
+                        index.remove(employee_id)
+
+    def clear(self) -> None:
+        """전체 인덱스 제거"""
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self) -> Dict:
+        """모니터링용 인덱스 현황"""
+        with self._lock:
+            return {
+                'tenants': len(self._indexes),
+                'records': sum(len(index) for index in self._indexes.values()),
+            }
+
+
+def _split_row(row) -> tuple:
+    """쿼리 행/모델 → (요약 레코드, 키 전용 부가 필드)"""
+    record = {field: getattr(row, field) for field in RECORD_FIELDS}
+    extra = {field: getattr(row, field) for field in EXTRA_FIELDS}
+    return record, extra
+
+
+# 프로세스 싱글톤
+employee_typeahead_index = EmployeeTypeaheadIndex()
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+@event.listens_for(Employee, 'after_insert')
+@event.listens_for(Employee, 'after_update')
+def on_employee_write(mapper, connection, target):
+    """직원 변경 스냅샷을 세션에 기록 (커밋 후 반영)"""
+    from sqlalchemy.orm import object_session
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, {})[target.id] = _split_row(target)
+
+
+@event.listens_for(Employee, 'after_delete')
+def on_employee_delete(mapper, connection, target):
+    """직원 삭제를 세션에 기록 (커밋 후 반영)"""
+    from sqlalchemy.orm import object_session
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, {})[target.id] = None
+
+
+@event.listens_for(Session, 'after_commit')
+def on_session_commit(session):
+    """커밋된 직원 변경을 프로세스 인덱스에 반영"""
+    changes = session.info.pop(PENDING_KEY, None)
+    if changes:
+        employee_typeahead_index.apply_changes(changes)
+
+
+@event.listens_for(Session, 'after_rollback')
+def on_session_rollback(session):
+    """롤백된 직원 변경 기록 제거"""
+    session.info.pop(PENDING_KEY, None)
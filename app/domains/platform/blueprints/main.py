@@ -9,6 +9,7 @@ from flask import Blueprint, render_template, request, session, redirect, url_fo
 
 from app.shared.constants.session_keys import SessionKeys, AccountType, UserRole
 from app.shared.utils.api_helpers import api_success
+from app.shared.utils.conditional import tenant_conditional
 from app.domains.employee.services import employee_service
 from app.shared.utils.decorators import login_required
 from app.shared.utils.tenant import get_current_organization_id
@@ -48,17 +49,28 @@ def index():
     # 멀티테넌시: 현재 회사의 organization_id로 필터링
     org_id = get_current_organization_id()
 
-    stats = employee_service.get_statistics(organization_id=org_id)
-    dept_stats = employee_service.get_department_statistics(organization_id=org_id)
-    recent_employees = employee_service.get_recent_employees(organization_id=org_id, limit=5)
+    # 현황 스냅샷 + 부서별 현황 + 최근 입사자 (테넌트 데이터 버전 캐시)
+    dashboard = employee_service.get_dashboard(organization_id=org_id, recent_limit=5)
     classification_options = employee_service.get_all_classification_options()
     return render_template('index.html',
-                           stats=stats,
-                           dept_stats=dept_stats,
-                           recent_employees=recent_employees,
+                           stats=dashboard['stats'],
+                           dept_stats=dashboard['dept_stats'],
+                           recent_employees=dashboard['recent_employees'],
                            classification_options=classification_options)
 
 
+@main_bp.route('/api/dashboard/trend')
+@login_required
+@tenant_conditional(daily=True)
+def dashboard_trend():
+    """일별 직원 현황 추이 API (tenant_daily_stats, days: 1~366)"""
+    org_id = get_current_organization_id()
+    if not org_id:
+        return api_success({'days': []})
+    days = max(1, min(request.args.get('days', 30, type=int), 366))
+    return api_success({'days': employee_service.get_headcount_trend(org_id, days)})
+
+
 @main_bp.route('/examples/data-table')
 @login_required
 def data_table_demo():
@@ -79,6 +91,7 @@ def styleguide():
 
 @main_bp.route('/search')
 @login_required
+@tenant_conditional
 def search():
     """직원 검색"""
     query = request.args.get('q', '')
@@ -69,3 +69,10 @@ def create_setting():
         'message': f'설정 "{data["key"]}"이(가) 생성되었습니다.',
         'setting': setting_info
     }, status_code=201)
+
+
+@platform_bp.route('/api/cache-stats', methods=['GET'])
+@api_superadmin_required
+def cache_stats():
+    """프로세스 캐시 히트/미스 통계 (모니터링용)"""
+    return api_success(platform_service.get_cache_stats())
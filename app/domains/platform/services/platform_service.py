@@ -403,6 +403,21 @@ class PlatformService:
             'superadmins': superadmins,
         }
 
+    def get_cache_stats(self) -> Dict:
+        """프로세스 캐시 통계 조회 (요청을 처리한 워커 기준)
+
+        Returns:
+            캐시별 통계 Dict
+        """
+        from app.domains.employee.services.typeahead_index import employee_typeahead_index
+        from app.shared.utils.org_scope_cache import org_scope_cache
+        from app.shared.utils.tenant_data_cache import tenant_data_cache
+        return {
+            'org_scope': org_scope_cache.stats(),
+            'employee_typeahead': employee_typeahead_index.stats(),
+            'tenant_data': tenant_data_cache.stats(),
+        }
+
     def get_recent_users(self, limit: int = 5) -> list:
         """최근 가입 사용자 조회
 
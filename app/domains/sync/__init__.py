@@ -2,8 +2,11 @@
 Sync Domain
 
 동기화 관련 모든 기능을 포함합니다:
-- Repositories: SyncLogRepository
-- Services: SyncService, SyncBasicService, SyncRelationService, TerminationService
+- Models: SyncJob (자동 동기화 작업 큐), SyncFingerprint (관계 동기화 지문),
+  SyncBatchRun/SyncBatchItem (법인 일괄 동기화)
+- Repositories: SyncLogRepository, SyncJobRepository, SyncFingerprintRepository, SyncBatchRepository
+- Services: SyncService, SyncBasicService, SyncRelationService, TerminationService, SyncJobService,
+  SyncBatchService
 - Blueprints: sync_bp
 
 Phase 7: 도메인 중심 마이그레이션 완료
@@ -10,6 +10,8 @@ from flask import request, session
 from app.domains.sync.blueprints import sync_bp
 from app.shared.constants.session_keys import SessionKeys
 from app.domains.sync.services.sync_service import sync_service
+from app.domains.sync.services.sync_job_service import sync_job_service
+from app.domains.sync.services.sync_batch_service import sync_batch_service
 from app.domains.contract.services.contract_service import contract_service
 from app.shared.utils.transaction import atomic_transaction
 from app.domains.contract.models import PersonCorporateContract, SyncLog
@@ -155,17 +157,7 @@ def full_sync_from_corporate(contract_id):
         with atomic_transaction():
             # DataSharingSettings 생성 또는 업데이트 (전체 공유)
             # Phase 2: db.session 직접 사용 제거 - Service 메서드 사용
-            contract_service.update_or_create_sharing_settings(
-                contract_id,
-                commit=False,
-                share_basic_info=True,
-                share_contact=True,
-                share_education=True,
-                share_career=True,
-                share_certificates=True,
-                share_languages=True,
-                share_military=True
-            )
+            sync_service.enable_full_sharing(contract_id, commit=False)
 
             # 전체 동기화 실행
             result = sync_service.sync_personal_to_employee(
@@ -211,6 +203,116 @@ def sync_all_contracts():
     return api_success(result)
 
 
+@sync_bp.route('/batch', methods=['POST'])
+@login_required
+@corporate_account_required
+def start_company_batch_sync():
+    """
+    법인 전체 승인 계약 일괄 동기화 시작 (법인용)
+
+    계약을 청크로 나누어 백그라운드 워커가 병렬 처리합니다.
+    진행 중인 실행이 있으면 새로 만들지 않고 해당 실행을 반환합니다.
+
+    Request Body:
+    {
+        "full_sync": false  // true면 계약마다 전체 공유 설정 후 동기화 (/full-sync와 동일)
+    }
+
+    Response (202):
+    {
+        "success": true,
+        "data": {"id": 1, "status": "pending|running|completed", "total": 1200,
+                 "progress": {"done": 0, "succeeded": 0, "failed": 0, "remaining": 1200, ...},
+                 "stale": false, "failures": []}
+    }
+    """
+    company_id = session.get(SessionKeys.COMPANY_ID)
+    if not company_id:
+        return api_error('법인 정보를 찾을 수 없습니다.', 403)
+
+    data = request.get_json(silent=True) or {}
+    run = sync_batch_service.start_company_sync(
+        company_id=company_id,
+        user_id=session.get(SessionKeys.USER_ID),
+        full_sync=bool(data.get('full_sync')),
+    )
+    return api_success(run, status_code=202)
+
+
+@sync_bp.route('/batch/<int:run_id>', methods=['GET'])
+@login_required
+@corporate_account_required
+def get_company_batch_sync(run_id):
+    """
+    일괄 동기화 진행률 조회 (폴링)
+
+    stale이 true면 워커가 중단된 실행이므로 /batch/<run_id>/resume으로 재개할 수 있습니다.
+    """
+    run = sync_batch_service.get_progress(run_id)
+    if not run or run['company_id'] != session.get(SessionKeys.COMPANY_ID):
+        return api_not_found('동기화 실행')
+    return api_success(run)
+
+
+@sync_bp.route('/batch/<int:run_id>/resume', methods=['POST'])
+@login_required
+@corporate_account_required
+def resume_company_batch_sync(run_id):
+    """
+    중단된 일괄 동기화 재개 (남은 계약부터)
+
+    Request Body:
+    {
+        "retry_failed": false  // true면 실패한 계약도 다시 시도
+    }
+    """
+    run = sync_batch_service.get_progress(run_id)
+    if not run or run['company_id'] != session.get(SessionKeys.COMPANY_ID):
+        return api_not_found('동기화 실행')
+
+    data = request.get_json(silent=True) or {}
+    run = sync_batch_service.resume(run_id, retry_failed=bool(data.get('retry_failed')))
+    return api_success(run, status_code=202)
+
+
+@sync_bp.route('/jobs', methods=['GET'])
+@login_required
+@personal_account_required
+def get_my_sync_jobs():
+    """
+    내 자동 동기화 작업 상태 조회 (개인용)
+
+    프로필 저장 후 적재된 계약별 동기화 작업의 상태/재시도/오류를 반환합니다.
+
+    Response:
+    {
+        "success": true,
+        "data": {
+            "jobs": [{"contract_id": 1, "status": "pending|running|succeeded|failed",
+                      "attempts": 1, "last_error": null, "next_run_at": "...", ...}]
+        }
+    }
+    """
+    user_id = session.get(SessionKeys.USER_ID)
+    return api_success({'jobs': sync_job_service.get_jobs_for_user(user_id)})
+
+
+@sync_bp.route('/jobs/contract/<int:contract_id>', methods=['GET'])
+@login_required
+@contract_access_required
+def get_contract_sync_jobs(contract_id):
+    """
+    계약의 자동 동기화 작업 상태 조회
+
+    Response:
+    {
+        "success": true,
+        "data": {"jobs": [...]}
+    }
+    """
+    return api_success({'jobs': sync_job_service.get_jobs_for_contract(contract_id)})
+
+
 @sync_bp.route('/field-mappings', methods=['GET'])
 @login_required
 def get_field_mappings():
@@ -2,8 +2,17 @@
 Sync Domain Models
 
 Phase 7: 도메인 중심 마이그레이션
-Sync 도메인은 자체 모델이 없습니다.
-(Employee, PersonalProfile 등 다른 도메인 모델을 사용)
+동기화 데이터는 다른 도메인 모델(Employee, PersonalProfile 등)을 사용하며,
+Sync 도메인 자체 모델은 동기화 작업 큐(SyncJob), 관계 동기화 지문(SyncFingerprint),
+법인 일괄 동기화 실행(SyncBatchRun, SyncBatchItem)입니다.
 """
+from .sync_job import SyncJob
+from .sync_fingerprint import SyncFingerprint
+from .sync_batch import SyncBatchRun, SyncBatchItem
 
-__all__ = []
+__all__ = [
+    'SyncJob',
+    'SyncFingerprint',
+    'SyncBatchRun',
+    'SyncBatchItem',
+]
@@ -0,0 +1,90 @@
+"""
+SyncBatchRun / SyncBatchItem SQLAlchemy Models
+
+법인 전체 계약 일괄 동기화 실행과 계약별 진행 상태입니다.
+실행 생성 시 대상 계약을 청크 단위 항목으로 저장하고, 워커가 청크를 점유하여 별도 세션에서 처리합니다.
+
+- 진행률(완료/실패/남음)은 항목 상태로 집계
+- 중단 판단: running 항목의 started_at(점유 후 항목 완료마다 하트비트로 갱신)이 오래된 경우
+- 중단된 실행은 중단된 running 항목만 대기로 되돌려 남은 항목부터 재개
+"""
+from datetime import datetime
+
+from app.database import db
+from app.shared.models.mixins import DictSerializableMixin
+
+
+class SyncBatchRun(DictSerializableMixin, db.Model):
+    """일괄 동기화 실행 모델"""
+    __tablename__ = 'sync_batch_runs'
+    __table_args__ = (
+        db.Index('ix_sync_batch_runs_company_status', 'company_id', 'status'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    sync_type = db.Column(db.String(30), nullable=False, default='manual')
+    full_sync = db.Column(db.Boolean, nullable=False, default=False)
+
+    # 상태
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    total = db.Column(db.Integer, nullable=False, default=0)
+    chunk_size = db.Column(db.Integer, nullable=False, default=50)
+    last_error = db.Column(db.Text, nullable=True)
+
+    # 시각 (updated_at: 워커가 청크를 점유하거나 항목을 완료할 때마다 갱신)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 상태 상수
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+
+    ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING)
+
+    def __repr__(self):
+        return f'<SyncBatchRun {self.id}: company={self.company_id} {self.status}>'
+
+
+class SyncBatchItem(DictSerializableMixin, db.Model):
+    """일괄 동기화 계약별 항목 모델"""
+    __tablename__ = 'sync_batch_items'
+    __table_args__ = (
+        db.UniqueConstraint('run_id', 'contract_id', name='uq_sync_batch_items_run_contract'),
+        db.Index('ix_sync_batch_items_run_status_chunk', 'run_id', 'status', 'chunk'),
+    )
+
+    __dict_excludes__ = ['locked_by']
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    run_id = db.Column(
+        db.Integer,
+        db.ForeignKey('sync_batch_runs.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    contract_id = db.Column(
+        db.Integer,
+        db.ForeignKey('person_corporate_contracts.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    chunk = db.Column(db.Integer, nullable=False, default=0)
+
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    error = db.Column(db.Text, nullable=True)
+    locked_by = db.Column(db.String(100), nullable=True)
+    # 점유 시각 (같은 워커의 항목 완료마다 하트비트로 갱신, 중단 판단 기준)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # 상태 상수
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+
+    def __repr__(self):
+        return f'<SyncBatchItem {self.id}: run={self.run_id} contract={self.contract_id} {self.status}>'
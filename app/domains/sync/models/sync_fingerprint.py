@@ -0,0 +1,29 @@
+"""
+SyncFingerprint SQLAlchemy Model
+
+개인 -> 법인 관계 데이터 동기화 지문입니다.
+(계약, 관계 유형)별로 마지막 동기화한 개인 측 행 집합의 내용 해시를 저장하고,
+다음 동기화에서 해시와 대상 직원이 같으면 해당 관계 동기화를 생략합니다.
+"""
+from datetime import datetime
+
+from app.database import db
+
+
+class SyncFingerprint(db.Model):
+    """관계 데이터 동기화 지문 모델"""
+    __tablename__ = 'sync_fingerprints'
+
+    contract_id = db.Column(
+        db.Integer,
+        db.ForeignKey('person_corporate_contracts.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    relation_type = db.Column(db.String(30), primary_key=True)
+    employee_id = db.Column(db.Integer, nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=False)  # SHA-256 hex
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<SyncFingerprint {self.contract_id} {self.relation_type} {self.fingerprint[:8]}>'
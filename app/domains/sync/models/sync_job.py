@@ -0,0 +1,87 @@
+"""
+SyncJob SQLAlchemy Model
+
+개인 -> 법인 자동 동기화 작업 큐입니다.
+프로필 저장 커밋 후 (user_id, contract_id)별 작업을 적재하고, 워커가 별도 세션에서 처리합니다.
+
+- (user_id, contract_id)당 1행: 재요청은 같은 행을 대기 상태로 되돌림 (멱등)
+- 실행 중 재요청: requested_at이 started_at보다 늦으면 완료 후 다시 대기
+- 실패: 지수 백오프(next_run_at)로 재시도, 최대 횟수 초과 시 failed
+- 병합: 대기 중 재요청은 변경 섹션(dirty_sections)을 합치고 실행 시각을 늦춤 (디바운스)
+  실행 시 점유한 섹션(run_sections)만 동기화, NULL이면 전체 동기화
+"""
+from datetime import datetime
+from typing import Iterable, Optional, Set
+
+from app.database import db
+from app.shared.models.mixins import DictSerializableMixin
+
+
+class SyncJob(DictSerializableMixin, db.Model):
+    """동기화 작업 큐 모델"""
+    __tablename__ = 'sync_jobs'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'contract_id', name='uq_sync_jobs_user_contract'),
+        db.Index('ix_sync_jobs_status_next_run_at', 'status', 'next_run_at'),
+    )
+
+    __dict_excludes__ = ['locked_by']
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    contract_id = db.Column(
+        db.Integer,
+        db.ForeignKey('person_corporate_contracts.id'),
+        nullable=False,
+        index=True
+    )
+    sync_type = db.Column(db.String(30), nullable=False, default='auto')
+
+    # 상태
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    locked_by = db.Column(db.String(100), nullable=True)
+
+    # 변경 섹션 (콤마 구분, NULL: 전체, 빈 문자열: 없음)
+    dirty_sections = db.Column(db.Text, nullable=True)
+    run_sections = db.Column(db.Text, nullable=True)
+
+    # 시각 (coalesce_since: 대기 중 요청 병합 시작 시각, 최대 지연 기준)
+    requested_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    next_run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    coalesce_since = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 상태 상수
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+
+    @staticmethod
+    def format_sections(sections: Optional[Iterable[str]]) -> Optional[str]:
+        """섹션 목록 -> 컬럼 값 (None: 전체)"""
+        if sections is None:
+            return None
+        return ','.join(sorted(set(sections)))
+
+    @staticmethod
+    def parse_sections(value: Optional[str]) -> Optional[Set[str]]:
+        """컬럼 값 -> 섹션 집합 (None: 전체)"""
+        if value is None:
+            return None
+        return {section for section in value.split(',') if section}
+
+    @classmethod
+    def merge_sections(cls, current: Optional[str], added: Optional[str]) -> Optional[str]:
+        """두 컬럼 값의 합집합 (한쪽이라도 전체면 전체)"""
+        if current is None or added is None:
+            return None
+        return cls.format_sections(cls.parse_sections(current) | cls.parse_sections(added))
+
+    def __repr__(self):
+        return f'<SyncJob {self.id}: user={self.user_id} contract={self.contract_id} {self.status}>'
@@ -4,8 +4,17 @@ Sync Domain Repositories
 Phase 7: 도메인 중심 마이그레이션 완료
 """
 from .sync_log_repository import SyncLogRepository, sync_log_repository
+from .sync_job_repository import SyncJobRepository, sync_job_repository
+from .sync_fingerprint_repository import SyncFingerprintRepository, sync_fingerprint_repository
+from .sync_batch_repository import SyncBatchRepository, sync_batch_repository
 
 __all__ = [
     'SyncLogRepository',
     'sync_log_repository',
+    'SyncJobRepository',
+    'sync_job_repository',
+    'SyncFingerprintRepository',
+    'sync_fingerprint_repository',
+    'SyncBatchRepository',
+    'sync_batch_repository',
 ]
@@ -0,0 +1,262 @@
+"""
+SyncBatch Repository
+
+법인 일괄 동기화 실행/항목의 생성, 청크 점유, 진행률 집계를 담당합니다.
+
+- 점유(claim_chunk)는 조건부 UPDATE로 처리하여 여러 워커(스레드/프로세스)가 같은 청크를 중복 처리하지 않음
+- 진행률은 항목 상태별 건수로 집계 (실행 행에 카운터를 두지 않아 동시 갱신 경합 없음)
+- 하트비트: 항목 완료마다 실행 updated_at과 해당 워커의 남은 점유 항목 started_at을 갱신
+  (오래 걸리는 청크를 처리 중인 워커의 항목이 중단으로 판단되어 재개 시 중복 처리되지 않음)
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select, update
+
+from app.database import db
+from app.domains.sync.models import SyncBatchItem, SyncBatchRun
+from app.shared.repositories.base_repository import BaseRepository
+
+
+class SyncBatchRepository(BaseRepository[SyncBatchRun]):
+    """법인 일괄 동기화 Repository"""
+
+    def __init__(self):
+        super().__init__(SyncBatchRun)
+
+    def find_approved_contract_ids(self, company_id: int) -> List[int]:
+        """법인의 승인 계약 ID 목록 (일괄 동기화 대상)"""
+        from app.domains.contract.models import PersonCorporateContract
+        from app.shared.constants.status import ContractStatus
+
+        return list(db.session.execute(
+            select(PersonCorporateContract.id)
+            .where(
+                PersonCorporateContract.company_id == company_id,
+                PersonCorporateContract.status == ContractStatus.APPROVED,
+            )
+            .order_by(PersonCorporateContract.id)
+        ).scalars())
+
+    def find_active_by_company(self, company_id: int) -> Optional[SyncBatchRun]:
+        """법인의 진행 중(대기/실행) 실행"""
+        return SyncBatchRun.query.filter(
+            SyncBatchRun.company_id == company_id,
+            SyncBatchRun.status.in_(SyncBatchRun.ACTIVE_STATUSES)
+        ).order_by(SyncBatchRun.id.desc()).first()
+
+    def find_by_company(self, company_id: int, limit: int = 20) -> List[SyncBatchRun]:
+        """법인의 실행 목록 (최근순)"""
+        return SyncBatchRun.query.filter_by(company_id=company_id).order_by(
+            SyncBatchRun.id.desc()
+        ).limit(limit).all()
+
+    def create_run(
+        self,
+        company_id: int,
+        contract_ids: List[int],
+        chunk_size: int,
+        requested_by: Optional[int] = None,
+        full_sync: bool = False,
+        sync_type: str = 'manual'
+    ) -> SyncBatchRun:
+        """실행과 계약별 항목 생성 (커밋 포함)
+
+        Args:
+            company_id: 법인 ID
+            contract_ids: 대상 계약 ID 목록
+            chunk_size: 청크당 계약 수
+            requested_by: 요청 사용자 ID
+            full_sync: 전체 공유 설정 후 동기화 여부
+            sync_type: 동기화 유형
+
+        Returns:
+            생성된 SyncBatchRun
+        """
+        run = SyncBatchRun(
+            company_id=company_id,
+            requested_by=requested_by,
+            sync_type=sync_type,
+            full_sync=full_sync,
+            status=SyncBatchRun.STATUS_PENDING,
+            total=len(contract_ids),
+            chunk_size=chunk_size,
+        )
+        db.session.add(run)
+        db.session.flush()
+        if contract_ids:
+            db.session.execute(insert(SyncBatchItem.__table__), [
+                {'run_id': run.id, 'contract_id': contract_id, 'chunk': index // chunk_size,
+                 'status': SyncBatchItem.STATUS_PENDING}
+                for index, contract_id in enumerate(contract_ids)
+            ])
+        db.session.commit()
+        return run
+
+    def claim_chunk(
+        self,
+        run_id: int,
+        worker_id: str,
+        now: Optional[datetime] = None
+    ) -> List[Tuple[int, int]]:
+        """대기 중인 가장 앞 청크 점유 (커밋 포함)
+
+        Args:
+            run_id: 실행 ID
+            worker_id: 워커 식별자
+            now: 기준 시각 (기본: 현재 UTC)
+
+        Returns:
+            점유한 (항목 ID, 계약 ID) 목록 (남은 청크가 없으면 빈 목록)
+        """
+        table = SyncBatchItem.__table__
+        now = now or datetime.utcnow()
+        while True:
+            chunk = db.session.execute(
+                select(func.min(table.c.chunk))
+                .where(table.c.run_id == run_id, table.c.status == SyncBatchItem.STATUS_PENDING)
+            ).scalar()
+            if chunk is None:
+                db.session.commit()
+                return []
+
+            claimed = db.session.execute(
+                update(table)
+                .where(table.c.run_id == run_id, table.c.chunk == chunk,
+                       table.c.status == SyncBatchItem.STATUS_PENDING)
+                .values(status=SyncBatchItem.STATUS_RUNNING, locked_by=worker_id, started_at=now)
+            ).rowcount
+            if claimed:
+                self._touch_run(run_id, now)
+            db.session.commit()
+            if not claimed:
+                # 다른 워커가 먼저 점유한 청크
+                continue
+
+            return [tuple(row) for row in db.session.execute(
+                select(table.c.id, table.c.contract_id)
+                .where(table.c.run_id == run_id, table.c.chunk == chunk,
+                       table.c.locked_by == worker_id,
+                       table.c.status == SyncBatchItem.STATUS_RUNNING)
+                .order_by(table.c.id)
+            )]
+
+    def finish_item(
+        self,
+        run_id: int,
+        item_id: int,
+        worker_id: str,
+        error: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> bool:
+        """항목 완료 기록 및 하트비트 (error가 있으면 failed, 커밋 포함)
+
+        Args:
+            run_id: 실행 ID
+            item_id: 항목 ID
+            worker_id: 워커 식별자
+            error: 오류 메시지 (성공 시 None)
+            now: 기준 시각 (기본: 현재 UTC)
+
+        Returns:
+            기록 여부 (중단으로 판단되어 다른 워커에게 넘어간 항목이면 False)
+        """
+        table = SyncBatchItem.__table__
+        now = now or datetime.utcnow()
+        finished = db.session.execute(
+            update(table)
+            .where(table.c.id == item_id, table.c.locked_by == worker_id,
+                   table.c.status == SyncBatchItem.STATUS_RUNNING)
+            .values(
+                status=SyncBatchItem.STATUS_FAILED if error else SyncBatchItem.STATUS_SUCCEEDED,
+                error=error,
+                locked_by=None,
+                finished_at=now,
+            )
+        ).rowcount
+        # 하트비트: 같은 워커가 점유 중인 남은 항목과 실행의 진행 시각 갱신
+        db.session.execute(
+            update(table)
+            .where(table.c.run_id == run_id, table.c.locked_by == worker_id,
+                   table.c.status == SyncBatchItem.STATUS_RUNNING)
+            .values(started_at=now)
+        )
+        self._touch_run(run_id, now)
+        db.session.commit()
+        return bool(finished)
+
+    def release_items(
+        self,
+        run_id: int,
+        stale_before: datetime,
+        include_failed: bool = False
+    ) -> int:
+        """중단된 항목을 대기로 되돌림 (재개, 커밋 포함)
+
+        started_at(점유/하트비트 시각)이 stale_before 이전인 running 항목만 되돌리므로
+        처리 중인 워커의 항목은 유지됩니다.
+
+        Args:
+            run_id: 실행 ID
+            stale_before: 중단 판단 기준 시각
+            include_failed: True면 실패 항목도 다시 시도
+
+        Returns:
+            대기로 되돌린 항목 수
+        """
+        table = SyncBatchItem.__table__
+        condition = (table.c.status == SyncBatchItem.STATUS_RUNNING) & (table.c.started_at < stale_before)
+        if include_failed:
+            condition = condition | (table.c.status == SyncBatchItem.STATUS_FAILED)
+        count = db.session.execute(
+            update(table)
+            .where(table.c.run_id == run_id, condition)
+            .values(status=SyncBatchItem.STATUS_PENDING, locked_by=None, error=None,
+                    started_at=None, finished_at=None)
+        ).rowcount
+        db.session.commit()
+        return count
+
+    def count_stale_items(self, run_id: int, stale_before: datetime) -> int:
+        """started_at(점유/하트비트 시각)이 stale_before 이전인 running 항목 수 (중단된 워커)"""
+        table = SyncBatchItem.__table__
+        return db.session.execute(
+            select(func.count())
+            .where(table.c.run_id == run_id,
+                   table.c.status == SyncBatchItem.STATUS_RUNNING,
+                   table.c.started_at < stale_before)
+        ).scalar()
+
+    def update_run(self, run_id: int, **values) -> None:
+        """실행 상태 갱신 (커밋 포함)"""
+        table = SyncBatchRun.__table__
+        db.session.execute(
+            update(table).where(table.c.id == run_id)
+            .values(updated_at=datetime.utcnow(), **values)
+        )
+        db.session.commit()
+
+    def _touch_run(self, run_id: int, now: datetime) -> None:
+        """실행 진행 시각 갱신 (중단 판단 기준)"""
+        table = SyncBatchRun.__table__
+        db.session.execute(update(table).where(table.c.id == run_id).values(updated_at=now))
+
+    def count_by_status(self, run_id: int) -> Dict[str, int]:
+        """항목 상태별 건수"""
+        table = SyncBatchItem.__table__
+        rows = db.session.execute(
+            select(table.c.status, func.count())
+            .where(table.c.run_id == run_id)
+            .group_by(table.c.status)
+        )
+        return {status: count for status, count in rows}
+
+    def find_failed_items(self, run_id: int, limit: int = 50) -> List[SyncBatchItem]:
+        """실패 항목 목록"""
+        return SyncBatchItem.query.filter_by(
+            run_id=run_id, status=SyncBatchItem.STATUS_FAILED
+        ).order_by(SyncBatchItem.id).limit(limit).all()
+
+
+# 싱글톤 인스턴스
+sync_batch_repository = SyncBatchRepository()
@@ -0,0 +1,54 @@
+"""
+SyncFingerprint Repository
+
+관계 데이터 동기화 지문 조회/저장을 처리합니다.
+"""
+from typing import Optional
+
+from app.database import db
+from app.domains.sync.models import SyncFingerprint
+
+
+class SyncFingerprintRepository:
+    """관계 데이터 동기화 지문 Repository"""
+
+    def find(self, contract_id: int, relation_type: str) -> Optional[SyncFingerprint]:
+        """(계약, 관계 유형) 지문 조회"""
+        return db.session.get(SyncFingerprint, (contract_id, relation_type))
+
+    def save(
+        self,
+        contract_id: int,
+        relation_type: str,
+        employee_id: int,
+        fingerprint: str,
+        row_count: int
+    ) -> SyncFingerprint:
+        """지문 저장 (없으면 생성, 커밋은 호출자)
+
+        Args:
+            contract_id: 계약 ID
+            relation_type: 관계 유형 (education, career 등)
+            employee_id: 동기화 대상 직원 ID
+            fingerprint: 개인 측 행 집합 해시
+            row_count: 행 수
+
+        Returns:
+            SyncFingerprint
+        """
+        record = self.find(contract_id, relation_type)
+        if record is None:
+            record = SyncFingerprint(contract_id=contract_id, relation_type=relation_type)
+            db.session.add(record)
+        record.employee_id = employee_id
+        record.fingerprint = fingerprint
+        record.row_count = row_count
+        return record
+
+    def delete_by_contract_id(self, contract_id: int) -> int:
+        """계약의 지문 전체 삭제 (다음 동기화에서 전체 비교, 커밋은 호출자)"""
+        return SyncFingerprint.query.filter_by(contract_id=contract_id).delete()
+
+
+# 싱글톤 인스턴스
+sync_fingerprint_repository = SyncFingerprintRepository()
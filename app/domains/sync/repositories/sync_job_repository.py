@@ -0,0 +1,299 @@
+"""
+SyncJob Repository
+
+동기화 작업 큐의 적재/점유/완료 처리를 담당합니다.
+
+- 적재(enqueue)는 커밋 직후 별도 커넥션에서 호출되므로 Core 문장으로 처리
+- 점유(claim)/완료는 조건부 UPDATE로 처리하여 여러 워커(스레드/프로세스)가 같은 행을 중복 처리하지 않음
+- 변경 섹션 병합은 읽은 값과 같을 때만 갱신(조건부 UPDATE)하고, 다르면 다시 읽어 병합
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database import db
+from app.domains.sync.models import SyncJob
+from app.shared.repositories.base_repository import BaseRepository
+
+
+class SyncJobRepository(BaseRepository[SyncJob]):
+    """동기화 작업 큐 Repository"""
+
+    def __init__(self):
+        super().__init__(SyncJob)
+
+    def find_realtime_contract_ids(self, user_id: int, connection=None) -> List[int]:
+        """실시간 동기화가 켜진 승인 계약 ID 목록 (자동 동기화 대상)
+
+        Args:
+            user_id: 개인 사용자 ID
+            connection: 조회 커넥션 (기본: 현재 세션)
+
+        Returns:
+            계약 ID 목록
+        """
+        from app.domains.contract.models import DataSharingSettings, PersonCorporateContract
+        from app.shared.constants.status import ContractStatus
+
+        stmt = (
+            select(PersonCorporateContract.id)
+            .join(DataSharingSettings, DataSharingSettings.contract_id == PersonCorporateContract.id)
+            .where(
+                PersonCorporateContract.person_user_id == user_id,
+                PersonCorporateContract.status == ContractStatus.APPROVED,
+                DataSharingSettings.is_realtime_sync.is_(True),
+            )
+            .order_by(PersonCorporateContract.id)
+        )
+        executor = connection if connection is not None else db.session
+        return list(executor.execute(stmt).scalars())
+
+    def enqueue(
+        self,
+        user_id: int,
+        contract_id: int,
+        sync_type: str,
+        connection=None,
+        now: Optional[datetime] = None,
+        sections: Optional[Iterable[str]] = None,
+        window_seconds: float = 0,
+        max_delay_seconds: Optional[float] = None
+    ) -> None:
+        """작업 적재 (같은 user_id/contract_id 행이 있으면 재사용)
+
+        변경 섹션은 행의 dirty_sections에 합칩니다. (어느 요청이든 전체면 전체 동기화)
+        대기/완료/실패 행은 실행 대기로 되돌리고 재시도 횟수를 초기화합니다.
+        대기 중 재요청은 실행 시각을 window_seconds만큼 늦추되, 첫 요청 후 max_delay_seconds를 넘기지 않습니다.
+        실행 중인 행은 상태를 유지하고 requested_at/섹션만 갱신합니다. (완료 시 다시 대기)
+
+        Args:
+            user_id: 개인 사용자 ID
+            contract_id: 계약 ID
+            sync_type: 동기화 유형
+            connection: 실행 커넥션 (기본: 현재 세션)
+            now: 요청 시각 (기본: 현재 UTC)
+            sections: 변경 섹션 목록 (None이면 전체)
+            window_seconds: 요청 병합 대기 시간 (초)
+            max_delay_seconds: 첫 요청 후 최대 지연 시간 (초, None이면 제한 없음)
+        """
+        table = SyncJob.__table__
+        now = now or datetime.utcnow()
+        executor = connection if connection is not None else db.session
+        added = SyncJob.format_sections(sections)
+        run_at = now + timedelta(seconds=window_seconds)
+
+        while True:
+            row = executor.execute(
+                select(table.c.id, table.c.status, table.c.dirty_sections, table.c.coalesce_since)
+                .where(table.c.user_id == user_id, table.c.contract_id == contract_id)
+            ).first()
+
+            if row is None:
+                try:
+                    with executor.begin_nested():
+                        executor.execute(table.insert().values(
+                            user_id=user_id, contract_id=contract_id, sync_type=sync_type,
+                            status=SyncJob.STATUS_PENDING, attempts=0, dirty_sections=added,
+                            requested_at=now, next_run_at=run_at, coalesce_since=now,
+                            created_at=now, updated_at=now,
+                        ))
+                    return
+                except IntegrityError:
+                    # 동시 적재로 행이 먼저 생성된 경우
+                    continue
+
+            values = {
+                'sync_type': sync_type,
+                'requested_at': now,
+                'updated_at': now,
+                'dirty_sections': SyncJob.merge_sections(row.dirty_sections, added),
+            }
+            if row.status != SyncJob.STATUS_RUNNING:
+                since = now
+                if row.status == SyncJob.STATUS_PENDING and row.coalesce_since:
+                    since = row.coalesce_since
+                next_run_at = run_at
+                if max_delay_seconds is not None:
+                    next_run_at = min(run_at, since + timedelta(seconds=max_delay_seconds))
+                values.update(status=SyncJob.STATUS_PENDING, attempts=0,
+                              next_run_at=next_run_at, coalesce_since=since)
+
+            # 읽은 뒤 점유/다른 적재로 바뀐 행이면 다시 읽어 병합
+            updated = executor.execute(
+                update(table)
+                .where(table.c.id == row.id, table.c.status == row.status,
+                       table.c.dirty_sections.is_not_distinct_from(row.dirty_sections))
+                .values(**values)
+            ).rowcount
+            if updated:
+                return
+
+    def claim_next(self, worker_id: str, now: Optional[datetime] = None) -> Optional[SyncJob]:
+        """실행 가능한 작업 1건 점유 (커밋 포함)
+
+        점유 시 변경 섹션을 run_sections로 옮기고 dirty_sections를 비웁니다.
+        (실행 중 재요청 섹션만 dirty_sections에 다시 쌓임)
+
+        Args:
+            worker_id: 워커 식별자
+            now: 기준 시각 (기본: 현재 UTC)
+
+        Returns:
+            점유한 SyncJob 또는 None
+        """
+        table = SyncJob.__table__
+        now = now or datetime.utcnow()
+        candidates = db.session.execute(
+            select(table.c.id)
+            .where(table.c.status == SyncJob.STATUS_PENDING, table.c.next_run_at <= now)
+            .order_by(table.c.next_run_at, table.c.id)
+            .limit(10)
+        ).scalars().all()
+
+        for job_id in candidates:
+            claimed = db.session.execute(
+                update(table)
+                .where(table.c.id == job_id, table.c.status == SyncJob.STATUS_PENDING)
+                .values(
+                    status=SyncJob.STATUS_RUNNING,
+                    locked_by=worker_id,
+                    started_at=now,
+                    attempts=table.c.attempts + 1,
+                    run_sections=table.c.dirty_sections,
+                    dirty_sections='',
+                    coalesce_since=None,
+                    updated_at=now,
+                )
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                return db.session.get(SyncJob, job_id, populate_existing=True)
+        return None
+
+    def mark_succeeded(self, job_id: int, worker_id: str, now: Optional[datetime] = None) -> None:
+        """성공 처리 (실행 중 재요청이 있었으면 다시 대기, 커밋 포함)
+
+        점유 시 dirty_sections를 ''로 비우므로 완료 시점에 값이 있으면(NULL=전체 포함) 실행 중 재요청입니다.
+        적재 시각(requested_at)이 점유 전이어도 UPDATE가 점유 뒤에 반영될 수 있어 섹션 값으로도 판단합니다.
+        """
+        table = SyncJob.__table__
+        now = now or datetime.utcnow()
+        requested_again = or_(
+            table.c.requested_at > table.c.started_at,
+            table.c.dirty_sections.is_(None),
+            table.c.dirty_sections != '',
+        )
+        self._finish(job_id, worker_id, now, {
+            'status': case((requested_again, SyncJob.STATUS_PENDING), else_=SyncJob.STATUS_SUCCEEDED),
+            'attempts': case((requested_again, 0), else_=table.c.attempts),
+            'next_run_at': now,
+            'last_error': None,
+        })
+
+    def mark_failed(
+        self,
+        job_id: int,
+        worker_id: str,
+        error: str,
+        retry_at: Optional[datetime],
+        now: Optional[datetime] = None
+    ) -> None:
+        """실패 처리 (점유한 섹션은 다음 실행 대상으로 되돌림, 커밋 포함)
+
+        Args:
+            job_id: 점유한 작업 ID
+            worker_id: 점유 워커 식별자
+            error: 오류 메시지
+            retry_at: 재시도 시각 (None이면 최종 실패)
+            now: 기준 시각 (기본: 현재 UTC)
+        """
+        table = SyncJob.__table__
+        now = now or datetime.utcnow()
+        while True:
+            row = db.session.execute(
+                select(table.c.dirty_sections, table.c.run_sections).where(table.c.id == job_id)
+            ).first()
+            if row is None:
+                return
+            finished = self._finish(job_id, worker_id, now, {
+                'status': SyncJob.STATUS_PENDING if retry_at else SyncJob.STATUS_FAILED,
+                'next_run_at': retry_at or now,
+                'last_error': error,
+                'dirty_sections': SyncJob.merge_sections(row.dirty_sections, row.run_sections),
+            }, table.c.dirty_sections.is_not_distinct_from(row.dirty_sections))
+            # 점유가 풀렸거나 (다른 워커 복구) 읽은 뒤 재요청이 없으면 종료
+            if finished or not self._is_claimed_by(job_id, worker_id):
+                return
+
+    def _is_claimed_by(self, job_id: int, worker_id: str) -> bool:
+        """작업이 아직 해당 워커 점유 중인지"""
+        table = SyncJob.__table__
+        return db.session.execute(
+            select(table.c.id).where(table.c.id == job_id, table.c.locked_by == worker_id,
+                                     table.c.status == SyncJob.STATUS_RUNNING)
+        ).first() is not None
+
+    def _finish(self, job_id: int, worker_id: str, now: datetime, values: dict, *conditions) -> bool:
+        """점유 워커 확인 후 완료 값 기록
+
+        Returns:
+            기록 여부 (점유가 풀렸거나 추가 조건이 맞지 않으면 False)
+        """
+        table = SyncJob.__table__
+        finished = db.session.execute(
+            update(table)
+            .where(and_(table.c.id == job_id, table.c.locked_by == worker_id,
+                        table.c.status == SyncJob.STATUS_RUNNING, *conditions))
+            .values(locked_by=None, finished_at=now, updated_at=now, **values)
+        ).rowcount
+        db.session.commit()
+        return bool(finished)
+
+    def release_stale(self, timeout_seconds: int, now: Optional[datetime] = None) -> int:
+        """중단된 워커가 점유한 채 남은 작업을 다시 대기로 전환 (커밋 포함)
+
+        중단 시점에 처리한 섹션을 알 수 없으므로 전체 동기화로 되돌립니다.
+
+        Args:
+            timeout_seconds: 점유 후 경과 시간 기준 (초)
+            now: 기준 시각 (기본: 현재 UTC)
+
+        Returns:
+            전환된 작업 수
+        """
+        table = SyncJob.__table__
+        now = now or datetime.utcnow()
+        count = db.session.execute(
+            update(table)
+            .where(table.c.status == SyncJob.STATUS_RUNNING,
+                   table.c.started_at < now - timedelta(seconds=timeout_seconds))
+            .values(status=SyncJob.STATUS_PENDING, locked_by=None, dirty_sections=None,
+                    next_run_at=now, updated_at=now)
+        ).rowcount
+        db.session.commit()
+        return count
+
+    def find_next_run_at(self) -> Optional[datetime]:
+        """대기 작업 중 가장 이른 실행 시각"""
+        table = SyncJob.__table__
+        return db.session.execute(
+            select(func.min(table.c.next_run_at)).where(table.c.status == SyncJob.STATUS_PENDING)
+        ).scalar()
+
+    def find_by_user_id(self, user_id: int) -> List[SyncJob]:
+        """사용자의 동기화 작업 목록 (최근 요청순)"""
+        return SyncJob.query.filter_by(user_id=user_id).order_by(
+            SyncJob.requested_at.desc()
+        ).all()
+
+    def find_by_contract_id(self, contract_id: int) -> List[SyncJob]:
+        """계약의 동기화 작업 목록"""
+        return SyncJob.query.filter_by(contract_id=contract_id).order_by(
+            SyncJob.requested_at.desc()
+        ).all()
+
+
+# 싱글톤 인스턴스
+sync_job_repository = SyncJobRepository()
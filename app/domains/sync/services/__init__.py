@@ -12,6 +12,8 @@ from .sync_service import SyncService
 from .sync_basic_service import SyncBasicService
 from .sync_relation_service import SyncRelationService
 from .termination_service import TerminationService, termination_service
+from .sync_job_service import SyncJobService, sync_job_service
+from .sync_batch_service import SyncBatchService, sync_batch_service
 
 # Singleton instances
 sync_service = SyncService()
@@ -22,7 +24,11 @@ __all__ = [
     'SyncBasicService',
     'SyncRelationService',
     'TerminationService',
+    'SyncJobService',
+    'SyncBatchService',
     # Singleton instances
     'sync_service',
     'termination_service',
+    'sync_job_service',
+    'sync_batch_service',
 ]
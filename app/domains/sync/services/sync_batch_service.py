@@ -0,0 +1,329 @@
+"""
+법인 일괄 동기화 서비스
+
+법인의 모든 승인 계약을 요청 안에서 순차 동기화하지 않고 실행(sync_batch_runs)으로 등록한 뒤,
+계약을 청크로 나누어 여러 워커가 병렬 처리합니다. 워커마다 앱 컨텍스트(세션)를 따로 사용합니다.
+
+- 시작: start_company_sync - 대상 계약을 청크 단위 항목으로 저장 후 백그라운드 실행
+  (SYNC_BATCH_IN_PROCESS=False면 `flask run-sync-batch`로 실행)
+- 처리: run - 워커가 청크를 점유 → 계약별 동기화/커밋 → 항목 완료 기록
+- 진행률: get_progress - 완료/실패/남음 (항목 상태 집계)
+- 재개: resume - 중단된 running 항목(하트비트가 SYNC_BATCH_STALE_SECONDS 동안 없음)만 대기로 되돌리고
+  남은 항목부터 처리 (처리 중인 워커의 항목은 유지)
+"""
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from flask import current_app, has_app_context
+
+from app.database import db
+from app.domains.contract.models import SyncLog
+
+
+class SyncBatchService:
+    """법인 일괄 동기화 서비스"""
+
+    # 설정 기본값 (app.config의 SYNC_BATCH_* 우선)
+    DEFAULT_WORKERS = 4
+    DEFAULT_CHUNK_SIZE = 50
+    DEFAULT_STALE_SECONDS = 900
+
+    def __init__(self):
+        self._batch_repo = None
+        self._runners: Dict[int, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def batch_repo(self):
+        """지연 초기화된 SyncBatch Repository"""
+        if self._batch_repo is None:
+            from app.domains.sync.repositories.sync_batch_repository import sync_batch_repository
+            self._batch_repo = sync_batch_repository
+        return self._batch_repo
+
+    @staticmethod
+    def _config(key: str, default):
+        """앱 설정 조회 (앱 컨텍스트 없으면 기본값)"""
+        if has_app_context():
+            return current_app.config.get(key, default)
+        return default
+
+    # ===== 시작/재개 =====
+
+    def start_company_sync(
+        self,
+        company_id: int,
+        user_id: Optional[int] = None,
+        full_sync: bool = False,
+        sync_type: str = SyncLog.SYNC_TYPE_MANUAL
+    ) -> Dict[str, Any]:
+        """법인 전체 승인 계약 일괄 동기화 시작
+
+        진행 중인 실행이 있으면 새로 만들지 않고 해당 실행을 반환합니다. (중단된 실행은 재개)
+
+        Args:
+            company_id: 법인 ID
+            user_id: 요청 사용자 ID (동기화 로그 기록자)
+            full_sync: True면 계약마다 전체 공유 설정 후 동기화 (/full-sync와 동일)
+            sync_type: 동기화 유형
+
+        Returns:
+            실행 진행률 (get_progress)
+        """
+        active = self.batch_repo.find_active_by_company(company_id)
+        if active:
+            if self.is_stale(active):
+                return self.resume(active.id)
+            return self.get_progress(active.id)
+
+        run = self.batch_repo.create_run(
+            company_id=company_id,
+            contract_ids=self.batch_repo.find_approved_contract_ids(company_id),
+            chunk_size=self._config('SYNC_BATCH_CHUNK_SIZE', self.DEFAULT_CHUNK_SIZE),
+            requested_by=user_id,
+            full_sync=full_sync,
+            sync_type=sync_type,
+        )
+        self.dispatch(run.id)
+        return self.get_progress(run.id)
+
+    def resume(self, run_id: int, retry_failed: bool = False) -> Optional[Dict[str, Any]]:
+        """중단된 실행 재개 (남은 항목부터)
+
+        Args:
+            run_id: 실행 ID
+            retry_failed: True면 실패 항목도 다시 시도
+
+        Returns:
+            실행 진행률 (실행이 없으면 None)
+        """
+        from app.domains.sync.models import SyncBatchRun
+
+        run = self.batch_repo.find_by_id(run_id)
+        if not run:
+            return None
+        if run.status == SyncBatchRun.STATUS_RUNNING and not self.is_stale(run):
+            return self.get_progress(run_id)
+
+        self.release_stale_items(run_id, retry_failed=retry_failed)
+        self.batch_repo.update_run(
+            run_id, status=SyncBatchRun.STATUS_PENDING, finished_at=None, last_error=None
+        )
+        self.dispatch(run_id)
+        return self.get_progress(run_id)
+
+    def release_stale_items(self, run_id: int, retry_failed: bool = False) -> int:
+        """중단된 running 항목을 대기로 되돌림 (처리 중인 워커의 항목 제외)
+
+        Args:
+            run_id: 실행 ID
+            retry_failed: True면 실패 항목도 다시 시도
+
+        Returns:
+            대기로 되돌린 항목 수
+        """
+        return self.batch_repo.release_items(run_id, self._stale_cutoff(), include_failed=retry_failed)
+
+    def dispatch(self, run_id: int) -> None:
+        """앱 프로세스 내 백그라운드 스레드에서 실행 (SYNC_BATCH_IN_PROCESS)"""
+        if not self._config('SYNC_BATCH_IN_PROCESS', True):
+            return
+        app = current_app._get_current_object()
+        with self._lock:
+            runner = self._runners.get(run_id)
+            if runner and runner.is_alive():
+                return
+            runner = threading.Thread(
+                target=self._run_in_app, args=(app, run_id),
+                name=f'sync-batch-{run_id}', daemon=True
+            )
+            self._runners[run_id] = runner
+        runner.start()
+
+    def _run_in_app(self, app, run_id: int) -> None:
+        with app.app_context():
+            try:
+                self.run(run_id)
+            except Exception as e:
+                app.logger.error(f"Sync batch {run_id} error: {str(e)}")
+                self.batch_repo.update_run(run_id, last_error=str(e))
+        with self._lock:
+            self._runners.pop(run_id, None)
+
+    # ===== 처리 =====
+
+    def run(self, run_id: int, workers: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """실행 처리 (남은 청크가 없을 때까지, 호출 스레드에서 대기)
+
+        Args:
+            run_id: 실행 ID
+            workers: 병렬 워커 수 (기본: SYNC_BATCH_WORKERS, 1이면 호출 스레드에서 처리)
+
+        Returns:
+            실행 진행률 (실행이 없으면 None)
+        """
+        from app.domains.sync.models import SyncBatchRun
+
+        run = self.batch_repo.find_by_id(run_id)
+        if not run:
+            return None
+        if run.status != SyncBatchRun.STATUS_COMPLETED:
+            self.batch_repo.update_run(
+                run_id, status=SyncBatchRun.STATUS_RUNNING,
+                started_at=run.started_at or datetime.utcnow()
+            )
+
+            workers = workers or self._config('SYNC_BATCH_WORKERS', self.DEFAULT_WORKERS)
+            worker_base = self.default_worker_id()
+            if workers <= 1:
+                self._work(run_id, f'{worker_base}:0')
+            else:
+                app = current_app._get_current_object()
+                threads = [
+                    threading.Thread(target=self._work_in_app, args=(app, run_id, f'{worker_base}:{index}'))
+                    for index in range(workers)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            self._finalize(run_id)
+        return self.get_progress(run_id)
+
+    def _work_in_app(self, app, run_id: int, worker_id: str) -> None:
+        """워커 스레드 (자체 앱 컨텍스트/세션)"""
+        with app.app_context():
+            try:
+                self._work(run_id, worker_id)
+            except Exception as e:
+                app.logger.error(f"Sync batch {run_id} worker {worker_id} error: {str(e)}")
+
+    def _work(self, run_id: int, worker_id: str) -> None:
+        """청크를 점유하여 계약별 동기화 (남은 청크가 없을 때까지)"""
+        from app.domains.sync.services.sync_service import SyncService
+
+        run = self.batch_repo.find_by_id(run_id)
+        full_sync, sync_type = run.full_sync, run.sync_type
+
+        # 워커별 인스턴스 (set_current_user 상태를 다른 스레드와 공유하지 않음)
+        sync_service = SyncService()
+        sync_service.set_current_user(run.requested_by)
+        while True:
+            items = self.batch_repo.claim_chunk(run_id, worker_id)
+            if not items:
+                return
+            for item_id, contract_id in items:
+                error = self._sync_contract(sync_service, contract_id, full_sync, sync_type)
+                if not self.batch_repo.finish_item(run_id, item_id, worker_id, error):
+                    current_app.logger.warning(
+                        f"Sync batch {run_id} item {item_id} was released before {worker_id} finished it"
+                    )
+
+    def _sync_contract(self, sync_service, contract_id: int, full_sync: bool, sync_type: str) -> Optional[str]:
+        """계약 1건 동기화 및 커밋
+
+        Returns:
+            오류 메시지 (성공 시 None)
+        """
+        try:
+            if full_sync:
+                sync_service.enable_full_sharing(contract_id, commit=False)
+            result = sync_service.sync_personal_to_employee(
+                contract_id=contract_id,
+                sync_type=sync_type,
+                commit=False
+            )
+            if result.get('success'):
+                db.session.commit()
+                return None
+            db.session.rollback()
+            return result.get('error') or '동기화 실패'
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Sync batch error for contract {contract_id}: {str(e)}")
+            return str(e)
+
+    def _finalize(self, run_id: int) -> None:
+        """남은 항목이 없으면 완료 처리"""
+        from app.domains.sync.models import SyncBatchItem, SyncBatchRun
+
+        counts = self.batch_repo.count_by_status(run_id)
+        if not counts.get(SyncBatchItem.STATUS_PENDING) and not counts.get(SyncBatchItem.STATUS_RUNNING):
+            self.batch_repo.update_run(
+                run_id, status=SyncBatchRun.STATUS_COMPLETED, finished_at=datetime.utcnow()
+            )
+
+    # ===== 상태 조회 =====
+
+    def is_stale(self, run) -> bool:
+        """실행 중이지만 SYNC_BATCH_STALE_SECONDS 동안 진행이 없는 실행 (워커 중단)
+
+        점유 항목의 하트비트(started_at)가 끊긴 항목이 있거나,
+        점유 항목 없이 실행 진행 시각(updated_at)이 멈춘 경우입니다.
+        """
+        from app.domains.sync.models import SyncBatchItem, SyncBatchRun
+
+        if run.status != SyncBatchRun.STATUS_RUNNING:
+            return False
+        cutoff = self._stale_cutoff()
+        if self.batch_repo.count_stale_items(run.id, cutoff):
+            return True
+        return (run.updated_at < cutoff
+                and not self.batch_repo.count_by_status(run.id).get(SyncBatchItem.STATUS_RUNNING))
+
+    def _stale_cutoff(self) -> datetime:
+        """중단 판단 기준 시각 (이전 하트비트는 중단)"""
+        stale_seconds = self._config('SYNC_BATCH_STALE_SECONDS', self.DEFAULT_STALE_SECONDS)
+        return datetime.utcnow() - timedelta(seconds=stale_seconds)
+
+    def get_progress(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """실행 진행률
+
+        Returns:
+            실행 정보 + {'progress': {'total', 'done', 'succeeded', 'failed', 'running', 'remaining'},
+                        'stale': bool, 'failures': [{'contract_id', 'error'}]}
+        """
+        from app.domains.sync.models import SyncBatchItem
+
+        run = self.batch_repo.find_by_id(run_id)
+        if not run:
+            return None
+        db.session.refresh(run)
+        counts = self.batch_repo.count_by_status(run_id)
+        succeeded = counts.get(SyncBatchItem.STATUS_SUCCEEDED, 0)
+        failed = counts.get(SyncBatchItem.STATUS_FAILED, 0)
+        running = counts.get(SyncBatchItem.STATUS_RUNNING, 0)
+        pending = counts.get(SyncBatchItem.STATUS_PENDING, 0)
+
+        data = run.to_dict()
+        data['progress'] = {
+            'total': run.total,
+            'done': succeeded + failed,
+            'succeeded': succeeded,
+            'failed': failed,
+            'running': running,
+            'remaining': pending + running,
+        }
+        data['stale'] = self.is_stale(run)
+        data['failures'] = [
+            {'contract_id': item.contract_id, 'error': item.error}
+            for item in self.batch_repo.find_failed_items(run_id)
+        ]
+        return data
+
+    def get_runs_for_company(self, company_id: int) -> list:
+        """법인의 최근 실행 목록"""
+        return [run.to_dict() for run in self.batch_repo.find_by_company(company_id)]
+
+    @staticmethod
+    def default_worker_id() -> str:
+        """워커 식별자 (호스트:PID:스레드)"""
+        return f'{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}'
+
+
+# 싱글톤 인스턴스
+sync_batch_service = SyncBatchService()
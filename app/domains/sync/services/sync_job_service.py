@@ -0,0 +1,292 @@
+"""
+동기화 작업 큐 서비스
+
+프로필 저장 커밋 후 자동 동기화를 요청 안에서 실행하지 않고 작업 큐(sync_jobs)에 적재합니다.
+워커(앱 프로세스 내 스레드 또는 `flask run-sync-worker`)가 작업을 점유하여 별도 세션에서 동기화합니다.
+
+- 적재: enqueue_for_user - 실시간 동기화 계약별 1건, 커밋된 세션과 분리된 커넥션 사용
+- 병합: 같은 사용자의 연속 요청은 SYNC_COALESCE_WINDOW_SECONDS 동안 모아 1회 실행
+  (최대 SYNC_COALESCE_MAX_DELAY_SECONDS 지연), 변경 섹션의 합집합만 동기화
+- 처리: run_pending - 점유 → sync_personal_to_employee → 성공/실패 기록
+- 재시도: 예외 발생 시 지수 백오프 (SYNC_QUEUE_RETRY_BASE_SECONDS * 2^(시도-1))
+  계약 미승인/프로필 없음 등 동기화 결과 오류는 재시도 없이 failed
+- 상태 조회: get_jobs_for_user / get_jobs_for_contract
+"""
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from flask import current_app, has_app_context, request_started
+
+from app.database import db
+from app.domains.contract.models import SyncLog
+
+
+class SyncJobService:
+    """동기화 작업 큐 서비스"""
+
+    # 설정 기본값 (app.config의 SYNC_QUEUE_* 우선)
+    DEFAULT_MAX_ATTEMPTS = 5
+    DEFAULT_RETRY_BASE_SECONDS = 30
+    DEFAULT_RETRY_MAX_SECONDS = 3600
+    DEFAULT_STALE_SECONDS = 900
+    DEFAULT_COALESCE_WINDOW_SECONDS = 3
+    DEFAULT_COALESCE_MAX_DELAY_SECONDS = 30
+
+    def __init__(self):
+        self._job_repo = None
+        self._wakeup = threading.Event()
+        self._workers: List['SyncWorker'] = []
+        # 지연 시작 워커 수 / 워커를 시작한 프로세스 ID
+        self._lazy_worker_count = 0
+        self._workers_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def job_repo(self):
+        """지연 초기화된 SyncJob Repository"""
+        if self._job_repo is None:
+            from app.domains.sync.repositories.sync_job_repository import sync_job_repository
+            self._job_repo = sync_job_repository
+        return self._job_repo
+
+    @staticmethod
+    def _config(key: str, default):
+        """앱 설정 조회 (앱 컨텍스트 없으면 기본값)"""
+        if has_app_context():
+            return current_app.config.get(key, default)
+        return default
+
+    # ===== 적재 =====
+
+    def enqueue_for_user(
+        self,
+        user_id: int,
+        sync_type: str = SyncLog.SYNC_TYPE_AUTO,
+        sections: Optional[Iterable[str]] = None
+    ) -> int:
+        """사용자의 실시간 동기화 계약별 작업 적재
+
+        세션 after_commit 시점에도 호출할 수 있도록 별도 커넥션 트랜잭션에서 실행합니다.
+        아직 실행되지 않은 작업이 있으면 섹션을 합치고 실행 시각을 병합 대기 시간만큼 늦춥니다.
+
+        Args:
+            user_id: 개인 사용자 ID
+            sync_type: 동기화 유형
+            sections: 변경 섹션 목록 (None이면 전체 동기화)
+
+        Returns:
+            적재한 작업 수
+        """
+        now = datetime.utcnow()
+        window = self._config('SYNC_COALESCE_WINDOW_SECONDS', self.DEFAULT_COALESCE_WINDOW_SECONDS)
+        max_delay = self._config('SYNC_COALESCE_MAX_DELAY_SECONDS', self.DEFAULT_COALESCE_MAX_DELAY_SECONDS)
+        with db.engine.begin() as connection:
+            contract_ids = self.job_repo.find_realtime_contract_ids(user_id, connection)
+            for contract_id in contract_ids:
+                self.job_repo.enqueue(
+                    user_id, contract_id, sync_type, connection=connection, now=now,
+                    sections=sections, window_seconds=window, max_delay_seconds=max_delay
+                )
+
+        if contract_ids:
+            self._wakeup.set()
+        return len(contract_ids)
+
+    # ===== 처리 =====
+
+    def run_pending(self, worker_id: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, int]:
+        """실행 가능한 작업을 순서대로 처리
+
+        Args:
+            worker_id: 워커 식별자 (기본: 호스트:PID:스레드)
+            limit: 최대 처리 건수 (기본: 대기 작업이 없을 때까지)
+
+        Returns:
+            {'succeeded': n, 'retrying': n, 'failed': n}
+        """
+        from app.domains.sync.services.sync_service import SyncService
+
+        worker_id = worker_id or self.default_worker_id()
+        self.job_repo.release_stale(self._config('SYNC_QUEUE_STALE_SECONDS', self.DEFAULT_STALE_SECONDS))
+
+        # 워커별 인스턴스 (set_current_user 상태를 요청 스레드와 공유하지 않음)
+        sync_service = SyncService()
+        stats = {'succeeded': 0, 'retrying': 0, 'failed': 0}
+        processed = 0
+        while limit is None or processed < limit:
+            job = self.job_repo.claim_next(worker_id)
+            if job is None:
+                break
+            stats[self._process(job, worker_id, sync_service)] += 1
+            processed += 1
+        return stats
+
+    def _process(self, job, worker_id: str, sync_service) -> str:
+        """작업 1건 실행 및 결과 기록
+
+        Returns:
+            'succeeded' | 'retrying' | 'failed'
+        """
+        from app.domains.sync.models import SyncJob
+
+        job_id, user_id, contract_id = job.id, job.user_id, job.contract_id
+        attempts = job.attempts
+        try:
+            sync_service.set_current_user(user_id)
+            result = sync_service.sync_personal_to_employee(
+                contract_id=contract_id,
+                sync_type=job.sync_type,
+                commit=False,
+                sections=SyncJob.parse_sections(job.run_sections)
+            )
+            if result.get('success'):
+                db.session.commit()
+            else:
+                db.session.rollback()
+        except Exception as e:
+            db.session.rollback()
+            retry_at = self._retry_at(attempts)
+            self.job_repo.mark_failed(job_id, worker_id, str(e), retry_at)
+            current_app.logger.error(
+                f"Sync job {job_id} error for contract {contract_id} "
+                f"(attempt {attempts}): {str(e)}"
+            )
+            return 'retrying' if retry_at else 'failed'
+
+        if not result.get('success'):
+            self.job_repo.mark_failed(job_id, worker_id, result.get('error') or '동기화 실패', None)
+            current_app.logger.warning(
+                f"Sync job {job_id} failed for contract {contract_id}: {result.get('error')}"
+            )
+            return 'failed'
+
+        self.job_repo.mark_succeeded(job_id, worker_id)
+        current_app.logger.info(
+            f"Sync job {job_id} completed for contract {contract_id}: "
+            f"{len(result.get('changes', []))} changes"
+        )
+        return 'succeeded'
+
+    def _retry_at(self, attempts: int) -> Optional[datetime]:
+        """재시도 시각 (최대 시도 횟수 도달 시 None)"""
+        if attempts >= self._config('SYNC_QUEUE_MAX_ATTEMPTS', self.DEFAULT_MAX_ATTEMPTS):
+            return None
+        base = self._config('SYNC_QUEUE_RETRY_BASE_SECONDS', self.DEFAULT_RETRY_BASE_SECONDS)
+        cap = self._config('SYNC_QUEUE_RETRY_MAX_SECONDS', self.DEFAULT_RETRY_MAX_SECONDS)
+        delay = min(base * (2 ** max(attempts - 1, 0)), cap)
+        return datetime.utcnow() + timedelta(seconds=delay)
+
+    # ===== 상태 조회 =====
+
+    def get_jobs_for_user(self, user_id: int) -> List[Dict]:
+        """사용자의 동기화 작업 상태 목록"""
+        return [job.to_dict() for job in self.job_repo.find_by_user_id(user_id)]
+
+    def get_jobs_for_contract(self, contract_id: int) -> List[Dict]:
+        """계약의 동기화 작업 상태 목록"""
+        return [job.to_dict() for job in self.job_repo.find_by_contract_id(contract_id)]
+
+    # ===== 워커 =====
+
+    @staticmethod
+    def default_worker_id() -> str:
+        """워커 식별자 (호스트:PID:스레드)"""
+        return f'{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}'
+
+    def wait_for_work(self, timeout: float) -> None:
+        """새 작업 적재 또는 timeout까지 대기"""
+        if self._wakeup.wait(timeout):
+            self._wakeup.clear()
+
+    def next_wait_seconds(self, poll_seconds: float) -> float:
+        """다음 대기 시간 (병합 대기 중인 작업의 실행 시각이 더 이르면 그 시각까지)"""
+        next_run_at = self.job_repo.find_next_run_at()
+        if next_run_at is None:
+            return poll_seconds
+        return min(poll_seconds, max((next_run_at - datetime.utcnow()).total_seconds(), 0))
+
+    def start_workers(self, app, count: int) -> None:
+        """앱 프로세스 내 워커 스레드 시작
+
+        Args:
+            app: Flask 애플리케이션
+            count: 워커 스레드 수
+        """
+        poll_seconds = app.config.get('SYNC_QUEUE_POLL_SECONDS', 5)
+        for _ in range(count - len(self._workers)):
+            worker = SyncWorker(app, self, f'sync-worker-{len(self._workers) + 1}', poll_seconds)
+            worker.start()
+            self._workers.append(worker)
+
+    def start_workers_lazily(self, app, count: int) -> None:
+        """요청을 처리하는 프로세스의 첫 요청에서 워커 스레드 시작
+
+        gunicorn --preload처럼 앱 생성 후 fork하는 서버에서는 fork 전에 시작한 스레드가
+        자식 프로세스로 복제되지 않고, 부모가 연 DB 커넥션을 자식과 공유하게 되므로
+        앱 생성 시점이 아닌 프로세스별 첫 요청(request_started)에서 시작합니다.
+
+        Args:
+            app: Flask 애플리케이션
+            count: 워커 스레드 수
+        """
+        self._lazy_worker_count = count
+        request_started.connect(self._on_request_started, app)
+
+    def _on_request_started(self, app, **extra) -> None:
+        """request_started 시그널 핸들러 (프로세스별 1회 워커 시작)"""
+        if self._workers_pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._workers_pid == os.getpid():
+                return
+            if self._workers_pid is not None:
+                # fork로 복제된 상태: 부모 프로세스의 스레드는 자식에서 실행되지 않음
+                self._workers = []
+                self._wakeup = threading.Event()
+            self._workers_pid = os.getpid()
+            self.start_workers(app, self._lazy_worker_count)
+
+    def stop_workers(self, timeout: float = 5) -> None:
+        """워커 스레드 종료 (지연 시작 대기 해제)"""
+        request_started.disconnect(self._on_request_started)
+        self._workers_pid = None
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+        self._wakeup.set()
+        for worker in workers:
+            worker.join(timeout)
+
+
+class SyncWorker(threading.Thread):
+    """동기화 작업 큐 워커 스레드 (처리 주기마다 앱 컨텍스트/세션 분리)"""
+
+    def __init__(self, app, service: SyncJobService, name: str, poll_seconds: float):
+        super().__init__(name=name, daemon=True)
+        self.app = app
+        self.service = service
+        self.poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+
+    def run(self):
+        worker_id = self.service.default_worker_id()
+        while not self._stopped.is_set():
+            timeout = self.poll_seconds
+            try:
+                with self.app.app_context():
+                    self.service.run_pending(worker_id=worker_id)
+                    timeout = self.service.next_wait_seconds(self.poll_seconds)
+            except Exception as e:
+                self.app.logger.error(f"Sync worker {self.name} error: {str(e)}")
+            self.service.wait_for_work(timeout)
+
+    def stop(self):
+        """다음 대기 후 종료"""
+        self._stopped.set()
+
+
+# 싱글톤 인스턴스
+sync_job_service = SyncJobService()
@@ -5,11 +5,14 @@
 
 Phase 30: 레이어 분리 - db.session 제거, Repository 패턴 적용
 Phase 33: 첨부파일 동기화 추가
+
+관계 데이터(학력/경력/자격증/어학/가족)는 (계약, 관계 유형)별 내용 지문으로 변경 여부를 판단하고,
+변경된 경우에만 직원 측 행과 자연 키로 매칭하여 바뀐 행만 반영합니다. (SyncFingerprint)
 """
 from typing import Dict, Any, List
+import hashlib
 import json
 import os
-import shutil
 from datetime import datetime
 
 from app.domains.employee.models import Employee
@@ -24,6 +27,30 @@ class SyncRelationService:
     Phase 33: 첨부파일 동기화 추가
     """
 
+    # 관계 유형 → (프로필 관계 속성, 로그 entity_type, 복사 필드, 프로필에 속성이 없을 때 기본값)
+    # 복사 필드는 프로필/직원 모델에서 같은 속성명을 사용
+    RELATION_SPECS = {
+        'education': ('educations', 'education', (
+            'school_type', 'school_name', 'major', 'degree', 'admission_date',
+            'graduation_date', 'graduation_status', 'gpa', 'location', 'note',
+        ), {}),
+        'career': ('careers', 'career', (
+            'company_name', 'department', 'position', 'job_grade', 'job_title', 'job_role',
+            'job_description', 'start_date', 'end_date', 'is_current', 'resignation_reason', 'note',
+        ), {'is_current': False}),
+        'certificate': ('certificates', 'certificate', (
+            'certificate_name', 'issuing_organization', 'acquisition_date', 'expiry_date',
+            'certificate_number', 'grade', 'note',
+        ), {}),
+        'language': ('languages', 'language', (
+            'language_name', 'level', 'exam_name', 'score', 'acquisition_date', 'expiry_date', 'note',
+        ), {}),
+        'family': ('family_members', 'family_member', (
+            'relation', 'name', 'birth_date', 'occupation', 'contact',
+            'is_cohabitant', 'is_dependent', 'note',
+        ), {}),
+    }
+
     def __init__(self, current_user_id: int = None):
         self._current_user_id = current_user_id
         # Repository 지연 초기화용
@@ -34,6 +61,7 @@ class SyncRelationService:
         self._language_repo = None
         self._family_repo = None
         self._attachment_repo = None
+        self._fingerprint_repo = None
 
     # ========================================
     # Repository Properties (지연 초기화)
@@ -95,6 +123,14 @@ class SyncRelationService:
             self._attachment_repo = attachment_repository
         return self._attachment_repo
 
+    @property
+    def fingerprint_repo(self):
+        """지연 초기화된 SyncFingerprint Repository"""
+        if self._fingerprint_repo is None:
+            from app.domains.sync.repositories.sync_fingerprint_repository import sync_fingerprint_repository
+            self._fingerprint_repo = sync_fingerprint_repository
+        return self._fingerprint_repo
+
     def set_current_user(self, user_id: int):
         """현재 작업 사용자 설정"""
         self._current_user_id = user_id
@@ -185,54 +221,8 @@ class SyncRelationService:
         employee: Employee,
         sync_type: str
     ) -> Dict[str, Any]:
-        """학력 정보 동기화
-
-        Phase 30: Repository 패턴 적용
-        """
-        from app.domains.employee.models import Education
-
-        personal_edus = list(profile.educations.all())
-        if not personal_edus:
-            return {'synced': False}
-
-        # Phase 30: Repository 사용 - 기존 직원 학력 삭제
-        self.education_repo.delete_by_employee_id(employee.id, commit=False)
-
-        for pe in personal_edus:
-            edu = Education(
-                employee_id=employee.id,
-                school_type=pe.school_type,
-                school_name=pe.school_name,
-                major=pe.major,
-                degree=pe.degree,
-                admission_date=pe.admission_date,
-                graduation_date=pe.graduation_date,
-                graduation_status=pe.graduation_status,
-                gpa=getattr(pe, 'gpa', None),
-                location=getattr(pe, 'location', None),
-                note=getattr(pe, 'note', None),
-            )
-            # Phase 30: Repository 사용
-            self.education_repo.create_model(edu, commit=False)
-
-        # Phase 30: Repository 사용 - 로그 생성
-        log = self.sync_log_repo.create_log(
-            contract_id=contract_id,
-            sync_type=sync_type,
-            entity_type='education',
-            field_name=None,
-            old_value=None,
-            new_value=json.dumps({'count': len(personal_edus)}),
-            direction='personal_to_employee',
-            user_id=self._current_user_id,
-            commit=False
-        )
-
-        return {
-            'synced': True,
-            'changes': [{'entity': 'education', 'count': len(personal_edus)}],
-            'log_ids': [log.id]
-        }
+        """학력 정보 동기화"""
+        return self._sync_relation('education', contract_id, profile, employee, sync_type)
 
     def _sync_career(
         self,
@@ -241,54 +231,8 @@ class SyncRelationService:
         employee: Employee,
         sync_type: str
     ) -> Dict[str, Any]:
-        """경력 정보 동기화
-
-        Phase 30: Repository 패턴 적용
-        """
-        from app.domains.employee.models import Career
-
-        personal_careers = list(profile.careers.all())
-        if not personal_careers:
-            return {'synced': False}
-
-        # Phase 30: Repository 사용
-        self.career_repo.delete_by_employee_id(employee.id, commit=False)
-
-        for pc in personal_careers:
-            career = Career(
-                employee_id=employee.id,
-                company_name=pc.company_name,
-                department=pc.department,
-                position=pc.position,
-                job_grade=getattr(pc, 'job_grade', None),
-                job_title=getattr(pc, 'job_title', None),
-                job_role=getattr(pc, 'job_role', None),
-                job_description=getattr(pc, 'job_description', None),
-                start_date=pc.start_date,
-                end_date=pc.end_date,
-                is_current=getattr(pc, 'is_current', False),
-                resignation_reason=getattr(pc, 'resignation_reason', None),
-                note=getattr(pc, 'note', None),
-            )
-            self.career_repo.create_model(career, commit=False)
-
-        log = self.sync_log_repo.create_log(
-            contract_id=contract_id,
-            sync_type=sync_type,
-            entity_type='career',
-            field_name=None,
-            old_value=None,
-            new_value=json.dumps({'count': len(personal_careers)}),
-            direction='personal_to_employee',
-            user_id=self._current_user_id,
-            commit=False
-        )
-
-        return {
-            'synced': True,
-            'changes': [{'entity': 'career', 'count': len(personal_careers)}],
-            'log_ids': [log.id]
-        }
+        """경력 정보 동기화"""
+        return self._sync_relation('career', contract_id, profile, employee, sync_type)
 
     def _sync_certificates(
         self,
@@ -297,49 +241,8 @@ class SyncRelationService:
         employee: Employee,
         sync_type: str
     ) -> Dict[str, Any]:
-        """자격증 정보 동기화
-
-        Phase 30: Repository 패턴 적용
-        """
-        from app.domains.employee.models import Certificate
-
-        personal_certs = list(profile.certificates.all())
-        if not personal_certs:
-            return {'synced': False}
-
-        # Phase 30: Repository 사용
-        self.certificate_repo.delete_by_employee_id(employee.id, commit=False)
-
-        for pc in personal_certs:
-            cert = Certificate(
-                employee_id=employee.id,
-                certificate_name=pc.certificate_name,
-                issuing_organization=pc.issuing_organization,
-                acquisition_date=getattr(pc, 'acquisition_date', None),
-                expiry_date=getattr(pc, 'expiry_date', None),
-                certificate_number=getattr(pc, 'certificate_number', None),
-                grade=getattr(pc, 'grade', None),
-                note=getattr(pc, 'note', None),
-            )
-            self.certificate_repo.create_model(cert, commit=False)
-
-        log = self.sync_log_repo.create_log(
-            contract_id=contract_id,
-            sync_type=sync_type,
-            entity_type='certificate',
-            field_name=None,
-            old_value=None,
-            new_value=json.dumps({'count': len(personal_certs)}),
-            direction='personal_to_employee',
-            user_id=self._current_user_id,
-            commit=False
-        )
-
-        return {
-            'synced': True,
-            'changes': [{'entity': 'certificate', 'count': len(personal_certs)}],
-            'log_ids': [log.id]
-        }
+        """자격증 정보 동기화"""
+        return self._sync_relation('certificate', contract_id, profile, employee, sync_type)
 
     def _sync_languages(
         self,
@@ -348,49 +251,8 @@ class SyncRelationService:
         employee: Employee,
         sync_type: str
     ) -> Dict[str, Any]:
-        """어학 능력 동기화
-
-        Phase 30: Repository 패턴 적용
-        """
-        from app.domains.employee.models import Language
-
-        personal_langs = list(profile.languages.all())
-        if not personal_langs:
-            return {'synced': False}
-
-        # Phase 30: Repository 사용
-        self.language_repo.delete_by_employee_id(employee.id, commit=False)
-
-        for pl in personal_langs:
-            lang = Language(
-                employee_id=employee.id,
-                language_name=pl.language_name,
-                level=getattr(pl, 'level', None),
-                exam_name=getattr(pl, 'exam_name', None),
-                score=getattr(pl, 'score', None),
-                acquisition_date=getattr(pl, 'acquisition_date', None),
-                expiry_date=getattr(pl, 'expiry_date', None),
-                note=getattr(pl, 'note', None),
-            )
-            self.language_repo.create_model(lang, commit=False)
-
-        log = self.sync_log_repo.create_log(
-            contract_id=contract_id,
-            sync_type=sync_type,
-            entity_type='language',
-            field_name=None,
-            old_value=None,
-            new_value=json.dumps({'count': len(personal_langs)}),
-            direction='personal_to_employee',
-            user_id=self._current_user_id,
-            commit=False
-        )
-
-        return {
-            'synced': True,
-            'changes': [{'entity': 'language', 'count': len(personal_langs)}],
-            'log_ids': [log.id]
-        }
+        """어학 능력 동기화"""
+        return self._sync_relation('language', contract_id, profile, employee, sync_type)
 
     def _sync_family_members(
         self,
@@ -399,40 +261,74 @@ class SyncRelationService:
         employee: Employee,
         sync_type: str
     ) -> Dict[str, Any]:
-        """가족 정보 동기화
+        """가족 정보 동기화"""
+        return self._sync_relation('family', contract_id, profile, employee, sync_type)
 
-        Phase 30: Repository 패턴 적용
-        """
-        from app.domains.employee.models import FamilyMember
+    def _sync_relation(
+        self,
+        relation_type: str,
+        contract_id: int,
+        profile: Profile,
+        employee: Employee,
+        sync_type: str
+    ) -> Dict[str, Any]:
+        """관계 데이터 변경분 동기화
+
+        1. 개인 측 행 집합을 직원 속성 값으로 변환하여 지문(fingerprint) 계산
+        2. 자동 동기화에서 지난 동기화의 지문/대상 직원과 같고, 직원 측 현재 행의 지문도 같으면 생략
+           (법인에서 직원 측 행을 수정/삭제했으면 다시 동기화, 수동/초기 동기화는 항상 비교)
+        3. 자연 키로 직원 측 행과 매칭하여 바뀐 행만 INSERT/UPDATE/DELETE
+        개인 측 행이 없으면 기존과 같이 직원 측 데이터를 유지합니다.
+
+        Args:
+            relation_type: 관계 유형 (RELATION_SPECS 키)
+            contract_id: 계약 ID
+            profile: 개인 프로필
+            employee: 직원 객체
+            sync_type: 동기화 유형
 
-        personal_family = list(profile.family_members.all())
-        if not personal_family:
+        Returns:
+            동기화 결과 {'synced': bool, 'changes': [...], 'log_ids': [...]}
+            지문이 같아 생략한 경우 {'synced': False, 'skipped': True}
+        """
+        from app.shared.base import relation_updater, get_relation_config
+
+        relation_attr, entity_type, fields, defaults = self.RELATION_SPECS[relation_type]
+        rows = [
+            {name: getattr(source, name, defaults.get(name)) for name in fields}
+            for source in getattr(profile, relation_attr).all()
+        ]
+        if not rows:
             return {'synced': False}
 
-        # Phase 30: Repository 사용 - 기존 가족 정보 삭제
-        self.family_repo.delete_by_employee_id(employee.id, commit=False)
-
-        for pf in personal_family:
-            family = FamilyMember(
-                employee_id=employee.id,
-                relation=pf.relation,
-                name=pf.name,
-                birth_date=pf.birth_date,
-                occupation=pf.occupation,
-                contact=pf.contact,
-                is_cohabitant=pf.is_cohabitant,
-                is_dependent=pf.is_dependent,
-                note=pf.note,
-            )
-            self.family_repo.create_model(family, commit=False)
+        fingerprint = self.fingerprint_rows(rows)
+        if sync_type == SyncLog.SYNC_TYPE_AUTO:
+            stored = self.fingerprint_repo.find(contract_id, relation_type)
+            if (stored and stored.fingerprint == fingerprint and stored.employee_id == employee.id
+                    and self._employee_fingerprint(employee, relation_type) == fingerprint):
+                return {'synced': False, 'skipped': True}
+
+        config = get_relation_config(relation_type, {relation_type: self._relation_repo(relation_type)})
+        summary = relation_updater.apply_rows(employee.id, [(None, row) for row in rows], config)
+        self.fingerprint_repo.save(contract_id, relation_type, employee.id, fingerprint, len(rows))
 
+        if not summary.has_changes:
+            return {'synced': False}
+
+        change = {
+            'entity': entity_type,
+            'count': len(rows),
+            'created': len(summary.created),
+            'updated': len(summary.updated),
+            'deleted': len(summary.deleted),
+        }
         log = self.sync_log_repo.create_log(
             contract_id=contract_id,
             sync_type=sync_type,
-            entity_type='family_member',
+            entity_type=entity_type,
             field_name=None,
             old_value=None,
-            new_value=json.dumps({'count': len(personal_family)}),
+            new_value=json.dumps({key: value for key, value in change.items() if key != 'entity'}),
             direction='personal_to_employee',
             user_id=self._current_user_id,
             commit=False
@@ -440,10 +336,41 @@ class SyncRelationService:
 
         return {
             'synced': True,
-            'changes': [{'entity': 'family_member', 'count': len(personal_family)}],
+            'changes': [change],
             'log_ids': [log.id]
         }
 
+    def _employee_fingerprint(self, employee: Employee, relation_type: str) -> str:
+        """직원 측 현재 행 집합 지문 (개인 측 지문과 같은 속성/기본값)"""
+        relation_attr, _, fields, defaults = self.RELATION_SPECS[relation_type]
+        return self.fingerprint_rows([
+            {name: getattr(target, name, defaults.get(name)) for name in fields}
+            for target in getattr(employee, relation_attr).all()
+        ])
+
+    def _relation_repo(self, relation_type: str):
+        """관계 유형별 직원 Repository"""
+        return {
+            'education': self.education_repo,
+            'career': self.career_repo,
+            'certificate': self.certificate_repo,
+            'language': self.language_repo,
+            'family': self.family_repo,
+        }[relation_type]
+
+    @staticmethod
+    def fingerprint_rows(rows: List[Dict[str, Any]]) -> str:
+        """행 집합 지문 (행 순서와 무관한 SHA-256)
+
+        Args:
+            rows: {직원 속성: 값} 목록
+
+        Returns:
+            64자리 hex 문자열
+        """
+        canonical = sorted(json.dumps(row, sort_keys=True, default=str) for row in rows)
+        return hashlib.sha256('\n'.join(canonical).encode('utf-8')).hexdigest()
+
     def _sync_attachments(
         self,
         contract_id: int,
@@ -454,7 +381,8 @@ class SyncRelationService:
         """첨부파일 동기화 (Phase 33)
 
         DataSharingSettings에 따라 개인 프로필 첨부파일을 직원으로 동기화합니다.
-        파일은 복제되고 source 추적 정보가 설정됩니다.
+        파일은 blob 저장소 하드 링크로 공유되고 source 추적 정보가 설정됩니다.
+        이미 같은 파일로 동기화된 첨부파일은 유지하고, 공유가 끝난 첨부파일만 삭제합니다.
 
         Args:
             contract_id: 계약 ID
@@ -465,14 +393,12 @@ class SyncRelationService:
         Returns:
             동기화 결과
         """
-        from flask import current_app
         from app.domains.attachment.models import Attachment, SourceType
         from app.domains.attachment.constants import AttachmentCategory, OwnerType
-        from app.domains.attachment.services import attachment_service
         from app.domains.contract.services import contract_service
 
         # DataSharingSettings 조회
-        data_sharing = contract_service.get_data_sharing_settings(contract_id)
+        data_sharing = contract_service.get_sharing_settings_model(contract_id)
         if not data_sharing:
             return {'synced': False}
 
@@ -487,27 +413,28 @@ class SyncRelationService:
             return {'synced': False}
 
         # 프로필 첨부파일 조회
-        profile_attachments = self.attachment_repo.get_by_owner(
-            OwnerType.PROFILE, profile.id
-        )
-
+        profile_attachments = [
+            pa for pa in self.attachment_repo.get_by_owner(OwnerType.PROFILE, profile.id)
+            if pa.category in sync_categories
+        ]
         if not profile_attachments:
             return {'synced': False}
 
-        synced_count = 0
-        log_ids = []
+        # 이 계약에서 이미 동기화된 첨부파일
+        existing = self._find_synced_attachments(employee.id, contract_id, sync_categories)
 
+        created_count = 0
         for pa in profile_attachments:
-            # 카테고리 필터링
-            if pa.category not in sync_categories:
+            kept = next((
+                att for att in existing
+                if att.category == pa.category and att.file_name == pa.file_name
+                and self._same_file(att.file_path, pa.file_path)
+            ), None)
+            if kept is not None:
+                existing.remove(kept)
                 continue
 
-            # 기존 동기화된 파일 삭제 (같은 계약에서 동기화된 것만)
-            self._delete_synced_attachments_by_category(
-                employee.id, pa.category, contract_id
-            )
-
-            # 파일 복제 (실제 파일 복사)
+            # 파일 공유 (blob 하드 링크)
             new_file_path = self._copy_attachment_file(
                 pa.file_path,
                 OwnerType.EMPLOYEE,
@@ -537,62 +464,92 @@ class SyncRelationService:
                 is_deletable_on_termination=True,
             )
             self.attachment_repo.create_model(new_attachment, commit=False)
-            synced_count += 1
-
-        if synced_count > 0:
-            log = self.sync_log_repo.create_log(
-                contract_id=contract_id,
-                sync_type=sync_type,
-                entity_type='attachment',
-                field_name=None,
-                old_value=None,
-                new_value=json.dumps({'count': synced_count, 'categories': sync_categories}),
-                direction='personal_to_employee',
-                user_id=self._current_user_id,
-                commit=False
-            )
-            log_ids.append(log.id)
+            created_count += 1
+
+        # 개인 측에서 삭제/교체된 첨부파일 정리
+        for att in existing:
+            self._delete_synced_attachment(att)
+        deleted_count = len(existing)
+
+        if not created_count and not deleted_count:
+            return {'synced': False}
+
+        change = {'entity': 'attachment', 'count': created_count, 'deleted': deleted_count}
+        log = self.sync_log_repo.create_log(
+            contract_id=contract_id,
+            sync_type=sync_type,
+            entity_type='attachment',
+            field_name=None,
+            old_value=None,
+            new_value=json.dumps({
+                'count': created_count, 'deleted': deleted_count, 'categories': sync_categories
+            }),
+            direction='personal_to_employee',
+            user_id=self._current_user_id,
+            commit=False
+        )
 
         return {
-            'synced': synced_count > 0,
-            'changes': [{'entity': 'attachment', 'count': synced_count}] if synced_count > 0 else [],
-            'log_ids': log_ids
+            'synced': True,
+            'changes': [change],
+            'log_ids': [log.id]
         }
 
-    def _delete_synced_attachments_by_category(
+    def _find_synced_attachments(
         self,
         employee_id: int,
-        category: str,
-        contract_id: int
-    ) -> int:
-        """특정 계약에서 동기화된 특정 카테고리 첨부파일 삭제
+        contract_id: int,
+        categories: List[str]
+    ) -> List[Any]:
+        """특정 계약에서 동기화된 첨부파일 조회
 
         Args:
             employee_id: 직원 ID
-            category: 카테고리
             contract_id: 계약 ID
+            categories: 카테고리 목록
 
         Returns:
-            삭제된 개수
+            Attachment 목록
         """
         from app.domains.attachment.models import Attachment, SourceType
         from app.domains.attachment.constants import OwnerType
 
-        attachments = Attachment.query.filter(
+        return Attachment.query.filter(
             Attachment.owner_type == OwnerType.EMPLOYEE,
             Attachment.owner_id == employee_id,
-            Attachment.category == category,
+            Attachment.category.in_(categories),
             Attachment.source_type == SourceType.SYNCED,
             Attachment.source_contract_id == contract_id
-        ).all()
+        ).order_by(Attachment.id).all()
+
+    def _delete_synced_attachment(self, attachment) -> None:
+        """동기화된 첨부파일 삭제 (레코드와 링크 파일, blob은 다른 참조가 없을 때 prune으로 정리)"""
+        file_path = self._static_file_path(attachment.file_path)
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+        self.attachment_repo.delete(attachment.id, commit=False)
+
+    @staticmethod
+    def _static_file_path(web_path: str) -> str:
+        """웹 경로 → 파일 시스템 경로 (/static/uploads/... → {static_folder}/uploads/...)"""
+        from flask import current_app
+
+        if not web_path or not web_path.startswith('/static/'):
+            return None
+        return os.path.join(current_app.static_folder, web_path[8:])
 
-        count = 0
-        for att in attachments:
-            # 파일 삭제는 선택사항 (파일 시스템 정리는 별도 처리)
-            self.attachment_repo.delete(att.id, commit=False)
-            count += 1
+    def _same_file(self, web_path_a: str, web_path_b: str) -> bool:
+        """두 웹 경로가 같은 내용의 파일인지 (같은 blob 링크 또는 같은 SHA-256)"""
+        from app.shared.services.blob_store import blob_store
 
-        return count
+        path_a = self._static_file_path(web_path_a)
+        path_b = self._static_file_path(web_path_b)
+        if not path_a or not path_b or not os.path.exists(path_a) or not os.path.exists(path_b):
+            return False
+        if os.path.samefile(path_a, path_b):
+            return True
+        return (os.path.getsize(path_a) == os.path.getsize(path_b)
+                and blob_store.hash_file(path_a) == blob_store.hash_file(path_b))
 
     def _copy_attachment_file(
         self,
@@ -601,7 +558,7 @@ class SyncRelationService:
         target_owner_id: int,
         category: str
     ) -> str:
-        """첨부파일 복제
+        """첨부파일 공유 (blob 저장소 하드 링크, 링크 불가 시 복사)
 
         Args:
             source_path: 원본 파일 경로 (웹 경로)
@@ -613,29 +570,19 @@ class SyncRelationService:
             새 파일 웹 경로 (실패 시 None)
         """
         from flask import current_app
+        from app.shared.services.blob_store import blob_store
         import uuid
 
-        if not source_path:
-            return None
-
-        # 웹 경로 → 파일 시스템 경로 변환
-        # /static/uploads/... → {static_folder}/uploads/...
-        if source_path.startswith('/static/'):
-            relative_path = source_path[8:]  # '/static/' 제거
-            source_file_path = os.path.join(current_app.static_folder, relative_path)
-        else:
-            return None
-
-        if not os.path.exists(source_file_path):
+        source_file_path = self._static_file_path(source_path)
+        if not source_file_path or not os.path.exists(source_file_path):
             return None
 
-        # 대상 폴더 생성
+        # 대상 폴더
         target_folder = os.path.join(
             current_app.static_folder,
             'uploads',
             'attachments'
         )
-        os.makedirs(target_folder, exist_ok=True)
 
         # 새 파일명 생성
         _, ext = os.path.splitext(source_path)
@@ -645,7 +592,7 @@ class SyncRelationService:
         target_file_path = os.path.join(target_folder, new_filename)
 
         try:
-            shutil.copy2(source_file_path, target_file_path)
+            blob_store.link_file(source_file_path, target_file_path)
             return f"/static/uploads/attachments/{new_filename}"
         except Exception:
             return None
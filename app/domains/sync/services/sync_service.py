@@ -8,7 +8,7 @@ Phase 4: 데이터 동기화 및 퇴사 처리
 Phase 5: 구조화 - sync/ 폴더로 이동
 Phase 30: 레이어 분리 - Model.query 제거, Repository 패턴 적용
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 import json
 
@@ -23,7 +23,7 @@ from .sync_relation_service import SyncRelationService
 
 # 필드 매핑 SSOT (Phase 4: 중앙화)
 from app.shared.constants.sync_fields import SYNC_MAPPINGS
-from app.shared.constants.status import ContractStatus
+from app.shared.constants.status import ContractStatus, EmployeeStatus
 
 
 class SyncService:
@@ -76,7 +76,7 @@ class SyncService:
     def profile_repo(self):
         """지연 초기화된 프로필 Repository"""
         if self._profile_repo is None:
-            from app.domains.employee.repositories import profile_repository
+            from app.domains.employee.repositories.profile_repository import profile_repository
             self._profile_repo = profile_repository
         return self._profile_repo
 
@@ -92,7 +92,7 @@ class SyncService:
     def employee_repo(self):
         """지연 초기화된 직원 Repository"""
         if self._employee_repo is None:
-            from app.domains.employee.repositories import employee_repository
+            from app.domains.employee.repositories.employee_repository import employee_repository
             self._employee_repo = employee_repository
         return self._employee_repo
 
@@ -185,7 +185,8 @@ class SyncService:
         contract_id: int,
         fields: Optional[List[str]] = None,
         sync_type: str = SyncLog.SYNC_TYPE_AUTO,
-        commit: bool = True
+        commit: bool = True,
+        sections: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         개인 프로필 -> 법인 직원 데이터 동기화
@@ -197,6 +198,8 @@ class SyncService:
             fields: 동기화할 필드 목록 (None이면 설정에 따라 자동)
             sync_type: 동기화 유형 (auto, manual, initial)
             commit: True면 commit 실행, False면 외부 트랜잭션에 위임 (Phase 30)
+            sections: 변경 섹션만 동기화 ('basic' 또는 get_syncable_fields 관계 키, None이면 전체)
+                계약의 재직 중인 직원이 없으면 전체 동기화
 
         Returns:
             동기화 결과
@@ -217,11 +220,20 @@ class SyncService:
         # 관계 데이터용 Profile 조회 (educations, careers 등)
         profile = self.profile_repo.get_by_user_id(contract.person_user_id)
 
-        employee = self._find_or_create_employee(contract, personal_profile)
+        employee = None
+        if sections is not None:
+            # 변경분은 이미 동기화된 직원에만 적용 (새 직원은 전체 동기화)
+            employee = self._find_contract_employee(contract)
+            if not employee:
+                sections = None
+        if not employee:
+            employee = self._find_or_create_employee(contract, personal_profile)
         if not employee:
             return {'success': False, 'error': '직원 데이터를 생성/조회할 수 없습니다.'}
 
         syncable = self.get_syncable_fields(contract_id)
+        if sections is not None:
+            syncable = self._limit_syncable(syncable, set(sections))
         target_fields = fields if fields else syncable['basic'] + syncable['contact']
 
         # 기본 필드 동기화 (PersonalProfile에서)
@@ -304,6 +316,30 @@ class SyncService:
             'logs': result['log_ids'],
         }
 
+    def enable_full_sharing(self, contract_id: int, commit: bool = True):
+        """계약의 DataSharingSettings를 전체 공유로 설정 (전체 동기화 전처리)
+
+        Args:
+            contract_id: 계약 ID
+            commit: True면 commit 실행, False면 외부 트랜잭션에 위임
+
+        Returns:
+            DataSharingSettings
+        """
+        from app.domains.contract.services.contract_service import contract_service
+
+        return contract_service.update_or_create_sharing_settings(
+            contract_id,
+            commit=commit,
+            share_basic_info=True,
+            share_contact=True,
+            share_education=True,
+            share_career=True,
+            share_certificates=True,
+            share_languages=True,
+            share_military=True
+        )
+
     # ===== 실시간 동기화 지원 =====
 
     def should_auto_sync(self, contract_id: int) -> bool:
@@ -361,6 +397,38 @@ class SyncService:
         """프로필 필드에 대응하는 Employee 필드명 반환"""
         return SYNC_MAPPINGS.map_field(profile_field)
 
+    @staticmethod
+    def _limit_syncable(syncable: Dict[str, Any], sections: set) -> Dict[str, Any]:
+        """동기화 가능 설정을 변경 섹션으로 제한
+
+        Args:
+            syncable: get_syncable_fields 결과
+            sections: 변경 섹션 ('basic'은 기본/연락처 필드)
+
+        Returns:
+            제한된 설정 (첨부파일은 'attachments' 섹션이 있을 때만)
+        """
+        limited = {
+            key: (value if key in sections else False)
+            for key, value in syncable.items() if key not in ('basic', 'contact')
+        }
+        include_basic = 'basic' in sections
+        limited['basic'] = syncable['basic'] if include_basic else []
+        limited['contact'] = syncable['contact'] if include_basic else []
+        limited['attachments'] = 'attachments' in sections
+        return limited
+
+    def _find_contract_employee(self, contract: PersonCorporateContract) -> Optional[Employee]:
+        """계약 사번의 재직 중인 직원 조회 (없으면 None)"""
+        if not contract.employee_number:
+            return None
+        employee = self.employee_repo.find_by_employee_number_and_company(
+            contract.employee_number, contract.company_id
+        )
+        if employee and EmployeeStatus.is_working(employee.status):
+            return employee
+        return None
+
     def _find_or_create_employee(
         self,
         contract: PersonCorporateContract,
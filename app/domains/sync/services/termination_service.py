@@ -273,6 +273,10 @@ class TerminationService:
         # 데이터 공유 설정 삭제
         self.data_sharing_settings_repo.delete_by_contract_id(contract_id, commit=False)
 
+        # 관계 데이터 동기화 지문 삭제
+        from app.domains.sync.repositories.sync_fingerprint_repository import sync_fingerprint_repository
+        sync_fingerprint_repository.delete_by_contract_id(contract_id)
+
         # 아카이브 로그
         self.sync_log_repo.create_log(
             contract_id=contract_id,
@@ -10,7 +10,7 @@ from flask import Blueprint, render_template, session, redirect, url_for, flash
 from app.shared.constants.session_keys import SessionKeys, AccountType
 from app.shared.constants.status import ContractStatus, EmployeeStatus
 from app.shared.utils.decorators import login_required
-from app.domains.employee.services import employee_service
+from app.domains.employee.services import employee_relation_loader, employee_service
 from app.domains.platform.services.system_setting_service import system_setting_service
 from app.domains.contract.services import contract_service
 from app.domains.attachment.constants import AttachmentCategory
@@ -66,12 +66,15 @@ def company_info():
     # Fetch company info from SystemSetting
     company_data = system_setting_service.get_company_data()
 
-    # Phase 24: Optimized with unified method (21 calls -> 1 call + business card)
+    # Relation data for all 21 tables in a single query
     full_view_data = employee_service.get_employee_full_view_data(employee_id)
 
-    # Business card data (not included in unified method)
-    business_card_front = employee_service.get_attachment_by_category(employee_id, AttachmentCategory.BUSINESS_CARD_FRONT)
-    business_card_back = employee_service.get_attachment_by_category(employee_id, AttachmentCategory.BUSINESS_CARD_BACK)
+    # Business card data (picked from the loaded attachment list)
+    attachment_list = full_view_data['attachment_list']
+    business_card_front = employee_relation_loader.latest_attachment(
+        attachment_list, AttachmentCategory.BUSINESS_CARD_FRONT)
+    business_card_back = employee_relation_loader.latest_attachment(
+        attachment_list, AttachmentCategory.BUSINESS_CARD_BACK)
 
     return render_template('domains/user/mypage/company_info.html',
                            employee=employee,
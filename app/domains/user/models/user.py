@@ -6,6 +6,7 @@ User SQLAlchemy 모델
 Phase 2 Migration: 도메인으로 이동
 """
 from datetime import datetime
+from sqlalchemy import event, select
 from werkzeug.security import generate_password_hash, check_password_hash
 from app.database import db
 
@@ -200,3 +201,25 @@ class User(db.Model):
 
     def __repr__(self):
         return f'<User {self.username} ({self.role}/{self.account_type})>'
+
+
+# ===== SQLAlchemy Event Listeners =====
+
+# 직원 목록(계약 직원의 아이디/이메일/계정 유형 열)에 표시되는 계정 필드
+LIST_DISPLAY_FIELDS = ('username', 'email', 'account_type')
+
+
+@event.listens_for(User, 'after_update')
+def on_user_update(mapper, connection, target):
+    """계정 표시 필드 수정 시 계약 법인의 테넌트 기록 (로그인 시각 등 다른 필드 변경은 무시)"""
+    state = db.inspect(target)
+    if not any(state.attrs[key].history.has_changes() for key in LIST_DISPLAY_FIELDS):
+        return
+    from app.domains.company.models import TenantDataVersion
+    from app.domains.contract.models import PersonCorporateContract
+    company_ids = connection.execute(
+        select(PersonCorporateContract.company_id)
+        .where(PersonCorporateContract.person_user_id == target.id)
+        .distinct()
+    ).scalars().all()
+    TenantDataVersion.mark(target, TenantDataVersion.COMPANIES, *company_ids)
@@ -8,7 +8,9 @@ Phase 6: ServiceResult 패턴 표준화 추가
 Phase 2 Task 2.2: GenericRelationCRUD 추가 (관계형 데이터 CRUD 공통화)
 """
 from .history_service import BaseHistoryService
-from .relation_updater import RelationDataUpdater, RelationDataConfig, relation_updater
+from .relation_updater import (
+    RelationDataUpdater, RelationDataConfig, RelationChangeSummary, relation_updater
+)
 from .relation_configs import get_relation_config, SUPPORTED_RELATION_TYPES
 from .service_result import ServiceResult
 from .generic_relation_crud import GenericRelationCRUD, RelationConfig as GenericRelationConfig
@@ -17,6 +19,7 @@ __all__ = [
     'BaseHistoryService',
     'RelationDataUpdater',
     'RelationDataConfig',
+    'RelationChangeSummary',
     'relation_updater',
     'get_relation_config',
     'SUPPORTED_RELATION_TYPES',
@@ -216,6 +216,14 @@ class GenericRelationCRUD:
 
         filter_kwargs = self._get_filter_kwargs(owner_id, owner_type)
         count = self.model.query.filter_by(**filter_kwargs).delete()
+        if count and filter_kwargs.get('employee_id'):
+            # 일괄 DELETE는 모델 이벤트가 없으므로 직접 기록 (인사카드 섹션 조각)
+            from app.domains.company.models import TenantDataVersion
+            from app.domains.company.models.tenant_data_version import apply_pending_changes
+            session = db.session()
+            TenantDataVersion.mark_session(session, TenantDataVersion.RELATIONS,
+                                           filter_kwargs['employee_id'])
+            apply_pending_changes(session)
 
         if commit:
             db.session.commit()
@@ -48,6 +48,7 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
                 'degree': 'degree',
                 'graduation_status': 'graduation_status',
             },
+            natural_key=['school_name', 'major'],
             field_order=_get_field_order('education'),
         ),
 
@@ -64,6 +65,7 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
                 'position': 'position',
                 'duties': 'job_description',
             },
+            natural_key=['company_name', 'start_date'],
             field_order=_get_field_order('career'),
         ),
 
@@ -79,6 +81,7 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
                 'number': 'certificate_number',
                 'date': 'acquisition_date',
             },
+            natural_key=['certificate_name', 'certificate_number'],
             field_order=_get_field_order('certificate'),
         ),
 
@@ -88,12 +91,13 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
             form_prefix='language_',
             required_field='name',
             field_mapping={
-                'name': 'language',
+                'name': 'language_name',
                 'level': 'level',
-                'test_name': 'test_name',
+                'test_name': 'exam_name',
                 'score': 'score',
-                'test_date': 'test_date',
+                'test_date': 'acquisition_date',
             },
+            natural_key=['language_name', 'exam_name'],
             field_order=_get_field_order('language'),
         ),
 
@@ -111,6 +115,7 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
                 'cohabiting': 'is_cohabitant',
             },
             converters={'is_cohabitant': bool},
+            natural_key=['relation', 'name'],
             field_order=_get_field_order('family'),
         ),
 
@@ -122,9 +127,10 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
             field_mapping={
                 'date': 'award_date',
                 'name': 'award_name',
-                'issuer': 'issuer',
+                'issuer': 'institution',
                 'note': 'note',
             },
+            natural_key=['award_name', 'award_date'],
             field_order=_get_field_order('award'),
         ),
 
@@ -137,10 +143,11 @@ def get_relation_config(relation_type: str, repositories: Dict[str, Any]) -> Rel
                 'name': 'project_name',
                 'start_date': 'start_date',
                 'end_date': 'end_date',
-                'duties': 'role',
+                'duties': 'duty',
                 'role': 'role',
                 'client': 'client',
             },
+            natural_key=['project_name', 'start_date'],
             field_order=_get_field_order('project_participation'),
         ),
     }
@@ -5,9 +5,19 @@ RelationDataUpdater
 Phase 4.2: SOLID 원칙 적용 - SRP, DRY 개선
 
 기존 EmployeeService의 8개 _update_*_data 메서드를 설정 기반으로 통합합니다.
+
+- update(): 전체 교체 (기존 행 삭제 후 재생성)
+- update_diff(): 변경분 반영 (id 또는 자연 키로 기존 행과 매칭, 필요한 INSERT/UPDATE/DELETE만 1회 flush)
+- apply_rows(): update_diff의 매칭/반영 로직 (폼 이외 입력용)
+  입력 값은 컬럼 타입으로 변환 후 비교 ('2' vs 2, 'true' vs True가 변경으로 잡히지 않도록)
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Callable, Type
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Any, Optional, Callable, Tuple, Type
+
+from sqlalchemy import select
+
 from app.database import db
 from app.shared.utils.transaction import atomic_transaction
 
@@ -27,6 +37,34 @@ class RelationDataConfig:
     converters: Dict[str, Callable] = field(default_factory=dict)
     owner_field: str = 'employee_id'  # 'employee_id' or 'profile_id'
     field_order: List[str] = field(default_factory=list)  # FieldRegistry 순서
+    # update_diff() 매칭용 자연 키 (모델 속성명, 기본: 필수 필드)
+    natural_key: List[str] = field(default_factory=list)
+    id_field: str = 'id'  # 기존 행 ID 폼 필드 ({form_prefix}id[], 없으면 자연 키로 매칭)
+
+    def get_natural_key(self) -> List[str]:
+        """자연 키 속성 목록"""
+        return self.natural_key or [self.field_mapping[self.required_field]]
+
+
+@dataclass
+class RelationChangeSummary:
+    """update_diff() 변경 요약 (감사 로그용)"""
+    created: List[int] = field(default_factory=list)
+    updated: List[int] = field(default_factory=list)
+    deleted: List[int] = field(default_factory=list)
+    unchanged: List[int] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'created': list(self.created),
+            'updated': list(self.updated),
+            'deleted': list(self.deleted),
+            'unchanged': len(self.unchanged),
+        }
 
 
 class RelationDataUpdater:
@@ -49,7 +87,7 @@ class RelationDataUpdater:
         )
 
         updater = RelationDataUpdater()
-        updater.update(employee_id, form_data, config)
+        summary = updater.update_diff(employee_id, form_data, config)
     """
 
     def update(self, owner_id: int, form_data: Dict, config: RelationDataConfig) -> int:
@@ -70,38 +108,178 @@ class RelationDataUpdater:
         else:
             config.repository.delete_all_by_profile(owner_id)
 
-        # 폼 데이터 추출
-        form_lists = {}
-        for field_suffix in config.field_mapping.keys():
-            form_key = f"{config.form_prefix}{field_suffix}[]"
-            if hasattr(form_data, 'getlist'):
-                form_lists[field_suffix] = form_data.getlist(form_key)
+        created_count = 0
+        for _, row_data in self._extract_rows(form_data, config):
+            model_data = {config.owner_field: owner_id, **row_data}
+            instance = config.model_class(**model_data)
+            config.repository.create(instance)
+            created_count += 1
+
+        return created_count
+
+    def update_diff(self, owner_id: int, form_data: Dict,
+                    config: RelationDataConfig) -> RelationChangeSummary:
+        """
+        관계형 데이터 업데이트 (변경분 반영 방식)
+
+        제출된 행을 기존 행과 매칭하여 바뀐 행만 수정합니다.
+        - 매칭: {form_prefix}id[] 값이 기존 행 ID이면 해당 행, 아니면 자연 키(natural_key)가 같은 행
+        - 매칭된 행: 값이 다른 필드만 UPDATE (같으면 변경 없음)
+        - 매칭되지 않은 제출 행은 INSERT, 매칭되지 않은 기존 행은 DELETE
+        기존 행 ID가 유지되므로 linked_entity 첨부파일 연결이 끊기지 않습니다.
+        변경은 세션 flush 1회로 실행되며(테이블별 일괄 문장), 커밋은 호출자가 합니다.
+
+        Args:
+            owner_id: 직원 ID 또는 프로필 ID
+            form_data: 폼 데이터 (Flask request.form)
+            config: 업데이트 설정
+
+        Returns:
+            RelationChangeSummary: 생성/수정/삭제 행 ID
+        """
+        return self.apply_rows(owner_id, self._extract_rows(form_data, config), config)
+
+    def apply_rows(self, owner_id: int, rows: Iterable[Tuple[Optional[int], Dict[str, Any]]],
+                   config: RelationDataConfig) -> RelationChangeSummary:
+        """
+        행 목록을 기존 행과 매칭하여 변경분만 반영 (update_diff 공통 로직)
+
+        폼 이외의 입력(개인 -> 법인 동기화 등)에서도 사용합니다.
+
+        Args:
+            owner_id: 직원 ID 또는 프로필 ID
+            rows: (기존 행 ID 또는 None, {모델 속성: 값}) 목록
+            config: 업데이트 설정 (model_class, owner_field, natural_key 사용)
+
+        Returns:
+            RelationChangeSummary: 생성/수정/삭제 행 ID
+        """
+        model = config.model_class
+        rows = [(row_id, self._coerce_row(model, row_data)) for row_id, row_data in rows]
+        existing = db.session.execute(
+            select(model)
+            .where(getattr(model, config.owner_field) == owner_id)
+            .order_by(model.id)
+        ).scalars().all()
+        remaining = {instance.id: instance for instance in existing}
+
+        natural_key = config.get_natural_key()
+        summary = RelationChangeSummary()
+        unmatched_rows = []
+        pairs = []
+
+        # 1) 기존 행 ID로 매칭
+        for row_id, row_data in rows:
+            instance = remaining.pop(row_id, None) if row_id is not None else None
+            if instance is None:
+                unmatched_rows.append(row_data)
             else:
-                # Dict인 경우 (테스트용)
-                form_lists[field_suffix] = form_data.get(form_key, [])
+                pairs.append((instance, row_data))
 
-        # 필수 필드 리스트를 기준으로 반복
-        required_values = form_lists.get(config.required_field, [])
-        created_count = 0
+        # 2) 자연 키로 매칭 (같은 키가 여러 행이면 ID 순서대로)
+        by_key: Dict[Tuple, List[Any]] = {}
+        for instance in remaining.values():
+            key = tuple(getattr(instance, attr) for attr in natural_key)
+            by_key.setdefault(key, []).append(instance)
+        new_instances = []
+        for row_data in unmatched_rows:
+            candidates = by_key.get(tuple(row_data.get(attr) for attr in natural_key))
+            if candidates:
+                instance = candidates.pop(0)
+                del remaining[instance.id]
+                pairs.append((instance, row_data))
+            else:
+                new_instances.append(model(**{config.owner_field: owner_id, **row_data}))
 
-        for i in range(len(required_values)):
-            if required_values[i]:
-                model_data = {config.owner_field: owner_id}
+        for instance, row_data in pairs:
+            changed = False
+            for attr, value in row_data.items():
+                if getattr(instance, attr) != value:
+                    setattr(instance, attr, value)
+                    changed = True
+            (summary.updated if changed else summary.unchanged).append(instance.id)
 
-                for field_suffix, model_attr in config.field_mapping.items():
-                    values = form_lists.get(field_suffix, [])
-                    value = values[i] if i < len(values) else None
+        for instance in remaining.values():
+            summary.deleted.append(instance.id)
+            db.session.delete(instance)
+        db.session.add_all(new_instances)
 
-                    if model_attr in config.converters and value is not None:
-                        value = config.converters[model_attr](value)
+        if summary.updated or summary.deleted or new_instances:
+            db.session.flush()
+        summary.created = [instance.id for instance in new_instances]
+        return summary
 
-                    model_data[model_attr] = value
+    # 폼 문자열 → bool 변환 시 참으로 보는 값
+    TRUE_STRINGS = frozenset({'1', 'true', 'on', 'y', 'yes'})
 
-                instance = config.model_class(**model_data)
-                config.repository.create(instance)
-                created_count += 1
+    def _coerce_row(self, model: Type, row_data: Dict[str, Any]) -> Dict[str, Any]:
+        """행 값을 모델 컬럼의 Python 타입으로 변환 (문자열 컬럼/변환 불가 값은 그대로)"""
+        column_attrs = model.__mapper__.column_attrs
+        coerced = {}
+        for attr, value in row_data.items():
+            if isinstance(value, str) and attr in column_attrs:
+                value = self._coerce_value(column_attrs[attr].columns[0].type, value)
+            coerced[attr] = value
+        return coerced
 
-        return created_count
+    def _coerce_value(self, column_type, value: str) -> Any:
+        """폼 문자열 → 컬럼 타입 값 (빈 문자열은 None)"""
+        try:
+            python_type = column_type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is str:
+            return value
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            if python_type is bool:
+                return value.lower() in self.TRUE_STRINGS
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+            if python_type in (int, float, Decimal):
+                return python_type(value)
+        except (ValueError, InvalidOperation):
+            pass
+        return value
+
+    def _extract_rows(self, form_data: Dict,
+                      config: RelationDataConfig) -> List[Tuple[Optional[int], Dict]]:
+        """폼 데이터 → (기존 행 ID 또는 None, 모델 속성 Dict) 목록 (필수 필드가 빈 행 제외)"""
+        def getlist(form_key: str) -> List:
+            if hasattr(form_data, 'getlist'):
+                return form_data.getlist(form_key)
+            # Dict인 경우 (테스트용)
+            return form_data.get(form_key, [])
+
+        form_lists = {
+            field_suffix: getlist(f"{config.form_prefix}{field_suffix}[]")
+            for field_suffix in config.field_mapping.keys()
+        }
+        row_ids = getlist(f"{config.form_prefix}{config.id_field}[]")
+
+        # 필수 필드 리스트를 기준으로 반복
+        rows = []
+        for i, required_value in enumerate(form_lists.get(config.required_field, [])):
+            if not required_value:
+                continue
+
+            model_data = {}
+            for field_suffix, model_attr in config.field_mapping.items():
+                values = form_lists.get(field_suffix, [])
+                value = values[i] if i < len(values) else None
+
+                if model_attr in config.converters and value is not None:
+                    value = config.converters[model_attr](value)
+
+                model_data[model_attr] = value
+
+            row_id = row_ids[i] if i < len(row_ids) else None
+            rows.append((int(row_id) if str(row_id or '').isdigit() else None, model_data))
+        return rows
 
     def update_with_commit(self, owner_id: int, form_data: Dict,
                            config: RelationDataConfig) -> tuple[bool, Optional[str]]:
@@ -120,7 +298,7 @@ class RelationDataUpdater:
         """
         try:
             with atomic_transaction():
-                self.update(owner_id, form_data, config)
+                self.update_diff(owner_id, form_data, config)
             return True, None
         except Exception as e:
             return False, str(e)
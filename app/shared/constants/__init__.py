@@ -13,7 +13,7 @@ from .field_registry import (
     Visibility,
 )
 from .field_options import FieldOptions
-from .system_config import FileConfig, PaginationConfig, SessionConfig
+from .system_config import FileConfig, PaginationConfig, SessionConfig, TenantScopeConfig
 from .status import ContractStatus, EmployeeStatus, AccountStatus
 from .sync_fields import (
     SyncFieldMapping,
@@ -44,6 +44,7 @@ __all__ = [
     'FileConfig',
     'PaginationConfig',
     'SessionConfig',
+    'TenantScopeConfig',
     # Status Constants (SSOT)
     'ContractStatus',
     'EmployeeStatus',
@@ -24,6 +24,14 @@ class PaginationConfig:
     MAX_PAGE_SIZE = 100
 
 
+class TenantScopeConfig:
+    """멀티테넌시 직원 스코프 모드 (Config.TENANT_SCOPE_MODE)"""
+    MODE_ORG_TREE = 'org_tree'      # 조직 트리 확장 (organization_id IN 하위 조직)
+    MODE_COMPANY_ID = 'company_id'  # 인덱스된 employees.company_id 직접 필터
+
+    VALID_MODES = [MODE_ORG_TREE, MODE_COMPANY_ID]
+
+
 class SessionConfig:
     """세션 설정"""
     SESSION_LIFETIME_DAYS = 7
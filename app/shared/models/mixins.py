@@ -8,9 +8,90 @@ DictSerializableMixin: to_dict/from_dict 자동화
 
 Phase 29 (2026-01-05): camelCase 폴백 제거 - snake_case 직접 사용
 Phase 31 (2026-01-10): shared/models로 이동 - 모든 도메인에서 사용
+
+to_dict 직렬화기는 모델 클래스별로 매퍼 구성 시 1회 컴파일합니다. (_DictSerializer)
+- 컬럼별 변환(ISO 포맷/JSON 파싱/없음)을 컬럼 타입과 __dict_json_fields__로 미리 결정
+- 호출 시에는 (키, 직접 조회 여부, 변환) 튜플만 순회
 """
+import json
 from collections import OrderedDict
-from typing import Dict, List, Any, Optional, Callable, Type, Union
+from typing import Dict, List, Any, Optional, Callable, Tuple, Type, Union
+
+from sqlalchemy import event, types as sqltypes
+
+# 값에 isoformat이 없는 컬럼 타입 (변환 생략)
+# String은 제외: 날짜 문자열 컬럼(hire_date 등)에 flush 전 date 객체가 할당될 수 있음
+_PLAIN_TYPES = (sqltypes.Integer, sqltypes.Boolean, sqltypes.Numeric)
+
+
+def _isoformat(value):
+    """datetime/date 자동 ISO 포맷 변환"""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _json_field(value):
+    """JSON 필드 파싱 (datetime 변환 포함, 실패 시 원래 값)"""
+    value = _isoformat(value)
+    if value:
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return value
+
+
+class _DictSerializer:
+    """모델 클래스별 컴파일된 to_dict 직렬화기"""
+
+    __slots__ = ('columns', 'aliases', 'computed', 'field_domain')
+
+    def __init__(self, cls: Type):
+        json_fields = set(cls.__dict_json_fields__)
+        excludes = set(cls.__dict_excludes__)
+
+        # 컬럼명과 같은 키로 매핑된 컬럼 (로드된 값은 instance.__dict__에서 직접 조회)
+        mapped_keys = {prop.key for prop in cls.__mapper__.column_attrs}
+
+        # (결과 키, 직접 조회 여부, 변환 함수 또는 None) - 테이블 컬럼 순서
+        columns: List[Tuple[str, bool, Optional[Callable]]] = []
+        for column in cls.__table__.columns:
+            name = column.name
+            if name in excludes:
+                continue
+            if name in json_fields:
+                transform = _json_field
+            elif isinstance(column.type, _PLAIN_TYPES):
+                transform = None
+            else:
+                transform = _isoformat
+            columns.append((name, name in mapped_keys, transform))
+
+        self.columns = tuple(columns)
+        self.aliases = tuple(cls.__dict_aliases__.items())
+        self.computed = tuple(cls.__dict_computed__.items())
+        self.field_domain = cls.__dict_field_domain__
+
+    def serialize(self, instance) -> Dict[str, Any]:
+        """FieldRegistry 정렬 전 직렬화 결과"""
+        result = {}
+        state = instance.__dict__
+        for name, direct, transform in self.columns:
+            # 만료/미로드 속성은 getattr로 로드
+            value = state[name] if direct and name in state else getattr(instance, name)
+            result[name] = value if transform is None else transform(value)
+
+        for alias_name, actual_field in self.aliases:
+            if actual_field in result:
+                result[alias_name] = result[actual_field]
+
+        for computed_name, compute_fn in self.computed:
+            try:
+                result[computed_name] = compute_fn(instance)
+            except Exception:
+                result[computed_name] = None
+        return result
 
 
 class DictSerializableMixin:
@@ -77,55 +158,27 @@ class DictSerializableMixin:
         Returns:
             모델 데이터 딕셔너리 (ordered=True일 경우 OrderedDict)
         """
-        result = {}
-
-        # 1. 기본 컬럼 직렬화
-        for column in self.__table__.columns:
-            field_name = column.name
-
-            # 제외 필드 스킵
-            if field_name in self.__dict_excludes__:
-                continue
-
-            value = getattr(self, field_name)
-
-            # datetime/date 자동 변환
-            if hasattr(value, 'isoformat'):
-                value = value.isoformat()
-
-            # JSON 필드 자동 파싱
-            if field_name in self.__dict_json_fields__ and value:
-                import json
-                try:
-                    value = json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            result[field_name] = value
+        serializer = type(self).__dict__.get('_dict_serializer') or type(self)._compile_dict_serializer()
+        result = serializer.serialize(self)
 
-        # 2. Alias 추가 (기존 필드에 대한 추가 키)
-        for alias_name, actual_field in self.__dict_aliases__.items():
-            if actual_field in result:
-                result[alias_name] = result[actual_field]
-
-        # 3. Computed 필드 추가
-        for computed_name, compute_fn in self.__dict_computed__.items():
-            try:
-                result[computed_name] = compute_fn(self)
-            except Exception:
-                result[computed_name] = None
-
-        # 4. FieldRegistry 기반 필드 순서 적용
-        if ordered and self.__dict_field_domain__:
+        # FieldRegistry 기반 필드 순서 적용
+        if ordered and serializer.field_domain:
             from app.shared.constants.field_registry import FieldRegistry
             result = FieldRegistry.to_ordered_dict(
-                self.__dict_field_domain__,
+                serializer.field_domain,
                 result,
                 account_type
             )
 
         return result
 
+    @classmethod
+    def _compile_dict_serializer(cls) -> _DictSerializer:
+        """클래스 직렬화기 컴파일 및 저장 (매퍼 구성 시 호출, 누락 시 최초 to_dict에서 호출)"""
+        serializer = _DictSerializer(cls)
+        cls._dict_serializer = serializer
+        return serializer
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DictSerializableMixin':
         """
@@ -155,6 +208,12 @@ class DictSerializableMixin:
         return cls(**kwargs)
 
 
+@event.listens_for(DictSerializableMixin, 'mapper_configured', propagate=True)
+def _on_mapper_configured(mapper, cls):
+    """매퍼 구성 완료 시 to_dict 직렬화기 컴파일"""
+    cls._compile_dict_serializer()
+
+
 class TimestampMixin:
     """
     생성/수정 시간 자동 관리 Mixin
@@ -8,14 +8,32 @@ Phase 24: Option A 레이어 분리 - find_by_id(), find_all() 표준화 (Model
 Phase 26: 레거시 메서드 완전 제거 (get_by_id, get_all 등)
 Phase 27: 트랜잭션 안전성 - commit 파라미터 추가 (단일 트랜잭션 지원)
 Phase 9: app/shared/repositories/로 이동 (도메인 마이그레이션)
+
+일괄 쓰기 (bulk_create / bulk_update / bulk_upsert):
+    행 Dict 목록을 배치 단위 문장(INSERT executemany / INSERT ... ON CONFLICT / UPDATE executemany)으로 실행합니다.
+    ORM 객체를 만들지 않으므로 모델 이벤트(after_insert 등)는 실행되지 않으며,
+    테넌트 데이터 버전(bulk_tenant_kind가 설정된 Repository)과 개인 프로필 동기화 대상
+    (SyncEventManager 감지 모델)은 _after_bulk_write에서 직접 기록합니다.
+    모델 이벤트가 파생 상태(조직 클로저, 초성, 인원 집계, 법인 테넌트 버전 등)를 유지하는 모델은
+    bulk_write_supported = False로 일괄 쓰기를 막습니다. (BulkWriteNotSupportedError, ORM 경로 사용)
 """
-from typing import List, Optional, Dict, Any, Type, TypeVar, Generic
+from itertools import groupby
+from typing import List, Optional, Dict, Any, Iterable, Sequence, Type, TypeVar, Generic
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm.util import identity_key
+
 from app.database import db
+from app.shared.utils.sql_dialect import dialect_insert
 
 # 제네릭 타입 변수 정의
 ModelType = TypeVar('ModelType', bound=db.Model)
 
 
+class BulkWriteNotSupportedError(ValueError):
+    """일괄 쓰기를 지원하지 않는 Repository에서 bulk_* 메서드 호출"""
+
+
 class BaseRepository(Generic[ModelType]):
     """
     기본 Repository 클래스 (제네릭 타입 지원)
@@ -147,6 +165,201 @@ class BaseRepository(Generic[ModelType]):
             db.session.commit()
         return True
 
+    # ========================================
+    # 일괄 쓰기
+    # ========================================
+
+    # 배치당 행 수 (INSERT ... VALUES 다중 행 / executemany 단위)
+    BULK_BATCH_SIZE = 500
+    # 일괄 쓰기 후 기록할 TenantDataVersion 변경 종류 속성명 (employee_id 컬럼 기준, None이면 기록 안 함)
+    bulk_tenant_kind: Optional[str] = None
+    # 일괄 쓰기 허용 여부 (모델 이벤트가 파생 상태를 유지하는 모델은 False)
+    bulk_write_supported: bool = True
+
+    def bulk_create(self, rows: Sequence[Dict], commit: bool = True,
+                    batch_size: int = None) -> List[int]:
+        """여러 레코드 일괄 생성 (배치당 INSERT executemany, RETURNING id를 rows 순서로)
+
+        PostgreSQL은 insertmanyvalues로 배치당 INSERT 1회이며,
+        순서 대응을 보장할 수 없는 DB(SQLite)에서는 SQLAlchemy가 행 단위로 실행합니다.
+
+        Args:
+            rows: 모델 속성명(snake_case) 키의 데이터 Dict 목록 (모델에 없는 키 무시)
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+            batch_size: 배치당 행 수 (기본: BULK_BATCH_SIZE)
+
+        Returns:
+            생성된 레코드 ID 목록 (rows 순서)
+        """
+        self._ensure_bulk_write_supported()
+        table = self.model_class.__table__
+        # 다중 행 INSERT의 RETURNING 순서는 보장되지 않으므로 executemany + sort_by_parameter_order
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+        ordered = {}
+        for _, group in self._group_by_keys(rows):
+            for start in range(0, len(group), batch_size):
+                chunk = group[start:start + batch_size]
+                returned = db.session.execute(stmt, [values for _, values in chunk]).scalars().all()
+                ordered.update(zip((index for index, _ in chunk), returned))
+        ids = [ordered[index] for index in sorted(ordered)]
+        self._finish_bulk_write(ids, commit)
+        return ids
+
+    def bulk_update(self, rows: Sequence[Dict], commit: bool = True,
+                    batch_size: int = None) -> int:
+        """여러 레코드 일괄 수정 (ID 기준 UPDATE executemany)
+
+        Args:
+            rows: 'id'와 수정할 모델 속성 키의 Dict 목록 (같은 키 조합끼리 한 문장)
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+            batch_size: 배치당 행 수 (기본: BULK_BATCH_SIZE)
+
+        Returns:
+            수정된 행 수
+        """
+        self._ensure_bulk_write_supported()
+        table = self.model_class.__table__
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+        updated = 0
+        ids = []
+        for keys, group in self._group_by_keys(rows, exclude=('id',)):
+            if not keys:
+                continue
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam('_bulk_id'))
+                .values({key: bindparam(key) for key in keys})
+            )
+            for start in range(0, len(group), batch_size):
+                params = [{'_bulk_id': values['id'], **{key: values[key] for key in keys}}
+                          for _, values in group[start:start + batch_size]]
+                result = db.session.execute(stmt, params)
+                updated += max(result.rowcount, 0)
+                ids.extend(values['_bulk_id'] for values in params)
+        self._finish_bulk_write(ids, commit)
+        return updated
+
+    def bulk_upsert(self, rows: Sequence[Dict], conflict_columns: Sequence[str] = ('id',),
+                    update_columns: Optional[Iterable[str]] = None, commit: bool = True,
+                    batch_size: int = None) -> List[int]:
+        """여러 레코드 일괄 생성/수정 (INSERT ... ON CONFLICT DO UPDATE, RETURNING id)
+
+        PostgreSQL(운영)과 SQLite(테스트)의 ON CONFLICT 구문을 사용합니다.
+        conflict_columns에는 유니크 제약/인덱스가 있어야 하며, 반환 ID는 충돌 키 값으로
+        행과 대응하므로 모든 행에 conflict_columns 값이 있어야 합니다.
+
+        Args:
+            rows: 모델 속성명 키의 데이터 Dict 목록
+            conflict_columns: 충돌 판단 컬럼 (기본: id)
+            update_columns: 충돌 시 갱신할 컬럼 (기본: 행의 키 중 conflict_columns/id 제외,
+                빈 목록이면 DO NOTHING)
+            commit: True면 즉시 커밋, False면 트랜잭션 유지
+            batch_size: 배치당 행 수 (기본: BULK_BATCH_SIZE)
+
+        Returns:
+            생성/수정된 레코드 ID 목록 (rows 순서, DO NOTHING으로 건너뛴 행 제외)
+
+        Raises:
+            ValueError: conflict_columns 값이 없는 행
+        """
+        self._ensure_bulk_write_supported()
+        table = self.model_class.__table__
+        conflict_columns = list(conflict_columns)
+        if any(row.get(column) is None for row in rows for column in conflict_columns):
+            raise ValueError(f'bulk_upsert 행에는 충돌 컬럼 값이 필요합니다: {conflict_columns}')
+        fixed_update_columns = list(update_columns) if update_columns is not None else None
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+
+        ordered = {}
+        for _, group in self._group_by_keys(rows):
+            for start in range(0, len(group), batch_size):
+                chunk = group[start:start + batch_size]
+                batch = [values for _, values in chunk]
+                stmt = dialect_insert(db.session.get_bind(), table).values(batch)
+                columns = fixed_update_columns
+                if columns is None:
+                    columns = [key for key in batch[0] if key not in conflict_columns and key != 'id']
+                if columns:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=conflict_columns,
+                        set_={column: stmt.excluded[column] for column in columns},
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+                # RETURNING 순서는 보장되지 않으므로 충돌 키로 행과 ID를 대응
+                stmt = stmt.returning(table.c.id, *(table.c[column] for column in conflict_columns))
+                returned = {tuple(row[1:]): row[0] for row in db.session.execute(stmt)}
+                for index, values in chunk:
+                    key = tuple(values.get(column) for column in conflict_columns)
+                    if key in returned:
+                        ordered[index] = returned[key]
+
+        ids = [ordered[index] for index in sorted(ordered)]
+        self._finish_bulk_write(ids, commit)
+        return ids
+
+    def _ensure_bulk_write_supported(self) -> None:
+        """일괄 쓰기 불가 모델이면 예외 (모델 이벤트 파생 상태 누락 방지)
+
+        Raises:
+            BulkWriteNotSupportedError: bulk_write_supported = False인 Repository
+        """
+        if not self.bulk_write_supported:
+            raise BulkWriteNotSupportedError(
+                f'{self.model_class.__name__}은(는) 모델 이벤트로 파생 상태를 유지하므로 '
+                f'일괄 쓰기를 지원하지 않습니다.'
+            )
+
+    def _column_values(self, row: Dict) -> Dict:
+        """모델 속성명 키 → 테이블 컬럼 키 (컬럼이 아닌 키 제외)"""
+        attrs = self.model_class.__mapper__.column_attrs
+        return {attrs[key].columns[0].key: value for key, value in row.items() if key in attrs}
+
+    def _group_by_keys(self, rows: Sequence[Dict], exclude: Sequence[str] = ()) -> List[tuple]:
+        """행을 컬럼 키 조합별로 묶음 (다중 VALUES/executemany는 같은 키 조합이어야 함)
+
+        Returns:
+            [(키 튜플, [(원래 위치, 컬럼 값 Dict)])]
+        """
+        indexed = [(index, self._column_values(row)) for index, row in enumerate(rows)]
+        signature = lambda item: tuple(sorted(k for k in item[1] if k not in exclude))
+        return [(keys, list(group))
+                for keys, group in groupby(sorted(indexed, key=signature), key=signature)]
+
+    def _finish_bulk_write(self, record_ids: List[int], commit: bool) -> None:
+        """일괄 쓰기 후처리 (세션 내 객체 만료, 테넌트 버전 기록, 커밋)"""
+        session = db.session()
+        for record_id in record_ids:
+            instance = session.identity_map.get(identity_key(self.model_class, record_id))
+            if instance is not None:
+                session.expire(instance)
+        if record_ids:
+            self._after_bulk_write(record_ids)
+        if commit:
+            db.session.commit()
+
+    def _after_bulk_write(self, record_ids: List[int]) -> None:
+        """일괄 쓰기 후 모델 이벤트 대체 (개인 프로필 동기화 대상, 직원 테넌트 데이터 버전 기록)"""
+        from app.shared.services.event_listeners import SyncEventManager
+
+        SyncEventManager.mark_bulk_write(db.session(), self.model_class, record_ids)
+        if not self.bulk_tenant_kind:
+            return
+        from app.domains.company.models import TenantDataVersion
+        from app.domains.company.models.tenant_data_version import apply_pending_changes
+
+        employee_ids = db.session.execute(
+            select(self.model_class.employee_id)
+            .where(self.model_class.id.in_(record_ids))
+            .distinct()
+        ).scalars().all()
+        session = db.session()
+        TenantDataVersion.mark_session(
+            session, getattr(TenantDataVersion, self.bulk_tenant_kind), *employee_ids
+        )
+        apply_pending_changes(session)
+
     def _update_record_fields(self, record: ModelType, data: Dict) -> None:
         """
         레코드 필드 업데이트 (공통 로직)
@@ -187,6 +400,9 @@ class BaseRelationRepository(BaseRepository[ModelType]):
                 super().__init__(Education)
     """
 
+    # 직원 이력/인사기록 변경 (인사카드 섹션 조각)
+    bulk_tenant_kind = 'RELATIONS'
+
     def find_by_employee_id(self, employee_id: int) -> List[ModelType]:
         """
         특정 직원의 모든 레코드 조회 (신규 표준 메서드)
@@ -210,6 +426,13 @@ class BaseRelationRepository(BaseRepository[ModelType]):
             commit: True면 즉시 커밋, False면 트랜잭션 유지
         """
         count = self.model_class.query.filter_by(employee_id=employee_id).delete()
+        if count:
+            # 일괄 DELETE는 모델 이벤트가 없으므로 직접 기록 (인사카드 섹션 조각)
+            from app.domains.company.models import TenantDataVersion
+            from app.domains.company.models.tenant_data_version import apply_pending_changes
+            session = db.session()
+            TenantDataVersion.mark_session(session, TenantDataVersion.RELATIONS, employee_id)
+            apply_pending_changes(session)
         if commit:
             db.session.commit()
         return count
@@ -399,6 +622,9 @@ class BaseOneToOneRepository(BaseRepository[ModelType]):
                 super().__init__(Salary)
     """
 
+    # 직원 이력/인사기록 변경 (인사카드 섹션 조각)
+    bulk_tenant_kind = 'RELATIONS'
+
     def find_by_employee_id(self, employee_id: int) -> Optional[ModelType]:
         """
         특정 직원의 레코드 조회 (신규 표준 메서드, 1:1 관계)
@@ -3,6 +3,8 @@ Tenant Filter Mixin
 
 멀티테넌시 필터링을 위한 공통 로직을 제공합니다.
 조직 계층 구조를 기반으로 데이터 접근 범위를 제한합니다.
+하위 조직 조회는 organization_closure 테이블을 사용하여 단일 쿼리로 처리합니다.
+조직 ID 집합은 org_scope_cache(테넌트 조직 구조 버전 키)에 캐시됩니다.
 
 SSOT: 멀티테넌시 조직 ID 조회 로직의 단일 진실 공급원
 """
@@ -35,18 +37,17 @@ class TenantFilterMixin:
         if not root_org_id:
             return set()
 
-        from app.domains.company.models import Organization
-        root_org = Organization.query.get(root_org_id)
-        if not root_org:
-            return set()
-
-        # 루트 조직 ID + 모든 하위 조직 ID
-        org_ids = {root_org_id}
-        descendants = root_org.get_descendants()
-        for desc in descendants:
-            org_ids.add(desc.id)
+        from app.shared.utils.org_scope_cache import org_scope_cache
+        return org_scope_cache.get_or_load(
+            'org_ids', root_org_id, lambda: self._load_tenant_org_ids(root_org_id), copy=set
+        )
 
-        return org_ids
+    def _load_tenant_org_ids(self, root_org_id: int) -> frozenset:
+        """organization_closure 단일 조회 (루트 + 활성 하위 조직)"""
+        from app.database import db
+        from app.domains.company.models import OrganizationClosure
+        rows = db.session.execute(OrganizationClosure.subtree_ids_select(root_org_id))
+        return frozenset(rows.scalars())
 
     def get_tenant_org_ids_list(self, root_org_id: int) -> List[int]:
         """루트 조직과 모든 하위 조직의 ID 목록 반환
@@ -73,10 +74,16 @@ class TenantFilterMixin:
         Returns:
             해당 테넌트에 속하면 True, 아니면 False
         """
-        if not root_org_id:
+        if not root_org_id or not org_id:
             return False
-        allowed_ids = self.get_tenant_org_ids(root_org_id)
-        return org_id in allowed_ids
+
+        from app.database import db
+        from app.domains.company.models import OrganizationClosure
+        subtree = OrganizationClosure.subtree_ids_select(root_org_id).subquery()
+        row = db.session.execute(
+            db.select(subtree.c.descendant_id).where(subtree.c.descendant_id == org_id).limit(1)
+        ).first()
+        return row is not None
 
     def apply_tenant_filter(self, query, org_field, root_org_id: int):
         """쿼리에 멀티테넌시 필터 적용
@@ -92,14 +99,13 @@ class TenantFilterMixin:
         Example:
             query = Employee.query
             query = self.apply_tenant_filter(query, Employee.organization_id, root_org_id)
+
+        Note:
+            조직 ID 목록을 미리 조회하지 않고 organization_closure IN 서브쿼리로
+            필터링합니다 (단일 쿼리, 조직이 없으면 빈 결과).
         """
         if not root_org_id:
             return query
 
-        org_ids = self.get_tenant_org_ids(root_org_id)
-        if org_ids:
-            return query.filter(org_field.in_(org_ids))
-        else:
-            # 조직이 없으면 빈 결과 반환
-            from app.database import db
-            return query.filter(db.false())
+        from app.domains.company.models import OrganizationClosure
+        return query.filter(org_field.in_(OrganizationClosure.subtree_ids_select(root_org_id)))
@@ -0,0 +1,253 @@
+"""
+Blob Store
+
+업로드 파일 내용 주소 저장소입니다.
+- 파일 내용 SHA-256으로 blob 경로 결정: {root}/ab/cd/{sha256}
+- 업로드/동기화 경로의 파일은 blob의 하드 링크 (같은 내용은 물리 파일 1개)
+- 참조 수 = blob inode 링크 수 - 1 (파일 삭제 시 파일 시스템이 자동 감소)
+- 하드 링크를 쓸 수 없으면(다른 파일 시스템 등) 일반 복사로 대체
+
+링크된 파일은 내용을 공유하므로 제자리 수정하지 않고 항상 새 파일로 교체합니다.
+(_place: 임시 이름에 링크 후 os.replace)
+"""
+import hashlib
+import os
+import shutil
+import time
+import uuid
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from flask import current_app
+
+CHUNK_SIZE = 1024 * 1024
+TEMP_DIR = 'tmp'
+
+
+class BlobStore:
+    """내용 주소(SHA-256) 저장소"""
+
+    def __init__(self):
+        self.root = None  # Flask app context에서 초기화
+
+    def _get_root(self) -> str:
+        """blob 저장소 경로 (기본: 업로드 폴더 아래 .blobs, 하드 링크를 위해 같은 파일 시스템)"""
+        if self.root:
+            return self.root
+        configured = current_app.config.get('BLOB_STORE_PATH')
+        if configured:
+            return configured
+        from app.shared.services.file_storage_service import file_storage
+        return os.path.join(file_storage._get_base_path(), '.blobs')
+
+    def blob_path(self, digest: str) -> str:
+        """blob 파일 경로"""
+        return os.path.join(self._get_root(), digest[:2], digest[2:4], digest)
+
+    # ========================================
+    # 저장
+    # ========================================
+
+    def save(self, stream: BinaryIO, dest_path: str) -> Tuple[str, int]:
+        """스트림을 blob으로 저장하고 dest_path에 링크
+
+        Args:
+            stream: 읽기 가능한 바이너리 스트림 (업로드 파일 등)
+            dest_path: 파일을 노출할 경로
+
+        Returns:
+            (sha256, 파일크기)
+        """
+        temp_path = self._temp_path()
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp_path, 'wb') as out:
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            digest = hasher.hexdigest()
+            self._store(temp_path, digest, dest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return digest, size
+
+    def link_file(self, source_path: str, dest_path: str) -> str:
+        """기존 파일을 blob 저장소에 등록하고 dest_path에 링크 (복사 대체)
+
+        Args:
+            source_path: 원본 파일 경로
+            dest_path: 새 파일 경로
+
+        Returns:
+            sha256
+        """
+        digest = self.hash_file(source_path)
+        self._store(source_path, digest, dest_path)
+        return digest
+
+    def _store(self, path: str, digest: str, dest_path: str) -> None:
+        """path를 blob으로 등록(또는 기존 blob 사용)하고 dest_path에 배치"""
+        source = self._adopt(path, digest)
+        try:
+            self._place(source, dest_path)
+        except FileNotFoundError:
+            if source == path:
+                raise
+            # 배치 직전 prune으로 blob이 삭제된 경우
+            self._place(path, dest_path)
+
+    def _adopt(self, path: str, digest: str) -> str:
+        """blob이 없으면 path의 inode를 blob으로 등록
+
+        Returns:
+            링크 원본으로 쓸 경로 (blob 또는 blob과 같은 inode인 path)
+            하드 링크를 쓸 수 없으면 path (이후 _place가 복사)
+        """
+        blob = self.blob_path(digest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        try:
+            os.link(path, blob)
+            return path
+        except FileExistsError:
+            return blob
+        except OSError:
+            return path
+
+    def _place(self, source_path: str, dest_path: str) -> None:
+        """source_path와 같은 내용을 dest_path에 원자적으로 배치 (링크, 불가 시 복사)"""
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        if os.path.exists(dest_path) and os.path.samefile(source_path, dest_path):
+            return
+        temp_path = f'{dest_path}.{uuid.uuid4().hex[:8]}.tmp'
+        try:
+            os.link(source_path, temp_path)
+        except OSError:
+            shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, dest_path)
+
+    def _temp_path(self) -> str:
+        """저장소 내 임시 파일 경로 (blob과 같은 파일 시스템)"""
+        folder = os.path.join(self._get_root(), TEMP_DIR)
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, uuid.uuid4().hex)
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """파일 SHA-256"""
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def ref_count(self, digest: str) -> int:
+        """blob을 참조하는 파일 수 (하드 링크 기준, blob 없으면 0)"""
+        try:
+            return os.stat(self.blob_path(digest)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def iter_blobs(self) -> Iterator[str]:
+        """저장된 blob 경로 목록"""
+        root = self._get_root()
+        if not os.path.isdir(root):
+            return
+        for dirpath, dirnames, filenames in os.walk(root):
+            if dirpath == root and TEMP_DIR in dirnames:
+                dirnames.remove(TEMP_DIR)
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+
+    # ========================================
+    # 정리
+    # ========================================
+
+    def prune(self, min_age_seconds: int = 3600, dry_run: bool = False) -> Dict[str, int]:
+        """참조 없는 blob과 남은 임시 파일 삭제
+
+        링크 직전의 blob을 지우지 않도록 min_age_seconds보다 오래된 것만 삭제합니다.
+
+        Args:
+            min_age_seconds: 삭제 대상 최소 경과 시간 (초)
+            dry_run: True면 집계만 수행
+
+        Returns:
+            {'blobs': 삭제 blob 수, 'bytes': 회수 바이트}
+        """
+        cutoff = time.time() - min_age_seconds
+        stats = {'blobs': 0, 'bytes': 0}
+        candidates = list(self.iter_blobs())
+        temp_folder = os.path.join(self._get_root(), TEMP_DIR)
+        if os.path.isdir(temp_folder):
+            candidates += [os.path.join(temp_folder, name) for name in os.listdir(temp_folder)]
+
+        for path in candidates:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if st.st_nlink > 1 or st.st_mtime > cutoff:
+                continue
+            stats['blobs'] += 1
+            stats['bytes'] += st.st_size
+            if not dry_run:
+                os.remove(path)
+        return stats
+
+    def dedupe_tree(self, root: Optional[str] = None, dry_run: bool = False) -> Dict[str, int]:
+        """기존 업로드 폴더의 파일을 blob 저장소로 이전하여 중복 제거
+
+        같은 내용의 파일은 하나의 blob 하드 링크로 교체합니다. (경로/파일명 유지)
+
+        Args:
+            root: 대상 폴더 (기본: 업로드 폴더)
+            dry_run: True면 집계만 수행
+
+        Returns:
+            {'files': 검사 파일 수, 'linked': 링크로 교체한 수, 'bytes_saved': 절감 바이트}
+        """
+        from app.shared.services.file_storage_service import file_storage
+
+        root = root or file_storage._get_base_path()
+        blob_root = os.path.realpath(self._get_root())
+        stats = {'files': 0, 'linked': 0, 'bytes_saved': 0}
+        seen: Dict[str, str] = {}
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                name for name in dirnames
+                if os.path.realpath(os.path.join(dirpath, name)) != blob_root
+            ]
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if os.path.islink(path) or not os.path.isfile(path):
+                    continue
+                stats['files'] += 1
+                digest = self.hash_file(path)
+                blob = self.blob_path(digest)
+                first = seen.setdefault(digest, path)
+
+                if dry_run:
+                    if first != path and not os.path.samefile(first, path):
+                        stats['linked'] += 1
+                        stats['bytes_saved'] += os.path.getsize(path)
+                    continue
+
+                source = self._adopt(path, digest)
+                if source == blob and not os.path.samefile(blob, path):
+                    size = os.path.getsize(path)
+                    self._place(blob, path)
+                    if os.path.samefile(blob, path):
+                        stats['linked'] += 1
+                        stats['bytes_saved'] += size
+        return stats
+
+
+# 싱글톤 인스턴스
+blob_store = BlobStore()
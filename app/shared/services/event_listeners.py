@@ -5,9 +5,10 @@ SQLAlchemy 이벤트 리스너
 Phase 4: 데이터 동기화 및 퇴사 처리
 Phase 31: 컨벤션 준수 - Repository 패턴 적용
 """
-from typing import Any, Set
-from sqlalchemy import event
-from sqlalchemy.orm import Session
+from typing import Any, Optional, Set
+import click
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
 from flask import current_app, has_app_context
 
 from app.database import db
@@ -20,30 +21,39 @@ class SyncEventManager:
     """
     동기화 이벤트 관리자
 
-    PersonalProfile 모델의 변경사항을 감지하고
-    실시간 동기화가 활성화된 계약에 대해 자동 동기화를 수행합니다.
+    PersonalProfile 모델과 개인 프로필 이력/첨부파일의 변경사항을 감지하고
+    커밋 후 실시간 동기화가 활성화된 계약의 동기화 작업을 큐(sync_jobs)에 적재합니다.
+    변경된 섹션만 기록하여 작업 큐가 연속 요청을 병합하고 해당 섹션만 동기화하도록 합니다.
+    동기화 실행은 작업 큐 워커가 담당합니다. (SyncJobService)
+
+    동기화 대상은 변경을 flush한 세션의 Session.info에 기록하므로 요청 스레드 간에 공유되지 않으며,
+    after_commit에서 적재 후 제거하고 after_rollback에서 버립니다.
     """
 
     _enabled = False
-    _pending_syncs: Set[int] = set()
-    _contract_repo = None
-    _data_sharing_repo = None
+    _job_service = None
+
+    # Session.info 키: 동기화 대상 사용자별 변경 섹션 ({user_id: 섹션 집합}, None이면 전체 동기화)
+    PENDING_KEY = 'sync_event_pending'
+
+    # 동기화 섹션 (SyncService.get_syncable_fields 키)
+    SECTION_BASIC = 'basic'
+    RELATION_SECTIONS = {
+        'Education': 'education',
+        'Career': 'career',
+        'Certificate': 'certificates',
+        'Language': 'languages',
+        'FamilyMember': 'family',
+    }
+    SECTION_ATTACHMENTS = 'attachments'
 
     @classmethod
-    def _get_contract_repo(cls):
-        """지연 초기화된 계약 Repository"""
-        if cls._contract_repo is None:
-            from app.domains.contract.repositories.person_contract_repository import person_contract_repository
-            cls._contract_repo = person_contract_repository
-        return cls._contract_repo
-
-    @classmethod
-    def _get_data_sharing_repo(cls):
-        """지연 초기화된 데이터 공유 설정 Repository"""
-        if cls._data_sharing_repo is None:
-            from app.domains.company.repositories.data_sharing_settings_repository import data_sharing_settings_repository
-            cls._data_sharing_repo = data_sharing_settings_repository
-        return cls._data_sharing_repo
+    def _get_job_service(cls):
+        """지연 초기화된 동기화 작업 큐 서비스"""
+        if cls._job_service is None:
+            from app.domains.sync.services.sync_job_service import sync_job_service
+            cls._job_service = sync_job_service
+        return cls._job_service
 
     @classmethod
     def enable(cls):
@@ -64,6 +74,14 @@ class SyncEventManager:
         """활성화 상태 확인"""
         return cls._enabled
 
+    @classmethod
+    def _section_models(cls) -> list:
+        """변경 감지 대상 이력/첨부파일 모델"""
+        from app.domains.attachment.models import Attachment
+        from app.domains.employee import models as employee_models
+
+        return [getattr(employee_models, name) for name in cls.RELATION_SECTIONS] + [Attachment]
+
     @classmethod
     def _register_listeners(cls):
         """이벤트 리스너 등록"""
@@ -71,8 +89,14 @@ class SyncEventManager:
         event.listen(PersonalProfile, 'after_update', cls._on_profile_update)
         event.listen(PersonalProfile, 'after_insert', cls._on_profile_insert)
 
-        # 세션 커밋 후 처리
+        # 개인 프로필 이력/첨부파일 변경 감지
+        for model in cls._section_models():
+            for identifier in ('after_insert', 'after_update', 'after_delete'):
+                event.listen(model, identifier, cls._on_section_change)
+
+        # 세션 커밋 후 적재 / 롤백 시 폐기
         event.listen(db.session, 'after_commit', cls._after_commit)
+        event.listen(db.session, 'after_rollback', cls._after_rollback)
 
     @classmethod
     def _unregister_listeners(cls):
@@ -80,10 +104,35 @@ class SyncEventManager:
         try:
             event.remove(PersonalProfile, 'after_update', cls._on_profile_update)
             event.remove(PersonalProfile, 'after_insert', cls._on_profile_insert)
+            for model in cls._section_models():
+                for identifier in ('after_insert', 'after_update', 'after_delete'):
+                    event.remove(model, identifier, cls._on_section_change)
             event.remove(db.session, 'after_commit', cls._after_commit)
+            event.remove(db.session, 'after_rollback', cls._after_rollback)
         except Exception:
             pass
 
+    @classmethod
+    def _mark_pending(cls, session: Optional[Session], user_id: int, section: Optional[str] = None):
+        """
+        동기화 대상으로 마킹
+
+        Args:
+            session: 변경을 flush하는 세션 (None이면 무시)
+            user_id: 개인 사용자 ID
+            section: 변경 섹션 (None이면 전체 동기화)
+        """
+        if session is None:
+            return
+        pending = session.info.setdefault(cls.PENDING_KEY, {})
+        if user_id in pending and pending[user_id] is None:
+            # 이미 전체 동기화 대상
+            return
+        if section is None:
+            pending[user_id] = None
+        else:
+            pending.setdefault(user_id, set()).add(section)
+
     @classmethod
     def _on_profile_update(cls, mapper, connection, target: PersonalProfile):
         """
@@ -97,8 +146,8 @@ class SyncEventManager:
         if not cls._enabled:
             return
 
-        # 동기화 대상으로 마킹
-        cls._pending_syncs.add(target.user_id)
+        # 동기화 대상으로 마킹 (기본/연락처 필드)
+        cls._mark_pending(object_session(target), target.user_id, cls.SECTION_BASIC)
 
     @classmethod
     def _on_profile_insert(cls, mapper, connection, target: PersonalProfile):
@@ -110,90 +159,132 @@ class SyncEventManager:
         if not cls._enabled:
             return
 
-        cls._pending_syncs.add(target.user_id)
+        cls._mark_pending(object_session(target), target.user_id)
 
     @classmethod
-    def _after_commit(cls, session: Session):
+    def _on_section_change(cls, mapper, connection, target):
         """
-        세션 커밋 후 동기화 실행
+        개인 프로필 이력/첨부파일 생성/수정/삭제 이벤트 핸들러
+
+        프로필 소유 행(직원 소유 행 제외)만 해당 섹션을 동기화 대상으로 마킹합니다.
 
-        트랜잭션이 성공적으로 커밋된 후에만 동기화를 수행합니다.
+        Args:
+            mapper: SQLAlchemy mapper
+            connection: DB connection (flush 중인 트랜잭션)
+            target: 변경된 이력/첨부파일 인스턴스
         """
-        if not cls._pending_syncs:
+        if not cls._enabled:
             return
 
-        user_ids = cls._pending_syncs.copy()
-        cls._pending_syncs.clear()
+        from app.domains.attachment.constants import OwnerType
+        from app.domains.employee.models import Profile
 
-        # 앱 컨텍스트 확인
-        if not has_app_context():
+        section = cls.RELATION_SECTIONS.get(mapper.class_.__name__)
+        if section:
+            profile_id = None if target.employee_id else target.profile_id
+        elif target.owner_type == OwnerType.PROFILE:
+            section, profile_id = cls.SECTION_ATTACHMENTS, target.owner_id
+        else:
+            return
+        if not profile_id:
             return
 
-        for user_id in user_ids:
-            try:
-                cls._sync_user_contracts(user_id)
-            except Exception as e:
-                if current_app:
-                    current_app.logger.error(
-                        f"Auto sync failed for user {user_id}: {str(e)}"
-                    )
+        user_id = connection.execute(
+            select(Profile.user_id).where(Profile.id == profile_id)
+        ).scalar()
+        if user_id:
+            cls._mark_pending(object_session(target), user_id, section)
 
     @classmethod
-    def _sync_user_contracts(cls, user_id: int):
+    def mark_bulk_write(cls, session: Session, model_class, record_ids: list):
         """
-        사용자의 모든 활성 계약 동기화
+        일괄 쓰기(bulk_*) 대상 행의 동기화 마킹 (_on_section_change 대체)
+
+        일괄 쓰기는 모델 이벤트를 실행하지 않으므로 Repository가 쓰기 후 직접 호출합니다.
+        프로필 소유 행(직원 소유 행 제외)의 사용자만 해당 섹션을 동기화 대상으로 마킹합니다.
 
         Args:
-            user_id: 개인 사용자 ID
+            session: 일괄 쓰기를 실행한 세션 (트랜잭션 유지 중)
+            model_class: 일괄 쓰기 대상 모델
+            record_ids: 생성/수정된 레코드 ID 목록
         """
-        # Phase 31: Repository 패턴 적용
-        contracts = cls._get_contract_repo().find_by_person_user_id_and_status(
-            user_id, ContractStatus.APPROVED
-        )
+        if not cls._enabled or not record_ids:
+            return
 
-        for contract in contracts:
-            # 실시간 동기화 설정 확인
-            settings = cls._get_data_sharing_repo().find_by_contract_id(contract.id)
+        from app.domains.attachment.models import Attachment
+        from app.domains.attachment.constants import OwnerType
+        from app.domains.employee.models import Profile
+
+        section = cls.RELATION_SECTIONS.get(model_class.__name__)
+        if section:
+            profile_ids = (
+                select(model_class.profile_id)
+                .where(model_class.id.in_(record_ids), model_class.employee_id.is_(None))
+            )
+        elif model_class is Attachment:
+            section = cls.SECTION_ATTACHMENTS
+            profile_ids = (
+                select(Attachment.owner_id)
+                .where(Attachment.id.in_(record_ids), Attachment.owner_type == OwnerType.PROFILE)
+            )
+        else:
+            return
 
-            if settings and settings.is_realtime_sync:
-                cls._execute_sync(contract.id, user_id)
+        user_ids = session.execute(
+            select(Profile.user_id)
+            .where(Profile.id.in_(profile_ids), Profile.user_id.isnot(None))
+            .distinct()
+        ).scalars().all()
+        for user_id in user_ids:
+            cls._mark_pending(session, user_id, section)
 
     @classmethod
-    def _execute_sync(cls, contract_id: int, user_id: int):
+    def _after_commit(cls, session: Session):
         """
-        실제 동기화 실행
+        세션 커밋 후 동기화 작업 적재
 
-        Args:
-            contract_id: 계약 ID
-            user_id: 사용자 ID
+        트랜잭션이 성공적으로 커밋된 후에만 적재하며, 동기화 완료를 기다리지 않습니다.
         """
-        # 순환 import 방지
-        from app.domains.sync.services.sync_service import sync_service
+        pending = session.info.pop(cls.PENDING_KEY, None)
+        if not pending:
+            return
 
-        try:
-            sync_service.set_current_user(user_id)
-            result = sync_service.sync_personal_to_employee(
-                contract_id=contract_id,
-                sync_type=SyncLog.SYNC_TYPE_AUTO
-            )
+        # 앱 컨텍스트 확인
+        if not has_app_context():
+            return
 
-            if current_app:
-                if result.get('success'):
-                    current_app.logger.info(
-                        f"Auto sync completed for contract {contract_id}: "
-                        f"{len(result.get('changes', []))} changes"
-                    )
-                else:
-                    current_app.logger.warning(
-                        f"Auto sync failed for contract {contract_id}: "
-                        f"{result.get('error')}"
+        for user_id, sections in pending.items():
+            try:
+                cls._sync_user_contracts(user_id, sections)
+            except Exception as e:
+                if current_app:
+                    current_app.logger.error(
+                        f"Auto sync enqueue failed for user {user_id}: {str(e)}"
                     )
 
-        except Exception as e:
-            if current_app:
-                current_app.logger.error(
-                    f"Auto sync error for contract {contract_id}: {str(e)}"
-                )
+    @classmethod
+    def _after_rollback(cls, session: Session):
+        """롤백된 변경의 동기화 대상 제거"""
+        session.info.pop(cls.PENDING_KEY, None)
+
+    @classmethod
+    def _sync_user_contracts(cls, user_id: int, sections: Optional[Set[str]] = None):
+        """
+        사용자의 실시간 동기화 계약별 동기화 작업 적재
+
+        커밋된 세션은 SQL을 실행할 수 없으므로 작업 큐 서비스가 별도 커넥션에서 적재합니다.
+
+        Args:
+            user_id: 개인 사용자 ID
+            sections: 변경 섹션 (None이면 전체 동기화)
+        """
+        count = cls._get_job_service().enqueue_for_user(
+            user_id, SyncLog.SYNC_TYPE_AUTO, sections=sections
+        )
+        if count and current_app:
+            current_app.logger.info(
+                f"Auto sync queued for user {user_id}: {count} contract(s)"
+            )
 
 
 class ContractEventManager:
@@ -350,14 +441,31 @@ def init_event_listeners(app):
             SyncEventManager.enable()
             app.logger.info("SyncEventManager enabled")
 
+            # 동기화 작업 큐 워커 (0이면 `flask run-sync-worker` 별도 프로세스로 처리)
+            # fork 전 스레드/커넥션 공유를 피하도록 요청을 처리하는 프로세스의 첫 요청에서 시작
+            worker_count = app.config.get('SYNC_QUEUE_WORKERS', 0)
+            if worker_count and not _is_cli_command():
+                SyncEventManager._get_job_service().start_workers_lazily(app, worker_count)
+
         if app.config.get('ENABLE_CONTRACT_EVENTS', True):
             ContractEventManager.enable()
             app.logger.info("ContractEventManager enabled")
 
 
+def _is_cli_command() -> bool:
+    """flask CLI 명령(flask run 제외) 실행 중 생성된 앱인지
+
+    마이그레이션/관리 명령 같은 일회성 명령에서는 작업 큐 폴링 스레드를 시작하지 않습니다.
+    (웹 서버: gunicorn/run.py/flask run, 별도 워커: `flask run-sync-worker`)
+    """
+    ctx = click.get_current_context(silent=True)
+    return ctx is not None and ctx.info_name != 'run'
+
+
 def cleanup_event_listeners():
     """이벤트 리스너 정리"""
     SyncEventManager.disable()
+    SyncEventManager._get_job_service().stop_workers()
     ContractEventManager.disable()
 
 
@@ -3,7 +3,7 @@ File Storage Service
 
 파일 저장 체계를 관리하는 서비스입니다.
 - 계정 유형별 경로 분리 (personal/corporate)
-- 파일 업로드/삭제/조회
+- 파일 업로드/삭제/조회 (내용은 blob_store에 중복 없이 저장)
 - 보안 접근 제어
 """
 import os
@@ -51,7 +51,8 @@ class FileStorageService:
     ├── personal/{user_id}/
     │   ├── attachments/
     │   └── profile_photo/
-    └── temp/
+    ├── temp/
+    └── .blobs/ab/cd/{sha256}   (내용 저장소, 위 파일들은 이 blob의 하드 링크)
     """
 
     def __init__(self):
@@ -216,6 +217,8 @@ class FileStorageService:
     def save_file(self, file, folder_path: str, filename: str) -> str:
         """파일 저장
 
+        내용은 blob 저장소(SHA-256)에 한 번만 저장하고, 저장 경로에는 blob 하드 링크를 둡니다.
+
         Args:
             file: 업로드된 파일 객체
             folder_path: 저장할 폴더 경로
@@ -224,9 +227,11 @@ class FileStorageService:
         Returns:
             저장된 파일의 전체 경로
         """
+        from app.shared.services.blob_store import blob_store
+
         os.makedirs(folder_path, exist_ok=True)
         file_path = os.path.join(folder_path, filename)
-        file.save(file_path)
+        blob_store.save(getattr(file, 'stream', file), file_path)
         return file_path
 
     def delete_file(self, file_path: str) -> bool:
@@ -4,8 +4,9 @@ API 응답 헬퍼 모듈
 API 응답 형식을 표준화합니다.
 Phase 6: 백엔드 리팩토링
 """
+import hashlib
 from typing import Any, Optional, Dict
-from flask import jsonify
+from flask import jsonify, request
 
 
 def api_success(data: Any = None, message: str = None, status_code: int = 200):
@@ -36,6 +37,30 @@ def api_success(data: Any = None, message: str = None, status_code: int = 200):
     return jsonify(response), status_code
 
 
+def api_success_with_etag(data: Any = None, etag: str = None):
+    """
+    ETag 조건부 성공 API 응답 생성
+
+    If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+
+    Args:
+        data: 응답 데이터
+        etag: ETag 값 (미지정 시 응답 본문 해시)
+
+    Returns:
+        Response: JSON 응답 또는 304 응답
+
+    사용 예:
+        return api_success_with_etag(tree_data)
+    """
+    response = jsonify({'success': True, 'data': data})
+    if etag is None:
+        etag = hashlib.sha1(response.get_data()).hexdigest()
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+
 def api_error(message: str, status_code: int = 400, errors: Dict = None):
     """
     에러 API 응답 생성
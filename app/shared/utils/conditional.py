@@ -0,0 +1,116 @@
+"""
+테넌트 데이터 버전 기반 조건부 응답 (ETag / 304)
+
+목록 화면과 API 응답은 (테넌트 데이터 버전, 요청 사용자, 요청 URL)이 같으면 동일합니다.
+이 값들로 강한 ETag를 만들어 If-None-Match가 일치하면 목록 조회 없이 304를 반환합니다.
+
+- 버전: TenantDataVersion (직원/조직/계약/분류 옵션 변경 시 증가)
+- 사용자: 세션 사용자/역할/법인/CSRF 토큰 (HTML에 포함되는 값)
+- 플래시 메시지가 대기 중인 요청은 조건부 처리하지 않음 (1회성 출력)
+- daily=True: 오늘 날짜도 포함 (오늘 기준 기간을 조회하는 응답은 자정 이후 새 ETag)
+
+사용 예:
+    @bp.route('/employees')
+    @manager_or_admin_required
+    @tenant_conditional
+    def employee_list():
+        ...
+
+    @bp.route('/api/dashboard/trend')
+    @login_required
+    @tenant_conditional(daily=True)
+    def dashboard_trend():
+        ...
+"""
+import hashlib
+from datetime import date
+from functools import partial, wraps
+from typing import Optional, Tuple
+
+from flask import make_response, request, session
+
+from app.shared.constants.session_keys import SessionKeys
+from app.shared.utils.tenant import get_current_organization_id
+
+# ETag에 포함하는 세션 값 (템플릿/응답에 반영되는 사용자 컨텍스트)
+_SESSION_ETAG_KEYS = (
+    SessionKeys.USER_ID,
+    SessionKeys.USERNAME,
+    SessionKeys.USER_ROLE,
+    SessionKeys.EMPLOYEE_ID,
+    SessionKeys.ACCOUNT_TYPE,
+    SessionKeys.COMPANY_ID,
+    'csrf_token',
+)
+
+
+def tenant_data_etag(root_org_id: int, version: int, day: Optional[date] = None) -> str:
+    """현재 요청의 테넌트 데이터 ETag
+
+    Args:
+        root_org_id: 테넌트 루트 조직 ID
+        version: 테넌트 데이터 버전
+        day: 응답 기준일 (오늘 기준 기간을 조회하는 응답, 기본: 미포함)
+
+    Returns:
+        str: 강한 ETag 값 (따옴표 제외)
+    """
+    parts = [
+        request.endpoint or '',
+        str(root_org_id),
+        str(version),
+        request.full_path,
+        request.headers.get('X-Requested-With', ''),
+        day.isoformat() if day else '',
+    ]
+    parts.extend(str(session.get(key, '')) for key in _SESSION_ETAG_KEYS)
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _conditional_version() -> Optional[Tuple[int, int]]:
+    """조건부 처리 대상이면 (루트 조직 ID, 데이터 버전), 아니면 None"""
+    if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+        return None
+    root_org_id = get_current_organization_id()
+    if not root_org_id:
+        return None
+    from app.domains.company.models import TenantDataVersion
+    return root_org_id, TenantDataVersion.get_version(root_org_id)
+
+
+def tenant_conditional(f=None, *, daily: bool = False):
+    """테넌트 데이터 버전 ETag 조건부 응답 데코레이터
+
+    If-None-Match가 현재 ETag와 일치하면 뷰를 실행하지 않고 304를 반환합니다.
+    200 응답에는 ETag와 Cache-Control: private, no-cache를 설정합니다.
+    버전은 뷰 실행 전에 읽으므로 실행 중 커밋된 변경은 다음 요청에서 새 ETag가 됩니다.
+    인증 데코레이터 아래(안쪽)에 적용합니다.
+
+    Args:
+        daily: True면 ETag에 오늘 날짜 포함 (데이터 변경 없이도 날짜가 바뀌면 결과가 달라지는 응답)
+    """
+    if f is None:
+        return partial(tenant_conditional, daily=daily)
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        scope = _conditional_version()
+        if scope is None:
+            return f(*args, **kwargs)
+
+        if daily:
+            scope = (*scope, date.today())
+        etag = tenant_data_etag(*scope)
+        if etag in request.if_none_match:
+            response = make_response('', 304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed:
+            # 렌더링 중 세션에 추가된 값(CSRF 토큰 등)을 반영하여 다시 계산
+            response.set_etag(tenant_data_etag(*scope))
+            response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    return decorated_function
@@ -0,0 +1,196 @@
+"""
+커서(키셋) 페이지네이션 유틸리티
+
+OFFSET + COUNT(*) 대신 정렬 컬럼 값 + id(동률 해소)를 기준으로 다음/이전 페이지를 조회합니다.
+깊은 페이지에서도 인덱스 탐색 비용이 일정합니다.
+
+- 커서: 정렬 컬럼/값/id/방향/총건수를 담은 불투명 문자열 (base64url JSON)
+- 총건수: 첫 페이지에서만 COUNT 후 커서에 실어 재사용 (요청 시에만)
+- NULL 정렬값: 정렬 방향과 무관하게 항상 마지막 (NULLS LAST)
+
+사용 예:
+    page = keyset_paginate(query, Employee.name, Employee.id, per_page=20, cursor=cursor)
+    page.items, page.next_cursor, page.prev_cursor
+"""
+import base64
+import json
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, or_
+
+from app.shared.utils.exceptions import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    """잘못된(변조/다른 정렬 기준) 커서"""
+
+    def __init__(self, message: str = '잘못된 페이지 커서입니다.'):
+        super().__init__(message, field='cursor')
+
+
+DIRECTION_NEXT = 'next'
+DIRECTION_PREV = 'prev'
+
+
+def encode_cursor(payload: dict) -> str:
+    """커서 payload → 불투명 문자열"""
+    raw = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    """불투명 문자열 → 커서 payload
+
+    Raises:
+        InvalidCursorError: 디코딩 실패 또는 형식 오류
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError() from e
+    if not isinstance(payload, dict) or 'id' not in payload or 'k' not in payload:
+        raise InvalidCursorError()
+    return payload
+
+
+class CursorPage:
+    """커서 페이지 결과
+
+    Attributes:
+        items: 현재 페이지 항목
+        per_page: 페이지당 항목 수
+        next_cursor: 다음 페이지 커서 (없으면 None)
+        prev_cursor: 이전 페이지 커서 (없으면 None)
+        total: 총건수 (요청하지 않았으면 None)
+    """
+
+    cursor_mode = True
+
+    def __init__(self, items: List[Any], per_page: int, next_cursor: Optional[str],
+                 prev_cursor: Optional[str], total: Optional[int] = None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    def to_dict(self) -> dict:
+        """API 응답용 페이지 메타데이터"""
+        return {
+            'per_page': self.per_page,
+            'next_cursor': self.next_cursor,
+            'prev_cursor': self.prev_cursor,
+            'has_next': self.has_next,
+            'has_prev': self.has_prev,
+            'total': self.total,
+        }
+
+
+def _seek_clause(sort_column, id_column, value, last_id, descending: bool):
+    """(정렬값, id) 이후 행 조건 (NULLS LAST 순서 기준)"""
+    after_id = id_column < last_id if descending else id_column > last_id
+    if value is None:
+        return and_(sort_column.is_(None), after_id)
+    after_value = sort_column < value if descending else sort_column > value
+    return or_(
+        after_value,
+        and_(sort_column == value, after_id),
+        sort_column.is_(None),
+    )
+
+
+def _before_clause(sort_column, id_column, value, last_id, descending: bool):
+    """(정렬값, id) 이전 행 조건 (NULLS LAST 순서 기준)"""
+    before_id = id_column > last_id if descending else id_column < last_id
+    if value is None:
+        return or_(sort_column.isnot(None), and_(sort_column.is_(None), before_id))
+    before_value = sort_column > value if descending else sort_column < value
+    return and_(
+        sort_column.isnot(None),
+        or_(before_value, and_(sort_column == value, before_id)),
+    )
+
+
+def _order(column, descending: bool, reverse: bool):
+    """정렬 절 (reverse=True면 역순: 이전 페이지 조회용)"""
+    desc = descending != reverse
+    ordered = column.desc() if desc else column.asc()
+    return ordered.nulls_first() if reverse else ordered.nulls_last()
+
+
+def keyset_paginate(query, sort_column, id_column, per_page: int = 20,
+                    cursor: str = None, descending: bool = False,
+                    with_total: bool = False, row_key=None) -> CursorPage:
+    """키셋 페이지네이션 실행
+
+    Args:
+        query: 필터가 적용된 Query (정렬 미적용)
+        sort_column: 정렬 컬럼 (id_column과 같아도 됨)
+        id_column: 고유 동률 해소 컬럼
+        per_page: 페이지당 항목 수
+        cursor: 이전 응답의 next_cursor/prev_cursor (None이면 첫 페이지)
+        descending: 내림차순 여부
+        with_total: 첫 페이지에서 COUNT 조회 후 커서에 보관
+        row_key: 항목 → (정렬값, id) 추출 함수 (기본: 컬럼 이름 속성)
+
+    Returns:
+        CursorPage
+
+    Raises:
+        InvalidCursorError: 커서가 잘못되었거나 정렬 기준이 다른 경우
+    """
+    sort_key = sort_column.key
+    if row_key is None:
+        def row_key(item):
+            return getattr(item, sort_key), getattr(item, id_column.key)
+
+    total = None
+    direction = DIRECTION_NEXT
+    if cursor:
+        payload = decode_cursor(cursor)
+        if payload['k'] != sort_key or bool(payload.get('desc')) != descending:
+            raise InvalidCursorError('정렬 기준이 변경되어 커서를 사용할 수 없습니다.')
+        direction = payload.get('d', DIRECTION_NEXT)
+        total = payload.get('t')
+        clause = _before_clause if direction == DIRECTION_PREV else _seek_clause
+        query = query.filter(clause(sort_column, id_column, payload.get('v'), payload['id'], descending))
+    elif with_total:
+        total = query.order_by(None).count()
+
+    reverse = direction == DIRECTION_PREV
+    order = [_order(sort_column, descending, reverse)]
+    if sort_column is not id_column:
+        order.append(id_column.desc() if descending != reverse else id_column.asc())
+    rows = query.order_by(*order).limit(per_page + 1).all()
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if reverse:
+        rows.reverse()
+
+    def make_cursor(item, to_direction):
+        value, item_id = row_key(item)
+        payload = {'k': sort_key, 'v': value, 'id': item_id, 'd': to_direction}
+        if descending:
+            payload['desc'] = True
+        if total is not None:
+            payload['t'] = total
+        return encode_cursor(payload)
+
+    if reverse:
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, bool(cursor)
+
+    next_cursor = make_cursor(rows[-1], DIRECTION_NEXT) if rows and has_next else None
+    prev_cursor = make_cursor(rows[0], DIRECTION_PREV) if rows and has_prev else None
+    return CursorPage(rows, per_page, next_cursor, prev_cursor, total)
@@ -0,0 +1,52 @@
+"""
+한글 검색 유틸리티
+
+초성(ㄱ, ㄴ, ㄷ ...) 추출 및 초성 검색어 판별을 제공합니다.
+Employee.name_choseong 등 미리 계산된 초성 컬럼과 함께 사용합니다.
+
+사용 예:
+    to_choseong('김민수')        # 'ㄱㅁㅅ'
+    is_choseong_query('ㄱㅁㅅ')  # True
+"""
+from typing import Optional
+
+# 한글 음절 (가 ~ 힣) 초성 19자 (유니코드 순서)
+CHOSEONG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+
+
+def to_choseong(text: Optional[str]) -> Optional[str]:
+    """문자열의 한글 음절을 초성으로 변환 (공백 제거, 그 외 문자는 소문자로 유지)
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        초성 문자열 (입력이 비어 있으면 None)
+    """
+    if not text:
+        return None
+
+    result = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            result.append(CHOSEONG[(code - _HANGUL_BASE) // _SYLLABLES_PER_CHOSEONG])
+        elif not char.isspace():
+            result.append(char.lower())
+    return ''.join(result) or None
+
+
+def is_choseong_query(query: Optional[str]) -> bool:
+    """검색어가 초성(자음)으로만 이루어졌는지 확인 (공백 무시)"""
+    if not query:
+        return False
+    chars = [char for char in query if not char.isspace()]
+    return bool(chars) and all(char in _CHOSEONG_SET for char in chars)
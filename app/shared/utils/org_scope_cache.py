@@ -0,0 +1,149 @@
+"""
+조직 스코프 프로세스 캐시
+
+테넌트별 조직 ID 집합, 조직 트리 스냅샷을 프로세스 LRU 캐시에 보관합니다.
+캐시 키는 (종류, root_organization_id, 조직 구조 버전)이며,
+버전은 org_scope_versions 행(OrgScopeVersion)에서 읽습니다.
+
+무효화:
+    - 같은 프로세스: 조직 변경 커밋 직후 invalidate() 호출 (세션 이벤트)
+    - 다른 워커: ORG_SCOPE_VERSION_POLL_SECONDS 간격으로 버전 행 재조회
+    - 커밋 전 변경이 있는 세션은 캐시를 우회
+
+설정:
+    ORG_SCOPE_CACHE_ENABLED: 캐시 사용 여부
+    ORG_SCOPE_CACHE_SIZE: 최대 항목 수 (LRU)
+    ORG_SCOPE_VERSION_POLL_SECONDS: 버전 재조회 간격 (초)
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from flask import current_app, has_app_context
+
+
+class OrgScopeCache:
+    """테넌트 조직 스코프 LRU 캐시"""
+
+    DEFAULT_SIZE = 256
+    DEFAULT_POLL_SECONDS = 0.2
+
+    def __init__(self):
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._versions: Dict[int, tuple] = {}  # root_id -> (version, checked_at)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+        self._invalidations = 0
+
+    def _config(self, key: str, default):
+        if not has_app_context():
+            return default
+        return current_app.config.get(key, default)
+
+    def is_enabled(self) -> bool:
+        """캐시 사용 여부 (앱 컨텍스트 필요)"""
+        return has_app_context() and bool(self._config('ORG_SCOPE_CACHE_ENABLED', True))
+
+    def _has_pending_changes(self, root_org_id: int) -> bool:
+        """현재 세션에 커밋 전 조직 변경이 있는지 확인"""
+        from app.database import db
+        from app.domains.company.models import OrgScopeVersion
+        return root_org_id in db.session.info.get(OrgScopeVersion.DIRTY_KEY, ())
+
+    def current_version(self, root_org_id: int) -> int:
+        """조직 구조 버전 (폴링 간격 내에서는 로컬 값 재사용)
+
+        버전 변경이 감지되면 해당 루트의 이전 버전 항목을 제거합니다.
+        """
+        poll_seconds = self._config('ORG_SCOPE_VERSION_POLL_SECONDS', self.DEFAULT_POLL_SECONDS)
+        now = time.monotonic()
+        known = self._versions.get(root_org_id)
+        if known and now - known[1] < poll_seconds:
+            return known[0]
+
+        from app.domains.company.models import OrgScopeVersion
+        version = OrgScopeVersion.get_version(root_org_id)
+        with self._lock:
+            if known and known[0] != version:
+                self._drop_root(root_org_id)
+            self._versions[root_org_id] = (version, now)
+        return version
+
+    def get_or_load(self, kind: str, root_org_id: int, loader: Callable[[], Any],
+                    copy: Optional[Callable[[Any], Any]] = None) -> Any:
+        """캐시 조회, 없으면 loader 결과 저장
+
+        Args:
+            kind: 항목 종류 (예: 'org_ids', 'selector_tree')
+            root_org_id: 루트 조직 ID
+            loader: 캐시 미스 시 호출할 함수
+            copy: 반환 전 복사 함수 (호출자가 결과를 수정하는 경우)
+
+        Returns:
+            캐시 값 (copy 지정 시 복사본)
+        """
+        if not root_org_id or not self.is_enabled() or self._has_pending_changes(root_org_id):
+            with self._lock:
+                self._bypasses += 1
+            return loader()
+
+        key = (kind, root_org_id, self.current_version(root_org_id))
+        with self._lock:
+            found = key in self._entries
+            if found:
+                self._entries.move_to_end(key)
+                value = self._entries[key]
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if not found:
+            value = loader()
+            max_size = self._config('ORG_SCOPE_CACHE_SIZE', self.DEFAULT_SIZE)
+            with self._lock:
+                self._entries[key] = value
+                while len(self._entries) > max_size:
+                    self._entries.popitem(last=False)
+
+        return copy(value) if copy else value
+
+    def _drop_root(self, root_org_id: int) -> None:
+        """루트 조직 항목 제거 (락 보유 상태에서 호출)"""
+        for key in [k for k in self._entries if k[1] == root_org_id]:
+            del self._entries[key]
+
+    def invalidate(self, root_org_ids: Iterable[int]) -> None:
+        """루트 조직 캐시 무효화 (다음 조회 시 버전 재조회)"""
+        with self._lock:
+            for root_org_id in root_org_ids:
+                self._versions.pop(root_org_id, None)
+                self._drop_root(root_org_id)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """전체 캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._hits = self._misses = self._bypasses = self._invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 캐시 통계 (프로세스 단위)"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'bypasses': self._bypasses,
+                'invalidations': self._invalidations,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'max_size': self._config('ORG_SCOPE_CACHE_SIZE', self.DEFAULT_SIZE),
+            }
+
+
+# 프로세스 싱글톤
+org_scope_cache = OrgScopeCache()
@@ -0,0 +1,55 @@
+"""
+SQL 실행 횟수 측정
+
+블록 안에서 현재 스레드가 실행한 SQL 문 수를 셉니다.
+화면/서비스 단위 쿼리 수 상한 검증(N+1 회귀 테스트)과 디버깅에 사용합니다.
+
+사용법:
+    from app.shared.utils.query_counter import count_queries
+
+    with count_queries() as counter:
+        employee_service.get_employee_full_view_data(employee_id)
+    assert counter.count <= 3
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """SQL 실행 횟수 (count) 및 실행 문장 (statements)"""
+
+    def __init__(self):
+        self.count = 0
+        self.statements: List[str] = []
+
+
+@contextmanager
+def count_queries(engine=None) -> Iterator[QueryCounter]:
+    """블록 내 현재 스레드의 SQL 실행 횟수 측정
+
+    Args:
+        engine: 대상 엔진 (기본: db.engine, 앱 컨텍스트 필요)
+
+    Yields:
+        QueryCounter: 블록 종료 후에도 값 유지
+    """
+    if engine is None:
+        from app.database import db
+        engine = db.engine
+
+    counter = QueryCounter()
+    thread_id = threading.get_ident()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == thread_id:
+            counter.count += 1
+            counter.statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, 'before_cursor_execute', on_execute)
@@ -0,0 +1,36 @@
+"""
+DB 방언별 SQL 구문 유틸리티
+
+운영(PostgreSQL)과 테스트(SQLite)가 모두 지원하는 INSERT ... ON CONFLICT 구문을 만듭니다.
+카운터/버전 행처럼 "없으면 생성, 있으면 증감"하는 쓰기는 UPDATE 후 INSERT 대신 이 구문을 사용하여
+동시에 첫 행을 쓰는 트랜잭션이 기본 키 충돌로 실패하지 않도록 합니다.
+
+사용 예:
+    stmt = dialect_insert(connection, table).values(key=1, count=delta)
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=['key'], set_={'count': table.c.count + delta}
+    ))
+"""
+
+
+def dialect_insert(bind, table):
+    """ON CONFLICT를 지원하는 방언별 INSERT 구문
+
+    Args:
+        bind: 실행할 커넥션/엔진 (dialect 확인용)
+        table: 대상 테이블
+
+    Returns:
+        postgresql/sqlite Insert 구문
+
+    Raises:
+        ValueError: ON CONFLICT를 지원하지 않는 DB
+    """
+    dialect = bind.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f'ON CONFLICT 구문을 지원하지 않는 DB입니다: {dialect}')
+    return insert(table)
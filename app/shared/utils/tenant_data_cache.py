@@ -0,0 +1,123 @@
+"""
+테넌트 데이터 버전 프로세스 캐시
+
+목록 패싯 건수 등 테넌트 직원 데이터에서 파생된 집계 결과를 프로세스 LRU 캐시에 보관합니다.
+캐시 키는 (종류, root_organization_id, 테넌트 데이터 버전, 인자 키)이며,
+버전은 tenant_data_versions 행(TenantDataVersion)에서 매 조회 시 읽습니다(PK 단일 조회).
+
+무효화:
+    - 직원/조직/계약/분류 옵션 변경 커밋 시 버전이 증가하여 이전 키는 더 이상 조회되지 않음
+    - 버전 변경이 감지되면 해당 루트의 이전 버전 항목 제거
+    - 커밋 전 버전이 증가한 세션은 캐시를 우회 (롤백 시 같은 버전 번호 재사용 방지)
+
+설정:
+    TENANT_DATA_CACHE_ENABLED: 캐시 사용 여부
+    TENANT_DATA_CACHE_SIZE: 최대 항목 수 (LRU)
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from flask import current_app, has_app_context
+
+
+class TenantDataCache:
+    """테넌트 데이터 버전 LRU 캐시"""
+
+    DEFAULT_SIZE = 512
+
+    def __init__(self):
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._versions: Dict[int, int] = {}  # root_id -> 마지막으로 확인한 버전
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+
+    def _config(self, key: str, default):
+        if not has_app_context():
+            return default
+        return current_app.config.get(key, default)
+
+    def is_enabled(self) -> bool:
+        """캐시 사용 여부 (앱 컨텍스트 필요)"""
+        return has_app_context() and bool(self._config('TENANT_DATA_CACHE_ENABLED', True))
+
+    def _has_uncommitted_bump(self, root_org_id: int) -> bool:
+        """현재 세션에서 커밋 전 버전 증가가 있는지 확인"""
+        from app.database import db
+        from app.domains.company.models import TenantDataVersion
+        info = db.session.info
+        return (root_org_id in info.get(TenantDataVersion.DIRTY_KEY, ())
+                or bool(info.get(TenantDataVersion.PENDING_KEY)))
+
+    def get_or_load(self, kind: str, root_org_id: int, key: Hashable,
+                    loader: Callable[[], Any]) -> Any:
+        """캐시 조회, 없으면 loader 결과 저장
+
+        Args:
+            kind: 항목 종류 (예: 'employee_facets')
+            root_org_id: 루트 조직 ID
+            key: 인자 키 (필터 조건 등, 해시 가능)
+            loader: 캐시 미스 시 호출할 함수
+
+        Returns:
+            캐시 값 (호출자는 수정하지 않아야 함)
+        """
+        if not root_org_id or not self.is_enabled() or self._has_uncommitted_bump(root_org_id):
+            with self._lock:
+                self._bypasses += 1
+            return loader()
+
+        from app.domains.company.models import TenantDataVersion
+        version = TenantDataVersion.get_version(root_org_id)
+        entry_key = (kind, root_org_id, version, key)
+        with self._lock:
+            if self._versions.get(root_org_id, version) != version:
+                self._drop_root(root_org_id)
+            self._versions[root_org_id] = version
+            found = entry_key in self._entries
+            if found:
+                self._entries.move_to_end(entry_key)
+                value = self._entries[entry_key]
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if not found:
+            value = loader()
+            max_size = self._config('TENANT_DATA_CACHE_SIZE', self.DEFAULT_SIZE)
+            with self._lock:
+                self._entries[entry_key] = value
+                while len(self._entries) > max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def _drop_root(self, root_org_id: int) -> None:
+        """루트 조직 항목 제거 (락 보유 상태에서 호출)"""
+        for entry_key in [k for k in self._entries if k[1] == root_org_id]:
+            del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """전체 캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._hits = self._misses = self._bypasses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 캐시 통계 (프로세스 단위)"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'bypasses': self._bypasses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'max_size': self._config('TENANT_DATA_CACHE_SIZE', self.DEFAULT_SIZE),
+            }
+
+
+# 프로세스 싱글톤
+tenant_data_cache = TenantDataCache()
@@ -0,0 +1,160 @@
+/**
+ * Lazy Sections Component
+ * 인사카드 섹션 지연 로딩
+ *
+ * 인사카드 첫 응답에는 헤더/기본정보만 포함되고, 아래 섹션은 자리표시자로 렌더링됩니다.
+ * - 자리표시자가 스크롤 영역에 가까워지면 섹션 HTML 조각을 조회하여 교체
+ * - 네비게이션에서 아직 없는 섹션을 선택하면 해당 조각을 먼저 조회 (SectionNav.resolveMissingTarget)
+ * - 조각 API: GET /api/employees/<id>/sections/<section>/render (ETag/304)
+ *
+ * 자리표시자 마크업:
+ *   <div data-lazy-section="history" data-fragment-url="..." data-section-anchors="education-info career-info">
+ */
+
+/**
+ * LazySections 클래스
+ */
+export class LazySections {
+    /**
+     * @param {Object} options - 설정 옵션
+     * @param {string} options.placeholderSelector - 자리표시자 선택자 (기본: '[data-lazy-section]')
+     * @param {string} options.scrollContainerSelector - 스크롤 컨테이너 선택자 (기본: null, 없으면 viewport)
+     * @param {string} options.rootMargin - 미리 불러올 거리 (기본: '600px 0px')
+     * @param {Function} options.onLoad - 조각 삽입 후 호출 (section => void)
+     */
+    constructor(options = {}) {
+        this.options = {
+            placeholderSelector: options.placeholderSelector || '[data-lazy-section]',
+            scrollContainerSelector: options.scrollContainerSelector || null,
+            rootMargin: options.rootMargin || '600px 0px',
+            onLoad: options.onLoad || null
+        };
+
+        this.observer = null;
+        this.pending = new Map();  // 자리표시자 → 로딩 Promise
+    }
+
+    /**
+     * 초기화 - 자리표시자 관찰 시작
+     * @returns {LazySections} 체이닝을 위한 this 반환
+     */
+    init() {
+        const placeholders = document.querySelectorAll(this.options.placeholderSelector);
+        if (placeholders.length === 0) return this;
+
+        if (!('IntersectionObserver' in window)) {
+            placeholders.forEach(placeholder => this.load(placeholder));
+            return this;
+        }
+
+        const root = this.options.scrollContainerSelector
+            ? document.querySelector(this.options.scrollContainerSelector)
+            : null;
+
+        this.observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    this.load(entry.target);
+                }
+            });
+        }, { root, rootMargin: this.options.rootMargin, threshold: 0 });
+
+        placeholders.forEach(placeholder => this.observer.observe(placeholder));
+        return this;
+    }
+
+    /**
+     * 자리표시자를 섹션 조각으로 교체 (중복 호출 시 같은 Promise 반환)
+     * @param {HTMLElement} placeholder - 자리표시자 요소
+     * @returns {Promise<boolean>} 성공 여부
+     */
+    load(placeholder) {
+        if (!this.pending.has(placeholder)) {
+            this.observer?.unobserve(placeholder);
+            this.pending.set(placeholder, this.fetchAndReplace(placeholder));
+        }
+        return this.pending.get(placeholder);
+    }
+
+    /**
+     * 조각 조회 및 삽입
+     * @param {HTMLElement} placeholder - 자리표시자 요소
+     * @returns {Promise<boolean>} 성공 여부
+     */
+    async fetchAndReplace(placeholder) {
+        const section = placeholder.dataset.lazySection;
+        try {
+            const response = await fetch(placeholder.dataset.fragmentUrl, {
+                credentials: 'same-origin',
+                headers: { 'X-Requested-With': 'XMLHttpRequest' }
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+
+            const template = document.createElement('template');
+            template.innerHTML = await response.text();
+            placeholder.replaceWith(template.content);
+
+            if (this.options.onLoad) {
+                this.options.onLoad(section);
+            }
+            return true;
+        } catch (error) {
+            console.error(`LazySections: '${section}' 섹션 로딩 실패`, error);
+            this.showError(placeholder);
+            return false;
+        }
+    }
+
+    /**
+     * 로딩 실패 표시 (다시 시도 버튼)
+     * @param {HTMLElement} placeholder - 자리표시자 요소
+     */
+    showError(placeholder) {
+        placeholder.innerHTML = `
+            <div class="lazy-section__placeholder lazy-section__placeholder--error" role="alert">
+                <span>섹션을 불러오지 못했습니다.</span>
+                <button type="button" class="btn btn--secondary btn--sm">다시 시도</button>
+            </div>`;
+        placeholder.querySelector('button').addEventListener('click', () => {
+            this.pending.delete(placeholder);
+            this.load(placeholder);
+        }, { once: true });
+    }
+
+    /**
+     * 섹션 ID가 포함된 조각을 불러온 후 섹션 요소 반환 (네비게이션용)
+     * @param {string} sectionId - 섹션 요소 ID (예: 'education-info')
+     * @returns {Promise<HTMLElement|null>} 섹션 요소
+     */
+    async resolve(sectionId) {
+        const placeholder = Array.from(document.querySelectorAll(this.options.placeholderSelector))
+            .find(el => (el.dataset.sectionAnchors || '').split(' ').includes(sectionId));
+        if (placeholder) {
+            await this.load(placeholder);
+        }
+        return document.getElementById(sectionId);
+    }
+
+    /**
+     * 옵저버 정리
+     */
+    destroy() {
+        if (this.observer) {
+            this.observer.disconnect();
+            this.observer = null;
+        }
+    }
+}
+
+/**
+ * 간편 초기화 함수
+ * @param {Object} options - LazySections 옵션
+ * @returns {LazySections} 초기화된 인스턴스
+ */
+export function initLazySections(options = {}) {
+    return new LazySections(options).init();
+}
+
+export default LazySections;
@@ -30,7 +30,7 @@ export class SidebarSearch {
             debounceDelay: options.debounceDelay || 300,
             minChars: options.minChars || 2,
             maxResults: options.maxResults || 10,
-            apiUrl: options.apiUrl || '/api/employees',
+            apiUrl: options.apiUrl || '/api/employees/typeahead',
             ...options
         };
 
@@ -6,6 +6,7 @@
  * - Phase 5.4: 파일 미리보기 (FilePreview 컴포넌트 사용)
  * - 명함 QR 코드 (BusinessCard 도메인)
  * - Phase 1: 인라인 편집 시스템 (InlineEditManager)
+ * - 인사카드 섹션 지연 로딩 (LazySections)
  */
 
 import { SectionNav } from '../../../shared/components/section-nav.js';
@@ -13,6 +14,7 @@ import { FileUpload, FileFilter, FilePreview } from '../../../shared/components/
 import { initBusinessCards } from '../../businesscard/index.js';
 import { initInlineEdit, SECTION_CONFIG as INLINE_SECTION_CONFIG } from '../../../shared/components/inline-edit-manager.js';
 import { openAddressSearch } from './address-search.js';
+import { LazySections } from '../components/lazy-sections.js';
 
 // 전역 인스턴스 (업로드/삭제 후 새로고침용)
 let fileFilter = null;
@@ -117,7 +119,14 @@ function initSectionNavigation() {
     // 사이드바 섹션 네비게이션 초기화 (hr_card 모드)
     const sidebarNav = document.querySelector('.sub-nav');
     if (sidebarNav) {
-        const sectionNav = new SectionNav({
+        // 인사카드 지연 로딩 섹션: 삽입 후 스크롤 스파이 갱신, 미로딩 섹션 이동 시 먼저 로딩
+        let sectionNav = null;
+        const lazySections = new LazySections({
+            scrollContainerSelector: '.detail-main-content',
+            onLoad: () => sectionNav?.refresh()
+        });
+
+        sectionNav = new SectionNav({
             sectionSelector: '.content-section',
             navItemSelector: '.sub-nav__item',  // 사이드바 네비 아이템
             scrollContainerSelector: '.detail-main-content',
@@ -125,9 +134,11 @@ function initSectionNavigation() {
             overlayId: 'sectionNavOverlay',
             toggleBtnId: 'mobileNavToggle',
             scrollOffset: 80,
-            rootMargin: '-100px 0px -50% 0px'
+            rootMargin: '-100px 0px -50% 0px',
+            resolveMissingTarget: (sectionId) => lazySections.resolve(sectionId)
         });
         sectionNav.init();
+        lazySections.init();
         return;
     }
 
@@ -1171,7 +1182,6 @@ function openOrganizationSelector(displayInput, hiddenInput) {
             inputId: displayId,
             hiddenInputId: hiddenId,
             modalId: 'inlineOrgTreeSelectorModal',
-            apiUrl: '/admin/api/organizations?format=tree',
             allowEmpty: true,
             onSelect: (selected) => {
                 if (displayInput && selected) {
@@ -62,7 +62,6 @@ export function initTreeSelector() {
         inputId: 'organization_display',
         hiddenInputId: 'organization_id',
         modalId: 'orgTreeSelectorModal',
-        apiUrl: '/admin/api/organizations?format=tree',
         allowEmpty: true,
         onSelect: function(selected) {
             // 선택 완료 - 필요시 추가 처리 가능
@@ -6,22 +6,13 @@
  * - templates/index.html
  *
  * Dependencies:
- * - SheetJS (xlsx) - Excel 내보내기용 (CDN)
+ * - 없음 (Excel/CSV 파일은 /api/employees/export에서 서버가 생성)
  */
 
 /**
- * 직원 데이터 내보내기 컬럼 설정
+ * 직원 내보내기 API (서버 스트리밍 CSV/XLSX, 직원 목록과 동일한 필터 파라미터)
  */
-const EXPORT_COLUMNS = [
-    { key: 'employee_number', label: '사번', width: 100 },
-    { key: 'name', label: '이름', width: 100 },
-    { key: 'department', label: '부서', width: 100 },
-    { key: 'position', label: '직급', width: 80 },
-    { key: 'email', label: '이메일', width: 180 },
-    { key: 'phone', label: '연락처', width: 120 },
-    { key: 'hire_date', label: '입사일', width: 100 },
-    { key: 'status', label: '상태', width: 80 }
-];
+const EXPORT_URL = '/api/employees/export';
 
 /**
  * 버튼 로딩 상태 설정
@@ -41,81 +32,54 @@ function setButtonLoading(btn, isLoading, loadingText = '처리 중...', default
 }
 
 /**
- * 직원 목록 API에서 데이터 가져오기
- * @returns {Promise<Array>} 직원 목록
+ * 내보내기 URL 생성
+ * @param {string} format - 'xlsx' | 'csv'
+ * @param {Object} filters - 필터 파라미터 (search, department, position, status 등)
+ * @returns {string} 내보내기 URL
  */
-async function fetchEmployees() {
-    const response = await fetch('/api/employees');
-    const result = await response.json();
-
-    if (!result.success || !result.employees || result.employees.length === 0) {
-        throw new Error('내보낼 직원 데이터가 없습니다.');
-    }
-
-    return result.employees;
+function buildExportUrl(format = 'xlsx', filters = {}) {
+    const params = new URLSearchParams({ format });
+    Object.entries(filters).forEach(([key, value]) => {
+        (Array.isArray(value) ? value : [value])
+            .filter(v => v !== undefined && v !== null && v !== '')
+            .forEach(v => params.append(key, v));
+    });
+    return `${EXPORT_URL}?${params.toString()}`;
 }
 
 /**
- * 직원 데이터를 Excel 파일로 내보내기
- * @param {Array} employees - 직원 데이터 배열
- * @param {string} sheetName - 시트 이름
- * @returns {string} 생성된 파일명
+ * 직원 목록 파일 다운로드 (브라우저가 스트리밍 응답을 직접 저장)
+ * @param {string} format - 'xlsx' | 'csv'
+ * @param {Object} filters - 필터 파라미터
  */
-function exportToExcel(employees, sheetName = '직원현황') {
-    // XLSX 라이브러리 확인
-    if (typeof XLSX === 'undefined') {
-        throw new Error('Excel 내보내기 라이브러리가 로드되지 않았습니다.');
-    }
-
-    // 헤더 행 생성
-    const headers = EXPORT_COLUMNS.map(col => col.label);
-
-    // 데이터 행 생성
-    const rows = employees.map(emp =>
-        EXPORT_COLUMNS.map(col => emp[col.key] || '')
-    );
-
-    // 워크시트 데이터 구성
-    const wsData = [headers, ...rows];
-
-    // 워크시트 생성
-    const ws = XLSX.utils.aoa_to_sheet(wsData);
-
-    // 컬럼 너비 설정
-    ws['!cols'] = EXPORT_COLUMNS.map(col => ({ wch: col.width / 8 || 15 }));
-
-    // 워크북 생성
-    const wb = XLSX.utils.book_new();
-    XLSX.utils.book_append_sheet(wb, ws, sheetName);
-
-    // 파일명 생성 (YYYYMMDD 형식)
-    const timestamp = new Date().toISOString().slice(0, 10).replace(/-/g, '');
-    const filename = `${sheetName}_${timestamp}.xlsx`;
-
-    // 파일 다운로드
-    XLSX.writeFile(wb, filename);
-
-    return filename;
+function downloadEmployees(format = 'xlsx', filters = {}) {
+    const link = document.createElement('a');
+    link.href = buildExportUrl(format, filters);
+    link.rel = 'noopener';
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
 }
 
 /**
  * 내보내기 버튼 클릭 핸들러
  * @param {Event} event - 클릭 이벤트
  */
-async function handleExportClick(event) {
+function handleExportClick(event) {
     const btn = event.currentTarget;
+    const format = btn.dataset.exportFormat || 'xlsx';
 
     setButtonLoading(btn, true, '내보내기 중...', '내보내기', 'fa-download');
-
     try {
-        const employees = await fetchEmployees();
-        const filename = exportToExcel(employees);
-        alert(`${employees.length}명의 직원 정보가 내보내기되었습니다.`);
+        downloadEmployees(format);
     } catch (error) {
         console.error('Export error:', error);
         alert(error.message || '내보내기 중 오류가 발생했습니다.');
     } finally {
-        setButtonLoading(btn, false, '내보내기 중...', '내보내기', 'fa-download');
+        // 다운로드는 브라우저가 처리하므로 중복 클릭만 잠시 방지
+        setTimeout(() => {
+            setButtonLoading(btn, false, '내보내기 중...', '내보내기', 'fa-download');
+        }, 1500);
     }
 }
 
@@ -145,10 +109,9 @@ if (typeof module !== 'undefined' && module.exports) {
         initDashboard,
         initDashboardExport,
         handleExportClick,
-        exportToExcel,
-        fetchEmployees,
-        setButtonLoading,
-        EXPORT_COLUMNS
+        buildExportUrl,
+        downloadEmployees,
+        setButtonLoading
     };
 }
 
@@ -157,6 +120,6 @@ window.DashboardModule = {
     initDashboard,
     initDashboardExport,
     handleExportClick,
-    exportToExcel,
-    fetchEmployees
+    buildExportUrl,
+    downloadEmployees
 };
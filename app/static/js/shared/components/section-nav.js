@@ -21,6 +21,7 @@ export class SectionNav {
      * @param {string} options.toggleBtnId - 모바일 토글 버튼 ID (기본: 'mobileNavToggle')
      * @param {number} options.scrollOffset - 스크롤 오프셋 (기본: 80)
      * @param {string} options.rootMargin - IntersectionObserver rootMargin (기본: '-100px 0px -50% 0px')
+     * @param {Function} options.resolveMissingTarget - 대상 섹션이 아직 없을 때 호출 (id => Promise<HTMLElement|null>, 지연 로딩 섹션용)
      */
     constructor(options = {}) {
         this.options = {
@@ -31,7 +32,8 @@ export class SectionNav {
             overlayId: options.overlayId || 'sectionNavOverlay',
             toggleBtnId: options.toggleBtnId || 'mobileNavToggle',
             scrollOffset: options.scrollOffset || 80,
-            rootMargin: options.rootMargin || '-100px 0px -50% 0px'
+            rootMargin: options.rootMargin || '-100px 0px -50% 0px',
+            resolveMissingTarget: options.resolveMissingTarget || null
         };
 
         this.sections = null;
@@ -85,6 +87,21 @@ export class SectionNav {
         });
     }
 
+    /**
+     * 섹션 목록 갱신 - 나중에 삽입된 섹션(지연 로딩)을 스크롤 스파이에 추가
+     */
+    refresh() {
+        this.sections = document.querySelectorAll(this.options.sectionSelector);
+
+        if (!this.observer) {
+            this.initScrollSpy();
+            return;
+        }
+        this.sections.forEach(section => {
+            this.observer.observe(section);
+        });
+    }
+
     /**
      * 활성 네비게이션 아이템 설정
      * @param {string} sectionId - 활성화할 섹션 ID
@@ -108,11 +125,16 @@ export class SectionNav {
      */
     initSmoothScroll() {
         this.navItems.forEach(item => {
-            item.addEventListener('click', (e) => {
+            item.addEventListener('click', async (e) => {
                 e.preventDefault();
 
                 const targetId = item.getAttribute('href');
-                const targetSection = document.querySelector(targetId);
+                let targetSection = document.querySelector(targetId);
+
+                // 아직 로딩되지 않은 섹션이면 먼저 불러온 후 스크롤
+                if (!targetSection && this.options.resolveMissingTarget) {
+                    targetSection = await this.options.resolveMissingTarget(targetId.slice(1));
+                }
 
                 if (targetSection) {
                     this.scrollToSection(targetSection);
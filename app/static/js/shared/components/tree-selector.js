@@ -6,11 +6,13 @@
  */
 
 class TreeSelector {
+    static treeCache = new Map();
+
     constructor(options = {}) {
         this.inputId = options.inputId;
         this.hiddenInputId = options.hiddenInputId;
         this.modalId = options.modalId || 'treeSelectorModal';
-        this.apiUrl = options.apiUrl || '/admin/api/organizations?format=tree';
+        this.apiUrl = options.apiUrl || '/admin/api/organizations?format=selector';
         this.placeholder = options.placeholder || '조직을 선택하세요';
         this.allowEmpty = options.allowEmpty !== false;
         this.onSelect = options.onSelect || null;
@@ -30,8 +32,7 @@ class TreeSelector {
 
     async loadTreeData() {
         try {
-            const response = await fetch(this.apiUrl);
-            const result = await response.json();
+            const result = await TreeSelector.fetchTree(this.apiUrl);
             if (result.success) {
                 this.treeData = result.data;
             }
@@ -41,6 +42,23 @@ class TreeSelector {
         }
     }
 
+    /**
+     * 동일 URL 트리 요청을 페이지 내 선택기 간에 공유
+     * (서버 ETag로 재방문 시 304 재검증)
+     */
+    static fetchTree(apiUrl) {
+        if (!TreeSelector.treeCache.has(apiUrl)) {
+            const request = fetch(apiUrl)
+                .then(response => response.json())
+                .catch(error => {
+                    TreeSelector.treeCache.delete(apiUrl);
+                    throw error;
+                });
+            TreeSelector.treeCache.set(apiUrl, request);
+        }
+        return TreeSelector.treeCache.get(apiUrl);
+    }
+
     createModal() {
         // 이미 모달이 있으면 제거
         const existingModal = document.getElementById(this.modalId);
@@ -1,7 +1,7 @@
 /**
  * 페이지네이션 유틸리티
  * - 기존 URL 파라미터 유지
- * - per_page 변경 시 page=1로 초기화
+ * - per_page 변경 시 page=1로 초기화 (커서 페이지네이션은 첫 페이지로)
  */
 
 /**
@@ -12,6 +12,7 @@ function updatePerPage(value) {
     const url = new URL(window.location.href);
     url.searchParams.set('per_page', value);
     url.searchParams.set('page', '1'); // 페이지 초기화
+    url.searchParams.delete('cursor');
     window.location.href = url.toString();
 }
 
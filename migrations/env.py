@@ -25,7 +25,7 @@ from app import create_app
 from app.database import db
 
 # Import all models to ensure they are registered with SQLAlchemy
-from app.domains.company.models import ClassificationOption, Company, Organization
+from app.domains.company.models import ClassificationOption, Company, Organization, OrganizationClosure, OrgScopeVersion, OrgHeadcount
 from app.domains.employee.models import (
     Asset,
     Attendance,
@@ -0,0 +1,49 @@
+"""Add organization_closure table
+
+조직 계층 클로저 테이블 (ancestor, descendant, depth) 추가 및 기존 트리 백필.
+get_descendants/get_ancestors/get_level 및 테넌트 필터를 단일 인덱스 쿼리로 처리합니다.
+
+Revision ID: 1a2b3c4d5e6f
+Revises: 0k1l2m3n4o5p
+Create Date: 2026-01-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a2b3c4d5e6f'
+down_revision = '0k1l2m3n4o5p'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create organization_closure and backfill from organizations.parent_id"""
+    op.create_table(
+        'organization_closure',
+        sa.Column('ancestor_id', sa.Integer(), sa.ForeignKey('organizations.id'), primary_key=True),
+        sa.Column('descendant_id', sa.Integer(), sa.ForeignKey('organizations.id'), primary_key=True),
+        sa.Column('depth', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index('idx_org_closure_descendant', 'organization_closure', ['descendant_id', 'depth'])
+
+    # 기존 트리 백필 (재귀 CTE, 순환 데이터 방지를 위해 depth 제한)
+    op.execute("""
+        INSERT INTO organization_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE org_tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM organizations
+            UNION ALL
+            SELECT t.ancestor_id, o.id, t.depth + 1
+            FROM org_tree t
+            JOIN organizations o ON o.parent_id = t.descendant_id
+            WHERE t.depth < 64
+        )
+        SELECT ancestor_id, descendant_id, depth FROM org_tree
+    """)
+
+
+def downgrade():
+    """Drop organization_closure"""
+    op.drop_index('idx_org_closure_descendant', 'organization_closure')
+    op.drop_table('organization_closure')
@@ -0,0 +1,32 @@
+"""Add company_id tenant scope indexes
+
+employees.company_id 직접 필터(TENANT_SCOPE_MODE=company_id)를 위한 인덱스 추가.
+companies.root_organization_id는 루트 조직 -> 회사 ID 해석에 사용됩니다.
+
+기존 데이터 정합성은 `flask check-employee-company-ids` /
+`flask backfill-employee-company-ids`로 확인/보정합니다.
+
+Revision ID: 2b3c4d5e6f7a
+Revises: 1a2b3c4d5e6f
+Create Date: 2026-01-21
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2b3c4d5e6f7a'
+down_revision = '1a2b3c4d5e6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create company scope indexes"""
+    op.create_index('ix_employees_company_id', 'employees', ['company_id'])
+    op.create_index('ix_companies_root_organization_id', 'companies', ['root_organization_id'])
+
+
+def downgrade():
+    """Drop company scope indexes"""
+    op.drop_index('ix_companies_root_organization_id', 'companies')
+    op.drop_index('ix_employees_company_id', 'employees')
@@ -0,0 +1,41 @@
+"""Add org_scope_versions table
+
+테넌트(루트 조직)별 조직 구조 버전 카운터 테이블 생성.
+조직 변경 시 버전이 증가하며, 프로세스 캐시(org_scope_cache)가
+다른 워커의 변경을 감지하는 데 사용합니다.
+
+Revision ID: 3c4d5e6f7a8b
+Revises: 2b3c4d5e6f7a
+Create Date: 2026-01-22
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c4d5e6f7a8b'
+down_revision = '2b3c4d5e6f7a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create org_scope_versions and seed root organizations"""
+    op.create_table(
+        'org_scope_versions',
+        sa.Column('root_organization_id', sa.Integer(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.execute("""
+        INSERT INTO org_scope_versions (root_organization_id, version, updated_at)
+        SELECT id, 1, CURRENT_TIMESTAMP
+        FROM organizations
+        WHERE parent_id IS NULL
+    """)
+
+
+def downgrade():
+    """Drop org_scope_versions"""
+    op.drop_table('org_scope_versions')
@@ -0,0 +1,45 @@
+"""Add org_headcount rollup table
+
+조직별 (상태별) 직접/하위 트리 인원 롤업 테이블 생성 및 기존 데이터 백필.
+이후 갱신은 Employee/Organization 이벤트 리스너에서 증분 처리됩니다.
+
+Revision ID: 4d5e6f7a8b9c
+Revises: 3c4d5e6f7a8b
+Create Date: 2026-01-23
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d5e6f7a8b9c'
+down_revision = '3c4d5e6f7a8b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create org_headcount and backfill from employees"""
+    op.create_table(
+        'org_headcount',
+        sa.Column('organization_id', sa.Integer(), sa.ForeignKey('organizations.id'), primary_key=True),
+        sa.Column('status', sa.String(50), primary_key=True),
+        sa.Column('direct_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('subtree_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute("""
+        INSERT INTO org_headcount (organization_id, status, direct_count, subtree_count)
+        SELECT c.ancestor_id,
+               COALESCE(e.status, ''),
+               SUM(CASE WHEN c.depth = 0 THEN 1 ELSE 0 END),
+               COUNT(*)
+        FROM employees e
+        JOIN organization_closure c ON c.descendant_id = e.organization_id
+        GROUP BY c.ancestor_id, COALESCE(e.status, '')
+    """)
+
+
+def downgrade():
+    """Drop org_headcount"""
+    op.drop_table('org_headcount')
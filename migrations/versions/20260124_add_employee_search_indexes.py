@@ -0,0 +1,90 @@
+"""Add employee search indexes and name_choseong column
+
+- employees.name_choseong: 이름 초성 (예: 김민수 -> ㄱㅁㅅ), 초성 검색용
+- PostgreSQL: pg_trgm 확장 + 검색 컬럼 GIN trigram 인덱스 (ILIKE '%term%' 인덱스 사용)
+  대상: name, english_name, employee_number, department, position, email, name_choseong
+- 다른 DB(SQLite 등)는 name_choseong B-tree 인덱스만 생성
+
+Revision ID: 5e6f7a8b9c0d
+Revises: 4d5e6f7a8b9c
+Create Date: 2026-01-24
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e6f7a8b9c0d'
+down_revision = '4d5e6f7a8b9c'
+branch_labels = None
+depends_on = None
+
+TRGM_COLUMNS = ('name', 'english_name', 'employee_number', 'department', 'position', 'email', 'name_choseong')
+BATCH_SIZE = 1000
+
+# 마이그레이션 시점 고정 (app.shared.utils.korean_search.to_choseong과 동일 규칙)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+
+def _to_choseong(text):
+    if not text:
+        return None
+    result = []
+    for char in text:
+        code = ord(char)
+        if 0xAC00 <= code <= 0xD7A3:
+            result.append(CHOSEONG[(code - 0xAC00) // 588])
+        elif not char.isspace():
+            result.append(char.lower())
+    return ''.join(result) or None
+
+
+def _is_postgresql():
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade():
+    """Add name_choseong, backfill, create search indexes"""
+    op.add_column('employees', sa.Column('name_choseong', sa.String(100), nullable=True))
+    op.create_index('ix_employees_name_choseong', 'employees', ['name_choseong'])
+
+    # 기존 직원 초성 백필 (배치당 UPDATE executemany 1회)
+    conn = op.get_bind()
+    employees = sa.table('employees', sa.column('id', sa.Integer), sa.column('name', sa.String),
+                         sa.column('name_choseong', sa.String))
+    backfill = (
+        employees.update()
+        .where(employees.c.id == sa.bindparam('_id'))
+        .values(name_choseong=sa.bindparam('_choseong'))
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(employees.c.id, employees.c.name)
+            .where(employees.c.id > last_id)
+            .order_by(employees.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        conn.execute(backfill, [
+            {'_id': row.id, '_choseong': _to_choseong(row.name)} for row in rows
+        ])
+        last_id = rows[-1].id
+
+    if _is_postgresql():
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in TRGM_COLUMNS:
+            op.execute(
+                f'CREATE INDEX IF NOT EXISTS ix_employees_{column}_trgm '
+                f'ON employees USING gin ({column} gin_trgm_ops)'
+            )
+
+
+def downgrade():
+    """Drop search indexes and name_choseong"""
+    if _is_postgresql():
+        for column in TRGM_COLUMNS:
+            op.execute(f'DROP INDEX IF EXISTS ix_employees_{column}_trgm')
+    op.drop_index('ix_employees_name_choseong', 'employees')
+    op.drop_column('employees', 'name_choseong')
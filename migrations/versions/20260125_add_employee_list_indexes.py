@@ -0,0 +1,45 @@
+"""Add employee list composite indexes
+
+EmployeeRepository 목록/필터/정렬/통계 쿼리용 복합 인덱스 추가.
+
+- 조직 트리 스코프 (organization_id IN 하위 조직): 상태/부서/직급 필터, 입사일/이름 정렬,
+  상태별 통계(GROUP BY status), 최근 입사자(ORDER BY hire_date DESC)
+- 회사 스코프 (TENANT_SCOPE_MODE=company_id): 상태 필터/통계, 최근 입사자
+
+organization_id 단일 조회는 선두 컬럼이 같은 복합 인덱스를 사용합니다.
+쿼리 계획 회귀 테스트: tests/unit/repositories/test_employee_query_plans.py
+
+Revision ID: 6f7a8b9c0d1e
+Revises: 5e6f7a8b9c0d
+Create Date: 2026-01-25
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6f7a8b9c0d1e'
+down_revision = '5e6f7a8b9c0d'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('idx_employees_org_status', ['organization_id', 'status']),
+    ('idx_employees_org_department', ['organization_id', 'department']),
+    ('idx_employees_org_position', ['organization_id', 'position']),
+    ('idx_employees_org_hire_date', ['organization_id', 'hire_date']),
+    ('idx_employees_org_name', ['organization_id', 'name']),
+    ('idx_employees_company_status', ['company_id', 'status']),
+    ('idx_employees_company_hire_date', ['company_id', 'hire_date']),
+)
+
+
+def upgrade():
+    """Create employee list composite indexes"""
+    for name, columns in INDEXES:
+        op.create_index(name, 'employees', columns)
+
+
+def downgrade():
+    """Drop employee list composite indexes"""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, 'employees')
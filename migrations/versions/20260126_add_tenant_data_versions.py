@@ -0,0 +1,41 @@
+"""Add tenant_data_versions table
+
+테넌트(루트 조직)별 목록 데이터 버전 카운터 테이블 생성.
+직원/조직/계약/분류 옵션 변경 시 버전이 증가하며,
+직원 목록 화면/API의 ETag(If-None-Match → 304)에 사용합니다.
+
+Revision ID: 7a8b9c0d1e2f
+Revises: 6f7a8b9c0d1e
+Create Date: 2026-01-26
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a8b9c0d1e2f'
+down_revision = '6f7a8b9c0d1e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create tenant_data_versions and seed root organizations"""
+    op.create_table(
+        'tenant_data_versions',
+        sa.Column('root_organization_id', sa.Integer(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    op.execute("""
+        INSERT INTO tenant_data_versions (root_organization_id, version, updated_at)
+        SELECT id, 1, CURRENT_TIMESTAMP
+        FROM organizations
+        WHERE parent_id IS NULL
+    """)
+
+
+def downgrade():
+    """Drop tenant_data_versions"""
+    op.drop_table('tenant_data_versions')
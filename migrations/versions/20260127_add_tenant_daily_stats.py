@@ -0,0 +1,40 @@
+"""Add tenant_daily_stats table
+
+테넌트(루트 조직)별 일별 직원 현황 스냅샷 테이블 생성.
+직원/조직/계약 변경 flush 시 당일 행이 재계산되며,
+`flask refresh-tenant-daily-stats`로 전체 테넌트의 당일 행을 생성/보정합니다.
+(초기 데이터는 배포 후 CLI 1회 실행으로 생성)
+
+Revision ID: 8b9c0d1e2f3a
+Revises: 7a8b9c0d1e2f
+Create Date: 2026-01-27
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b9c0d1e2f3a'
+down_revision = '7a8b9c0d1e2f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create tenant_daily_stats"""
+    op.create_table(
+        'tenant_daily_stats',
+        sa.Column('root_organization_id', sa.Integer(), nullable=False),
+        sa.Column('stat_date', sa.Date(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('active', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('on_leave', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('resigned', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('root_organization_id', 'stat_date'),
+    )
+
+
+def downgrade():
+    """Drop tenant_daily_stats"""
+    op.drop_table('tenant_daily_stats')
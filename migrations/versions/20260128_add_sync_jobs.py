@@ -0,0 +1,55 @@
+"""Add sync_jobs table
+
+개인 -> 법인 자동 동기화 작업 큐 테이블 생성.
+프로필 저장 커밋 후 (user_id, contract_id)별 작업을 적재하고,
+워커(앱 내 스레드 또는 `flask run-sync-worker`)가 처리합니다.
+
+Revision ID: 9c0d1e2f3a4b
+Revises: 8b9c0d1e2f3a
+Create Date: 2026-01-28
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c0d1e2f3a4b'
+down_revision = '8b9c0d1e2f3a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create sync_jobs"""
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('contract_id', sa.Integer(), nullable=False),
+        sa.Column('sync_type', sa.String(length=30), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('requested_at', sa.DateTime(), nullable=False),
+        sa.Column('next_run_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['contract_id'], ['person_corporate_contracts.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'contract_id', name='uq_sync_jobs_user_contract'),
+    )
+    op.create_index('ix_sync_jobs_user_id', 'sync_jobs', ['user_id'])
+    op.create_index('ix_sync_jobs_contract_id', 'sync_jobs', ['contract_id'])
+    op.create_index('ix_sync_jobs_status_next_run_at', 'sync_jobs', ['status', 'next_run_at'])
+
+
+def downgrade():
+    """Drop sync_jobs"""
+    op.drop_index('ix_sync_jobs_status_next_run_at', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_contract_id', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_user_id', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
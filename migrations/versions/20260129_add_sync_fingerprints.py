@@ -0,0 +1,38 @@
+"""Add sync_fingerprints table
+
+개인 -> 법인 관계 데이터(학력/경력/자격증/어학/가족) 동기화 지문 테이블 생성.
+(계약, 관계 유형)별 마지막 동기화 내용 해시를 저장하여 변경 없는 관계는 동기화를 생략합니다.
+
+Revision ID: 0d1e2f3a4b5c
+Revises: 9c0d1e2f3a4b
+Create Date: 2026-01-29
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d1e2f3a4b5c'
+down_revision = '9c0d1e2f3a4b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create sync_fingerprints"""
+    op.create_table(
+        'sync_fingerprints',
+        sa.Column('contract_id', sa.Integer(), nullable=False),
+        sa.Column('relation_type', sa.String(length=30), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['contract_id'], ['person_corporate_contracts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('contract_id', 'relation_type'),
+    )
+
+
+def downgrade():
+    """Drop sync_fingerprints"""
+    op.drop_table('sync_fingerprints')
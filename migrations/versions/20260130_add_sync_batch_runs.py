@@ -0,0 +1,70 @@
+"""Add sync_batch_runs and sync_batch_items tables
+
+법인 전체 계약 일괄 동기화 실행/계약별 진행 상태 테이블 생성.
+계약을 청크로 나누어 병렬 워커가 처리하고, 중단된 실행은 남은 항목부터 재개합니다.
+
+Revision ID: 1e2f3a4b5c6d
+Revises: 0d1e2f3a4b5c
+Create Date: 2026-01-30
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1e2f3a4b5c6d'
+down_revision = '0d1e2f3a4b5c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create sync_batch_runs, sync_batch_items"""
+    op.create_table(
+        'sync_batch_runs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column('sync_type', sa.String(length=30), nullable=False),
+        sa.Column('full_sync', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('chunk_size', sa.Integer(), nullable=False, server_default='50'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id']),
+        sa.ForeignKeyConstraint(['requested_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_sync_batch_runs_company_status', 'sync_batch_runs', ['company_id', 'status'])
+
+    op.create_table(
+        'sync_batch_items',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('contract_id', sa.Integer(), nullable=False),
+        sa.Column('chunk', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['sync_batch_runs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['contract_id'], ['person_corporate_contracts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('run_id', 'contract_id', name='uq_sync_batch_items_run_contract'),
+    )
+    op.create_index(
+        'ix_sync_batch_items_run_status_chunk', 'sync_batch_items', ['run_id', 'status', 'chunk']
+    )
+
+
+def downgrade():
+    """Drop sync_batch_items, sync_batch_runs"""
+    op.drop_index('ix_sync_batch_items_run_status_chunk', table_name='sync_batch_items')
+    op.drop_table('sync_batch_items')
+    op.drop_index('ix_sync_batch_runs_company_status', table_name='sync_batch_runs')
+    op.drop_table('sync_batch_runs')
@@ -0,0 +1,32 @@
+"""Add dirty_sections, run_sections, coalesce_since to sync_jobs
+
+연속 프로필 편집의 자동 동기화 요청 병합(디바운스)과 변경 섹션만 동기화하기 위한 컬럼 추가.
+기존 행은 섹션이 NULL(전체 동기화)로 유지됩니다.
+
+Revision ID: 2f3a4b5c6d7e
+Revises: 1e2f3a4b5c6d
+Create Date: 2026-01-31
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f3a4b5c6d7e'
+down_revision = '1e2f3a4b5c6d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add coalescing columns to sync_jobs"""
+    op.add_column('sync_jobs', sa.Column('dirty_sections', sa.Text(), nullable=True))
+    op.add_column('sync_jobs', sa.Column('run_sections', sa.Text(), nullable=True))
+    op.add_column('sync_jobs', sa.Column('coalesce_since', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    """Drop coalescing columns from sync_jobs"""
+    op.drop_column('sync_jobs', 'coalesce_since')
+    op.drop_column('sync_jobs', 'run_sections')
+    op.drop_column('sync_jobs', 'dirty_sections')
@@ -0,0 +1,95 @@
+"""
+to_dict 직렬화 벤치마크
+
+실행: python scripts/benchmark_to_dict.py [행 수]
+
+컴파일 이전 방식(컬럼 순회 + hasattr isoformat)과 컴파일된 직렬화기의
+to_dict(ordered=False) 시간을 비교합니다. (DB 조회 없이 메모리 인스턴스 사용)
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+
+
+def legacy_to_dict(instance):
+    """컴파일 이전 to_dict 알고리즘 (ordered=False)"""
+    cls = type(instance)
+    result = {}
+    for column in cls.__table__.columns:
+        field_name = column.name
+        if field_name in cls.__dict_excludes__:
+            continue
+        value = getattr(instance, field_name)
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        if field_name in cls.__dict_json_fields__ and value:
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        result[field_name] = value
+    for alias_name, actual_field in cls.__dict_aliases__.items():
+        if actual_field in result:
+            result[alias_name] = result[actual_field]
+    for computed_name, compute_fn in cls.__dict_computed__.items():
+        try:
+            result[computed_name] = compute_fn(instance)
+        except Exception:
+            result[computed_name] = None
+    return result
+
+
+def build_rows(count):
+    """벤치마크용 인스턴스 (학력, 감사 로그)"""
+    from app.domains.employee.models import Education
+    from app.domains.platform.models import AuditLog
+
+    educations = [
+        Education(id=i, employee_id=i % 100, school_type='대학교', school_name=f'학교{i}',
+                  major='컴퓨터공학', degree='학사', admission_date='2015-03-02',
+                  graduation_date='2019-02-20', graduation_status='졸업', gpa='3.8/4.5',
+                  location='서울', note=None, display_order=0)
+        for i in range(count)
+    ]
+    audit_logs = [
+        AuditLog(id=i, user_id=i % 50, action='update', resource_type='employee',
+                 resource_id=i, details=json.dumps({'field': 'name', 'index': i}),
+                 status='success', created_at=datetime(2026, 1, 2, 3, 4, 5))
+        for i in range(count)
+    ]
+    return {'Education': educations, 'AuditLog': audit_logs}
+
+
+def measure(fn, rows, repeat=5):
+    """최소 소요 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            fn(row)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = create_app('testing')
+    with app.app_context():
+        for name, rows in build_rows(count).items():
+            assert all(row.to_dict(ordered=False) == legacy_to_dict(row) for row in rows)
+            legacy = measure(legacy_to_dict, rows)
+            compiled = measure(lambda row: row.to_dict(ordered=False), rows)
+            print(f'{name:<10} {count:>6}행  기존 {legacy * 1000:8.1f}ms  '
+                  f'컴파일 {compiled * 1000:8.1f}ms  ({legacy / compiled:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -76,6 +76,28 @@ class TestEmployeePendingList:
         response = auth_client_corporate_full.get('/employees/pending')
         assert response.status_code == 200
 
+    def test_pending_list_paginates(self, session, auth_client_corporate_full, test_company):
+        """계약대기 목록 페이지네이션 (총건수는 전체 대기 인원)"""
+        from app.domains.employee.models import Employee
+
+        for i in range(3):
+            employee = Employee(name=f'대기직원{i}', status='active')
+            session.add(employee)
+            session.flush()
+            user = User(username=f'pending{i}', email=f'pending{i}@test.com',
+                        account_type=User.ACCOUNT_EMPLOYEE_SUB, company_id=test_company.id,
+                        employee_id=employee.id)
+            user.set_password('test1234')
+            session.add(user)
+        session.commit()
+
+        response = auth_client_corporate_full.get('/employees/pending?page=2&per_page=2')
+        html = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert '대기 중인 직원 3명' in html
+        assert '대기직원2' in html
+        assert '대기직원0' not in html
+
 
 class TestEmployeeDetail:
     """직원 상세 조회 테스트"""
@@ -109,6 +131,111 @@ class TestEmployeeDetail:
         assert response.status_code in [200, 302]
 
 
+class TestEmployeeSectionFragments:
+    """인사카드 섹션 조각 (지연 로딩) API 테스트"""
+
+    @pytest.fixture
+    def tenant_employee(self, session, auth_client_corporate_full, test_company):
+        """루트 조직이 연결된 법인 세션과 소속 직원"""
+        from app.domains.company.models import Organization
+        from app.domains.employee.models import Employee
+        root = Organization(name='테스트 본사', code='TEST-HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        test_company.root_organization_id = root.id
+        employee = Employee(name='조각직원', organization_id=root.id,
+                            company_id=test_company.id, status='active')
+        session.add(employee)
+        session.commit()
+        return employee
+
+    def test_detail_renders_lazy_placeholders(self, auth_client_corporate_full, tenant_employee):
+        """인사카드는 이력/인사기록 섹션을 자리표시자로 렌더링"""
+        response = auth_client_corporate_full.get(f'/employees/{tenant_employee.id}')
+        html = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert f'/api/employees/{tenant_employee.id}/sections/history/render' in html
+        assert f'/api/employees/{tenant_employee.id}/sections/hr-records/render' in html
+        assert 'id="education-table"' not in html
+
+    def test_render_section_fragment(self, session, auth_client_corporate_full, tenant_employee):
+        """섹션 조각 HTML 반환"""
+        from app.domains.employee.models import Education
+        session.add(Education(employee_id=tenant_employee.id, school_name='조각대학교'))
+        session.commit()
+
+        response = auth_client_corporate_full.get(
+            f'/api/employees/{tenant_employee.id}/sections/history/render')
+        html = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        assert 'id="education-info"' in html
+        assert '조각대학교' in html
+
+        response = auth_client_corporate_full.get(
+            f'/api/employees/{tenant_employee.id}/sections/hr-records/render')
+        assert response.status_code == 200
+        assert 'id="employment-contract"' in response.get_data(as_text=True)
+
+    def test_render_unknown_section(self, auth_client_corporate_full, tenant_employee):
+        """알 수 없는 섹션은 400"""
+        response = auth_client_corporate_full.get(
+            f'/api/employees/{tenant_employee.id}/sections/unknown/render')
+        assert response.status_code == 400
+
+    def test_render_other_tenant_employee_forbidden(self, session, auth_client_corporate_full,
+                                                    tenant_employee):
+        """다른 테넌트 직원 섹션은 403"""
+        from app.domains.company.models import Organization
+        from app.domains.employee.models import Employee
+        other_root = Organization(name='타사 본사', code='OTHER-HQ', org_type='company')
+        session.add(other_root)
+        session.commit()
+        other = Employee(name='타사직원', organization_id=other_root.id, status='active')
+        session.add(other)
+        session.commit()
+
+        response = auth_client_corporate_full.get(f'/api/employees/{other.id}/sections/history/render')
+        assert response.status_code == 403
+
+    def test_fragment_not_modified_until_relation_change(self, session, auth_client_corporate_full,
+                                                         tenant_employee):
+        """같은 버전은 304, 이력 변경 후 새 조각으로 200"""
+        from app.domains.employee.models import Career
+        url = f'/api/employees/{tenant_employee.id}/sections/history/render'
+        first = auth_client_corporate_full.get(url)
+        etag = first.headers['ETag']
+        assert auth_client_corporate_full.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+        session.add(Career(employee_id=tenant_employee.id, company_name='이전회사'))
+        session.commit()
+        response = auth_client_corporate_full.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert '이전회사' in response.get_data(as_text=True)
+
+        # 일괄 삭제(모델 이벤트 없음)도 버전 증가
+        from app.domains.employee.repositories import CareerRepository
+        etag = response.headers['ETag']
+        assert CareerRepository().delete_by_employee_id(tenant_employee.id) == 1
+        response = auth_client_corporate_full.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert '이전회사' not in response.get_data(as_text=True)
+
+    def test_fragment_etag_changes_with_date(self, auth_client_corporate_full, tenant_employee):
+        """근태 섹션은 올해 기준이므로 날짜가 바뀌면 같은 버전이어도 새 ETag"""
+        from datetime import date
+        from unittest.mock import patch
+        url = f'/api/employees/{tenant_employee.id}/sections/hr-records/render'
+        etag = auth_client_corporate_full.get(url).headers['ETag']
+
+        with patch('app.shared.utils.conditional.date') as mock_date:
+            mock_date.today.return_value = date(date.today().year + 1, 1, 1)
+            response = auth_client_corporate_full.get(url, headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+
 class TestEmployeeNew:
     """직원 등록 폼 테스트"""
 
@@ -326,6 +453,109 @@ class TestEmployeeListAPI:
         data = json.loads(response.data)
         assert 'success' in data or 'employees' in data or 'data' in data
 
+    def test_api_employee_export_csv(self, auth_client_corporate_full, test_employee):
+        """CSV 내보내기 스트리밍 응답"""
+        response = auth_client_corporate_full.get('/api/employees/export?format=csv')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        assert 'attachment' in response.headers['Content-Disposition']
+
+        lines = response.get_data().decode('utf-8-sig').splitlines()
+        assert lines[0].startswith('사번,이름')
+        assert any(test_employee.name in line for line in lines[1:])
+
+    def test_api_employee_export_xlsx(self, auth_client_corporate_full, test_employee):
+        """XLSX 내보내기 응답은 유효한 ZIP(XLSX) 패키지"""
+        import io
+        import zipfile
+        response = auth_client_corporate_full.get('/api/employees/export')
+        assert response.status_code == 200
+
+        archive = zipfile.ZipFile(io.BytesIO(response.get_data()))
+        assert 'xl/worksheets/sheet1.xml' in archive.namelist()
+
+    def test_api_employee_export_invalid_format(self, auth_client_corporate_full):
+        """지원하지 않는 형식"""
+        response = auth_client_corporate_full.get('/api/employees/export?format=pdf')
+        assert response.status_code == 400
+
+
+class TestEmployeeListConditional:
+    """테넌트 데이터 버전 ETag/304 테스트"""
+
+    @pytest.fixture
+    def tenant_client(self, session, auth_client_corporate_full, test_company):
+        """루트 조직이 연결된 법인 세션"""
+        from app.domains.company.models import Organization
+        root = Organization(name='테스트 본사', code='TEST-HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        test_company.root_organization_id = root.id
+        session.commit()
+        self.root_id = root.id
+        return auth_client_corporate_full
+
+    @pytest.mark.parametrize('url', ['/api/employees', '/employees', '/search'])
+    def test_not_modified_until_tenant_write(self, session, tenant_client, url):
+        """같은 버전은 304, 직원 변경 후 새 ETag로 200"""
+        from app.domains.employee.models import Employee
+        first = tenant_client.get(url)
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+        assert first.headers['Cache-Control'] == 'private, no-cache'
+
+        second = tenant_client.get(url, headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.get_data() == b''
+
+        session.add(Employee(name='신규직원', organization_id=self.root_id, status='active'))
+        session.commit()
+        third = tenant_client.get(url, headers={'If-None-Match': etag})
+        assert third.status_code == 200
+        assert third.headers['ETag'] != etag
+
+    def test_trend_etag_changes_at_midnight(self, monkeypatch, tenant_client):
+        """추이 API는 데이터 변경 없이도 날짜가 바뀌면 새 ETag로 200"""
+        from datetime import date
+        import app.shared.utils.conditional as conditional
+
+        first = tenant_client.get('/api/dashboard/trend')
+        etag = first.headers['ETag']
+        assert tenant_client.get('/api/dashboard/trend', headers={'If-None-Match': etag}).status_code == 304
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.fromordinal(date.today().toordinal() + 1)
+
+        monkeypatch.setattr(conditional, 'date', Tomorrow)
+        response = tenant_client.get('/api/dashboard/trend', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_etag_varies_by_query(self, tenant_client):
+        """필터/페이지가 다르면 다른 ETag"""
+        etag = tenant_client.get('/api/employees').headers['ETag']
+        response = tenant_client.get('/api/employees?search=홍', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_api_employee_facets(self, session, tenant_client):
+        """필터 패싯 건수 API"""
+        from app.domains.employee.models import Employee
+        session.add_all([
+            Employee(name='김개발', department='개발팀', status='active', organization_id=self.root_id),
+            Employee(name='이개발', department='개발팀', status='resigned', organization_id=self.root_id),
+        ])
+        session.commit()
+
+        response = tenant_client.get('/api/employees/facets?status=active')
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['department'] == [{'value': '개발팀', 'count': 1}]
+        assert {item['value']: item['count'] for item in data['status']} == {'active': 1, 'resigned': 1}
+        assert data['organization'][0]['label'] == '테스트 본사'
+
 
 class TestLegacyRedirects:
     """레거시 리다이렉트 테스트"""
@@ -29,7 +29,7 @@ class TestMainIndex:
         with patch('app.blueprints.main.employee_service') as mock_service, \
              patch('app.blueprints.main.get_current_organization_id', return_value=1):
             mock_service.get_statistics.return_value = {'total': 10}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
@@ -53,7 +53,7 @@ class TestMainSearch:
             mock_employee.to_dict.return_value = {'id': 1, 'name': '홍길동'}
             mock_service.search_employees.return_value = [mock_employee]
             mock_service.get_statistics.return_value = {'total': 1}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
@@ -84,7 +84,7 @@ class TestMainSearch:
             mock_employee.to_dict.return_value = {'id': 1}
             mock_service.filter_employees.return_value = [mock_employee]
             mock_service.get_statistics.return_value = {'total': 1}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
@@ -153,7 +153,7 @@ class TestMainSearchEdgeCases:
              patch('app.blueprints.main.get_current_organization_id', return_value=1):
             mock_service.get_all_employees.return_value = []
             mock_service.get_statistics.return_value = {'total': 0}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
@@ -168,7 +168,7 @@ class TestMainSearchEdgeCases:
             mock_employee.to_dict.return_value = {'id': 1}
             mock_service.filter_employees.return_value = [mock_employee]
             mock_service.get_statistics.return_value = {'total': 1}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
@@ -182,7 +182,7 @@ class TestMainSearchEdgeCases:
              patch('app.blueprints.main.get_current_organization_id', return_value=1):
             mock_service.get_all_employees.return_value = []
             mock_service.get_statistics.return_value = {'total': 0}
-            mock_service.get_department_statistics.return_value = {}
+            mock_service.get_department_statistics.return_value = []
             mock_service.get_recent_employees.return_value = []
             mock_service.get_all_classification_options.return_value = {}
 
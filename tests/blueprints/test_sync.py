@@ -170,6 +170,41 @@ class TestSyncAllContractsAPI:
         assert response.status_code == 200
 
 
+class TestSyncJobsAPI:
+    """자동 동기화 작업 상태 조회 테스트"""
+
+    def test_get_sync_jobs_requires_login(self, client):
+        """작업 상태 조회 로그인 필요 테스트"""
+        response = client.get('/api/sync/jobs')
+        assert response.status_code in [401, 302]
+
+    def test_get_sync_jobs_personal(
+        self, session, auth_client_personal_full, test_user_personal, test_contract_approved
+    ):
+        """개인 계정 작업 상태 조회 (적재된 작업 반환)"""
+        from app.domains.contract.models import DataSharingSettings
+        from app.domains.sync.services.sync_job_service import sync_job_service
+
+        session.add(DataSharingSettings(contract_id=test_contract_approved.id, is_realtime_sync=True))
+        session.commit()
+        sync_job_service.enqueue_for_user(test_user_personal.id)
+
+        response = auth_client_personal_full.get('/api/sync/jobs')
+        assert response.status_code == 200
+
+        jobs = json.loads(response.data)['data']['jobs']
+        assert [(job['contract_id'], job['status']) for job in jobs] == [
+            (test_contract_approved.id, 'pending')
+        ]
+        assert 'locked_by' not in jobs[0]
+
+        response = auth_client_personal_full.get(
+            f'/api/sync/jobs/contract/{test_contract_approved.id}'
+        )
+        assert response.status_code == 200
+        assert len(json.loads(response.data)['data']['jobs']) == 1
+
+
 class TestFieldMappingsAPI:
     """필드 매핑 조회 테스트"""
 
@@ -369,3 +404,35 @@ class TestTerminationHistoryAPI:
             '/api/sync/termination-history?limit=10'
         )
         assert response.status_code == 200
+
+
+class TestSyncBatchAPI:
+    """법인 일괄 동기화 API 테스트"""
+
+    def test_batch_requires_corporate_account(self, auth_client_personal_full):
+        """일괄 동기화 법인 계정 필요 테스트"""
+        response = auth_client_personal_full.post('/api/sync/batch')
+        assert response.status_code in [401, 403]
+
+    def test_start_and_poll_batch(self, client, test_user_corporate, test_company, test_contract_approved):
+        """일괄 동기화 시작 후 진행률 폴링"""
+        with client.session_transaction() as sess:
+            sess[SessionKeys.USER_ID] = test_user_corporate.id
+            sess[SessionKeys.ACCOUNT_TYPE] = User.ACCOUNT_CORPORATE
+            sess[SessionKeys.COMPANY_ID] = test_company.id
+            sess[SessionKeys.USER_ROLE] = test_user_corporate.role
+
+        response = client.post('/api/sync/batch', data=json.dumps({}), content_type='application/json')
+        assert response.status_code == 202
+        run = json.loads(response.data)['data']
+        assert run['total'] == 1
+        assert run['progress']['remaining'] == 1
+
+        response = client.get(f"/api/sync/batch/{run['id']}")
+        assert response.status_code == 200
+        assert json.loads(response.data)['data']['id'] == run['id']
+
+        with client.session_transaction() as sess:
+            sess[SessionKeys.COMPANY_ID] = test_company.id + 1
+        response = client.get(f"/api/sync/batch/{run['id']}")
+        assert response.status_code == 404
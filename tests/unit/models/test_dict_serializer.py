@@ -0,0 +1,123 @@
+"""
+DictSerializableMixin 컴파일 직렬화기 테스트
+
+모든 DictSerializableMixin 모델에서 컴파일된 to_dict 결과가
+기존 컬럼 순회 방식(getattr + hasattr isoformat + JSON 파싱)과 같은지 검증
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import types as sqltypes
+from sqlalchemy.orm import configure_mappers
+
+from app.database import db as _db
+from app.shared.models.mixins import DictSerializableMixin
+
+
+def _legacy_to_dict(instance):
+    """컴파일 이전 to_dict 알고리즘 (ordered=False)"""
+    cls = type(instance)
+    result = {}
+    for column in cls.__table__.columns:
+        field_name = column.name
+        if field_name in cls.__dict_excludes__:
+            continue
+        value = getattr(instance, field_name)
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        if field_name in cls.__dict_json_fields__ and value:
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        result[field_name] = value
+    for alias_name, actual_field in cls.__dict_aliases__.items():
+        if actual_field in result:
+            result[alias_name] = result[actual_field]
+    for computed_name, compute_fn in cls.__dict_computed__.items():
+        try:
+            result[computed_name] = compute_fn(instance)
+        except Exception:
+            result[computed_name] = None
+    return result
+
+
+def _sample_value(column, index):
+    """컬럼 타입별 샘플 값"""
+    if isinstance(column.type, sqltypes.Boolean):
+        return index % 2 == 0
+    if isinstance(column.type, sqltypes.Integer):
+        return index + 1
+    if isinstance(column.type, sqltypes.Numeric):
+        return Decimal('12.50')
+    if isinstance(column.type, sqltypes.DateTime):
+        return datetime(2026, 1, 2, 3, 4, 5)
+    if isinstance(column.type, sqltypes.Date):
+        return date(2026, 1, 2)
+    if isinstance(column.type, sqltypes.JSON):
+        return {'key': index}
+    return f'value-{index}'
+
+
+def _serializable_models():
+    configure_mappers()
+    return sorted(
+        (mapper.class_ for mapper in _db.Model.registry.mappers
+         if issubclass(mapper.class_, DictSerializableMixin)),
+        key=lambda cls: cls.__name__,
+    )
+
+
+class TestCompiledDictSerializer:
+    """컴파일된 to_dict 직렬화기 테스트"""
+
+    def test_serializer_compiled_at_mapper_configure(self, app):
+        """매퍼 구성 후 모든 모델에 직렬화기 생성"""
+        models = _serializable_models()
+        assert models
+        for cls in models:
+            assert '_dict_serializer' in cls.__dict__, cls.__name__
+
+    def test_output_matches_legacy(self, app):
+        """샘플 값 / 빈 값 모두 기존 알고리즘과 같은 결과"""
+        for cls in _serializable_models():
+            filled = cls()
+            for index, column in enumerate(cls.__table__.columns):
+                setattr(filled, column.key, _sample_value(column, index))
+            for instance in (filled, cls()):
+                assert instance.to_dict(ordered=False) == _legacy_to_dict(instance), cls.__name__
+
+    def test_string_column_holding_date_still_formatted(self, app):
+        """문자열 날짜 컬럼에 flush 전 date 객체가 있어도 ISO 포맷"""
+        from app.domains.employee.models import Education
+
+        education = Education(graduation_date=date(2020, 2, 20))
+        assert education.to_dict(ordered=False)['graduation_date'] == '2020-02-20'
+
+    def test_expired_instance_reloads_values(self, session):
+        """commit 후 만료된 속성은 getattr로 다시 로드"""
+        from app.domains.employee.models import Education
+
+        education = Education(school_name='한국대학교', graduation_date='2020-02-20')
+        session.add(education)
+        session.commit()
+        assert 'school_name' not in education.__dict__
+
+        result = education.to_dict(ordered=False)
+        assert result['school_name'] == '한국대학교'
+        assert result['id'] == education.id
+
+    @pytest.mark.parametrize('raw, expected', [
+        ('{"a": 1}', {'a': 1}),
+        ('not-json', 'not-json'),
+        ('', ''),
+        (None, None),
+    ])
+    def test_json_field_parsing(self, app, raw, expected):
+        """JSON 필드 파싱, 실패 시 원래 값"""
+        from app.domains.user.models import Notification
+
+        notification = Notification(extra_data=raw)
+        assert notification.to_dict(ordered=False)['extra_data'] == expected
@@ -0,0 +1,131 @@
+"""
+테넌트 일별 현황 스냅샷 테스트
+
+직원 변경 flush 시 당일 스냅샷 증분 갱신, 전체 보정(refresh_daily_stats), 대시보드 조회 테스트
+"""
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.domains.company.models import Organization, TenantDailyStats, TenantDataVersion
+from app.domains.company.repositories import organization_repository
+from app.domains.employee.models import Employee
+from app.domains.employee.services import employee_service
+
+
+class TestTenantDailyStats:
+    """TenantDailyStats 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테넌트 2개 (본사 + 부서)"""
+        self.session = session
+        self.tenants = []
+        for code in ('A', 'B'):
+            root = Organization(name=f'본사{code}', code=code, org_type='company')
+            session.add(root)
+            session.commit()
+            dept = Organization(name='개발팀', code=f'{code}-DEV', org_type='department',
+                                parent_id=root.id)
+            session.add(dept)
+            session.commit()
+            self.tenants.append((root.id, dept.id))
+
+    def _today(self, root_id):
+        return TenantDailyStats.query.get((root_id, date.today()))
+
+    def test_employee_write_refreshes_own_tenant_snapshot(self, session):
+        """직원 생성/상태 변경 시 해당 테넌트의 당일 행만 갱신"""
+        (root_a, dept_a), (root_b, _) = self.tenants
+        session.add_all([
+            Employee(name='재직1', organization_id=dept_a, status='active'),
+            Employee(name='재직2', organization_id=dept_a, status='active'),
+            Employee(name='휴직1', organization_id=dept_a, status='on_leave'),
+        ])
+        session.commit()
+
+        snapshot = self._today(root_a)
+        assert (snapshot.total, snapshot.active, snapshot.on_leave, snapshot.resigned) == (3, 2, 1, 0)
+        assert self._today(root_b) is None
+
+        Employee.query.filter_by(name='재직2').one().status = 'resigned'
+        session.commit()
+        session.expire_all()
+        snapshot = self._today(root_a)
+        assert (snapshot.active, snapshot.resigned) == (1, 1)
+        assert snapshot.to_statistics() == employee_service.get_statistics(organization_id=root_a)
+
+    def test_employee_write_applies_delta_without_recount(self, session):
+        """직원 변경은 전체 재집계 없이 증감만 반영, 당일 행이 없으면 직전 스냅샷에서 시작"""
+        (root_a, dept_a), (_, dept_b) = self.tenants
+        session.add(TenantDailyStats(root_organization_id=root_a, stat_date=date.today() - timedelta(days=3),
+                                     total=10, active=8, on_leave=1, resigned=1))
+        session.commit()
+
+        from app.domains.employee.repositories.employee_repository import EmployeeRepository
+        with patch.object(EmployeeRepository, 'get_statistics') as get_statistics:
+            employee = Employee(name='신규', organization_id=dept_a, status='active')
+            session.add(employee)
+            session.commit()
+            employee.status = 'on_leave'
+            session.commit()
+            employee.organization_id = dept_b
+            session.commit()
+
+        get_statistics.assert_not_called()
+        (root_a, _), (root_b, _) = self.tenants
+        snapshot = self._today(root_a)
+        assert (snapshot.total, snapshot.active, snapshot.on_leave, snapshot.resigned) == (10, 8, 1, 1)
+        snapshot = self._today(root_b)
+        assert (snapshot.total, snapshot.active, snapshot.on_leave, snapshot.resigned) == (1, 0, 1, 0)
+
+    def test_rolled_back_write_leaves_snapshot(self, session):
+        """롤백된 변경은 스냅샷에 반영되지 않고 다음 flush에도 남지 않음"""
+        (root_a, dept_a), _ = self.tenants
+        session.add(Employee(name='취소', organization_id=dept_a, status='active'))
+        session.flush()
+        session.rollback()
+        session.add(Employee(name='재직', organization_id=dept_a, status='active'))
+        session.commit()
+
+        assert self._today(root_a).total == 1
+
+    def test_refresh_daily_stats_covers_all_tenants(self, session):
+        """전체 보정은 직원이 없는 테넌트도 행 생성, 재실행 시 갱신"""
+        (root_a, dept_a), (root_b, _) = self.tenants
+        session.add(Employee(name='재직1', organization_id=dept_a, status='active'))
+        session.commit()
+
+        assert organization_repository.refresh_daily_stats() == 2
+        assert organization_repository.refresh_daily_stats() == 2
+        assert self._today(root_a).active == 1
+        assert self._today(root_b).total == 0
+        assert [s['active'] for s in employee_service.get_headcount_trend(root_a, days=7)] == [1]
+
+        backfill = date(2026, 1, 1)
+        organization_repository.refresh_daily_stats(stat_date=backfill)
+        rows = organization_repository.find_daily_stats(root_a, backfill)
+        assert [row.stat_date for row in rows] == [backfill, date.today()]
+
+    def test_refresh_daily_stats_bumps_tenant_version(self, session):
+        """전체 보정은 모델 이벤트 없이 기록되므로 모든 테넌트 버전 증가 (캐시된 추이 무효화)"""
+        versions = {root_id: TenantDataVersion.get_version(root_id) for root_id, _ in self.tenants}
+
+        organization_repository.refresh_daily_stats()
+
+        assert {root_id: TenantDataVersion.get_version(root_id) for root_id in versions} == {
+            root_id: version + 1 for root_id, version in versions.items()
+        }
+
+    def test_dashboard_uses_snapshot(self, session):
+        """대시보드 현황은 당일 스냅샷, 최근 입사자는 프로젝션 행"""
+        (root_a, dept_a), _ = self.tenants
+        session.add(Employee(name='신규', organization_id=dept_a, status='active',
+                             hire_date='2026-01-02'))
+        session.commit()
+
+        dashboard = employee_service.get_dashboard(organization_id=root_a)
+        assert dashboard['stats']['total'] == 1
+        assert dashboard['stats'] == self._today(root_a).to_statistics()
+        assert [e['name'] for e in dashboard['recent_employees']] == ['신규']
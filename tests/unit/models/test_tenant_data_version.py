@@ -0,0 +1,133 @@
+"""
+테넌트 목록 데이터 버전 테스트
+
+직원/조직/계약/분류 옵션/계약 직원 계정 변경 시 테넌트 버전 증가, flush당 1회 증가, 롤백 테스트
+"""
+import pytest
+
+from app.domains.company.models import (
+    ClassificationOption, Company, Organization, TenantDataVersion,
+)
+from app.domains.contract.models import PersonCorporateContract
+from app.domains.employee.models import Employee
+from app.domains.user.models import User
+
+
+class TestTenantDataVersion:
+    """TenantDataVersion 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테넌트 2개 (본사 + 부서, 법인)"""
+        self.session = session
+        self.tenants = []
+        for code in ('A', 'B'):
+            root = Organization(name=f'본사{code}', code=code, org_type='company')
+            session.add(root)
+            session.commit()
+            dept = Organization(name='개발팀', code=f'{code}-DEV', org_type='department',
+                                parent_id=root.id)
+            company = Company(name=f'법인{code}', business_number=f'12300000{ord(code)}',
+                              representative='홍길동', root_organization_id=root.id)
+            session.add_all([dept, company])
+            session.commit()
+            self.tenants.append((root.id, dept.id, company.id))
+
+    def _versions(self):
+        return [TenantDataVersion.get_version(root_id) for root_id, _, _ in self.tenants]
+
+    def test_employee_write_bumps_own_tenant_once_per_flush(self, session):
+        """직원 일괄 생성은 flush당 1회, 다른 테넌트는 불변"""
+        (_, dept_a, _), _ = self.tenants
+        before = self._versions()
+
+        session.add_all([
+            Employee(name=f'직원{i}', organization_id=dept_a, status='active') for i in range(5)
+        ])
+        session.commit()
+        assert self._versions() == [before[0] + 1, before[1]]
+
+        employee = Employee.query.filter_by(name='직원0').one()
+        employee.position = '대리'
+        session.commit()
+        assert self._versions() == [before[0] + 2, before[1]]
+
+    def test_employee_move_bumps_both_tenants(self, session):
+        """다른 테넌트로 이동 시 이전/새 테넌트 모두 증가"""
+        (_, dept_a, _), (_, dept_b, _) = self.tenants
+        employee = Employee(name='이동직원', organization_id=dept_a, status='active')
+        session.add(employee)
+        session.commit()
+        before = self._versions()
+
+        employee.organization_id = dept_b
+        session.commit()
+        assert self._versions() == [before[0] + 1, before[1] + 1]
+
+    def test_contract_and_classification_bump_by_company(self, session):
+        """계약/분류 옵션은 법인의 루트 조직 테넌트, 공용 옵션은 전체 테넌트"""
+        (_, _, company_a), (_, _, company_b) = self.tenants
+        user = User(username='person', email='person@test.com',
+                    account_type=User.ACCOUNT_PERSONAL)
+        user.set_password('test1234')
+        session.add(user)
+        session.commit()
+        before = self._versions()
+
+        session.add(PersonCorporateContract(person_user_id=user.id, company_id=company_b))
+        session.commit()
+        assert self._versions() == [before[0], before[1] + 1]
+
+        session.add(ClassificationOption(category='position', value='인턴', label='인턴',
+                                          company_id=company_a))
+        session.commit()
+        assert self._versions() == [before[0] + 1, before[1] + 1]
+
+        session.add(ClassificationOption(category='position', value='고문', label='고문'))
+        session.commit()
+        assert self._versions() == [before[0] + 2, before[1] + 2]
+
+    def test_contracted_user_account_change_bumps_company(self, session):
+        """계약 직원 계정의 표시 필드(아이디 등) 수정은 계약 법인 테넌트 증가, 로그인 시각은 무시"""
+        from datetime import datetime
+        (_, _, company_a), _ = self.tenants
+        user = User(username='person', email='person@test.com',
+                    account_type=User.ACCOUNT_PERSONAL)
+        user.set_password('test1234')
+        session.add(user)
+        session.commit()
+        session.add(PersonCorporateContract(person_user_id=user.id, company_id=company_a))
+        session.commit()
+        before = self._versions()
+
+        user.last_login_at = datetime.utcnow()
+        session.commit()
+        assert self._versions() == before
+
+        user.username = 'person-renamed'
+        session.commit()
+        assert self._versions() == [before[0] + 1, before[1]]
+
+    def test_first_bump_creates_row_and_later_bumps_increment(self, session):
+        """버전 행이 없으면 1로 생성, 있으면 증가 (INSERT ... ON CONFLICT)"""
+        connection = session.connection()
+        TenantDataVersion.bump(connection, [9001, 9002])
+        TenantDataVersion.bump(connection, [9001])
+
+        assert TenantDataVersion.get_version(9001) == 2
+        assert TenantDataVersion.get_version(9002) == 1
+
+    def test_organization_write_and_rollback(self, session):
+        """조직 변경은 증가, 롤백된 변경은 미반영"""
+        (root_a, dept_a, _), _ = self.tenants
+        before = self._versions()
+
+        Organization.query.get(dept_a).name = '플랫폼개발팀'
+        session.commit()
+        assert self._versions()[0] == before[0] + 1
+
+        session.add(Employee(name='롤백직원', organization_id=dept_a, status='active'))
+        session.flush()
+        session.rollback()
+        assert self._versions()[0] == before[0] + 1
+        assert TenantDataVersion.get_version(root_a) == before[0] + 1
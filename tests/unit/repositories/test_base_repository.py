@@ -167,3 +167,134 @@ class TestBaseRepository:
         assert result is True
         assert self.repo.find_by_id(emp_id) is None
 
+
+
+class TestBaseRepositoryBulkWrite:
+    """bulk_create / bulk_update / bulk_upsert 테스트"""
+
+    @pytest.fixture
+    def repo(self):
+        from app.domains.employee.repositories import CareerRepository
+        return CareerRepository()
+
+    @pytest.mark.unit
+    def test_bulk_create_returns_ids_in_row_order(self, session, repo, test_employee):
+        """RETURNING 순서와 무관하게 rows 순서의 ID 반환 (sort_by_parameter_order)"""
+        from app.domains.employee.models import Career
+        employee_id = test_employee.id
+        rows = [{'employee_id': employee_id, 'company_name': f'회사{i}', 'unknown': 'x'}
+                for i in range(5)]
+
+        ids = repo.bulk_create(rows, commit=False)
+        session.commit()
+
+        assert [session.get(Career, i).company_name for i in ids] == [f'회사{i}' for i in range(5)]
+
+    @pytest.mark.unit
+    def test_bulk_create_batches_and_mixed_keys(self, session, repo, test_employee):
+        """키 조합이 다른 행과 배치 크기 초과 행도 모두 생성"""
+        employee_id = test_employee.id
+        rows = [{'employee_id': employee_id, 'company_name': f'회사{i}'} for i in range(3)]
+        rows.append({'employee_id': employee_id, 'company_name': '부서포함', 'department': '개발'})
+
+        ids = repo.bulk_create(rows, batch_size=2)
+
+        assert len(ids) == 4 and len(set(ids)) == 4
+        assert repo.find_by_id(ids[3]).department == '개발'
+
+    @pytest.mark.unit
+    def test_bulk_update(self, session, repo, test_employee):
+        """ID 기준 일괄 수정, 세션 내 객체는 만료되어 새 값 조회"""
+        employee_id = test_employee.id
+        ids = repo.bulk_create([{'employee_id': employee_id, 'company_name': '이전'}] * 2)
+        loaded = repo.find_by_id(ids[0])
+        assert loaded.company_name == '이전'
+
+        count = repo.bulk_update([{'id': record_id, 'company_name': '변경'} for record_id in ids])
+
+        assert count == 2
+        assert loaded.company_name == '변경'
+
+    @pytest.mark.unit
+    def test_bulk_upsert(self, session, repo, test_employee):
+        """기존 ID는 갱신, 새 행은 생성"""
+        employee_id = test_employee.id
+        existing_id = repo.bulk_create([{'employee_id': employee_id, 'company_name': '기존'}])[0]
+
+        ids = repo.bulk_upsert([
+            {'id': existing_id, 'employee_id': employee_id, 'company_name': '갱신'},
+            {'id': existing_id + 100, 'employee_id': employee_id, 'company_name': '신규'},
+        ])
+
+        assert ids == [existing_id, existing_id + 100]
+        assert repo.find_by_id(existing_id).company_name == '갱신'
+        assert repo.find_by_id(existing_id + 100).company_name == '신규'
+
+    @pytest.mark.unit
+    def test_bulk_upsert_matches_ids_by_conflict_key(self, session, repo, test_employee):
+        """반환 ID는 충돌 키로 행과 대응 (DO NOTHING으로 건너뛴 행만 제외)"""
+        employee_id = test_employee.id
+        existing_id = repo.bulk_create([{'employee_id': employee_id, 'company_name': '기존'}])[0]
+        rows = [
+            {'id': existing_id + 200, 'employee_id': employee_id, 'company_name': '신규2'},
+            {'id': existing_id, 'employee_id': employee_id, 'company_name': '건너뜀'},
+            {'id': existing_id + 100, 'employee_id': employee_id, 'company_name': '신규1'},
+        ]
+
+        ids = repo.bulk_upsert(rows, update_columns=[])
+
+        assert ids == [existing_id + 200, existing_id + 100]
+        assert repo.find_by_id(existing_id).company_name == '기존'
+        with pytest.raises(ValueError):
+            repo.bulk_upsert([{'employee_id': employee_id, 'company_name': '키 없음'}])
+
+    @pytest.mark.unit
+    def test_bulk_write_bumps_tenant_version(self, session, repo, test_company, test_employee):
+        """일괄 쓰기는 모델 이벤트 대신 직원 테넌트 버전 기록"""
+        from app.domains.company.models import Organization, TenantDataVersion
+        root = Organization(name='본사', code='BULK-HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        test_company.root_organization_id = root.id
+        session.commit()
+        before = TenantDataVersion.get_version(root.id)
+
+        repo.bulk_create([{'employee_id': test_employee.id, 'company_name': '회사'}])
+
+        assert TenantDataVersion.get_version(root.id) == before + 1
+
+    @pytest.mark.unit
+    def test_bulk_write_refused_for_derived_state_models(self, session, test_company):
+        """직원/조직/법인/분류 옵션은 모델 이벤트 파생 상태(초성, 인원 집계, 조직 클로저, 테넌트 버전)가
+        누락되므로 일괄 쓰기 불가"""
+        from app.domains.company.models import ClassificationOption, Organization
+        from app.domains.company.repositories import ClassificationOptionsRepository, CompanyRepository
+        from app.domains.company.repositories.organization_repository import OrganizationRepository
+        from app.domains.employee.models import Employee
+        from app.domains.employee.repositories import EmployeeRepository
+        from app.shared.repositories.base_repository import BulkWriteNotSupportedError
+
+        employee_count = Employee.query.count()
+        organization_count = Organization.query.count()
+        option_count = ClassificationOption.query.count()
+
+        with pytest.raises(BulkWriteNotSupportedError):
+            EmployeeRepository().bulk_create([
+                {'employee_number': 'BULK001', 'name': '홍길동', 'company_id': test_company.id}
+            ])
+        with pytest.raises(BulkWriteNotSupportedError):
+            OrganizationRepository().bulk_create([
+                {'name': '일괄조직', 'code': 'BULK-ORG', 'org_type': 'department'}
+            ])
+        with pytest.raises(BulkWriteNotSupportedError):
+            EmployeeRepository().bulk_update([{'id': 1, 'name': '변경'}])
+        with pytest.raises(BulkWriteNotSupportedError):
+            CompanyRepository().bulk_update([{'id': test_company.id, 'name': '변경'}])
+        with pytest.raises(BulkWriteNotSupportedError):
+            ClassificationOptionsRepository().bulk_create([
+                {'company_id': test_company.id, 'category': 'position', 'value': '일괄'}
+            ])
+
+        assert Employee.query.count() == employee_count
+        assert ClassificationOption.query.count() == option_count
+        assert Organization.query.count() == organization_count
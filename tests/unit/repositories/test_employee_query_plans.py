@@ -0,0 +1,154 @@
+"""
+직원 목록 쿼리 계획 회귀 테스트
+
+여러 테넌트의 직원 데이터를 적재한 뒤 EmployeeRepository 목록/필터/정렬/통계 쿼리의
+EXPLAIN QUERY PLAN이 employees 테이블을 기대한 인덱스로 SEARCH하는지 확인합니다.
+(SCAN ... USING INDEX는 인덱스 전체 순회이므로 실패)
+
+SQLite 기본 비용 모델(ANALYZE 통계 없음) 기준으로 인덱스 존재와 컬럼 구성 회귀를 검출합니다.
+(통계 기반 계획 선택은 DB/데이터 분포에 따라 달라지므로 운영 DB에서 별도 확인)
+"""
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app.domains.company.models import Company, Organization
+from app.domains.employee.models import Employee
+from app.domains.employee.repositories import EmployeeRepository
+from app.shared.constants.system_config import TenantScopeConfig
+
+DEPARTMENTS = ('개발팀', '인사팀', '영업팀', '재무팀', '마케팅팀')
+POSITIONS = ('사원', '대리', '과장', '차장', '부장')
+STATUSES = ('active', 'active', 'active', 'on_leave', 'resigned')
+TENANTS = 20
+
+# 스코프 컬럼으로 시작하는 인덱스 (필터 없이 스코프만 조건인 정렬 조회는 이 중 어느 것이든 SEARCH)
+ORG_INDEXES = (
+    'idx_employees_org_status', 'idx_employees_org_department', 'idx_employees_org_position',
+    'idx_employees_org_hire_date', 'idx_employees_org_name',
+)
+COMPANY_INDEXES = ('idx_employees_company_status', 'idx_employees_company_hire_date')
+EMPLOYEES_PER_TENANT = 100
+
+
+def _employees_plan_rows(connection, statement, parameters):
+    """EXPLAIN QUERY PLAN 결과 중 employees 테이블 접근 행"""
+    rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+    return [row[-1] for row in rows if ' employees' in row[-1]]
+
+
+class TestEmployeeQueryPlans:
+    """EmployeeRepository 쿼리 인덱스 사용 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테넌트 TENANTS개 x 직원 EMPLOYEES_PER_TENANT명 적재"""
+        self.session = session
+        self.repo = EmployeeRepository()
+        self.roots = []
+        self.companies = []
+
+        rows = []
+        for tenant in range(TENANTS):
+            root = Organization(name=f'본사{tenant}', code=f'HQ{tenant}', org_type='company')
+            session.add(root)
+            session.commit()
+            depts = []
+            for name in DEPARTMENTS:
+                dept = Organization(name=name, code=f'{tenant}-{name}', org_type='department',
+                                    parent_id=root.id)
+                session.add(dept)
+                depts.append(dept)
+            company = Company(name=f'법인{tenant}', business_number=f'9990000{tenant:03d}',
+                              representative='홍길동', root_organization_id=root.id)
+            session.add(company)
+            session.commit()
+            self.roots.append(root.id)
+            self.companies.append(company.id)
+
+            for i in range(EMPLOYEES_PER_TENANT):
+                rows.append({
+                    'name': f'직원{tenant}-{i:04d}',
+                    'organization_id': depts[i % len(depts)].id,
+                    'company_id': company.id,
+                    'department': DEPARTMENTS[i % len(DEPARTMENTS)],
+                    'position': POSITIONS[(i // 7) % len(POSITIONS)],
+                    'status': STATUSES[i % len(STATUSES)],
+                    'hire_date': f'20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}',
+                })
+        session.execute(Employee.__table__.insert(), rows)
+        session.commit()
+
+    def _plans(self, call):
+        """repository 호출 중 실행된 employees 쿼리별 계획"""
+        executed = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if 'employees' in statement and not statement.lstrip().upper().startswith('EXPLAIN'):
+                executed.append((statement, parameters))
+
+        engine = self.session.get_bind()
+        event.listen(engine, 'before_cursor_execute', capture)
+        try:
+            call()
+        finally:
+            event.remove(engine, 'before_cursor_execute', capture)
+
+        connection = self.session.connection()
+        return [_employees_plan_rows(connection, statement, parameters)
+                for statement, parameters in executed]
+
+    def _assert_indexed(self, call, indexes):
+        """모든 employees 접근이 indexes 중 하나로 SEARCH (SCAN 및 다른 인덱스 사용 시 실패)"""
+        plans = self._plans(call)
+        assert plans
+        for plan in plans:
+            assert plan, 'employees 접근 계획 없음'
+            for detail in plan:
+                assert detail.startswith('SEARCH'), f'employees 전체 스캔: {detail}'
+                used = re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)
+                assert used and used.group(1) in indexes, f'기대한 인덱스 {indexes} 미사용: {detail}'
+
+    @pytest.mark.parametrize('params, indexes', [
+        ({'status': 'active'}, ('idx_employees_org_status',)),
+        ({'departments': ['개발팀', '인사팀']}, ('idx_employees_org_department',)),
+        ({'positions': ['과장']}, ('idx_employees_org_position',)),
+        ({'statuses': ['active'], 'sort_by': 'name'}, ('idx_employees_org_status',)),
+        ({'sort_by': 'hire_date', 'sort_order': 'desc'}, ORG_INDEXES),
+    ])
+    def test_filter_employees_uses_index(self, params, indexes):
+        """목록 필터/정렬 (페이지 조회 + COUNT)"""
+        self._assert_indexed(lambda: self.repo.filter_employees(
+            organization_id=self.roots[0], page=3, per_page=20, **params
+        ), indexes)
+
+    def test_filter_employees_cursor_uses_index(self):
+        """커서 모드 입사일 정렬"""
+        def walk():
+            page = self.repo.filter_employees(organization_id=self.roots[0], sort_by='hire_date',
+                                              per_page=50, cursor_mode=True)
+            self.repo.filter_employees(organization_id=self.roots[0], sort_by='hire_date',
+                                       per_page=50, cursor=page.next_cursor)
+        self._assert_indexed(walk, ORG_INDEXES)
+
+    def test_statistics_and_recent_use_index(self):
+        """상태별 통계, 최근 입사자"""
+        self._assert_indexed(lambda: self.repo.get_statistics(self.roots[0]),
+                             ('idx_employees_org_status',))
+        self._assert_indexed(lambda: self.repo.get_recent_employees(organization_id=self.roots[0]),
+                             ORG_INDEXES)
+
+    def test_company_scope_uses_index(self, app):
+        """company_id 스코프 모드 통계/최근 입사자/상태 필터"""
+        app.config['TENANT_SCOPE_MODE'] = TenantScopeConfig.MODE_COMPANY_ID
+        try:
+            self._assert_indexed(lambda: self.repo.get_statistics(self.roots[1]),
+                                 ('idx_employees_company_status',))
+            self._assert_indexed(lambda: self.repo.get_recent_employees(organization_id=self.roots[1]),
+                                 COMPANY_INDEXES)
+            self._assert_indexed(lambda: self.repo.filter_employees(
+                organization_id=self.roots[1], status='active', page=1, per_page=20
+            ), ('idx_employees_company_status',))
+        finally:
+            app.config['TENANT_SCOPE_MODE'] = TenantScopeConfig.MODE_ORG_TREE
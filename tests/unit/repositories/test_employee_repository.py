@@ -4,6 +4,8 @@ EmployeeRepository 단위 테스트
 import pytest
 from app.domains.employee.repositories import EmployeeRepository
 from app.domains.employee.models import Employee
+from app.domains.company.models import Company, Organization
+from app.shared.constants.system_config import TenantScopeConfig
 
 
 class TestEmployeeRepository:
@@ -187,3 +189,260 @@ class TestEmployeeRepository:
         assert 'onLeave' in stats
         assert 'resigned' in stats
         assert stats['total'] >= 2
+
+    @pytest.mark.unit
+    def test_search_ranked_by_relevance(self, session):
+        """검색 결과 관련도 순 (정확 일치 > 이름 접두 > 이름 포함 > 기타 컬럼)"""
+        session.add_all([
+            Employee(name='최민수', department='개발팀', status='active'),
+            Employee(name='김민', english_name='Min Kim', department='민원팀', status='active'),
+            Employee(name='민수', status='active'),
+            Employee(name='민수아', status='active'),
+            Employee(name='홍길동', department='민수지원팀', status='active'),
+        ])
+        session.commit()
+
+        names = [e['name'] for e in self.repo.search('민수')]
+
+        assert names == ['민수', '민수아', '최민수', '홍길동']
+
+    @pytest.mark.unit
+    def test_search_choseong_and_wildcards(self, session):
+        """초성 검색 및 LIKE 와일드카드 이스케이프"""
+        session.add_all([
+            Employee(name='김민수', status='active'),
+            Employee(name='김미선', status='active'),
+            Employee(name='이민수', status='active'),
+            Employee(name='100%달성', status='active'),
+        ])
+        session.commit()
+
+        assert [e['name'] for e in self.repo.search('ㄱㅁㅅ')] == ['김미선', '김민수']
+        assert [e['name'] for e in self.repo.search('ㅁㅅ')] == ['김미선', '김민수', '이민수']
+        assert [e['name'] for e in self.repo.search('0%')] == ['100%달성']
+        assert len(self.repo.search('ㅁㅅ', limit=1)) == 1
+
+    @pytest.mark.unit
+    def test_name_choseong_updated_on_rename(self, session):
+        """이름 변경 시 초성 컬럼 갱신"""
+        employee = Employee(name='김민수', status='active')
+        session.add(employee)
+        session.commit()
+
+        employee.name = '박지훈'
+        session.commit()
+
+        assert employee.name_choseong == 'ㅂㅈㅎ'
+
+    @pytest.mark.unit
+    def test_filter_employees_cursor_mode(self, session):
+        """커서 모드: 필터 유지, 정렬 컬럼 키셋 탐색, 첫 페이지 총건수"""
+        for i in range(5):
+            session.add(Employee(name=f'개발{i}', department='개발팀', status='active'))
+        session.add(Employee(name='인사0', department='인사팀', status='active'))
+        session.commit()
+
+        first = self.repo.filter_employees(department='개발팀', sort_by='name', sort_order='desc',
+                                           per_page=3, cursor_mode=True, with_total=True)
+        second = self.repo.filter_employees(department='개발팀', sort_by='name', sort_order='desc',
+                                            per_page=3, cursor=first.next_cursor)
+
+        names = [e.name for e in first.items + second.items]
+        assert names == ['개발4', '개발3', '개발2', '개발1', '개발0']
+        assert first.total == second.total == 5
+        assert second.has_next is False
+
+    @pytest.mark.unit
+    def test_filter_employees_projection(self, session):
+        """프로젝션: 목록 컬럼 + 조직명 Row, 페이지당 쿼리 수 고정"""
+        from sqlalchemy import event
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        dept = Organization(name='개발팀', code='DEV', org_type='department', parent_id=root.id)
+        session.add(dept)
+        session.commit()
+        for i in range(10):
+            session.add(Employee(name=f'직원{i}', organization_id=dept.id, status='active'))
+        session.commit()
+        root_id = root.id
+        session.expire_all()
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            page = self.repo.filter_employees(organization_id=root_id, page=1, per_page=5,
+                                              projection=True)
+            rows = [row._asdict() for row in page.items]
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+
+        assert len(statements) <= 2
+        assert page.total == 10
+        assert [row['name'] for row in rows] == [f'직원{i}' for i in range(5)]
+        assert rows[0]['organization_name'] == '개발팀'
+        assert 'age' not in rows[0] and 'organization' not in rows[0]
+
+        results = self.repo.search('직원9', organization_id=root_id, projection=True)
+        assert [r['name'] for r in results] == ['직원9']
+        assert results[0]['organization_name'] == '개발팀'
+
+    @pytest.mark.unit
+    def test_get_facet_counts(self, session):
+        """패싯 건수: 단일 쿼리, 각 패싯은 자기 필터 제외"""
+        from sqlalchemy import event
+        from app.domains.employee.models import Contract
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        dev = Organization(name='개발팀', code='DEV', org_type='department', parent_id=root.id)
+        hr = Organization(name='인사팀', code='HR', org_type='department', parent_id=root.id)
+        session.add_all([dev, hr])
+        session.commit()
+        people = [
+            ('김개발', dev, '개발팀', '사원', 'active', '정규직'),
+            ('이개발', dev, '개발팀', '대리', 'active', '계약직'),
+            ('박개발', dev, '개발팀', '사원', 'resigned', None),
+            ('최인사', hr, '인사팀', '사원', 'active', '정규직'),
+        ]
+        for name, org, department, position, status, employee_type in people:
+            employee = Employee(name=name, organization_id=org.id, department=department,
+                                position=position, status=status)
+            session.add(employee)
+            session.flush()
+            if employee_type:
+                session.add(Contract(employee_id=employee.id, employee_type=employee_type))
+        session.commit()
+        root_id, dev_id = root.id, dev.id
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            facets = self.repo.get_facet_counts(root_id, department='개발팀', statuses=['active'])
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+
+        assert len(statements) == 1
+        # 부서 패싯: 상태 필터만 적용 / 상태 패싯: 부서 필터만 적용
+        assert facets['department'] == {'개발팀': 2, '인사팀': 1}
+        assert facets['status'] == {'active': 2, 'resigned': 1}
+        assert facets['position'] == {'사원': 1, '대리': 1}
+        assert facets['employment_type'] == {'정규직': 1, '계약직': 1}
+        assert facets['organization'] == {dev_id: 2}
+        assert facets['organization_names'] == {dev_id: '개발팀'}
+
+
+class TestEmployeeRepositoryCompanyScope:
+    """company_id 테넌트 스코프 및 정합성 검사 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session, app):
+        """테스트 설정 (두 회사 + 조직 트리)"""
+        self.session = session
+        self.app = app
+        self.repo = EmployeeRepository()
+
+        self.root_a = Organization(name='A사', org_type='company')
+        self.root_b = Organization(name='B사', org_type='company')
+        session.add_all([self.root_a, self.root_b])
+        session.commit()
+        self.dept_a = Organization(name='A개발팀', org_type='department', parent_id=self.root_a.id)
+        session.add(self.dept_a)
+        self.company_a = Company(name='A사', business_number='1111111111', representative='대표A',
+                                 root_organization_id=self.root_a.id)
+        self.company_b = Company(name='B사', business_number='2222222222', representative='대표B',
+                                 root_organization_id=self.root_b.id)
+        session.add_all([self.company_a, self.company_b])
+        session.commit()
+
+        original_mode = app.config.get('TENANT_SCOPE_MODE')
+        yield
+        app.config['TENANT_SCOPE_MODE'] = original_mode
+
+    @pytest.mark.unit
+    def test_company_scope_filters_by_company_id(self, session):
+        """company_id 모드: 조직 트리 대신 company_id로 필터링"""
+        emp_a = Employee(name='A직원', status='active', organization_id=self.dept_a.id,
+                         company_id=self.company_a.id)
+        emp_b = Employee(name='B직원', status='active', organization_id=self.root_b.id,
+                         company_id=self.company_b.id)
+        session.add_all([emp_a, emp_b])
+        session.commit()
+
+        self.app.config['TENANT_SCOPE_MODE'] = TenantScopeConfig.MODE_COMPANY_ID
+
+        assert [e.id for e in self.repo.find_all(organization_id=self.root_a.id)] == [emp_a.id]
+        assert self.repo.get_count(organization_id=self.root_a.id) == 1
+        assert self.repo.get_statistics(organization_id=self.root_a.id)['active'] == 1
+        assert self.repo.count_by_company_id(self.company_b.id) == 1
+        assert [e.id for e in self.repo.find_by_company_id(self.company_a.id)] == [emp_a.id]
+
+    @pytest.mark.unit
+    def test_find_and_backfill_company_id_mismatches(self, session):
+        """조직 트리와 다른 company_id 검출 및 보정"""
+        wrong = Employee(name='잘못된회사', status='active', organization_id=self.dept_a.id,
+                         company_id=self.company_b.id)
+        missing = Employee(name='회사누락', status='active', organization_id=self.root_b.id)
+        ok = Employee(name='정상', status='active', organization_id=self.dept_a.id,
+                      company_id=self.company_a.id)
+        session.add_all([wrong, missing, ok])
+        session.commit()
+
+        mismatches = self.repo.find_company_id_mismatches()
+
+        assert {(m['employee_id'], m['expected_company_id']) for m in mismatches} == {
+            (wrong.id, self.company_a.id),
+            (missing.id, self.company_b.id),
+        }
+        assert self.repo.backfill_company_ids() == 2
+        assert self.repo.find_company_id_mismatches() == []
+        assert session.get(Employee, wrong.id).company_id == self.company_a.id
+
+    @pytest.mark.unit
+    def test_find_pending_contract_employees(self, session):
+        """승인 계약이 없는 employee_sub 계정 직원만 계약 상태와 함께 페이지 조회"""
+        from app.domains.contract.models import PersonCorporateContract
+        from app.domains.user.models import User
+
+        users = []
+        for name in ('미계약', '요청중', '승인됨', '타법인'):
+            employee = Employee(name=name, status='active', organization_id=self.dept_a.id)
+            session.add(employee)
+            session.flush()
+            company_id = self.company_b.id if name == '타법인' else self.company_a.id
+            user = User(username=f'sub{employee.id}', email=f'sub{employee.id}@test.com',
+                        account_type=User.ACCOUNT_EMPLOYEE_SUB, company_id=company_id,
+                        employee_id=employee.id)
+            user.set_password('test1234')
+            session.add(user)
+            users.append(user)
+        session.flush()
+        session.add_all([
+            PersonCorporateContract(person_user_id=users[1].id, company_id=self.company_a.id,
+                                    status=PersonCorporateContract.STATUS_REQUESTED),
+            PersonCorporateContract(person_user_id=users[2].id, company_id=self.company_a.id,
+                                    status=PersonCorporateContract.STATUS_APPROVED),
+            PersonCorporateContract(person_user_id=users[2].id, company_id=self.company_a.id,
+                                    status=PersonCorporateContract.STATUS_REJECTED),
+        ])
+        session.commit()
+
+        page = self.repo.find_pending_contract_employees(self.company_a.id, per_page=10)
+        assert page.total == 2
+        assert [(row.name, row.user_id, row.contract_status) for row in page.items] == [
+            ('미계약', users[0].id, 'none'),
+            ('요청중', users[1].id, 'requested'),
+        ]
+
+        second = self.repo.find_pending_contract_employees(self.company_a.id, page=2, per_page=1)
+        assert [row.name for row in second.items] == ['요청중']
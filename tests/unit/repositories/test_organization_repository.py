@@ -8,7 +8,8 @@ OrganizationRepository 단위 테스트
 """
 import pytest
 from app.domains.company.repositories.organization_repository import OrganizationRepository
-from app.domains.company.models import Organization
+from app.domains.company.models import Organization, OrganizationClosure, OrgHeadcount
+from app.domains.employee.models import Employee
 from app.domains.company.models import Company
 
 
@@ -339,3 +340,317 @@ class TestOrganizationRepositoryAdvanced:
         updated = self.repo.find_by_id(target.id)
         assert updated.parent_id == org2.id
 
+
+
+class TestOrganizationClosure:
+    """조직 클로저 테이블 (organization_closure) 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테스트 설정"""
+        self.session = session
+        self.repo = OrganizationRepository()
+
+    def _build_tree(self, session):
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        div = Organization(name='개발본부', code='DIV', org_type='division', parent_id=root.id, sort_order=1)
+        hr = Organization(name='인사팀', code='HR', org_type='department', parent_id=root.id, sort_order=2)
+        session.add_all([div, hr])
+        session.commit()
+        team = Organization(name='플랫폼팀', code='PLT', org_type='team', parent_id=div.id)
+        session.add(team)
+        session.commit()
+        return root, div, hr, team
+
+    def _closure_rows(self):
+        return {
+            (row.ancestor_id, row.descendant_id, row.depth)
+            for row in OrganizationClosure.query.all()
+        }
+
+    def test_closure_rows_on_insert(self, session):
+        """조직 생성 시 클로저 행 자동 생성"""
+        root, div, hr, team = self._build_tree(session)
+
+        rows = self._closure_rows()
+
+        assert (team.id, team.id, 0) in rows
+        assert (div.id, team.id, 1) in rows
+        assert (root.id, team.id, 2) in rows
+        assert team.get_level() == 2
+        assert [a.id for a in team.get_ancestors()] == [root.id, div.id]
+
+    def test_descendants_preorder_and_inactive_subtree(self, session):
+        """하위 조직 전위 순서 및 비활성 하위 트리 제외"""
+        root, div, hr, team = self._build_tree(session)
+
+        assert [o.id for o in root.get_descendants()] == [div.id, team.id, hr.id]
+
+        div.is_active = False
+        session.commit()
+
+        assert [o.id for o in root.get_descendants()] == [hr.id]
+        assert self.repo.get_tenant_org_ids(root.id) == {root.id, hr.id}
+
+    def test_reparent_updates_subtree(self, session):
+        """상위 조직 변경 시 하위 트리 경로 갱신"""
+        root, div, hr, team = self._build_tree(session)
+
+        self.repo.update_organization(div.id, {'parent_id': hr.id})
+
+        assert div.get_level() == 2
+        assert team.get_level() == 3
+        assert self.repo.is_in_subtree(team.id, hr.id)
+
+    def test_reparent_under_descendant_rejected(self, session):
+        """하위 조직을 상위로 지정하면 거부"""
+        root, div, hr, team = self._build_tree(session)
+
+        with pytest.raises(ValueError):
+            self.repo.update_organization(div.id, {'parent_id': team.id})
+        assert self.repo.move_organization(div.id, team.id) is False
+
+    def test_apply_tenant_filter_uses_closure(self, session):
+        """테넌트 필터 및 소유권 검증"""
+        root, div, hr, team = self._build_tree(session)
+        other = Organization(name='타사', code='OTHER', org_type='company')
+        session.add(other)
+        session.commit()
+
+        query = self.repo.apply_tenant_filter(Organization.query, Organization.id, root.id)
+
+        assert {o.id for o in query.all()} == {root.id, div.id, hr.id, team.id}
+        assert self.repo.verify_ownership(team.id, root.id) is True
+        assert self.repo.verify_ownership(other.id, root.id) is False
+
+    def test_rebuild_closure(self, session):
+        """클로저 테이블 재구성"""
+        root, div, hr, team = self._build_tree(session)
+        expected = self._closure_rows()
+        OrganizationClosure.query.delete()
+        session.commit()
+
+        count = self.repo.rebuild_closure()
+
+        assert count == len(expected)
+        assert self._closure_rows() == expected
+
+
+class TestOrganizationTreeAssembly:
+    """메모리 트리 조립 (get_tree / get_flat_list / get_selector_tree) 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테스트 설정"""
+        self.session = session
+        self.repo = OrganizationRepository()
+
+    def _build_tree(self, session):
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        div = Organization(name='개발본부', code='DIV', org_type='division', parent_id=root.id, sort_order=1)
+        hr = Organization(name='인사팀', code='HR', org_type='department', parent_id=root.id, sort_order=2)
+        session.add_all([div, hr])
+        session.commit()
+        team = Organization(name='플랫폼팀', code='PLT', org_type='team', parent_id=div.id)
+        session.add(team)
+        session.commit()
+        return root, div, hr, team
+
+    def test_get_tree_matches_model_hierarchy(self, session):
+        """트리 구조/level이 모델 계산 결과와 일치"""
+        root, div, hr, team = self._build_tree(session)
+
+        tree = self.repo.get_tree(root.id)
+
+        assert len(tree) == 1
+        assert [c['id'] for c in tree[0]['children']] == [div.id, hr.id]
+        team_node = tree[0]['children'][0]['children'][0]
+        assert team_node['id'] == team.id
+        assert team_node['level'] == team.get_level() == 2
+        assert team_node['children'] == []
+
+    def test_flat_list_path_and_full_code(self, session):
+        """플랫 목록 path/full_code가 모델 계산 결과와 일치"""
+        root, div, hr, team = self._build_tree(session)
+
+        flat = {o['id']: o for o in self.repo.get_flat_list(root_organization_id=root.id)}
+
+        assert flat[team.id]['path'] == team.get_path() == '본사 > 개발본부 > 플랫폼팀'
+        assert flat[team.id]['full_code'] == team.get_full_code() == 'HQ-DIV-PLT'
+
+    def test_boundary_org_uses_outer_ancestors(self, session):
+        """상위 조직이 결과 밖에 있는 조직도 전체 경로 계산"""
+        root, div, hr, team = self._build_tree(session)
+
+        results = self.repo.get_children(div.id)
+
+        assert results[0]['level'] == 2
+        assert self.repo.search('플랫폼', root.id)[0]['path'] == '본사 > 개발본부 > 플랫폼팀'
+
+    def test_get_tree_query_count_is_constant(self, session, app):
+        """트리 조회 쿼리 수가 조직 수와 무관"""
+        from sqlalchemy import event
+        root, div, hr, team = self._build_tree(session)
+        for i in range(5):
+            session.add(Organization(name=f'팀{i}', code=f'T{i}', org_type='team', parent_id=hr.id))
+        session.commit()
+        session.expire_all()
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            self.repo.get_tree(root.id)
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+
+        assert len(statements) <= 3
+
+    def test_selector_tree_payload(self, session):
+        """선택기용 경량 트리"""
+        root, div, hr, team = self._build_tree(session)
+
+        tree = self.repo.get_selector_tree(root.id)
+
+        assert set(tree[0].keys()) == {'id', 'name', 'code', 'org_type', 'children'}
+        assert tree[0]['children'][0]['children'][0]['name'] == '플랫폼팀'
+
+    def test_tree_nodes_has_children(self, session):
+        """트리 노드 하위 조직 여부"""
+        root, div, hr, team = self._build_tree(session)
+
+        nodes = {n['id']: n for n in self.repo.get_tree_nodes(root.id)}
+
+        assert nodes[div.id]['children'] is True
+        assert nodes[hr.id]['children'] is False
+
+
+class TestOrgHeadcount:
+    """조직 인원 롤업 (org_headcount) 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """테스트 설정"""
+        self.session = session
+        self.repo = OrganizationRepository()
+
+    def _build_tree(self, session):
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        div = Organization(name='개발본부', code='DIV', org_type='division', parent_id=root.id, sort_order=1)
+        hr = Organization(name='인사팀', code='HR', org_type='department', parent_id=root.id, sort_order=2)
+        session.add_all([div, hr])
+        session.commit()
+        team = Organization(name='플랫폼팀', code='PLT', org_type='team', parent_id=div.id)
+        session.add(team)
+        session.commit()
+        return root, div, hr, team
+
+    def _rollup(self):
+        return {
+            (row.organization_id, row.status, row.direct_count, row.subtree_count)
+            for row in OrgHeadcount.query.all()
+            if row.direct_count or row.subtree_count
+        }
+
+    def test_employee_changes_update_rollup(self, session):
+        """직원 생성/이동/퇴사/삭제 시 인원 증분 반영"""
+        root, div, hr, team = self._build_tree(session)
+        emp1 = Employee(name='직원1', status='active', organization_id=team.id)
+        emp2 = Employee(name='직원2', status='active', organization_id=hr.id)
+        session.add_all([emp1, emp2])
+        session.commit()
+
+        assert self.repo.get_member_count(team.id) == 1
+        assert self.repo.get_member_count(root.id, include_descendants=True) == 2
+        assert self.repo.get_member_count(div.id, include_descendants=True) == 1
+
+        emp1.organization_id = hr.id
+        session.commit()
+        assert self.repo.get_member_count(div.id, include_descendants=True) == 0
+        assert self.repo.get_member_counts(root.id) == {hr.id: 2}
+
+        emp2.status = 'resigned'
+        session.commit()
+        assert self.repo.get_member_count(hr.id) == 1
+        assert self.repo.get_headcounts([root.id])[root.id]['subtree'] == {'active': 1, 'resigned': 1}
+
+        session.delete(emp1)
+        session.commit()
+        assert self.repo.get_member_count(root.id, include_descendants=True) == 0
+
+    def test_apply_delta_upserts_partially_existing_path(self, session):
+        """경로 일부에만 행이 있어도 한 문장으로 증감/생성 (INSERT ... ON CONFLICT)"""
+        root, div, hr, team = self._build_tree(session)
+        connection = session.connection()
+        OrgHeadcount.apply_delta(connection, div.id, 'active', 2)
+        OrgHeadcount.apply_delta(connection, team.id, 'active', 1)
+
+        assert self._rollup() == {
+            (root.id, 'active', 0, 3),
+            (div.id, 'active', 2, 3),
+            (team.id, 'active', 1, 1),
+        }
+
+    def test_reparent_moves_subtree_headcount(self, session):
+        """조직 상위 변경 시 하위 트리 인원 이전"""
+        root, div, hr, team = self._build_tree(session)
+        session.add_all([
+            Employee(name='직원1', status='active', organization_id=team.id),
+            Employee(name='직원2', status='active', organization_id=team.id),
+        ])
+        session.commit()
+
+        self.repo.update_organization(div.id, {'parent_id': hr.id})
+
+        assert self.repo.get_member_count(hr.id, include_descendants=True) == 2
+        assert self.repo.get_member_count(root.id, include_descendants=True) == 2
+        assert self.repo.get_member_count(team.id) == 2
+
+    def test_rebuild_matches_incremental(self, session):
+        """재구성 결과가 증분 결과와 일치"""
+        root, div, hr, team = self._build_tree(session)
+        session.add_all([
+            Employee(name='직원1', status='active', organization_id=team.id),
+            Employee(name='직원2', status=None, organization_id=div.id),
+            Employee(name='직원3', status='resigned', organization_id=hr.id),
+        ])
+        session.commit()
+        expected = self._rollup()
+
+        self.repo.rebuild_headcounts()
+
+        assert self._rollup() == expected
+
+    def test_department_statistics_from_org_tree(self, session):
+        """부서별 현황은 루트 직속 + 루트 1단계 하위 조직 기준 (하위 트리 포함, 같은 이름도 조직별)"""
+        from app.domains.employee.repositories.employee_repository import EmployeeRepository
+        root, div, hr, team = self._build_tree(session)
+        twin = Organization(name='개발본부', code='DIV2', org_type='division', parent_id=root.id, sort_order=3)
+        session.add(twin)
+        session.commit()
+        session.add_all([
+            Employee(name='직원1', department='자유입력', status='active', organization_id=team.id),
+            Employee(name='직원2', status='active', organization_id=div.id),
+            Employee(name='직원3', status='active', organization_id=twin.id),
+            Employee(name='대표', status='active', organization_id=root.id),
+            Employee(name='퇴사자', status='resigned', organization_id=root.id),
+        ])
+        session.commit()
+
+        stats = EmployeeRepository().get_department_statistics(organization_id=root.id)
+
+        assert stats == [
+            {'organization_id': root.id, 'name': '본사', 'count': 1},
+            {'organization_id': div.id, 'name': '개발본부', 'count': 2},
+            {'organization_id': twin.id, 'name': '개발본부', 'count': 1},
+        ]
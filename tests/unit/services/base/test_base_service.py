@@ -52,3 +52,121 @@ class TestRelationDataUpdater:
         assert result == 1
         mock_repo.delete_by_employee_id.assert_called_once_with(1)
 
+
+
+class TestRelationDataUpdaterDiff:
+    """RelationDataUpdater.update_diff (변경분 반영) 테스트"""
+
+    @pytest.fixture
+    def education_config(self):
+        from app.shared.base.relation_configs import get_relation_config
+        return get_relation_config('education', {})
+
+    @staticmethod
+    def _form(rows, ids=None):
+        form = {
+            'education_school_name[]': [r[0] for r in rows],
+            'education_major[]': [r[1] for r in rows],
+            'education_degree[]': [r[2] for r in rows],
+        }
+        if ids is not None:
+            form['education_id[]'] = ids
+        return form
+
+    def test_update_diff_keeps_matched_rows(self, session, test_employee, education_config):
+        """자연 키가 같은 행은 ID 유지, 바뀐 필드만 수정"""
+        from app.domains.employee.models import Education
+        updater = RelationDataUpdater()
+        summary = updater.update_diff(test_employee.id, self._form([
+            ('가대학교', '컴퓨터', '학사'), ('나대학교', '경영', '석사'),
+        ]), education_config)
+        session.commit()
+        first_id, second_id = summary.created
+        assert summary.deleted == [] and summary.updated == []
+
+        summary = updater.update_diff(test_employee.id, self._form([
+            ('가대학교', '컴퓨터', '학사'), ('나대학교', '경영', '박사'), ('다대학교', '수학', '학사'),
+        ]), education_config)
+        session.commit()
+
+        assert summary.unchanged == [first_id]
+        assert summary.updated == [second_id]
+        assert len(summary.created) == 1
+        assert session.get(Education, second_id).degree == '박사'
+        assert summary.to_dict()['unchanged'] == 1
+
+    def test_update_diff_deletes_and_matches_by_id(self, session, test_employee, education_config):
+        """제출되지 않은 행은 삭제, id[]가 있으면 학교명이 바뀌어도 같은 행 수정"""
+        from app.domains.employee.models import Education
+        updater = RelationDataUpdater()
+        first_id, second_id = updater.update_diff(test_employee.id, self._form([
+            ('가대학교', '컴퓨터', '학사'), ('나대학교', '경영', '석사'),
+        ]), education_config).created
+        session.commit()
+
+        summary = updater.update_diff(test_employee.id, self._form(
+            [('가나대학교', '컴퓨터', '학사')], ids=[str(first_id)]
+        ), education_config)
+        session.commit()
+
+        assert summary.updated == [first_id]
+        assert summary.deleted == [second_id]
+        assert summary.created == []
+        assert session.get(Education, second_id) is None
+        assert session.get(Education, first_id).school_name == '가나대학교'
+
+    def test_update_diff_without_changes_writes_nothing(self, session, test_employee,
+                                                        education_config):
+        """변경이 없으면 SQL은 기존 행 조회 1회"""
+        from app.shared.utils.query_counter import count_queries
+        updater = RelationDataUpdater()
+        form = self._form([('가대학교', '컴퓨터', '학사')])
+        employee_id = test_employee.id
+        updater.update_diff(employee_id, form, education_config)
+        session.commit()
+
+        with count_queries() as counter:
+            summary = updater.update_diff(employee_id, form, education_config)
+        assert not summary.has_changes
+        assert counter.count == 1
+
+    def test_update_diff_compares_values_as_column_types(self, session, test_employee):
+        """폼 문자열은 컬럼 타입으로 변환 후 비교 (정수/불리언 컬럼이 매번 변경으로 잡히지 않음)"""
+        from app.domains.employee.models import FamilyMember
+        from app.shared.base.relation_updater import RelationDataConfig
+        config = RelationDataConfig(
+            model_class=FamilyMember,
+            repository=None,
+            form_prefix='family_',
+            required_field='name',
+            field_mapping={'name': 'name', 'is_dependent': 'is_dependent',
+                           'is_cohabitant': 'is_cohabitant'},
+            natural_key=['name'],
+        )
+        form = {'family_name[]': ['홍부모'], 'family_is_dependent[]': ['true'],
+                'family_is_cohabitant[]': ['0']}
+        updater = RelationDataUpdater()
+        member_id = updater.update_diff(test_employee.id, form, config).created[0]
+        session.commit()
+        member = session.get(FamilyMember, member_id)
+        assert member.is_dependent is True and member.is_cohabitant is False
+
+        summary = updater.update_diff(test_employee.id, form, config)
+        assert summary.unchanged == [member_id]
+
+        summary = updater.update_diff(test_employee.id, {**form, 'family_is_dependent[]': ['false']},
+                                      config)
+        assert summary.updated == [member_id]
+        assert member.is_dependent is False
+
+    def test_coerce_value_by_column_type(self):
+        """정수/날짜 컬럼 변환, 빈 값은 None, 변환 불가 값은 그대로"""
+        from datetime import date
+        from sqlalchemy import Date, Integer, String
+        updater = RelationDataUpdater()
+
+        assert updater._coerce_value(Integer(), '2') == 2
+        assert updater._coerce_value(Integer(), ' ') is None
+        assert updater._coerce_value(Date(), '2024-03-01') == date(2024, 3, 1)
+        assert updater._coerce_value(Date(), '2024-03') == '2024-03'
+        assert updater._coerce_value(String(), ' 2 ') == ' 2 '
@@ -0,0 +1,141 @@
+"""
+BlobStore 테스트
+
+업로드 파일 내용 주소 저장소 테스트:
+- 같은 내용은 blob 1개를 하드 링크로 공유, 참조 수 = 링크 수
+- 파일 교체는 다른 링크에 영향 없음
+- 참조 없는 blob 정리, 기존 업로드 폴더 중복 제거
+- 업로드 저장(FileStorageService)/첨부파일 동기화 연동
+"""
+import io
+import os
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+
+@pytest.fixture
+def store(app, tmp_path):
+    """임시 폴더 blob 저장소"""
+    from app.shared.services.blob_store import BlobStore
+
+    blob_store = BlobStore()
+    blob_store.root = str(tmp_path / 'uploads' / '.blobs')
+    return blob_store
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TestBlobStoreSave:
+    """저장/링크 테스트"""
+
+    def test_same_content_shares_one_blob(self, store, tmp_path):
+        """같은 내용은 같은 blob의 하드 링크"""
+        a = str(tmp_path / 'uploads' / 'personal' / '1' / 'a.pdf')
+        b = str(tmp_path / 'uploads' / 'corporate' / '2' / 'b.pdf')
+
+        digest_a, size = store.save(io.BytesIO(b'same content'), a)
+        digest_b, _ = store.save(io.BytesIO(b'same content'), b)
+
+        assert digest_a == digest_b
+        assert size == len(b'same content')
+        assert os.path.samefile(a, b)
+        assert os.path.samefile(a, store.blob_path(digest_a))
+        assert store.ref_count(digest_a) == 2
+        assert len(list(store.iter_blobs())) == 1
+        assert os.listdir(os.path.join(store.root, 'tmp')) == []
+
+    def test_replacing_file_keeps_other_links(self, store, tmp_path):
+        """같은 경로에 다시 저장해도 다른 링크의 내용은 그대로"""
+        a = str(tmp_path / 'a.txt')
+        b = str(tmp_path / 'b.txt')
+        digest, _ = store.save(io.BytesIO(b'original'), a)
+        store.link_file(a, b)
+
+        store.save(io.BytesIO(b'changed'), a)
+
+        assert _read(a) == b'changed'
+        assert _read(b) == b'original'
+        assert store.ref_count(digest) == 1
+
+    def test_prune_removes_unreferenced_blobs(self, store, tmp_path):
+        """참조가 없는 blob만 삭제, 최근 blob은 유지"""
+        kept = str(tmp_path / 'kept.txt')
+        removed = str(tmp_path / 'removed.txt')
+        kept_digest, _ = store.save(io.BytesIO(b'kept'), kept)
+        removed_digest, _ = store.save(io.BytesIO(b'removed'), removed)
+        os.remove(removed)
+
+        assert store.prune(min_age_seconds=3600) == {'blobs': 0, 'bytes': 0}
+        assert store.prune(min_age_seconds=0, dry_run=True)['blobs'] == 1
+        assert os.path.exists(store.blob_path(removed_digest))
+
+        assert store.prune(min_age_seconds=0) == {'blobs': 1, 'bytes': len(b'removed')}
+        assert not os.path.exists(store.blob_path(removed_digest))
+        assert store.ref_count(kept_digest) == 1
+
+
+class TestBlobStoreDedupe:
+    """기존 업로드 폴더 중복 제거 테스트"""
+
+    def test_dedupe_tree_links_duplicates(self, store, tmp_path):
+        """같은 내용의 기존 파일을 하나의 blob 링크로 교체 (경로 유지)"""
+        uploads = tmp_path / 'uploads'
+        paths = [uploads / 'personal' / 'a.pdf', uploads / 'attachments' / 'b.pdf',
+                 uploads / 'attachments' / 'c.pdf']
+        for path, content in zip(paths, [b'dup', b'dup', b'unique']):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+        assert store.dedupe_tree(str(uploads), dry_run=True) == \
+            {'files': 3, 'linked': 1, 'bytes_saved': 3}
+        assert not os.path.samefile(paths[0], paths[1])
+
+        assert store.dedupe_tree(str(uploads)) == {'files': 3, 'linked': 1, 'bytes_saved': 3}
+        assert os.path.samefile(paths[0], paths[1])
+        assert _read(paths[1]) == b'dup'
+        assert store.ref_count(store.hash_file(str(paths[2]))) == 1
+
+        # 재실행 시 추가 변경 없음 (blob 폴더는 검사 제외)
+        assert store.dedupe_tree(str(uploads)) == {'files': 3, 'linked': 0, 'bytes_saved': 0}
+
+
+class TestBlobStoreIntegration:
+    """업로드 저장/동기화 연동 테스트"""
+
+    def test_file_storage_save_file_uses_blobs(self, store, tmp_path, monkeypatch):
+        """FileStorageService 업로드는 blob 링크로 저장"""
+        from app.shared.services.file_storage_service import FileStorageService
+
+        monkeypatch.setattr('app.shared.services.blob_store.blob_store', store)
+        storage = FileStorageService()
+        folder = str(tmp_path / 'uploads' / 'personal' / '1' / 'attachments')
+
+        first = storage.save_file(FileStorage(io.BytesIO(b'%PDF-1.4'), 'a.pdf'), folder, 'a.pdf')
+        second = storage.save_file(FileStorage(io.BytesIO(b'%PDF-1.4'), 'b.pdf'), folder, 'b.pdf')
+
+        assert _read(first) == b'%PDF-1.4'
+        assert os.path.samefile(first, second)
+        assert len(list(store.iter_blobs())) == 1
+
+    def test_sync_attachment_links_instead_of_copying(self, app, store, tmp_path, monkeypatch):
+        """첨부파일 동기화는 원본과 같은 blob을 공유"""
+        from app.domains.sync.services.sync_relation_service import SyncRelationService
+
+        monkeypatch.setattr('app.shared.services.blob_store.blob_store', store)
+        monkeypatch.setattr(app, 'static_folder', str(tmp_path))
+        source = tmp_path / 'uploads' / 'personal' / '1' / 'attachments' / 'doc.pdf'
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b'document')
+
+        web_path = SyncRelationService()._copy_attachment_file(
+            '/static/uploads/personal/1/attachments/doc.pdf', 'employee', 7, 'document'
+        )
+
+        assert web_path.startswith('/static/uploads/attachments/employee_7_')
+        target = os.path.join(str(tmp_path), web_path[len('/static/'):])
+        assert os.path.samefile(str(source), target)
+        assert store.ref_count(store.hash_file(str(source))) == 2
@@ -234,15 +234,15 @@ class TestEmployeeCoreServiceStatistics:
     def test_get_department_statistics(self, mock_repos):
         """부서별 통계 조회"""
         mock_stats = [
-            {'department': '개발팀', 'count': 10},
-            {'department': '영업팀', 'count': 5}
+            {'organization_id': 2, 'name': '개발팀', 'count': 10},
+            {'organization_id': 3, 'name': '영업팀', 'count': 5}
         ]
         mock_repos.employee_repo.get_department_statistics.return_value = mock_stats
 
         result = mock_repos.get_department_statistics(organization_id=1)
 
         assert len(result) == 2
-        assert result[0]['department'] == '개발팀'
+        assert result[0]['name'] == '개발팀'
 
     def test_get_recent_employees(self, mock_repos):
         """최근 입사 직원 조회"""
@@ -268,5 +268,7 @@ class TestEmployeeCoreServiceStatistics:
         result = mock_repos.search_employees(query='검색어', organization_id=1)
 
         assert len(result) == 1
-        mock_repos.employee_repo.search.assert_called_once_with('검색어', organization_id=1)
+        mock_repos.employee_repo.search.assert_called_once_with(
+            '검색어', organization_id=1, limit=None, projection=False
+        )
 
@@ -0,0 +1,126 @@
+"""
+EmployeeRelationLoader 테스트
+
+직원 상세 관계형 데이터 일괄 조회: 개별 조회 메서드와 결과 동일, SQL 1회
+"""
+from datetime import date
+
+import pytest
+
+from app.domains.attachment.constants import AttachmentCategory
+from app.domains.attachment.models import Attachment
+from app.domains.employee.models import (
+    Attendance, Award, Career, Education, Employee, EmploymentContract, Insurance, Salary,
+    SalaryPayment,
+)
+from app.domains.employee.services import employee_relation_loader, employee_relation_service
+
+
+class TestEmployeeRelationLoader:
+    """EmployeeRelationLoader 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """관계형 데이터가 있는 직원 + 다른 직원"""
+        self.session = session
+        self.employee = Employee(name='홍길동', status='active')
+        self.other = Employee(name='김철수', status='active')
+        session.add_all([self.employee, self.other])
+        session.commit()
+
+        year = date.today().year
+        employee_id = self.employee.id
+        session.add_all([
+            Education(employee_id=employee_id, school_name='서울대학교', graduation_date='2010-02'),
+            Education(employee_id=employee_id, school_name='서울고등학교'),
+            Career(employee_id=employee_id, company_name='이전회사'),
+            Award(employee_id=employee_id, award_name='우수사원'),
+            Salary(employee_id=employee_id, base_salary=3000000),
+            Insurance(employee_id=employee_id, has_national_pension=True, national_pension_rate=4.5),
+            EmploymentContract(employee_id=employee_id, contract_date=date(2024, 1, 2)),
+            SalaryPayment(employee_id=employee_id, payment_period='2025-01'),
+            Attendance(employee_id=employee_id, year=year, month=1, work_days=20, late_count=1),
+            Attendance(employee_id=employee_id, year=year, month=2, work_days=19),
+            Attendance(employee_id=employee_id, year=year - 1, month=12, work_days=21),
+            Attachment(owner_type='employee', owner_id=employee_id, employee_id=employee_id,
+                       file_name='front_old.png', category=AttachmentCategory.BUSINESS_CARD_FRONT,
+                       upload_date='2025-01-01', display_order=1),
+            Attachment(owner_type='employee', owner_id=employee_id, employee_id=employee_id,
+                       file_name='front_new.png', category=AttachmentCategory.BUSINESS_CARD_FRONT,
+                       upload_date='2025-06-01', display_order=0),
+            Education(employee_id=self.other.id, school_name='다른학교'),
+            Attachment(owner_type='employee', owner_id=self.other.id, file_name='other.png'),
+        ])
+        session.commit()
+
+    def _individual(self, employee_id):
+        """기존 관계별 개별 조회 결과"""
+        service = employee_relation_service
+        year = date.today().year
+        return {
+            'education_list': service.get_education_list(employee_id),
+            'career_list': service.get_career_list(employee_id),
+            'certificate_list': service.get_certificate_list(employee_id),
+            'family_list': service.get_family_list(employee_id),
+            'language_list': service.get_language_list(employee_id),
+            'salary': service.get_salary_info(employee_id),
+            'benefit': service.get_benefit_info(employee_id),
+            'contract': service.get_contract_info(employee_id),
+            'salary_history_list': service.get_salary_history_list(employee_id),
+            'promotion_list': service.get_promotion_list(employee_id),
+            'evaluation_list': service.get_evaluation_list(employee_id),
+            'training_list': service.get_training_list(employee_id),
+            'attendance_summary': service.get_attendance_summary(employee_id, year),
+            'insurance': service.get_insurance_info(employee_id),
+            'hr_project_list': service.get_hr_project_list(employee_id),
+            'project_participation_list': service.get_project_participation_list(employee_id),
+            'award_list': service.get_award_list(employee_id),
+            'asset_list': service.get_asset_list(employee_id),
+            'salary_payment_list': service.get_salary_payment_list(employee_id),
+            'employment_contract_list': service.get_employment_contract_list(employee_id),
+            'attachment_list': service.get_attachment_list(employee_id),
+        }
+
+    def test_matches_individual_queries_in_one_statement(self):
+        """개별 조회와 같은 Dict, SQL 1회"""
+        expected = self._individual(self.employee.id)
+        self.session.expire_all()
+
+        data, query_count = employee_relation_loader.load_with_query_count(self.employee.id)
+
+        assert query_count == 1
+        assert data == expected
+        assert data['attendance_summary']['total_work_days'] == 39
+        assert [a['file_name'] for a in data['attachment_list']] == ['front_new.png', 'front_old.png']
+
+    def test_full_view_data_for_empty_employee(self):
+        """관계형 데이터가 없는 직원"""
+        other = Employee(name='신입', status='active')
+        self.session.add(other)
+        self.session.commit()
+
+        data = employee_relation_service.get_employee_full_view_data(other.id)
+
+        assert data == self._individual(other.id)
+        assert data['salary'] is None
+        assert data['attachment_list'] == []
+
+    def test_latest_attachment(self):
+        """카테고리별 최신 첨부파일 = get_attachment_by_category"""
+        attachments = employee_relation_loader.load(self.employee.id)['attachment_list']
+
+        for category in (AttachmentCategory.BUSINESS_CARD_FRONT, AttachmentCategory.BUSINESS_CARD_BACK):
+            assert employee_relation_loader.latest_attachment(attachments, category) == \
+                employee_relation_service.get_attachment_by_category(self.employee.id, category)
+
+    def test_padded_slots_are_typed_for_postgresql(self):
+        """빈 slot은 PostgreSQL에서도 CAST(NULL AS 타입)으로 컴파일 (UNION 타입 해석 오류 방지)"""
+        import re
+        from sqlalchemy.dialects import postgresql
+        from app.domains.employee.repositories import relation_batch_repository
+
+        relation_batch_repository._build()
+        sql = str(relation_batch_repository._statement.compile(dialect=postgresql.dialect()))
+
+        assert re.search(r'(?<!CAST\()NULL AS c\d+', sql) is None
+        assert 'CAST(NULL AS BOOLEAN)' in sql
@@ -75,7 +75,19 @@ class TestSyncEventManagerEvents:
     def setup_method(self):
         """테스트 전 초기화"""
         SyncEventManager._enabled = True
-        SyncEventManager._pending_syncs = set()
+        self.session = Mock(info={})
+        self.object_session = patch(
+            'app.shared.services.event_listeners.object_session', return_value=self.session
+        )
+        self.object_session.start()
+
+    def teardown_method(self):
+        """테스트 후 정리"""
+        self.object_session.stop()
+
+    def _pending(self):
+        """세션에 기록된 동기화 대상"""
+        return self.session.info.get(SyncEventManager.PENDING_KEY, {})
 
     def test_on_profile_update_adds_to_pending(self):
         """프로필 업데이트 시 pending_syncs에 추가"""
@@ -87,7 +99,7 @@ class TestSyncEventManagerEvents:
         SyncEventManager._on_profile_update(None, None, profile)
         
         # Then: pending_syncs에 추가됨
-        assert 123 in SyncEventManager._pending_syncs
+        assert 123 in self._pending()
 
     def test_on_profile_update_does_nothing_when_disabled(self):
         """비활성화 상태에서는 아무것도 하지 않음"""
@@ -100,7 +112,7 @@ class TestSyncEventManagerEvents:
         SyncEventManager._on_profile_update(None, None, profile)
         
         # Then: pending_syncs에 추가 안됨
-        assert 123 not in SyncEventManager._pending_syncs
+        assert 123 not in self._pending()
 
     def test_on_profile_insert_adds_to_pending(self):
         """프로필 생성 시 pending_syncs에 추가"""
@@ -112,13 +124,12 @@ class TestSyncEventManagerEvents:
         SyncEventManager._on_profile_insert(None, None, profile)
         
         # Then: pending_syncs에 추가됨
-        assert 456 in SyncEventManager._pending_syncs
+        assert 456 in self._pending()
 
     def test_after_commit_clears_pending_syncs(self):
         """커밋 후 pending_syncs가 클리어되는지 테스트"""
         # Given: pending_syncs에 항목들
-        SyncEventManager._pending_syncs = {1, 2, 3}
-        session = Mock()
+        session = Mock(info={SyncEventManager.PENDING_KEY: {1: None, 2: None, 3: None}})
         
         # When: 커밋 후 이벤트 (동기화 모킹)
         with patch.object(SyncEventManager, '_sync_user_contracts'):
@@ -126,13 +137,12 @@ class TestSyncEventManagerEvents:
                 SyncEventManager._after_commit(session)
         
         # Then: pending_syncs 클리어
-        assert len(SyncEventManager._pending_syncs) == 0
+        assert SyncEventManager.PENDING_KEY not in session.info
 
     def test_after_commit_does_nothing_without_pending(self):
         """pending_syncs가 비어있으면 아무것도 하지 않음"""
         # Given: 빈 pending_syncs
-        SyncEventManager._pending_syncs = set()
-        session = Mock()
+        session = Mock(info={})
         
         # When: 커밋 후 이벤트
         with patch.object(SyncEventManager, '_sync_user_contracts') as mock_sync:
@@ -144,8 +154,7 @@ class TestSyncEventManagerEvents:
     def test_after_commit_without_app_context(self):
         """앱 컨텍스트가 없으면 동기화 하지 않음"""
         # Given: pending_syncs와 앱 컨텍스트 없음
-        SyncEventManager._pending_syncs = {1}
-        session = Mock()
+        session = Mock(info={SyncEventManager.PENDING_KEY: {1: None}})
         
         # When: 커밋 후 이벤트
         with patch.object(SyncEventManager, '_sync_user_contracts') as mock_sync:
@@ -159,8 +168,7 @@ class TestSyncEventManagerEvents:
     def test_after_commit_handles_sync_errors(self):
         """동기화 중 에러 발생 시 로깅하고 계속 진행"""
         # Given: pending_syncs와 동기화 에러
-        SyncEventManager._pending_syncs = {1, 2}
-        session = Mock()
+        session = Mock(info={SyncEventManager.PENDING_KEY: {1: None, 2: None}})
         
         # When: 커밋 후 이벤트 (첫번째는 에러, 두번째는 성공)
         with patch.object(SyncEventManager, '_sync_user_contracts') as mock_sync:
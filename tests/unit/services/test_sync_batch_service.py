@@ -0,0 +1,206 @@
+"""
+SyncBatchService 테스트
+
+법인 일괄 동기화 테스트:
+- 시작: 승인 계약을 청크 단위 항목으로 저장, 진행 중 실행 재사용
+- 처리: 계약별 성공/실패 기록, 진행률(완료/실패/남음) 집계
+- 재개: 중단된 실행의 남은 항목부터 처리 (하트비트 중인 워커의 항목은 유지)
+- 병렬: 백그라운드 실행(dispatch)의 여러 워커 스레드가 청크를 나누어 처리
+"""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.domains.contract.models import PersonCorporateContract
+from app.domains.sync.models import SyncBatchItem, SyncBatchRun
+from app.domains.sync.repositories.sync_batch_repository import sync_batch_repository
+from app.domains.sync.services.sync_batch_service import sync_batch_service
+
+SYNC_TARGET = 'app.domains.sync.services.sync_service.SyncService.sync_personal_to_employee'
+
+
+@pytest.fixture
+def contracts(app, session, test_contract_approved, test_company, monkeypatch):
+    """승인 계약 3건 (청크 크기 2 → 청크 2개) + 대기 계약 1건"""
+    monkeypatch.setitem(app.config, 'SYNC_BATCH_CHUNK_SIZE', 2)
+    rows = [test_contract_approved]
+    for status in ['approved', 'approved', 'requested']:
+        contract = PersonCorporateContract(
+            person_user_id=test_contract_approved.person_user_id, company_id=test_company.id,
+            status=status, contract_type='employment', requested_by='company',
+        )
+        session.add(contract)
+        rows.append(contract)
+    session.commit()
+    return [contract for contract in rows if contract.status == 'approved']
+
+
+def _items(run_id):
+    return SyncBatchItem.query.filter_by(run_id=run_id).order_by(SyncBatchItem.id).all()
+
+
+class TestSyncBatchStart:
+    """실행 시작 테스트"""
+
+    def test_start_creates_chunked_items(self, contracts, test_company, test_user_corporate):
+        """승인 계약만 청크 단위 항목으로 저장"""
+        run = sync_batch_service.start_company_sync(test_company.id, test_user_corporate.id)
+
+        assert run['status'] == SyncBatchRun.STATUS_PENDING
+        assert run['total'] == 3
+        assert run['progress'] == {
+            'total': 3, 'done': 0, 'succeeded': 0, 'failed': 0, 'running': 0, 'remaining': 3
+        }
+        assert [(item.contract_id, item.chunk) for item in _items(run['id'])] == [
+            (contracts[0].id, 0), (contracts[1].id, 0), (contracts[2].id, 1)
+        ]
+
+    def test_start_reuses_active_run(self, contracts, test_company):
+        """진행 중인 실행이 있으면 새로 만들지 않음"""
+        first = sync_batch_service.start_company_sync(test_company.id)
+        second = sync_batch_service.start_company_sync(test_company.id)
+
+        assert second['id'] == first['id']
+        assert SyncBatchRun.query.count() == 1
+
+
+class TestSyncBatchRun:
+    """실행 처리 테스트"""
+
+    def test_run_records_success_and_failure(self, contracts, test_company):
+        """계약별 성공/실패 기록 후 완료"""
+        run = sync_batch_service.start_company_sync(test_company.id)
+        failing_id = contracts[1].id
+
+        def fake_sync(contract_id, **kwargs):
+            if contract_id == failing_id:
+                return {'success': False, 'error': '개인 프로필을 찾을 수 없습니다.'}
+            return {'success': True, 'changes': []}
+
+        with patch(SYNC_TARGET, side_effect=fake_sync) as mock_sync:
+            result = sync_batch_service.run(run['id'])
+
+        assert mock_sync.call_count == 3
+        assert result['status'] == SyncBatchRun.STATUS_COMPLETED
+        assert result['finished_at'] is not None
+        assert result['progress'] == {
+            'total': 3, 'done': 3, 'succeeded': 2, 'failed': 1, 'running': 0, 'remaining': 0
+        }
+        assert result['failures'] == [
+            {'contract_id': failing_id, 'error': '개인 프로필을 찾을 수 없습니다.'}
+        ]
+
+    def test_full_sync_enables_sharing(self, contracts, test_company):
+        """full_sync 실행은 계약마다 전체 공유 설정"""
+        from app.domains.contract.models import DataSharingSettings
+
+        run = sync_batch_service.start_company_sync(test_company.id, full_sync=True)
+        with patch(SYNC_TARGET, return_value={'success': True}):
+            sync_batch_service.run(run['id'])
+
+        settings = DataSharingSettings.query.filter(
+            DataSharingSettings.contract_id.in_([contract.id for contract in contracts])
+        ).all()
+        assert len(settings) == 3
+        assert all(setting.share_education and setting.share_career for setting in settings)
+
+    def test_interrupted_run_resumes_remaining(self, session, contracts, test_company):
+        """중단된 실행은 남은 항목부터 재개"""
+        run = sync_batch_service.start_company_sync(test_company.id)
+
+        # 첫 청크를 점유한 워커가 1건만 처리하고 중단
+        hour_ago = datetime.utcnow() - timedelta(hours=1)
+        [(item_id, _), _] = sync_batch_repository.claim_chunk(run['id'], 'crashed-worker', now=hour_ago)
+        sync_batch_repository.finish_item(run['id'], item_id, 'crashed-worker', now=hour_ago)
+        sync_batch_repository.update_run(run['id'], status=SyncBatchRun.STATUS_RUNNING)
+
+        progress = sync_batch_service.get_progress(run['id'])
+        assert progress['stale'] is True
+        assert progress['progress']['running'] == 1
+
+        resumed = sync_batch_service.start_company_sync(test_company.id)
+        assert resumed['id'] == run['id']
+        assert resumed['progress']['remaining'] == 2
+
+        with patch(SYNC_TARGET, return_value={'success': True}) as mock_sync:
+            result = sync_batch_service.run(run['id'])
+
+        assert mock_sync.call_count == 2
+        assert result['status'] == SyncBatchRun.STATUS_COMPLETED
+        assert result['progress']['succeeded'] == 3
+
+    def test_heartbeat_keeps_long_chunk_running(self, contracts, test_company):
+        """점유가 오래되어도 항목 완료 하트비트가 있으면 중단이 아니며 재개 시 되돌리지 않음"""
+        run = sync_batch_service.start_company_sync(test_company.id)
+        hour_ago = datetime.utcnow() - timedelta(hours=1)
+        [(first_id, _), (second_id, _)] = sync_batch_repository.claim_chunk(
+            run['id'], 'slow-worker', now=hour_ago
+        )
+        sync_batch_repository.update_run(run['id'], status=SyncBatchRun.STATUS_RUNNING)
+        sync_batch_repository.finish_item(run['id'], first_id, 'slow-worker')
+
+        progress = sync_batch_service.start_company_sync(test_company.id)
+        assert progress['stale'] is False
+        assert sync_batch_service.resume(run['id'])['progress']['running'] == 1
+
+        assert sync_batch_repository.finish_item(run['id'], second_id, 'slow-worker') is True
+        assert [item.status for item in _items(run['id'])][:2] == [SyncBatchItem.STATUS_SUCCEEDED] * 2
+
+    def test_cli_keeps_items_of_live_worker(self, runner, contracts, test_company):
+        """flask run-sync-batch는 하트비트 중인 워커의 항목을 되돌리지 않고 남은 청크만 처리"""
+        run = sync_batch_service.start_company_sync(test_company.id)
+        live_items = sync_batch_repository.claim_chunk(run['id'], 'live-worker')
+
+        with patch(SYNC_TARGET, return_value={'success': True}) as mock_sync:
+            result = runner.invoke(args=['run-sync-batch', str(run['id'])])
+
+        assert result.exit_code == 0
+        assert [call.kwargs['contract_id'] for call in mock_sync.call_args_list] == [contracts[2].id]
+        assert [(item.id, item.locked_by) for item in _items(run['id'])[:2]] == [
+            (item_id, 'live-worker') for item_id, _ in live_items
+        ]
+        assert sync_batch_service.get_progress(run['id'])['status'] == SyncBatchRun.STATUS_RUNNING
+
+
+class TestSyncBatchParallel:
+    """백그라운드 병렬 실행 테스트"""
+
+    def test_dispatch_runs_chunks_on_worker_threads(self, app, contracts, test_company, monkeypatch):
+        """dispatch → 백그라운드 스레드에서 워커 2개가 청크를 점유하여 계약별 1회씩 처리
+
+        인메모리 SQLite는 모든 스레드가 커넥션 하나를 공유하므로 워커 스레드(앱 컨텍스트 단위)를
+        잠금으로 순차 실행하고, 실행 스레드가 끝날 때까지 테스트 스레드는 DB를 사용하지 않습니다.
+        """
+        monkeypatch.setitem(app.config, 'SYNC_BATCH_WORKERS', 2)
+        run = sync_batch_service.start_company_sync(test_company.id)
+        monkeypatch.setitem(app.config, 'SYNC_BATCH_IN_PROCESS', True)
+        synced = []
+
+        def fake_sync(contract_id, **kwargs):
+            synced.append((contract_id, threading.current_thread().name))
+            return {'success': True}
+
+        work_in_app = sync_batch_service._work_in_app
+        connection_lock = threading.Lock()
+
+        def serialized_worker(*args):
+            with connection_lock:
+                work_in_app(*args)
+
+        with patch(SYNC_TARGET, side_effect=fake_sync), \
+                patch.object(sync_batch_service, '_work_in_app', side_effect=serialized_worker) as mock_worker:
+            sync_batch_service.dispatch(run['id'])
+            runner = sync_batch_service._runners.get(run['id'])
+            if runner:
+                runner.join(timeout=30)
+                assert not runner.is_alive()
+
+        worker_ids = [call.args[2] for call in mock_worker.call_args_list]
+        assert len(worker_ids) == len(set(worker_ids)) == 2
+        assert sorted(contract_id for contract_id, _ in synced) == sorted(contract.id for contract in contracts)
+        assert threading.main_thread().name not in {name for _, name in synced}
+        result = sync_batch_service.get_progress(run['id'])
+        assert result['status'] == SyncBatchRun.STATUS_COMPLETED
+        assert result['progress']['succeeded'] == 3
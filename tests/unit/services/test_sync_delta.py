@@ -0,0 +1,222 @@
+"""
+관계 데이터 변경분 동기화 테스트
+
+SyncRelationService 지문(SyncFingerprint) 기반 동기화:
+- 변경 없는 관계는 생략 (쓰기/로그 없음)
+- 변경된 행만 UPDATE (직원 측 행 ID 유지)
+- 대상 직원이 바뀌면 지문이 같아도 다시 동기화
+- 직원 측 행이 수정/삭제되었거나 수동(전체) 동기화면 지문이 같아도 다시 동기화
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.domains.contract.models import SyncLog
+from app.domains.employee.models import Career, Education, Profile
+from app.domains.sync.models import SyncFingerprint
+from app.domains.sync.services.sync_relation_service import SyncRelationService
+
+
+@pytest.fixture
+def profile(session, test_user_personal):
+    """학력 2건, 경력 1건을 가진 개인 프로필"""
+    profile = Profile(user_id=test_user_personal.id, name='테스트개인')
+    session.add(profile)
+    session.flush()
+    session.add_all([
+        Education(profile_id=profile.id, school_name='한국대학교', major='컴퓨터공학', degree='학사'),
+        Education(profile_id=profile.id, school_name='한국고등학교', major=None),
+        Career(profile_id=profile.id, company_name='이전회사', start_date='2020-01-01'),
+    ])
+    session.commit()
+    return profile
+
+
+def _sync(contract_id, profile, employee, sync_type=SyncLog.SYNC_TYPE_AUTO):
+    service = SyncRelationService(current_user_id=1)
+    return service.sync_relations(
+        contract_id=contract_id,
+        profile=profile,
+        employee=employee,
+        syncable={'education': True, 'career': True, 'attachments': False},
+        sync_type=sync_type
+    )
+
+
+def _employee_educations(employee_id):
+    return Education.query.filter_by(employee_id=employee_id).order_by(Education.id).all()
+
+
+class TestSyncRelationDelta:
+    """지문 기반 변경분 동기화 테스트"""
+
+    def test_first_sync_creates_rows_and_fingerprints(self, session, profile, test_employee,
+                                                      test_contract_approved):
+        """최초 동기화는 행 생성 후 관계별 지문 저장"""
+        result = _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+
+        assert result['synced_relations'] == ['education', 'career']
+        assert result['changes'][0] == {
+            'entity': 'education', 'count': 2, 'created': 2, 'updated': 0, 'deleted': 0
+        }
+        assert len(_employee_educations(test_employee.id)) == 2
+        fingerprints = SyncFingerprint.query.filter_by(contract_id=test_contract_approved.id).all()
+        assert {fp.relation_type: fp.row_count for fp in fingerprints} == {'education': 2, 'career': 1}
+
+    def test_unchanged_data_is_skipped(self, session, profile, test_employee, test_contract_approved):
+        """변경 없는 재동기화는 쓰기/로그 없이 생략"""
+        _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+        log_count = SyncLog.query.count()
+        ids = [edu.id for edu in _employee_educations(test_employee.id)]
+
+        result = _sync(test_contract_approved.id, profile, test_employee)
+
+        assert result['synced_relations'] == []
+        assert result['changes'] == []
+        assert not session.dirty and not session.new and not session.deleted
+        assert SyncLog.query.count() == log_count
+        assert [edu.id for edu in _employee_educations(test_employee.id)] == ids
+
+    def test_changed_row_updates_in_place(self, session, profile, test_employee, test_contract_approved):
+        """변경된 행만 UPDATE, 직원 측 행 ID 유지"""
+        _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+        ids = [edu.id for edu in _employee_educations(test_employee.id)]
+
+        source = profile.educations.filter_by(school_name='한국대학교').first()
+        source.degree = '석사'
+        session.commit()
+
+        result = _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+
+        assert result['synced_relations'] == ['education']
+        assert result['changes'] == [
+            {'entity': 'education', 'count': 2, 'created': 0, 'updated': 1, 'deleted': 0}
+        ]
+        educations = _employee_educations(test_employee.id)
+        assert [edu.id for edu in educations] == ids
+        assert {edu.school_name: edu.degree for edu in educations}['한국대학교'] == '석사'
+
+    def test_new_employee_forces_resync(self, session, profile, test_employee, test_company,
+                                        test_contract_approved):
+        """대상 직원이 바뀌면 지문이 같아도 다시 동기화"""
+        from app.domains.employee.models import Employee
+
+        _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+        other = Employee(employee_number='EMP002', name='새직원', status='active',
+                         company_id=test_company.id)
+        session.add(other)
+        session.commit()
+
+        result = _sync(test_contract_approved.id, profile, other)
+        session.commit()
+
+        assert result['synced_relations'] == ['education', 'career']
+        assert len(_employee_educations(other.id)) == 2
+        fingerprint = session.get(SyncFingerprint, (test_contract_approved.id, 'education'))
+        assert fingerprint.employee_id == other.id
+
+    def test_employee_side_edit_is_restored(self, session, profile, test_employee,
+                                            test_contract_approved):
+        """법인에서 직원 측 행을 수정/삭제하면 자동 동기화가 생략되지 않고 복원"""
+        _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+        edited, removed = _employee_educations(test_employee.id)
+        edited.major = '법인수정'
+        session.delete(removed)
+        session.commit()
+
+        result = _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+
+        assert result['synced_relations'] == ['education']
+        assert sorted((edu.school_name, edu.major) for edu in _employee_educations(test_employee.id)) == [
+            ('한국고등학교', None), ('한국대학교', '컴퓨터공학')
+        ]
+
+    def test_manual_full_sync_bypasses_fingerprint(self, session, profile, test_employee,
+                                                   test_contract_approved):
+        """수동(전체) 동기화는 지문과 무관하게 직원 측 행을 비교하여 복원"""
+        _sync(test_contract_approved.id, profile, test_employee)
+        session.commit()
+        careers = profile.careers.all()
+        employee_career = test_employee.careers.first()
+        employee_career.department = '법인수정'
+        session.commit()
+
+        with patch.object(SyncRelationService, '_employee_fingerprint') as employee_fingerprint:
+            result = _sync(test_contract_approved.id, profile, test_employee, SyncLog.SYNC_TYPE_MANUAL)
+            session.commit()
+
+        employee_fingerprint.assert_not_called()
+        assert result['synced_relations'] == ['career']
+        assert test_employee.careers.first().department == careers[0].department
+
+    def test_fingerprint_ignores_row_order(self):
+        """지문은 행 순서와 무관"""
+        rows = [{'school_name': 'A', 'major': None}, {'school_name': 'B', 'major': 'X'}]
+        assert SyncRelationService.fingerprint_rows(rows) == \
+            SyncRelationService.fingerprint_rows(list(reversed(rows)))
+        assert SyncRelationService.fingerprint_rows(rows) != \
+            SyncRelationService.fingerprint_rows(rows[:1])
+
+
+class TestSyncAttachmentDelta:
+    """첨부파일 변경분 동기화 테스트"""
+
+    def test_attachments_kept_when_unchanged_and_removed_when_unshared(
+            self, app, session, profile, test_employee, test_contract_approved, tmp_path, monkeypatch):
+        """같은 파일은 유지, 개인 측에서 삭제된 첨부파일은 직원 측에서도 삭제"""
+        import os
+        from app.domains.attachment.models import Attachment
+        from app.domains.contract.models import DataSharingSettings
+        from app.shared.services.blob_store import BlobStore
+
+        store = BlobStore()
+        store.root = str(tmp_path / 'uploads' / '.blobs')
+        monkeypatch.setattr('app.shared.services.blob_store.blob_store', store)
+        monkeypatch.setattr(app, 'static_folder', str(tmp_path))
+        source = tmp_path / 'uploads' / 'personal' / 'doc.pdf'
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b'document')
+
+        session.add(DataSharingSettings(contract_id=test_contract_approved.id, share_documents=True,
+                                        share_profile_photo=False))
+        personal = Attachment(owner_type='profile', owner_id=profile.id, category='document',
+                              file_name='doc.pdf', file_path='/static/uploads/personal/doc.pdf')
+        session.add(personal)
+        session.commit()
+
+        def sync_attachments():
+            result = SyncRelationService(current_user_id=1).sync_relations(
+                contract_id=test_contract_approved.id, profile=profile, employee=test_employee,
+                syncable={}, sync_type=SyncLog.SYNC_TYPE_MANUAL
+            )
+            session.commit()
+            return result
+
+        def synced():
+            return Attachment.query.filter_by(owner_type='employee', owner_id=test_employee.id).all()
+
+        assert sync_attachments()['synced_relations'] == ['attachments']
+        [copy] = synced()
+        copy_path = os.path.join(str(tmp_path), copy.file_path[len('/static/'):])
+        assert os.path.samefile(str(source), copy_path)
+
+        assert sync_attachments()['synced_relations'] == []
+        assert [att.id for att in synced()] == [copy.id]
+
+        session.delete(personal)
+        session.commit()
+        session.add(Attachment(owner_type='profile', owner_id=profile.id, category='document',
+                               file_name='other.pdf', file_path='/static/uploads/personal/doc.pdf'))
+        session.commit()
+
+        result = sync_attachments()
+        assert result['changes'] == [{'entity': 'attachment', 'count': 1, 'deleted': 1}]
+        assert [att.file_name for att in synced()] == ['other.pdf']
+        assert not os.path.exists(copy_path)
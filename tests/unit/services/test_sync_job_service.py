@@ -0,0 +1,466 @@
+"""
+SyncJobService 테스트
+
+자동 동기화 작업 큐 테스트:
+- 적재: 실시간 동기화 계약만, (user_id, contract_id)당 1행 (멱등)
+- 처리: 성공/재시도(백오프)/최종 실패, 실행 중 재요청
+- 중단된 작업 복구, 커밋 후 적재 (SyncEventManager)
+- 병합: 대기 시간 내 연속 요청은 1건으로, 변경 섹션의 합집합만 동기화
+"""
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.domains.contract.models import DataSharingSettings, PersonCorporateContract
+from app.domains.sync.models import SyncJob
+from app.domains.sync.repositories.sync_job_repository import sync_job_repository
+from app.domains.sync.services.sync_job_service import sync_job_service
+from app.domains.sync.services.sync_service import SyncService
+
+SYNC_TARGET = 'app.domains.sync.services.sync_service.SyncService.sync_personal_to_employee'
+
+
+@pytest.fixture
+def realtime_contract(session, test_contract_approved):
+    """실시간 동기화가 켜진 승인 계약"""
+    session.add(DataSharingSettings(contract_id=test_contract_approved.id, is_realtime_sync=True))
+    session.commit()
+    return test_contract_approved
+
+
+def _jobs():
+    return SyncJob.query.order_by(SyncJob.id).all()
+
+
+class TestSyncJobEnqueue:
+    """작업 적재 테스트"""
+
+    def test_enqueue_only_realtime_contracts(self, session, realtime_contract, test_company):
+        """실시간 동기화 계약만 적재, 수동 동기화 계약 제외"""
+        manual = PersonCorporateContract(
+            person_user_id=realtime_contract.person_user_id, company_id=test_company.id,
+            status='approved', contract_type='employment', requested_by='company',
+        )
+        session.add(manual)
+        session.commit()
+        session.add(DataSharingSettings(contract_id=manual.id, is_realtime_sync=False))
+        session.commit()
+
+        count = sync_job_service.enqueue_for_user(realtime_contract.person_user_id)
+
+        assert count == 1
+        jobs = _jobs()
+        assert [(job.contract_id, job.status) for job in jobs] == [
+            (realtime_contract.id, SyncJob.STATUS_PENDING)
+        ]
+
+    def test_enqueue_is_idempotent_per_contract(self, session, realtime_contract):
+        """재적재는 같은 행을 재사용하고 재시도 횟수 초기화"""
+        user_id = realtime_contract.person_user_id
+        sync_job_service.enqueue_for_user(user_id)
+        job = _jobs()[0]
+        job.status = SyncJob.STATUS_FAILED
+        job.attempts = 5
+        session.commit()
+
+        sync_job_service.enqueue_for_user(user_id)
+        sync_job_service.enqueue_for_user(user_id)
+
+        session.expire_all()
+        jobs = _jobs()
+        assert len(jobs) == 1
+        assert jobs[0].status == SyncJob.STATUS_PENDING
+        assert jobs[0].attempts == 0
+
+    def test_enqueue_while_running_requeues_after_success(self, session, realtime_contract):
+        """실행 중 재요청은 완료 후 다시 대기"""
+        user_id = realtime_contract.person_user_id
+        sync_job_service.enqueue_for_user(user_id)
+        job = sync_job_repository.claim_next('worker-a')
+        assert job.status == SyncJob.STATUS_RUNNING
+
+        sync_job_repository.enqueue(user_id, realtime_contract.id, 'auto',
+                                    now=datetime.utcnow() + timedelta(seconds=1))
+        session.expire_all()
+        assert _jobs()[0].status == SyncJob.STATUS_RUNNING
+
+        sync_job_repository.mark_succeeded(job.id, 'worker-a')
+        session.expire_all()
+        assert _jobs()[0].status == SyncJob.STATUS_PENDING
+
+
+class TestSyncJobProcessing:
+    """작업 처리 테스트"""
+
+    def test_run_pending_success(self, session, realtime_contract):
+        """성공 시 succeeded, 워커별 SyncService 사용"""
+        sync_job_service.enqueue_for_user(realtime_contract.person_user_id)
+
+        with patch(SYNC_TARGET, return_value={'success': True, 'changes': []}) as mock_sync:
+            stats = sync_job_service.run_pending(worker_id='worker-a')
+
+        assert stats == {'succeeded': 1, 'retrying': 0, 'failed': 0}
+        mock_sync.assert_called_once_with(
+            contract_id=realtime_contract.id, sync_type='auto', commit=False, sections=None
+        )
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_SUCCEEDED
+        assert job.attempts == 1
+        assert job.locked_by is None
+        assert job.finished_at is not None
+
+    def test_exception_retries_with_backoff(self, app, session, realtime_contract):
+        """예외 시 지수 백오프 재시도, 최대 횟수 후 failed"""
+        sync_job_service.enqueue_for_user(realtime_contract.person_user_id)
+        max_attempts = app.config['SYNC_QUEUE_MAX_ATTEMPTS']
+        base = app.config['SYNC_QUEUE_RETRY_BASE_SECONDS']
+
+        with patch(SYNC_TARGET, side_effect=RuntimeError('db down')):
+            stats = sync_job_service.run_pending(worker_id='worker-a')
+            assert stats == {'succeeded': 0, 'retrying': 1, 'failed': 0}
+            job = _jobs()[0]
+            assert job.status == SyncJob.STATUS_PENDING
+            assert job.last_error == 'db down'
+            assert job.next_run_at >= datetime.utcnow() + timedelta(seconds=base - 5)
+
+            # 백오프 시각 전에는 점유되지 않음
+            assert sync_job_service.run_pending(worker_id='worker-a')['retrying'] == 0
+
+            for _ in range(max_attempts - 1):
+                job.next_run_at = datetime.utcnow() - timedelta(seconds=1)
+                session.commit()
+                stats = sync_job_service.run_pending(worker_id='worker-a')
+
+        assert stats == {'succeeded': 0, 'retrying': 0, 'failed': 1}
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_FAILED
+        assert job.attempts == max_attempts
+
+    def test_result_error_fails_without_retry(self, session, realtime_contract):
+        """동기화 결과 오류(계약 미승인 등)는 재시도 없이 failed"""
+        sync_job_service.enqueue_for_user(realtime_contract.person_user_id)
+
+        with patch(SYNC_TARGET, return_value={'success': False, 'error': '승인된 계약만 동기화할 수 있습니다.'}):
+            stats = sync_job_service.run_pending(worker_id='worker-a')
+
+        assert stats['failed'] == 1
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_FAILED
+        assert job.last_error == '승인된 계약만 동기화할 수 있습니다.'
+
+    def test_release_stale_running_jobs(self, session, realtime_contract):
+        """중단된 워커의 작업은 다시 대기"""
+        sync_job_service.enqueue_for_user(realtime_contract.person_user_id)
+        job = sync_job_repository.claim_next('crashed-worker')
+        job.started_at = datetime.utcnow() - timedelta(hours=1)
+        session.commit()
+
+        assert sync_job_repository.release_stale(900) == 1
+        session.expire_all()
+        assert _jobs()[0].status == SyncJob.STATUS_PENDING
+        assert sync_job_repository.claim_next('worker-b').id == job.id
+
+
+class TestSyncEventManagerQueue:
+    """커밋 후 적재 테스트"""
+
+    def test_after_commit_enqueues_without_running_sync(self, session, realtime_contract):
+        """커밋 후 작업만 적재하고 동기화는 실행하지 않음"""
+        from app.shared.services.event_listeners import SyncEventManager
+
+        SyncEventManager._enabled = True
+        session.info[SyncEventManager.PENDING_KEY] = {realtime_contract.person_user_id: None}
+
+        with patch.object(SyncService, 'sync_personal_to_employee') as mock_sync:
+            SyncEventManager._after_commit(session)
+
+        mock_sync.assert_not_called()
+        assert SyncEventManager.PENDING_KEY not in session.info
+        assert [job.contract_id for job in _jobs()] == [realtime_contract.id]
+
+    @pytest.mark.parametrize('command, started', [(None, True), ('run', True), ('db', False)])
+    def test_workers_start_only_in_server_process(self, app, monkeypatch, command, started):
+        """작업 큐 워커는 웹 서버(flask run 포함)에서만 시작, 그 외 CLI 명령은 시작하지 않음"""
+        import click
+        from app.shared.services.event_listeners import SyncEventManager, init_event_listeners
+
+        monkeypatch.setitem(app.config, 'SYNC_QUEUE_WORKERS', 2)
+        job_service = Mock()
+        monkeypatch.setattr(SyncEventManager, '_get_job_service', classmethod(lambda cls: job_service))
+        monkeypatch.setattr(SyncEventManager, '_enabled', SyncEventManager._enabled)
+
+        if command:
+            with click.Context(click.Command(command), info_name=command):
+                init_event_listeners(app)
+        else:
+            init_event_listeners(app)
+
+        assert job_service.start_workers_lazily.called is started
+        job_service.start_workers.assert_not_called()
+
+    def test_workers_start_once_per_process_on_first_request(self, app, monkeypatch):
+        """워커는 앱 생성 시가 아니라 프로세스별 첫 요청에서 시작 (fork 후 자식에서 다시 시작)"""
+        import os
+        from flask import request_started
+        from app.domains.sync.services.sync_job_service import SyncJobService
+
+        service = SyncJobService()
+        monkeypatch.setattr(service, 'start_workers', Mock())
+        service.start_workers_lazily(app, 2)
+        try:
+            service.start_workers.assert_not_called()
+            request_started.send(app)
+            request_started.send(app)
+            service.start_workers.assert_called_once_with(app, 2)
+
+            # fork된 자식 프로세스의 첫 요청
+            service._workers = [Mock()]
+            monkeypatch.setattr(os, 'getpid', lambda: -1)
+            request_started.send(app)
+            assert service.start_workers.call_count == 2
+            assert service._workers == []
+        finally:
+            service.stop_workers()
+
+        request_started.send(app)
+        assert service.start_workers.call_count == 2
+
+    def test_rollback_discards_pending_syncs(self, session, test_user_personal):
+        """롤백된 변경은 커밋 시 적재하지 않음 (동기화 대상은 세션별 기록)"""
+        from app.shared.services.event_listeners import SyncEventManager
+
+        SyncEventManager._mark_pending(session, test_user_personal.id, 'basic')
+        SyncEventManager._after_rollback(session)
+
+        assert SyncEventManager.PENDING_KEY not in session.info
+
+
+class TestSyncJobCoalescing:
+    """연속 요청 병합 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def coalesce_window(self, app, monkeypatch):
+        monkeypatch.setitem(app.config, 'SYNC_COALESCE_WINDOW_SECONDS', 5)
+        monkeypatch.setitem(app.config, 'SYNC_COALESCE_MAX_DELAY_SECONDS', 30)
+
+    def test_requests_within_window_run_once_with_union(self, session, realtime_contract):
+        """대기 시간 내 요청은 1회 실행, 변경 섹션 합집합만 동기화"""
+        user_id = realtime_contract.person_user_id
+        for sections in [{'education'}, {'career'}, {'education', 'basic'}]:
+            sync_job_service.enqueue_for_user(user_id, sections=sections)
+
+        job = _jobs()[0]
+        assert job.dirty_sections == 'basic,career,education'
+        assert job.next_run_at > datetime.utcnow()
+
+        with patch(SYNC_TARGET, return_value={'success': True}) as mock_sync:
+            # 대기 시간 전에는 실행하지 않음
+            assert sync_job_service.run_pending(worker_id='worker-a')['succeeded'] == 0
+            job.next_run_at = datetime.utcnow() - timedelta(seconds=1)
+            session.commit()
+            assert sync_job_service.run_pending(worker_id='worker-a')['succeeded'] == 1
+
+        mock_sync.assert_called_once_with(
+            contract_id=realtime_contract.id, sync_type='auto', commit=False,
+            sections={'basic', 'career', 'education'}
+        )
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_SUCCEEDED
+        assert job.dirty_sections == ''
+
+    def test_window_is_capped_by_max_delay(self, session, realtime_contract):
+        """계속 요청해도 첫 요청 후 최대 지연 시각에는 실행"""
+        user_id, contract_id = realtime_contract.person_user_id, realtime_contract.id
+        start = datetime.utcnow()
+        for offset in [0, 4, 8]:
+            sync_job_repository.enqueue(user_id, contract_id, 'auto', sections=['education'],
+                                        now=start + timedelta(seconds=offset),
+                                        window_seconds=5, max_delay_seconds=10)
+            session.commit()
+
+        job = _jobs()[0]
+        assert job.coalesce_since == start
+        assert job.next_run_at == start + timedelta(seconds=10)
+
+    def test_full_request_overrides_sections(self, realtime_contract):
+        """섹션 없는 요청이 섞이면 전체 동기화"""
+        user_id = realtime_contract.person_user_id
+        sync_job_service.enqueue_for_user(user_id, sections={'education'})
+        sync_job_service.enqueue_for_user(user_id)
+        sync_job_service.enqueue_for_user(user_id, sections={'career'})
+
+        assert _jobs()[0].dirty_sections is None
+
+    def test_failed_run_keeps_sections(self, session, realtime_contract):
+        """실패한 실행의 섹션은 재시도 시 다시 동기화"""
+        sync_job_service.enqueue_for_user(realtime_contract.person_user_id, sections={'education'})
+        job = _jobs()[0]
+        job.next_run_at = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+
+        with patch(SYNC_TARGET, side_effect=RuntimeError('db down')):
+            assert sync_job_service.run_pending(worker_id='worker-a')['retrying'] == 1
+
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_PENDING
+        assert job.dirty_sections == 'education'
+
+    def test_request_during_run_syncs_only_new_sections(self, session, realtime_contract):
+        """실행 중 요청은 완료 후 새 섹션만 다시 대기"""
+        user_id, contract_id = realtime_contract.person_user_id, realtime_contract.id
+        sync_job_repository.enqueue(user_id, contract_id, 'auto', sections=['education'])
+        session.commit()
+        job = sync_job_repository.claim_next('worker-a')
+        assert job.run_sections == 'education'
+
+        sync_job_repository.enqueue(user_id, contract_id, 'auto', sections=['career'],
+                                    now=datetime.utcnow() + timedelta(seconds=1))
+        session.commit()
+        sync_job_repository.mark_succeeded(job.id, 'worker-a')
+
+        session.expire_all()
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_PENDING
+        assert job.dirty_sections == 'career'
+
+    @pytest.mark.parametrize('sections, expected', [(['career'], 'career'), (None, None)])
+    def test_request_stamped_before_claim_is_not_lost(self, session, realtime_contract, sections, expected):
+        """적재 시각이 점유 전이어도 점유 뒤에 반영된 요청은 완료 후 다시 대기"""
+        user_id, contract_id = realtime_contract.person_user_id, realtime_contract.id
+        sync_job_repository.enqueue(user_id, contract_id, 'auto', sections=['education'])
+        session.commit()
+        requested_at = datetime.utcnow()
+        job = sync_job_repository.claim_next('worker-a', now=requested_at + timedelta(seconds=1))
+
+        sync_job_repository.enqueue(user_id, contract_id, 'auto', sections=sections, now=requested_at)
+        session.commit()
+        sync_job_repository.mark_succeeded(job.id, 'worker-a')
+
+        session.expire_all()
+        job = _jobs()[0]
+        assert job.status == SyncJob.STATUS_PENDING
+        assert job.dirty_sections == expected
+
+
+class TestSyncEventManagerSections:
+    """변경 섹션 감지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def manager(self):
+        from app.shared.services.event_listeners import SyncEventManager
+
+        SyncEventManager._enabled = True
+        yield SyncEventManager
+        SyncEventManager._enabled = False
+
+    def test_profile_relation_change_marks_section(self, manager, session, test_user_personal):
+        """프로필 소유 이력 변경은 해당 섹션만, 직원 소유 행은 무시"""
+        from app.domains.employee.models import Education, FamilyMember, Profile
+
+        profile = Profile(user_id=test_user_personal.id, name='테스트개인')
+        session.add(profile)
+        session.flush()
+        connection = session.connection()
+
+        education = Education(profile_id=profile.id, school_name='한국대학교')
+        synced = FamilyMember(profile_id=profile.id, employee_id=1, name='가족')
+        session.add_all([education, synced])
+        manager._on_section_change(Education.__mapper__, connection, education)
+        manager._on_section_change(FamilyMember.__mapper__, connection, synced)
+        session.expunge_all()
+
+        pending = session.info[manager.PENDING_KEY]
+        assert pending == {test_user_personal.id: {'education'}}
+
+        # 기본정보 변경 후 프로필 생성(전체)이 오면 전체 동기화
+        personal_profile = Mock(user_id=test_user_personal.id)
+        with patch('app.shared.services.event_listeners.object_session', return_value=session):
+            manager._on_profile_update(None, None, personal_profile)
+            assert pending[test_user_personal.id] == {'education', 'basic'}
+            manager._on_profile_insert(None, None, personal_profile)
+        manager._mark_pending(session, test_user_personal.id, 'career')
+        assert pending == {test_user_personal.id: None}
+
+    def test_bulk_write_marks_profile_sections(self, manager, session, test_user_personal):
+        """일괄 쓰기는 모델 이벤트가 없으므로 Repository가 프로필 소유 행의 섹션을 직접 마킹"""
+        from app.domains.employee.models import Career, Profile
+        from app.shared.repositories.base_repository import BaseRepository
+
+        profile = Profile(user_id=test_user_personal.id, name='테스트개인')
+        session.add(profile)
+        session.flush()
+
+        BaseRepository(Career).bulk_create([
+            {'profile_id': profile.id, 'company_name': '회사1'},
+            {'profile_id': profile.id, 'company_name': '회사2'},
+        ], commit=False)
+
+        assert session.info[manager.PENDING_KEY] == {test_user_personal.id: {'career'}}
+
+    def test_after_commit_enqueues_dirty_sections(self, manager, session, realtime_contract):
+        """커밋 후 변경 섹션과 함께 적재"""
+        user_id = realtime_contract.person_user_id
+        manager._mark_pending(session, user_id, 'education')
+        manager._mark_pending(session, user_id, 'basic')
+
+        manager._after_commit(session)
+
+        assert manager.PENDING_KEY not in session.info
+        assert _jobs()[0].dirty_sections == 'basic,education'
+
+
+class TestSyncSections:
+    """변경 섹션만 동기화 테스트"""
+
+    @pytest.fixture
+    def personal(self, session, test_user_personal, test_contract_approved, test_company):
+        """학력/경력을 가진 개인 프로필 + 계약 사번의 재직 직원"""
+        from app.domains.employee.models import Career, Education, Employee, Profile
+        from app.domains.user.models import PersonalProfile
+
+        session.add(PersonalProfile(user_id=test_user_personal.id, name='테스트개인'))
+        profile = Profile(user_id=test_user_personal.id, name='테스트개인')
+        session.add(profile)
+        session.flush()
+        session.add_all([
+            Education(profile_id=profile.id, school_name='한국대학교'),
+            Career(profile_id=profile.id, company_name='이전회사', start_date='2020-01-01'),
+            DataSharingSettings(contract_id=test_contract_approved.id, share_basic_info=True,
+                                share_education=True, share_career=True),
+        ])
+        employee = Employee(employee_number=test_contract_approved.employee_number, name='테스트개인',
+                            status='active', company_id=test_company.id)
+        session.add(employee)
+        session.commit()
+        return employee
+
+    def test_sections_sync_only_dirty_relations(self, session, personal, test_contract_approved):
+        """지정 섹션만 기존 직원에 동기화 (새 직원 생성 없음)"""
+        from app.domains.employee.models import Career, Education, Employee
+
+        result = SyncService().sync_personal_to_employee(
+            test_contract_approved.id, sync_type='auto', sections={'education'}
+        )
+
+        assert result['success'] is True
+        assert result['relations'] == ['education']
+        assert result['synced_fields'] == []
+        assert Employee.query.count() == 1
+        assert Education.query.filter_by(employee_id=personal.id).count() == 1
+        assert Career.query.filter_by(employee_id=personal.id).count() == 0
+
+    def test_sections_fall_back_to_full_sync_without_employee(self, session, personal,
+                                                              test_contract_approved):
+        """계약 사번의 직원이 없으면 직원 생성 후 전체 동기화"""
+        test_contract_approved.employee_number = None
+        session.commit()
+
+        with patch.object(SyncService, '_find_or_create_employee', return_value=personal) as mock_create:
+            result = SyncService().sync_personal_to_employee(
+                test_contract_approved.id, sync_type='auto', sections={'education'}
+            )
+
+        mock_create.assert_called_once()
+        assert result['success'] is True
+        assert set(result['relations']) == {'education', 'career'}
@@ -0,0 +1,125 @@
+"""
+직원 자동완성 인덱스 테스트
+
+접두/초성 검색, 순위, 커밋 후 증분 반영, 테넌트 분리 테스트
+"""
+import pytest
+
+from app.domains.company.models import Organization
+from app.domains.employee.models import Employee
+from app.domains.employee.services.typeahead_index import employee_typeahead_index
+
+
+class TestEmployeeTypeaheadIndex:
+    """employee_typeahead_index 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session, app):
+        """인덱스 유지 (TTL 내 재생성 없음)"""
+        app.config['TYPEAHEAD_INDEX_TTL_SECONDS'] = 300
+        employee_typeahead_index.clear()
+        yield
+        app.config['TYPEAHEAD_INDEX_TTL_SECONDS'] = 0
+        employee_typeahead_index.clear()
+
+    def _build_tenant(self, session, code='HQ'):
+        root = Organization(name=f'본사{code}', code=code, org_type='company')
+        session.add(root)
+        session.commit()
+        dept = Organization(name='개발팀', code=f'{code}-DEV', org_type='department',
+                            parent_id=root.id)
+        session.add(dept)
+        session.commit()
+        return root, dept
+
+    def _names(self, root_id, query, limit=10):
+        return [r['name'] for r in employee_typeahead_index.search(root_id, query, limit=limit)]
+
+    def test_prefix_choseong_and_rank(self, session):
+        """이름 정확 일치 > 이름 접두 > 기타(이름 부분/초성/사번/부서) 순"""
+        root, dept = self._build_tenant(session)
+        session.add_all([
+            Employee(name='김민수', employee_number='EMP-001', department='개발팀',
+                     organization_id=dept.id, status='active'),
+            Employee(name='김민', employee_number='EMP-002', department='인사팀',
+                     organization_id=dept.id, status='active'),
+            Employee(name='박민수', employee_number='EMP-003', department='영업팀',
+                     organization_id=root.id, status='active'),
+        ])
+        session.commit()
+
+        assert self._names(root.id, '김민') == ['김민', '김민수']
+        assert self._names(root.id, '민수') == ['김민수', '박민수']
+        assert self._names(root.id, 'ㄱㅁㅅ') == ['김민수']
+        assert self._names(root.id, 'emp-003') == ['박민수']
+        assert self._names(root.id, '인사') == ['김민']
+        assert self._names(root.id, '김', limit=1) == ['김민']
+
+    def test_incremental_update_after_commit(self, session):
+        """생성/수정/삭제 커밋이 재생성 없이 반영되고 롤백은 무시"""
+        root, dept = self._build_tenant(session)
+        employee = Employee(name='이영희', organization_id=dept.id, status='active')
+        session.add(employee)
+        session.commit()
+
+        index = employee_typeahead_index.get_index(root.id)
+        assert self._names(root.id, '이영') == ['이영희']
+
+        session.add(Employee(name='이영수', organization_id=dept.id, status='active'))
+        session.commit()
+        employee.name = '최영희'
+        session.commit()
+        assert self._names(root.id, '이영') == ['이영수']
+        assert self._names(root.id, '최영') == ['최영희']
+
+        employee.name = '정영희'
+        session.flush()
+        session.rollback()
+        assert self._names(root.id, '정영') == []
+
+        session.delete(Employee.query.filter_by(name='이영수').one())
+        session.commit()
+        assert self._names(root.id, '이영') == []
+        assert employee_typeahead_index.get_index(root.id) is index
+
+    def test_tenant_isolation(self, session):
+        """다른 테넌트 직원은 검색되지 않음"""
+        root_a, dept_a = self._build_tenant(session, 'A')
+        root_b, dept_b = self._build_tenant(session, 'B')
+        session.add_all([
+            Employee(name='홍길동', organization_id=dept_a.id, status='active'),
+            Employee(name='홍길순', organization_id=dept_b.id, status='active'),
+        ])
+        session.commit()
+        employee_typeahead_index.get_index(root_a.id)
+        employee_typeahead_index.get_index(root_b.id)
+
+        session.add(Employee(name='홍두깨', organization_id=dept_b.id, status='active'))
+        session.commit()
+
+        assert self._names(root_a.id, '홍') == ['홍길동']
+        assert self._names(root_b.id, '홍') == ['홍길순', '홍두깨']
+        assert employee_typeahead_index.stats() == {'tenants': 2, 'records': 3}
+
+    def test_company_scope_applies_changes_by_company(self, session, app, monkeypatch):
+        """company_id 스코프 모드는 생성 쿼리와 같이 회사 ID로 증분 반영 대상 판단"""
+        from app.domains.company.models import Company
+        from app.shared.constants.system_config import TenantScopeConfig
+
+        monkeypatch.setitem(app.config, 'TENANT_SCOPE_MODE', TenantScopeConfig.MODE_COMPANY_ID)
+        root, dept = self._build_tenant(session)
+        company = Company(name='법인', business_number='1234500001', representative='홍길동',
+                          root_organization_id=root.id)
+        session.add(company)
+        session.commit()
+        session.add(Employee(name='홍길동', company_id=company.id, status='active'))
+        session.commit()
+        assert self._names(root.id, '홍') == ['홍길동']
+
+        # 조직 미배정이어도 같은 회사면 반영, 조직 트리 소속이어도 다른 회사면 제외
+        session.add_all([
+            Employee(name='홍두깨', company_id=company.id, status='active'),
+            Employee(name='홍길순', organization_id=dept.id, status='active'),
+        ])
+        session.commit()
+        assert self._names(root.id, '홍') == ['홍길동', '홍두깨']
@@ -6,6 +6,7 @@ API 응답 형식 표준화 기능 테스트
 import pytest
 from app.shared.utils.api_helpers import (
     api_success,
+    api_success_with_etag,
     api_error,
     api_not_found,
     api_unauthorized,
@@ -181,3 +182,22 @@ class TestApiServerError:
             assert status_code == 500
             assert response.json['error'] == 'DB 오류'
 
+
+
+class TestApiSuccessWithEtag:
+    """ETag 조건부 응답 테스트"""
+
+    def test_etag_set_and_not_modified(self, app):
+        """ETag 설정 및 If-None-Match 일치 시 304"""
+        with app.test_request_context('/'):
+            response = api_success_with_etag([{'id': 1}])
+            etag = response.get_etag()[0]
+
+            assert response.status_code == 200
+            assert response.json['data'] == [{'id': 1}]
+            assert etag
+
+        with app.test_request_context('/', headers={'If-None-Match': f'"{etag}"'}):
+            response = api_success_with_etag([{'id': 1}])
+
+            assert response.status_code == 304
@@ -0,0 +1,92 @@
+"""
+커서(키셋) 페이지네이션 테스트
+
+다음/이전 페이지 이동, NULL 정렬값, 동률 해소, 잘못된 커서 처리 테스트
+"""
+import pytest
+
+from app.domains.employee.models import Employee
+from app.shared.utils.cursor_pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_paginate,
+)
+
+
+class TestKeysetPaginate:
+    """keyset_paginate 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session):
+        """정렬값 중복/NULL 포함 직원 데이터"""
+        departments = ['개발팀', None, '인사팀', '개발팀', None, '영업팀', '개발팀']
+        for i, department in enumerate(departments):
+            session.add(Employee(name=f'직원{i}', department=department, status='active'))
+        session.commit()
+
+    def _walk(self, descending=False, per_page=3):
+        pages = []
+        cursor = None
+        while True:
+            page = keyset_paginate(
+                Employee.query, Employee.department, Employee.id,
+                per_page=per_page, cursor=cursor, descending=descending
+            )
+            pages.append(page)
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def _expected(self, descending):
+        rows = Employee.query.all()
+        non_null = sorted(
+            (e for e in rows if e.department is not None),
+            key=lambda e: (e.department, e.id), reverse=descending
+        )
+        nulls = sorted(
+            (e for e in rows if e.department is None),
+            key=lambda e: e.id, reverse=descending
+        )
+        return [e.id for e in non_null + nulls]
+
+    @pytest.mark.parametrize('descending', [False, True])
+    def test_forward_walk_matches_full_order(self, session, descending):
+        """다음 페이지 순회 결과가 전체 정렬(NULLS LAST)과 일치"""
+        pages = self._walk(descending=descending)
+
+        ids = [e.id for page in pages for e in page.items]
+        assert ids == self._expected(descending)
+        assert pages[0].has_prev is False
+        assert pages[-1].has_next is False
+
+    def test_prev_cursor_returns_previous_page(self, session):
+        """이전 페이지 커서로 직전 페이지 재조회"""
+        pages = self._walk()
+
+        for previous, current in zip(pages, pages[1:]):
+            back = keyset_paginate(
+                Employee.query, Employee.department, Employee.id,
+                per_page=3, cursor=current.prev_cursor
+            )
+            assert [e.id for e in back.items] == [e.id for e in previous.items]
+            assert back.has_next is True
+
+    def test_total_carried_in_cursor(self, session):
+        """첫 페이지 총건수가 다음 페이지 커서로 전달 (COUNT 1회)"""
+        first = keyset_paginate(Employee.query, Employee.name, Employee.id,
+                                per_page=2, with_total=True)
+        second = keyset_paginate(Employee.query, Employee.name, Employee.id,
+                                 per_page=2, cursor=first.next_cursor)
+
+        assert first.total == second.total == 7
+
+    def test_invalid_cursor(self, session):
+        """변조 커서 및 정렬 기준 변경 커서 거부"""
+        with pytest.raises(InvalidCursorError):
+            keyset_paginate(Employee.query, Employee.name, Employee.id, cursor='not-a-cursor')
+
+        cursor = encode_cursor({'k': 'department', 'v': '개발팀', 'id': 1})
+        assert decode_cursor(cursor)['v'] == '개발팀'
+        with pytest.raises(InvalidCursorError):
+            keyset_paginate(Employee.query, Employee.name, Employee.id, cursor=cursor)
@@ -0,0 +1,75 @@
+"""
+스트리밍 내보내기 유틸리티 테스트
+
+CSV BOM/수식 이스케이프, XLSX 패키지 구조/셀 값, 청크 단위 생성 테스트
+"""
+import io
+import zipfile
+from xml.etree import ElementTree
+
+from app.shared.utils import export_stream
+from app.shared.utils.export_stream import iter_csv, iter_xlsx
+
+NS = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+class TestIterCsv:
+    """iter_csv 테스트"""
+
+    def test_bom_header_and_formula_escape(self):
+        """BOM + 헤더, None은 빈 값, 수식 시작 문자 이스케이프"""
+        data = b''.join(iter_csv(['이름', '메모'], [('홍길동', '=SUM(A1)'), ('김철수', None)]))
+
+        text = data.decode('utf-8')
+        assert text.startswith('\ufeff이름,메모\r\n')
+        assert "홍길동,'=SUM(A1)" in text
+        assert text.endswith('김철수,\r\n')
+
+
+class TestIterXlsx:
+    """iter_xlsx 테스트"""
+
+    def _read_rows(self, data):
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        assert archive.testzip() is None
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        sheet = ElementTree.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+        rows = []
+        for row in sheet.findall('.//x:sheetData/x:row', NS):
+            values = {}
+            for cell in row.findall('x:c', NS):
+                inline = cell.find('x:is/x:t', NS)
+                values[cell.get('r')] = inline.text if inline is not None else cell.find('x:v', NS).text
+            rows.append(values)
+        return workbook.find('.//x:sheet', NS).get('name'), rows
+
+    def test_workbook_contents(self):
+        """시트 이름, 헤더, 문자열 이스케이프, 숫자/빈 셀"""
+        data = b''.join(iter_xlsx(['번호', '이름', '비고'],
+                                  [(1, '<홍길동> & 팀', None), (2, '김철수\x01', '')],
+                                  sheet_name='직원현황', column_widths=[8, 12, 20]))
+
+        sheet_name, rows = self._read_rows(data)
+        assert sheet_name == '직원현황'
+        assert rows[0] == {'A1': '번호', 'B1': '이름', 'C1': '비고'}
+        assert rows[1] == {'A2': '1', 'B2': '<홍길동> & 팀'}
+        assert rows[2] == {'A3': '2', 'B3': '김철수'}
+
+    def test_streams_in_chunks(self, monkeypatch):
+        """FLUSH_ROWS 단위로 청크 생성 (전체를 한 번에 만들지 않음)"""
+        monkeypatch.setattr(export_stream, 'FLUSH_ROWS', 10)
+        consumed = []
+
+        def rows():
+            for i in range(50):
+                consumed.append(i)
+                yield (i, f'직원{i}')
+
+        chunks = iter_xlsx(['번호', '이름'], rows())
+        next(chunks)  # 고정 파트
+        assert consumed == []
+        next(chunks)
+        assert 10 <= len(consumed) < 50
+
+        assert list(chunks)
+        assert len(consumed) == 50
@@ -0,0 +1,40 @@
+"""
+한글 검색 유틸리티 테스트
+
+초성 추출 및 초성 검색어 판별 테스트
+"""
+from app.shared.utils.korean_search import is_choseong_query, to_choseong
+
+
+class TestToChoseong:
+    """to_choseong 테스트"""
+
+    def test_hangul_syllables(self):
+        """한글 음절 초성 변환 (쌍자음 포함)"""
+        assert to_choseong('김민수') == 'ㄱㅁㅅ'
+        assert to_choseong('박씨') == 'ㅂㅆ'
+        assert to_choseong('힣가') == 'ㅎㄱ'
+
+    def test_mixed_text(self):
+        """공백 제거, 그 외 문자는 소문자 유지"""
+        assert to_choseong('김 Tom') == 'ㄱtom'
+
+    def test_empty(self):
+        """빈 값은 None"""
+        assert to_choseong('') is None
+        assert to_choseong(None) is None
+        assert to_choseong('  ') is None
+
+
+class TestIsChoseongQuery:
+    """is_choseong_query 테스트"""
+
+    def test_choseong_only(self):
+        assert is_choseong_query('ㄱㅁㅅ') is True
+        assert is_choseong_query('ㄱ ㅁ') is True
+
+    def test_not_choseong(self):
+        assert is_choseong_query('김ㅁㅅ') is False
+        assert is_choseong_query('kim') is False
+        assert is_choseong_query('') is False
+        assert is_choseong_query(None) is False
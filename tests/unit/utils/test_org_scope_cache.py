@@ -0,0 +1,99 @@
+"""
+조직 스코프 캐시 테스트
+
+테넌트 조직 ID 캐시, 버전 기반 무효화, 통계 테스트
+"""
+import pytest
+
+from app.domains.company.models import Organization, OrgScopeVersion
+from app.domains.company.repositories.organization_repository import OrganizationRepository
+from app.shared.utils.org_scope_cache import org_scope_cache
+
+
+class TestOrgScopeCache:
+    """org_scope_cache 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session, app):
+        """캐시 활성화 (폴링 간격 0: 매 조회 버전 확인)"""
+        self.session = session
+        self.repo = OrganizationRepository()
+        app.config['ORG_SCOPE_CACHE_ENABLED'] = True
+        app.config['ORG_SCOPE_VERSION_POLL_SECONDS'] = 0
+        org_scope_cache.clear()
+        yield
+        app.config['ORG_SCOPE_CACHE_ENABLED'] = False
+        app.config.pop('ORG_SCOPE_VERSION_POLL_SECONDS', None)
+        org_scope_cache.clear()
+
+    def _build_tree(self, session):
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        dept = Organization(name='인사팀', code='HR', org_type='department', parent_id=root.id)
+        session.add(dept)
+        session.commit()
+        return root, dept
+
+    def test_version_bumped_on_organization_write(self, session):
+        """조직 생성/수정 시 루트 조직 버전 증가"""
+        root, dept = self._build_tree(session)
+        version = OrgScopeVersion.get_version(root.id)
+
+        dept.name = '인사총무팀'
+        session.commit()
+
+        assert version >= 2
+        assert OrgScopeVersion.get_version(root.id) == version + 1
+
+    def test_cache_hit_and_local_invalidation(self, session):
+        """반복 조회는 캐시 히트, 조직 추가 커밋 후 즉시 반영"""
+        root, dept = self._build_tree(session)
+
+        first = self.repo.get_tenant_org_ids(root.id)
+        second = self.repo.get_tenant_org_ids(root.id)
+        assert first == second == {root.id, dept.id}
+        assert org_scope_cache.stats()['hits'] == 1
+
+        team = Organization(name='채용팀', code='REC', org_type='team', parent_id=dept.id)
+        session.add(team)
+        session.commit()
+
+        assert self.repo.get_tenant_org_ids(root.id) == {root.id, dept.id, team.id}
+
+    def test_other_worker_change_detected_by_version(self, session):
+        """다른 워커의 변경(버전 증가)을 폴링으로 감지"""
+        root, dept = self._build_tree(session)
+        self.repo.get_tenant_org_ids(root.id)
+
+        # 다른 프로세스의 변경 재현: 로컬 무효화 없이 데이터/버전만 변경
+        session.info.pop(OrgScopeVersion.DIRTY_KEY, None)
+        session.execute(
+            Organization.__table__.update().where(Organization.id == dept.id).values(is_active=False)
+        )
+        OrgScopeVersion.bump(session.connection(), [root.id])
+        session.commit()
+
+        assert self.repo.get_tenant_org_ids(root.id) == {root.id}
+
+    def test_pending_changes_bypass_cache(self, session):
+        """커밋 전 조직 변경이 있는 세션은 캐시 우회"""
+        root, dept = self._build_tree(session)
+        self.repo.get_tenant_org_ids(root.id)
+
+        team = Organization(name='채용팀', code='REC', org_type='team', parent_id=dept.id)
+        session.add(team)
+        session.flush()
+
+        assert team.id in self.repo.get_tenant_org_ids(root.id)
+        assert org_scope_cache.stats()['bypasses'] >= 1
+
+    def test_returned_copies_are_isolated(self, session):
+        """반환값 수정이 캐시에 영향 없음"""
+        root, dept = self._build_tree(session)
+
+        self.repo.get_tenant_org_ids(root.id).add(999)
+        self.repo.get_selector_tree(root.id)[0]['children'].clear()
+
+        assert 999 not in self.repo.get_tenant_org_ids(root.id)
+        assert len(self.repo.get_selector_tree(root.id)[0]['children']) == 1
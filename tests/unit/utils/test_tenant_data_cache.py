@@ -0,0 +1,58 @@
+"""
+테넌트 데이터 버전 캐시 테스트
+
+직원 목록 패싯 건수 캐시 히트, 버전 증가 시 갱신, 커밋 전 변경 우회 테스트
+"""
+import pytest
+
+from app.domains.company.models import Organization
+from app.domains.employee.models import Employee
+from app.domains.employee.services import employee_service
+from app.shared.utils.tenant_data_cache import tenant_data_cache
+
+
+class TestTenantDataCache:
+    """tenant_data_cache 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, session, app):
+        """캐시 활성화"""
+        app.config['TENANT_DATA_CACHE_ENABLED'] = True
+        tenant_data_cache.clear()
+        root = Organization(name='본사', code='HQ', org_type='company')
+        session.add(root)
+        session.commit()
+        self.root_id = root.id
+        yield
+        app.config['TENANT_DATA_CACHE_ENABLED'] = False
+        tenant_data_cache.clear()
+
+    def _departments(self, **filters):
+        return employee_service.get_filter_facets(self.root_id, **filters)['department']
+
+    def test_hit_and_refresh_on_tenant_write(self, session):
+        """같은 필터 반복 조회는 히트, 직원 변경 커밋 후 새 건수"""
+        session.add(Employee(name='김개발', department='개발팀', organization_id=self.root_id))
+        session.commit()
+
+        assert self._departments() == {'개발팀': 1}
+        assert self._departments(sort_by='name', page=2) == {'개발팀': 1}
+        assert self._departments(search='김') == {'개발팀': 1}
+        assert tenant_data_cache.stats()['hits'] == 1
+        assert tenant_data_cache.stats()['misses'] == 2
+
+        session.add(Employee(name='이인사', department='인사팀', organization_id=self.root_id))
+        session.commit()
+        assert self._departments() == {'개발팀': 1, '인사팀': 1}
+        assert tenant_data_cache.stats()['size'] == 1
+
+    def test_bypass_uncommitted_changes(self, session):
+        """커밋 전 변경이 있는 세션은 캐시를 사용하지 않음"""
+        assert self._departments() == {}
+        session.add(Employee(name='박영업', department='영업팀', organization_id=self.root_id))
+        session.flush()
+        assert self._departments() == {'영업팀': 1}
+        session.rollback()
+
+        assert self._departments() == {}
+        assert tenant_data_cache.stats()['bypasses'] == 1